@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+Core App Configuration
+"""
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.core"
+    verbose_name = "공통"
+
+    def ready(self):
+        from infrastructure.slow_queries.capture import install
+
+        # SLOW_QUERY_CAPTURE_ENABLED이면 DB 연결마다 느린 쿼리 수집기 등록
+        install()
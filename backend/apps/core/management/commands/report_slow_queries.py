@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+느린 쿼리 / 인덱스 사용 보고 명령
+
+현재 DB(--settings로 선택)에서 대시보드 / 데이터 조회 / CSV 내보내기 경로를 한 번씩 실행하며
+--threshold-ms 이상 걸린 쿼리의 실행 계획을 수집하고, SQL 형태별 상위 목록과
+모델에 선언된 인덱스의 사용 여부, 순차 스캔된 테이블을 출력합니다.
+조회 경로만 실행하므로 데이터를 변경하지 않습니다.
+
+사용법:
+    python manage.py report_slow_queries --settings config.settings.development
+    python manage.py report_slow_queries --threshold-ms 50 --limit 10 --output slow-queries.json
+"""
+import json
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from infrastructure.benchmarks.cases import dashboard_cases, data_list_cases, export_cases
+from infrastructure.slow_queries.capture import SlowQueryCapture, SlowQueryLog
+
+
+class Command(BaseCommand):
+    help = '조회 경로를 실행하여 느린 쿼리와 실행 계획, 인덱스 사용 현황을 보고합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threshold-ms',
+            type=float,
+            default=0,
+            help='이 시간 이상 걸린 쿼리만 수집 (기본값: 0 = 모든 쿼리)'
+        )
+        parser.add_argument('--limit', type=int, default=20, help='출력할 상위 쿼리 수')
+        parser.add_argument('--output', help='보고서 JSON 경로')
+
+    def handle(self, *args, **options):
+        log = SlowQueryLog(max_entries=10000)
+        capture = SlowQueryCapture(log, threshold_ms=options['threshold_ms'])
+
+        cases = dashboard_cases() + data_list_cases() + export_cases()
+        with connection.execute_wrapper(capture):
+            for case in cases:
+                self.stdout.write(f'실행: {case.name}')
+                case.func()
+
+        top = log.top(options['limit'])
+        indexes = log.index_usage()
+
+        self.stdout.write('')
+        self.stdout.write(f'{connection.vendor}: {len(log)}개 쿼리 수집 (>= {options["threshold_ms"]}ms)')
+        for rank, group in enumerate(top, 1):
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f'\n#{rank} 총 {group["total_ms"]}ms / {group["count"]}회 / 최대 {group["max_ms"]}ms'
+            ))
+            self.stdout.write(group['sql'])
+            self.stdout.write(f'  호출 위치: {", ".join(group["call_sites"])}')
+            if group['seq_scans']:
+                self.stdout.write(self.style.WARNING(f'  순차 스캔: {", ".join(group["seq_scans"])}'))
+            for line in group['plan'].splitlines():
+                self.stdout.write(f'    {line}')
+
+        self.stdout.write(self.style.MIGRATE_HEADING('\n인덱스 사용 현황'))
+        self.stdout.write(f'  사용됨 ({len(indexes["used"])}): {", ".join(indexes["used"]) or "-"}')
+        self.stdout.write(f'  사용되지 않음 ({len(indexes["unused"])}): {", ".join(indexes["unused"]) or "-"}')
+        self.stdout.write(f'  순차 스캔 테이블: {", ".join(indexes["seq_scanned_tables"]) or "-"}')
+
+        if options['output']:
+            report = {'vendor': connection.vendor, 'top': top, 'indexes': indexes}
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'\n보고서 저장: {options["output"]}'))
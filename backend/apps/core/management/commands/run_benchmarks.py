@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크 실행 명령
+
+별도의 테스트 DB(test_<NAME>)를 만들어 규모 인자별 합성 데이터를 적재하고,
+대시보드 / 데이터 조회 / CSV 내보내기 / 업로드 경로의 지연 시간(p50/p95/p99),
+쿼리 수, 최대 메모리를 JSON으로 기록합니다. 실제 데이터는 건드리지 않습니다.
+
+DB 엔진은 --settings로 선택합니다 (PostgreSQL은 CREATEDB 권한 필요).
+
+사용법:
+    python manage.py run_benchmarks --scales 0.1 1 10 --output bench-sqlite.json
+    python manage.py run_benchmarks --settings config.settings.development --output bench-pg.json
+    python manage.py run_benchmarks --output new.json --compare bench-pg.json --threshold 1.2
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from infrastructure.benchmarks.runner import compare
+from infrastructure.benchmarks.suite import BenchmarkSuite
+
+
+class Command(BaseCommand):
+    help = '합성 데이터로 주요 경로의 지연 시간/쿼리 수/메모리를 측정해 JSON으로 저장합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scales',
+            nargs='+',
+            type=float,
+            default=[0.1, 1.0],
+            help='측정할 규모 인자 목록 (1 = 학생 1만 명)'
+        )
+        parser.add_argument('--iterations', type=int, default=10, help='케이스별 측정 횟수')
+        parser.add_argument('--warmup', type=int, default=1, help='케이스별 워밍업 횟수')
+        parser.add_argument('--seed', type=int, default=42, help='합성 데이터 시드')
+        parser.add_argument('--upload-scale', type=float, default=0.1, help='업로드 케이스 파일의 규모 인자')
+        parser.add_argument('--output', default='benchmark.json', help='결과 JSON 경로')
+        parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=1.2,
+            help='--compare 시 p95가 이 배수를 넘으면 실패'
+        )
+
+    def handle(self, *args, **options):
+        baseline = self._read(options['compare']) if options['compare'] else None
+
+        try:
+            suite = BenchmarkSuite(
+                scales=options['scales'],
+                iterations=options['iterations'],
+                warmup=options['warmup'],
+                seed=options['seed'],
+                upload_scale=options['upload_scale'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            report = suite.run(progress=self.stdout.write)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+
+        if baseline is not None:
+            self._compare(report, baseline, options['threshold'])
+
+    def _read(self, path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"비교 파일을 읽을 수 없습니다: {str(e)}")
+
+    def _compare(self, report, baseline, threshold):
+        """p95 기준 비교표 출력, 임계값을 넘는 케이스가 있으면 실패"""
+        rows = compare(report, baseline)
+        regressions = [row for row in rows if row['ratio'] and row['ratio'] > threshold]
+
+        for row in rows:
+            line = (
+                f"scale={row['scale']} {row['case']}: {row['baseline']}ms → {row['current']}ms "
+                f"(x{row['ratio']}, queries {row['queries_delta']:+d})"
+            )
+            self.stdout.write(self.style.ERROR(line) if row in regressions else line)
+
+        if regressions:
+            raise CommandError(f"성능 회귀 {len(regressions)}건 (p95 > x{threshold})")
@@ -6,9 +6,12 @@ Base Repository
 - 공통 CRUD 메서드 제공
 - ORM 쿼리 추상화
 - 도메인 모델 ↔ ORM 모델 변환
+- 자연 키(natural key) 기반 일괄 중복 검사
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Set, Tuple
+from django.core.exceptions import ValidationError
+from django.db import connections, router
 from django.db.models import Model, QuerySet
 
 
@@ -21,6 +24,12 @@ class BaseRepository(ABC):
 
     model: Model = None  # 하위 클래스에서 ORM 모델 지정
 
+    # 중복 판정에 사용하는 자연 키 컬럼 (하위 클래스에서 지정)
+    natural_key: Tuple[str, ...] = ()
+
+    # 중복 검사 쿼리 1회에 포함하는 최대 키 수
+    DUPLICATE_CHUNK_SIZE = 500
+
     def get_by_id(self, id: int) -> Optional[Any]:
         """
         ID로 단일 객체 조회
@@ -135,6 +144,89 @@ class BaseRepository(ABC):
 
         return queryset.count()
 
+    def check_duplicates(self, rows: List[dict]) -> List[dict]:
+        """
+        이미 저장된 데이터와 자연 키가 같은 행 조회
+
+        행마다 exists() 쿼리를 보내지 않고, 키를 DUPLICATE_CHUNK_SIZE 단위로 묶어
+        IN 쿼리로 확인합니다 (N행 → N / chunk 회 조회).
+
+        Args:
+            rows: 확인할 데이터 리스트
+
+        Returns:
+            List[dict]: 중복된 데이터 리스트 (입력 순서 유지)
+        """
+        keys = [self._natural_key_of(row) for row in rows]
+        existing = self.find_existing_keys(keys)
+        return [row for row, key in zip(rows, keys) if key in existing]
+
+    def find_existing_keys(self, keys: Sequence[tuple]) -> Set[tuple]:
+        """
+        저장소에 이미 존재하는 자연 키 조회
+
+        단일 컬럼 키는 `컬럼 IN (...)`, 복합 키는 컬럼별 IN 조건으로 후보를 좁힌 뒤
+        조회된 키 튜플과 정확히 일치하는 것만 남깁니다.
+        키 값은 DB가 돌려주는 값과 비교할 수 있도록 필드의 to_python()으로 변환한 뒤 비교합니다
+        (예: 엑셀에서 읽은 '2024' → 2024, '2024-03-01' → date).
+
+        Args:
+            keys: natural_key 순서의 값 튜플 리스트
+
+        Returns:
+            Set[tuple]: 존재하는 키 집합 (keys에 전달된 그대로의 값)
+        """
+        if not self.natural_key:
+            raise NotImplementedError(f"{type(self).__name__}.natural_key가 정의되지 않았습니다")
+
+        requested: Dict[tuple, List[tuple]] = {}
+        for key in keys:
+            requested.setdefault(self._normalize_key(key), []).append(key)
+        existing = set()
+
+        for chunk in self._chunked(list(requested), self._duplicate_chunk_size()):
+            conditions = {
+                f"{field}__in": {key[position] for key in chunk}
+                for position, field in enumerate(self.natural_key)
+            }
+            rows = self._duplicate_queryset().filter(**conditions).values_list(*self.natural_key)
+            for key in map(tuple, rows):
+                existing.update(requested.get(key, ()))
+
+        return existing
+
+    def _normalize_key(self, key: tuple) -> tuple:
+        """자연 키 값을 모델 필드 타입으로 변환 (변환할 수 없는 값은 그대로 두어 일치하지 않게 함)"""
+        normalized = []
+        for field_name, value in zip(self.natural_key, key):
+            try:
+                normalized.append(self.model._meta.get_field(field_name).to_python(value))
+            except ValidationError:
+                normalized.append(value)
+        return tuple(normalized)
+
+    def _duplicate_queryset(self) -> QuerySet:
+        """중복 검사 대상 QuerySet (소프트 삭제 제외 등은 하위 클래스에서 재정의)"""
+        return self.model.objects.all()
+
+    def _natural_key_of(self, row: dict) -> tuple:
+        """입력 행에서 자연 키 튜플 추출 (입력 컬럼명이 다르면 하위 클래스에서 재정의)"""
+        return tuple(row[field] for field in self.natural_key)
+
+    def _duplicate_chunk_size(self) -> int:
+        """DB 바인딩 파라미터 한도(SQLite 999개 등)를 넘지 않는 청크 크기"""
+        connection = connections[router.db_for_read(self.model)]
+        max_params = connection.features.max_query_params
+        if max_params is None:
+            return self.DUPLICATE_CHUNK_SIZE
+        return max(1, min(self.DUPLICATE_CHUNK_SIZE, max_params // len(self.natural_key)))
+
+    @staticmethod
+    def _chunked(items: List[Any], size: int) -> Iterator[List[Any]]:
+        """리스트를 size 단위로 분할"""
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
+
     @abstractmethod
     def _to_domain(self, orm_obj: Model) -> Any:
         """
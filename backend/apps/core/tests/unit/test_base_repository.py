@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+BaseRepository 자연 키 중복 검사 단위 테스트
+"""
+import pytest
+
+from apps.core.repositories.base_repository import BaseRepository
+from apps.dashboard.persistence.models import DepartmentKPI
+
+
+class KPIRepository(BaseRepository):
+    """테스트용 학과 KPI Repository (자연 키: 평가년도 + 학과)"""
+    model = DepartmentKPI
+    natural_key = ('evaluation_year', 'department')
+    DUPLICATE_CHUNK_SIZE = 2
+
+    def _to_domain(self, orm_obj):
+        return orm_obj
+
+    def _to_orm(self, domain_obj):
+        return domain_obj
+
+
+def _kpi(year, department):
+    return DepartmentKPI.objects.create(
+        evaluation_year=year,
+        college='공과대학',
+        department=department,
+        employment_rate=80,
+        full_time_faculty=10,
+        visiting_faculty=2,
+        tech_transfer_income=1,
+        intl_conferences=1
+    )
+
+
+@pytest.mark.django_db
+class TestCheckDuplicates:
+    """check_duplicates 테스트"""
+
+    def test_returns_rows_matching_existing_keys_in_input_order(self):
+        """저장된 키와 일치하는 행만 입력 순서대로 반환한다"""
+        # Arrange
+        _kpi(2024, '컴퓨터공학과')
+        _kpi(2023, '전자공학과')
+        rows = [
+            {'evaluation_year': 2023, 'department': '전자공학과'},
+            {'evaluation_year': 2024, 'department': '전자공학과'},
+            {'evaluation_year': 2024, 'department': '컴퓨터공학과'},
+            {'evaluation_year': 2023, 'department': '컴퓨터공학과'},
+        ]
+
+        # Act
+        duplicates = KPIRepository().check_duplicates(rows)
+
+        # Assert
+        assert duplicates == [rows[0], rows[2]]
+
+    def test_issues_one_query_per_chunk(self, django_assert_num_queries):
+        """행마다 조회하지 않고 청크 단위로 조회한다"""
+        # Arrange
+        _kpi(2024, '학과4')
+        rows = [{'evaluation_year': 2024, 'department': f'학과{i}'} for i in range(5)]
+        rows.append(dict(rows[4]))
+
+        # Act
+        with django_assert_num_queries(3):
+            duplicates = KPIRepository().check_duplicates(rows)
+
+        # Assert
+        assert duplicates == [rows[4], rows[5]]
+
+    def test_empty_input_issues_no_query(self, django_assert_num_queries):
+        """입력이 없으면 조회하지 않는다"""
+        # Act
+        with django_assert_num_queries(0):
+            duplicates = KPIRepository().check_duplicates([])
+
+        # Assert
+        assert duplicates == []
+
+    def test_matches_string_typed_keys(self):
+        """엑셀에서 문자열로 읽힌 키도 필드 타입으로 변환하여 중복으로 판정한다"""
+        # Arrange
+        _kpi(2024, '컴퓨터공학과')
+        rows = [
+            {'evaluation_year': '2024', 'department': '컴퓨터공학과'},
+            {'evaluation_year': '2023', 'department': '컴퓨터공학과'},
+        ]
+
+        # Act
+        duplicates = KPIRepository().check_duplicates(rows)
+
+        # Assert
+        assert duplicates == [rows[0]]
@@ -4,12 +4,14 @@ Dashboard Views
 
 API 엔드포인트
 """
-from rest_framework import viewsets, permissions, status
+from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from datetime import datetime
 
 from infrastructure.authentication.supabase_auth import SupabaseAuthentication
+from infrastructure.logging.logger import StructuredLogger
+from infrastructure.views.async_views import AsyncViewSet
 from apps.dashboard.services.dashboard_service import DashboardService
 from apps.dashboard.presentation.serializers import (
     DashboardResponseSerializer,
@@ -17,9 +19,9 @@ from apps.dashboard.presentation.serializers import (
 )
 
 
-class DashboardViewSet(viewsets.ViewSet):
+class DashboardViewSet(AsyncViewSet):
     """
-    대시보드 ViewSet
+    대시보드 ViewSet (비동기)
 
     GET /api/dashboard/ - 대시보드 데이터 조회
     """
@@ -30,10 +32,10 @@ class DashboardViewSet(viewsets.ViewSet):
         super().__init__(**kwargs)
         self.dashboard_service = DashboardService()
 
-    def list(self, request):
+    async def list(self, request):
         """
         GET /api/dashboard/
-        대시보드 데이터 조회
+        대시보드 데이터 조회 (KPI/차트 조회를 동시에 실행)
 
         Query Parameters:
             - year (int, optional): 조회할 연도 (기본값: 현재 연도)
@@ -58,7 +60,7 @@ class DashboardViewSet(viewsets.ViewSet):
 
         try:
             # 서비스 호출
-            dashboard_data = self.dashboard_service.get_dashboard_data(year, college)
+            dashboard_data = await self.dashboard_service.aget_dashboard_data(year, college)
 
             # 응답 직렬화
             response_serializer = DashboardResponseSerializer(dashboard_data)
@@ -66,10 +68,8 @@ class DashboardViewSet(viewsets.ViewSet):
             return Response(response_serializer.data, status=status.HTTP_200_OK)
 
         except Exception as e:
-            # 에러 로깅 (실제로는 StructuredLogger 사용)
-            import traceback
-            print(f"Dashboard error: {str(e)}")
-            print(traceback.format_exc())
+            # 에러 로깅 (traceback 포함)
+            StructuredLogger.log_error(e, {'view': 'dashboard', 'year': year, 'college': college})
 
             return Response(
                 {'error': '데이터를 불러오는 중 오류가 발생했습니다'},
@@ -20,6 +20,7 @@ class BudgetRepository(BaseRepository):
     ORM 쿼리를 도메인 모델로 변환합니다.
     """
     model = BudgetORM
+    natural_key = ('item', 'fiscal_year')
 
     def get_total_by_year(self, year: int, department: str = 'all') -> Decimal:
         """
@@ -172,7 +173,7 @@ class BudgetRepository(BaseRepository):
 
     def check_duplicates(self, budgets: List[dict]) -> List[dict]:
         """
-        중복 데이터 확인
+        중복 데이터 확인 (자연 키: item, fiscal_year)
 
         Args:
             budgets: 예산 데이터 리스트
@@ -180,19 +181,11 @@ class BudgetRepository(BaseRepository):
         Returns:
             List[dict]: 중복된 데이터 리스트
         """
-        duplicates = []
+        return super().check_duplicates(budgets)
 
-        for budget in budgets:
-            exists = BudgetORM.objects.filter(
-                item=budget['item'],
-                fiscal_year=budget['fiscal_year'],
-                is_deleted=False
-            ).exists()
-
-            if exists:
-                duplicates.append(budget)
-
-        return duplicates
+    def _duplicate_queryset(self):
+        """소프트 삭제된 데이터는 중복으로 보지 않음"""
+        return self.model.objects.filter(is_deleted=False)
 
     def _to_orm(self, domain_obj: Budget) -> BudgetORM:
         """도메인 모델 → ORM 모델 변환"""
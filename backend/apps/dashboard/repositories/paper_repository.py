@@ -19,6 +19,7 @@ class PaperRepository(BaseRepository):
     ORM 쿼리를 도메인 모델로 변환합니다.
     """
     model = PaperORM
+    natural_key = ('title', 'publication_date')
 
     def get_count_by_year(self, year: int, department: str = 'all') -> int:
         """
@@ -136,7 +137,7 @@ class PaperRepository(BaseRepository):
 
     def check_duplicates(self, papers: List[dict]) -> List[dict]:
         """
-        중복 데이터 확인
+        중복 데이터 확인 (자연 키: title, publication_date)
 
         Args:
             papers: 논문 데이터 리스트
@@ -144,19 +145,11 @@ class PaperRepository(BaseRepository):
         Returns:
             List[dict]: 중복된 데이터 리스트
         """
-        duplicates = []
+        return super().check_duplicates(papers)
 
-        for paper in papers:
-            exists = PaperORM.objects.filter(
-                title=paper['title'],
-                publication_date=paper['publication_date'],
-                is_deleted=False
-            ).exists()
-
-            if exists:
-                duplicates.append(paper)
-
-        return duplicates
+    def _duplicate_queryset(self):
+        """소프트 삭제된 데이터는 중복으로 보지 않음"""
+        return self.model.objects.filter(is_deleted=False)
 
     def _to_orm(self, domain_obj: Paper) -> PaperORM:
         """도메인 모델 → ORM 모델 변환"""
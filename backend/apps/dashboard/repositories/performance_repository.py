@@ -21,6 +21,7 @@ class PerformanceRepository(BaseRepository):
     ORM 쿼리를 도메인 모델로 변환합니다.
     """
     model = PerformanceORM
+    natural_key = ('date', 'title')
 
     def get_summary_by_year(self, year: int, department: str = 'all') -> PerformanceSummary:
         """
@@ -120,7 +121,7 @@ class PerformanceRepository(BaseRepository):
 
     def check_duplicates(self, performances: List[dict]) -> List[dict]:
         """
-        중복 데이터 확인
+        중복 데이터 확인 (자연 키: date, title)
 
         Args:
             performances: 실적 데이터 리스트
@@ -128,19 +129,15 @@ class PerformanceRepository(BaseRepository):
         Returns:
             List[dict]: 중복된 데이터 리스트
         """
-        duplicates = []
+        return super().check_duplicates(performances)
 
-        for perf in performances:
-            exists = PerformanceORM.objects.filter(
-                date=perf['date'],
-                title=perf.get('title', perf.get('항목', '')),
-                is_deleted=False
-            ).exists()
-
-            if exists:
-                duplicates.append(perf)
+    def _duplicate_queryset(self):
+        """소프트 삭제된 데이터는 중복으로 보지 않음"""
+        return self.model.objects.filter(is_deleted=False)
 
-        return duplicates
+    def _natural_key_of(self, row: dict) -> tuple:
+        """제목 컬럼은 'title' 또는 '항목'으로 입력될 수 있음"""
+        return (row['date'], row.get('title', row.get('항목', '')))
 
     def _to_orm(self, domain_obj: Performance) -> PerformanceORM:
         """도메인 모델 → ORM 모델 변환"""
@@ -4,7 +4,8 @@ Dashboard Service
 
 대시보드 비즈니스 로직
 """
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 from decimal import Decimal
 
 from apps.dashboard.repositories.department_kpi_repository import DepartmentKPIRepository
@@ -13,6 +14,10 @@ from apps.dashboard.repositories.student_repository import StudentRepository
 from apps.dashboard.repositories.research_project_repository import ResearchProjectRepository
 from apps.dashboard.services.metric_calculator import MetricCalculator
 from apps.dashboard.services.chart_data_builder import ChartDataBuilder
+from infrastructure.database.concurrency import gather_queries
+from infrastructure.database.router import read_replica
+from infrastructure.logging.logger import StructuredLogger
+from infrastructure.metrics.metrics import DASHBOARD_SECTION_SECONDS
 
 
 class DashboardService:
@@ -42,6 +47,7 @@ class DashboardService:
         self.metric_calculator = metric_calculator or MetricCalculator()
         self.chart_builder = chart_builder or ChartDataBuilder()
 
+    @read_replica
     def get_dashboard_data(self, year: int, college: Optional[str] = 'all') -> Dict:
         """
         대시보드 전체 데이터 조회 및 생성
@@ -60,16 +66,88 @@ class DashboardService:
         college_filter = None if college == 'all' else college
 
         # KPI 메트릭 생성
-        kpi_metrics = self._build_kpi_metrics(year, college_filter)
+        with DASHBOARD_SECTION_SECONDS.time(section='kpi_metrics'):
+            kpi_metrics = self._build_kpi_metrics(year, college_filter)
 
         # 차트 데이터 생성
-        charts = self._build_charts(year, college_filter)
+        with DASHBOARD_SECTION_SECONDS.time(section='charts'):
+            charts = self._build_charts(year, college_filter)
 
         return {
             'kpi_metrics': kpi_metrics,
             'charts': charts
         }
 
+    @read_replica
+    async def aget_dashboard_data(self, year: int, college: Optional[str] = 'all') -> Dict:
+        """
+        대시보드 전체 데이터 조회 및 생성 (비동기 뷰용)
+
+        KPI/차트의 저장소 조회는 서로 독립적이므로 gather_queries로 동시에 실행합니다 (풀 백엔드에서만).
+        조회와 계산이 섞이지 않으므로 섹션 시간은 'queries'(전체 조회)와 'build'(계산)로 기록합니다.
+
+        Args:
+            year: 조회할 연도
+            college: 단과대학 ('all'이면 전체)
+
+        Returns:
+            Dict: get_dashboard_data와 같은 형식
+        """
+        college_filter = None if college == 'all' else college
+        kpi_queries = self._kpi_queries(year, college_filter)
+        chart_queries = self._chart_queries(year, college_filter)
+
+        with DASHBOARD_SECTION_SECONDS.time(section='queries'):
+            results = await gather_queries({
+                **{('kpi', name): query for name, query in kpi_queries.items()},
+                **{('chart', name): query for name, query in chart_queries.items()},
+            })
+
+        with DASHBOARD_SECTION_SECONDS.time(section='build'):
+            return {
+                'kpi_metrics': self._kpi_metrics_from(
+                    {name: results[('kpi', name)] for name in kpi_queries}, year, college_filter
+                ),
+                'charts': self._charts_from({name: results[('chart', name)] for name in chart_queries}),
+            }
+
+    def _kpi_queries(self, year: int, college: Optional[str]) -> Dict[str, Callable[[], Any]]:
+        """KPI 메트릭에 필요한 저장소 조회 (실행 순서대로)"""
+        prev_year = year - 1
+        return {
+            # 현재 연도 데이터
+            'current_kpi': partial(self.dept_kpi_repo.get_summary, year, college),
+            'current_pub': partial(self.publication_repo.get_count_by_period, year),
+            'current_student': partial(self.student_repo.get_stats, '재학'),
+            'current_budget': self.research_project_repo.get_budget_stats,
+            # 이전 연도 데이터
+            'prev_kpi': partial(self.dept_kpi_repo.get_summary, prev_year, college),
+            'prev_pub': partial(self.publication_repo.get_count_by_period, prev_year),
+            'prev_student': partial(self.student_repo.get_stats, '재학'),
+            # 예산 집행률은 연도 필터가 없으므로 임시로 현재 값 사용
+        }
+
+    def _chart_queries(self, year: int, college: Optional[str]) -> Dict[str, Callable[[], Any]]:
+        """차트에 필요한 저장소 조회 (실행 순서대로)"""
+        return {
+            # 1. 학과별 취업률
+            'dept_employment': partial(self.dept_kpi_repo.get_by_department, year, college),
+            # 2-3. 연도별 추이 (최근 3년)
+            'trend_data': partial(self.dept_kpi_repo.get_trend_by_year, year - 2, year, college),
+            # 4. SCIE/KCI 논문 분포
+            'paper_distribution': partial(self.publication_repo.get_grade_distribution, year),
+            # 5. 학과별 논문 수
+            'papers_by_dept': partial(self.publication_repo.get_by_department, year),
+            # 6. 과정별 학생 수
+            'students_by_program': partial(self.student_repo.get_by_program, '재학'),
+            # 7. 학과별 학생 수
+            'students_by_dept': partial(self.student_repo.get_count_by_department, '재학'),
+            # 8. 집행 항목별 비율
+            'budget_by_item': self.research_project_repo.get_by_item,
+            # 9. 지원 기관별 연구비
+            'budget_by_agency': self.research_project_repo.get_by_agency,
+        }
+
     def _build_kpi_metrics(self, year: int, college: Optional[str]) -> Dict:
         """
         8개 KPI 메트릭 생성
@@ -93,25 +171,26 @@ class DashboardService:
                 ...
             }
         """
-        # 현재 연도 데이터
-        current_kpi = self.dept_kpi_repo.get_summary(year, college)
-        print(f"[DashboardService] current_kpi (year={year}, college={college}): {current_kpi}")
+        results = {name: query() for name, query in self._kpi_queries(year, college).items()}
+        return self._kpi_metrics_from(results, year, college)
 
-        current_pub = self.publication_repo.get_count_by_period(year)
-        print(f"[DashboardService] current_pub (year={year}): {current_pub}")
+    def _kpi_metrics_from(self, results: Dict[str, Any], year: int, college: Optional[str]) -> Dict:
+        """_kpi_queries 조회 결과로 8개 KPI 메트릭 계산"""
+        current_kpi = results['current_kpi']
+        StructuredLogger.debug(__name__, "current_kpi (year=%s, college=%s): %s", year, college, current_kpi)
 
-        current_student = self.student_repo.get_stats('재학')
-        print(f"[DashboardService] current_student: {current_student}")
+        current_pub = results['current_pub']
+        StructuredLogger.debug(__name__, "current_pub (year=%s): %s", year, current_pub)
 
-        current_budget = self.research_project_repo.get_budget_stats()
-        print(f"[DashboardService] current_budget: {current_budget}")
+        current_student = results['current_student']
+        StructuredLogger.debug(__name__, "current_student: %s", current_student)
 
-        # 이전 연도 데이터
-        prev_year = year - 1
-        prev_kpi = self.dept_kpi_repo.get_summary(prev_year, college)
-        prev_pub = self.publication_repo.get_count_by_period(prev_year)
-        prev_student = self.student_repo.get_stats('재학')
-        # 예산 집행률은 연도 필터가 없으므로 임시로 현재 값 사용
+        current_budget = results['current_budget']
+        StructuredLogger.debug(__name__, "current_budget: %s", current_budget)
+
+        prev_kpi = results['prev_kpi']
+        prev_pub = results['prev_pub']
+        prev_student = results['prev_student']
 
         # 1. 전임교원 수
         full_time_faculty_value = current_kpi['total_full_time_faculty']
@@ -222,40 +301,24 @@ class DashboardService:
         Returns:
             Dict: {...}
         """
-        # 1. 학과별 취업률
-        dept_employment = self.dept_kpi_repo.get_by_department(year, college)
-
-        # 2-3. 연도별 추이 (최근 3년)
-        trend_data = self.dept_kpi_repo.get_trend_by_year(year - 2, year, college)
-
-        # 4. SCIE/KCI 논문 분포
-        paper_distribution = self.publication_repo.get_grade_distribution(year)
-
-        # 5. 학과별 논문 수
-        papers_by_dept = self.publication_repo.get_by_department(year)
-
-        # 6. 과정별 학생 수
-        students_by_program = self.student_repo.get_by_program('재학')
-
-        # 7. 학과별 학생 수
-        students_by_dept = self.student_repo.get_count_by_department('재학')
-
-        # 8. 집행 항목별 비율
-        budget_by_item = self.research_project_repo.get_by_item()
-
-        # 9. 지원 기관별 연구비
-        budget_by_agency = self.research_project_repo.get_by_agency()
+        results = {name: query() for name, query in self._chart_queries(year, college).items()}
+        return self._charts_from(results)
 
+    def _charts_from(self, results: Dict[str, Any]) -> Dict:
+        """_chart_queries 조회 결과로 9개 차트 데이터 생성"""
+        trend_data = results['trend_data']
         return {
-            'department_employment_rate': self.chart_builder.build_department_employment_rate(dept_employment),
+            'department_employment_rate': self.chart_builder.build_department_employment_rate(
+                results['dept_employment']
+            ),
             'faculty_trend': self.chart_builder.build_faculty_trend(trend_data),
             'tech_transfer_trend': self.chart_builder.build_tech_transfer_trend(trend_data),
-            'paper_distribution': self.chart_builder.build_paper_distribution(paper_distribution),
-            'papers_by_department': self.chart_builder.build_papers_by_department(papers_by_dept),
-            'students_by_program': self.chart_builder.build_students_by_program(students_by_program),
-            'students_by_department': self.chart_builder.build_students_by_department(students_by_dept),
-            'budget_by_item': self.chart_builder.build_budget_by_item(budget_by_item),
-            'budget_by_funder': self.chart_builder.build_budget_by_funder(budget_by_agency)
+            'paper_distribution': self.chart_builder.build_paper_distribution(results['paper_distribution']),
+            'papers_by_department': self.chart_builder.build_papers_by_department(results['papers_by_dept']),
+            'students_by_program': self.chart_builder.build_students_by_program(results['students_by_program']),
+            'students_by_department': self.chart_builder.build_students_by_department(results['students_by_dept']),
+            'budget_by_item': self.chart_builder.build_budget_by_item(results['budget_by_item']),
+            'budget_by_funder': self.chart_builder.build_budget_by_funder(results['budget_by_agency'])
         }
 
     def _safe_calculate_change_rate(self, current: Decimal, previous: Decimal) -> Decimal:
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+대시보드 쿼리 예산 테스트
+
+합성 데이터 위에서 대시보드 조회의 쿼리 수/조회 행 수가 선언된 예산 이내인지 확인합니다.
+"""
+import pytest
+from rest_framework.test import APIClient
+
+from apps.dashboard.services.dashboard_service import DashboardService
+from infrastructure.authentication.supabase_auth import SupabaseUser
+from infrastructure.testing.query_budget import assert_query_budget, load_budget_data
+
+
+@pytest.fixture
+def synthetic_data(db):
+    """예산 측정용 합성 데이터"""
+    load_budget_data()
+
+
+def test_dashboard_service_within_budget(synthetic_data):
+    """DashboardService.get_dashboard_data는 예산 이내의 쿼리로 생성된다"""
+    # Act
+    data = assert_query_budget(
+        'DashboardService.get_dashboard_data',
+        lambda: DashboardService().get_dashboard_data(2024, 'all')
+    )
+
+    # Assert
+    assert data['kpi_metrics']['full_time_faculty']['value'] > 0
+
+
+def test_dashboard_endpoint_within_budget(synthetic_data):
+    """GET /api/dashboard/ 는 예산 이내의 쿼리로 응답한다"""
+    # Arrange
+    client = APIClient()
+    client.force_authenticate(user=SupabaseUser(user_id='budget-user'))
+
+    # Act
+    response = assert_query_budget('GET /api/dashboard/', lambda: client.get('/api/dashboard/', {'year': 2024}))
+
+    # Assert
+    assert response.status_code == 200
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 """
 Data API Views
+
+비동기 뷰입니다 (infrastructure.views.async_views).
 """
 
-from django.http import HttpResponse
-from rest_framework.views import APIView
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework.response import Response
 from rest_framework import status
 
@@ -12,9 +14,11 @@ from apps.data.domain.models import DataType, DataFilter
 from apps.data.services.data_query_service import DataQueryService
 from apps.data.services.csv_export_service import CSVExportService
 from apps.data.presentation.serializers import PaginatedDataResponseSerializer
+from infrastructure.metrics.metrics import EXPORT_BYTES
+from infrastructure.views.async_views import AsyncAPIView, is_asgi_request
 
 
-class DataListView(APIView):
+class DataListView(AsyncAPIView):
     """
     데이터 목록 조회 API
 
@@ -32,7 +36,7 @@ class DataListView(APIView):
         super().__init__(**kwargs)
         self.service = DataQueryService()
 
-    def get(self, request):
+    async def get(self, request):
         """데이터 목록 조회"""
         # 1. 쿼리 파라미터 파싱
         page = int(request.query_params.get('page', 1))
@@ -62,14 +66,14 @@ class DataListView(APIView):
         )
 
         # 4. 서비스 호출
-        result = self.service.get_filtered_data(filters, page, page_size)
+        result = await self.service.aget_filtered_data(filters, page, page_size)
 
         # 5. 직렬화 및 응답
         serializer = PaginatedDataResponseSerializer(result)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class DataDetailView(APIView):
+class DataDetailView(AsyncAPIView):
     """
     데이터 상세 조회 API
 
@@ -80,7 +84,7 @@ class DataDetailView(APIView):
         super().__init__(**kwargs)
         self.service = DataQueryService()
 
-    def get(self, request, data_type: str, pk: int):
+    async def get(self, request, data_type: str, pk: int):
         """데이터 상세 조회"""
         # 1. 데이터 유형 변환
         try:
@@ -92,7 +96,7 @@ class DataDetailView(APIView):
             )
 
         # 2. 서비스 호출
-        item = self.service.get_data_by_id(data_type_enum, pk)
+        item = await self.service.aget_data_by_id(data_type_enum, pk)
 
         if item is None:
             return Response(
@@ -104,10 +108,13 @@ class DataDetailView(APIView):
         return Response(item.to_dict(), status=status.HTTP_200_OK)
 
 
-class ExportView(APIView):
+class ExportView(AsyncAPIView):
     """
     CSV 내보내기 API
 
+    ASGI에서는 CSV를 만드는 대로 스트리밍하고, WSGI에서는 전체 CSV를 만들어 한 번에 응답합니다
+    (WSGI에서 비동기 이터레이터를 스트리밍하면 Django가 어차피 전부 모은 뒤 보냄).
+
     GET /api/data/export/
     Query Parameters:
         - type: str (optional, 예: department_kpi/publication/research_project/student_roster)
@@ -119,7 +126,7 @@ class ExportView(APIView):
         super().__init__(**kwargs)
         self.service = CSVExportService()
 
-    def get(self, request):
+    async def get(self, request):
         """CSV 데이터 내보내기"""
         # 1. 쿼리 파라미터 파싱
         data_type_str = request.query_params.get('type', None)
@@ -145,20 +152,38 @@ class ExportView(APIView):
             ordering="-date"  # CSV는 기본 정렬
         )
 
-        # 4. CSV 생성
-        csv_content = self.service.export_to_csv(filters)
-
-        # 5. 파일명 생성
+        # 4. 파일명 생성
         # 데이터 유형이 지정되지 않았으면 기본값 사용
         filename = self.service.generate_filename(
             data_type if data_type else DataType.DEPARTMENT_KPI
         )
+        type_label = data_type.value if data_type else 'all'
 
-        # 6. HttpResponse로 CSV 반환
-        response = HttpResponse(
-            csv_content.encode('utf-8-sig'),
-            content_type='text/csv; charset=utf-8-sig'
-        )
+        # 5. CSV 응답 (ASGI는 스트리밍)
+        if is_asgi_request(request):
+            response = StreamingHttpResponse(
+                self._stream_body(filters, type_label),
+                content_type='text/csv; charset=utf-8-sig'
+            )
+        else:
+            csv_content = await sync_to_async(self.service.export_to_csv)(filters)
+            body = csv_content.encode('utf-8-sig')
+            EXPORT_BYTES.inc(len(body), data_type=type_label)
+            response = HttpResponse(
+                body,
+                content_type='text/csv; charset=utf-8-sig'
+            )
         response['Content-Disposition'] = f'attachment; filename="{filename}"'
 
         return response
+
+    async def _stream_body(self, filters: DataFilter, type_label: str):
+        """CSV 조각을 HttpResponse와 같은 바이트로 인코딩 (첫 조각만 utf-8-sig)"""
+        encoding = 'utf-8-sig'
+        size = 0
+        async for chunk in self.service.astream_csv(filters):
+            data = chunk.encode(encoding)
+            encoding = 'utf-8'
+            size += len(data)
+            yield data
+        EXPORT_BYTES.inc(size, data_type=type_label)
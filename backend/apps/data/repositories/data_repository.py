@@ -5,15 +5,115 @@ DataRepository
 모든 데이터 유형(Performance, Paper, Student, Budget)을 통합하여 조회하는 Repository입니다.
 """
 
-from typing import Optional, List
+from operator import attrgetter
+from string import Formatter
+from typing import Any, AsyncIterator, Callable, Dict, Optional, List
 from decimal import Decimal
-from datetime import date
+from datetime import date, timezone
 
-from django.db.models import Q, QuerySet
+from django.db.models import F, Q, QuerySet
+from django.db.models.functions import TruncDate
 from django.core.paginator import Paginator
 
 from apps.data.domain.models import DataType, DataFilter, UnifiedDataItem, PaginatedDataResult
 from apps.dashboard.persistence.models import DepartmentKPI, Publication, ResearchProject, Student
+from apps.uploads.services.schema_registry import DECIMAL, SCHEMAS, DataSchema
+from infrastructure.database.router import read_replica
+
+# 내보내기 스트리밍 시 DB에서 한 번에 가져오는 행 수
+EXPORT_CHUNK_ROWS = 2000
+
+# uploaded_by는 현재 모델에 없으므로 임시로 시스템 사용자로 설정
+# TODO: 향후 uploaded_by ForeignKey 추가 후 수정
+UPLOADED_BY_EMAIL = "system@university.ac.kr"
+
+
+def _to_float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _or_blank(value: Any) -> Any:
+    return value or ""
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _getter(name: Optional[str], default: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """속성 getter (필드명이 없으면 default)"""
+    return attrgetter(name) if name else default
+
+
+def _values_getter(names: tuple) -> Callable[[Any], tuple]:
+    """여러 속성을 튜플로 읽는 getter (속성이 하나여도 튜플 반환)"""
+    if len(names) == 1:
+        name = names[0]
+        return lambda obj: (getattr(obj, name),)
+    return attrgetter(*names)
+
+
+def _compile_domain_mapper(data_type: DataType, schema: DataSchema) -> Callable[[Any], UnifiedDataItem]:
+    """
+    스키마에서 ORM → UnifiedDataItem 변환 함수 생성
+
+    공통 필드(title/category/date/description)로 쓰인 컬럼을 제외한 나머지는
+    extra_fields에 담습니다 (DECIMAL은 float, NULL 허용 문자열은 빈 문자열).
+    """
+    summary = schema.summary
+
+    extras = [column for column in schema.columns if schema.summary_slot(column.field) is None]
+    names = tuple(column.field for column in extras)
+    converters = tuple(
+        _to_float if column.type == DECIMAL else _or_blank if column.nullable else _identity
+        for column in extras
+    )
+    values_of = _values_getter(names)
+
+    if '{' in summary.title:
+        template = summary.title
+        title_fields = tuple(name for _, name, _, _ in Formatter().parse(template) if name)
+        title_values = _values_getter(title_fields)
+
+        def get_title(obj):
+            return template.format(**dict(zip(title_fields, title_values(obj))))
+    else:
+        get_title = attrgetter(summary.title)
+
+    # 날짜 컬럼이 없는 유형은 생성일 사용
+    get_date = _getter(summary.date, lambda obj: obj.created_at.date())
+    get_category = attrgetter(summary.category)
+    get_amount = _getter(summary.amount, lambda obj: None)
+    get_description = (
+        (lambda obj: getattr(obj, summary.description) or "") if summary.description
+        else (lambda obj: None)
+    )
+
+    def to_domain(obj) -> UnifiedDataItem:
+        values = values_of(obj)
+        return UnifiedDataItem(
+            id=obj.id,
+            data_type=data_type,
+            date=get_date(obj),
+            title=get_title(obj),
+            uploaded_at=obj.created_at,
+            uploaded_by=UPLOADED_BY_EMAIL,
+            amount=get_amount(obj),
+            category=get_category(obj),
+            description=get_description(obj),
+            extra_fields={
+                name: convert(value) for name, convert, value in zip(names, converters, values)
+            },
+        )
+
+    return to_domain
+
+
+# 데이터 유형별 ORM → UnifiedDataItem 변환 함수 (모듈 로드 시 한 번 컴파일)
+DOMAIN_MAPPERS: Dict[DataType, Callable[[Any], UnifiedDataItem]] = {
+    data_type: _compile_domain_mapper(data_type, SCHEMAS[data_type.value])
+    for data_type in DataType
+}
 
 
 class DataRepository:
@@ -24,8 +124,11 @@ class DataRepository:
     - 모든 데이터 유형을 통합하여 조회
     - 필터링, 정렬, 페이지네이션 적용
     - ORM 모델을 도메인 모델로 변환
+
+    조회 메서드는 읽기 복제본에서 실행될 수 있습니다 (read_replica).
     """
 
+    @read_replica
     def get_all_with_filters(
         self,
         filters: DataFilter,
@@ -43,31 +146,43 @@ class DataRepository:
         Returns:
             PaginatedDataResult: 페이지네이션 결과
         """
-        # 1. 데이터 유형별로 QuerySet 가져오기
-        querysets = self._get_querysets_by_type(filters.data_type)
-
-        # 2. 각 QuerySet에 필터 적용
-        filtered_querysets = []
-        for data_type, queryset in querysets:
-            filtered_qs = self._apply_filters(queryset, data_type, filters)
-            filtered_querysets.append((data_type, filtered_qs))
+        # 1. 데이터 유형별 QuerySet에 필터 적용
+        filtered_querysets = self._get_filtered_querysets(filters)
 
-        # 3. 모든 QuerySet을 UnifiedDataItem으로 변환
+        # 2. 모든 QuerySet을 UnifiedDataItem으로 변환
         all_items: List[UnifiedDataItem] = []
         for data_type, queryset in filtered_querysets:
-            items = [self._to_domain(obj, data_type) for obj in queryset]
-            all_items.extend(items)
+            to_domain = self._domain_mapper(data_type)
+            all_items.extend(to_domain(obj) for obj in queryset)
 
-        # 4. 정렬 적용
+        # 3. 정렬 및 페이지네이션 적용
         all_items = self._apply_ordering(all_items, filters.ordering)
+        return self._paginate(all_items, page, page_size)
 
-        # 5. 페이지네이션 적용
+    @read_replica
+    async def aget_all_with_filters(
+        self,
+        filters: DataFilter,
+        page: int = 1,
+        page_size: int = 20
+    ) -> PaginatedDataResult:
+        """get_all_with_filters의 비동기 버전 (비동기 ORM 사용)"""
+        all_items: List[UnifiedDataItem] = []
+        for data_type, queryset in self._get_filtered_querysets(filters):
+            to_domain = self._domain_mapper(data_type)
+            all_items.extend([to_domain(obj) async for obj in queryset])
+
+        all_items = self._apply_ordering(all_items, filters.ordering)
+        return self._paginate(all_items, page, page_size)
+
+    def _paginate(self, all_items: List[UnifiedDataItem], page: int, page_size: int) -> PaginatedDataResult:
+        """정렬된 전체 목록에서 한 페이지를 잘라 PaginatedDataResult 생성"""
         total_count = len(all_items)
         start_index = (page - 1) * page_size
         end_index = start_index + page_size
         paginated_items = all_items[start_index:end_index]
 
-        # 6. next/previous URL 생성 (간단한 구현)
+        # next/previous URL 생성 (간단한 구현)
         has_next = end_index < total_count
         has_previous = page > 1
         next_url = f"?page={page + 1}" if has_next else None
@@ -80,6 +195,7 @@ class DataRepository:
             results=paginated_items
         )
 
+    @read_replica
     def get_by_id(self, data_type: DataType, obj_id: int) -> Optional[UnifiedDataItem]:
         """
         데이터 유형과 ID로 단일 데이터 조회
@@ -98,6 +214,17 @@ class DataRepository:
         except model_class.DoesNotExist:
             return None
 
+    @read_replica
+    async def aget_by_id(self, data_type: DataType, obj_id: int) -> Optional[UnifiedDataItem]:
+        """get_by_id의 비동기 버전 (비동기 ORM 사용)"""
+        model_class = self._get_model_class(data_type)
+        try:
+            obj = await model_class.objects.aget(id=obj_id)
+        except model_class.DoesNotExist:
+            return None
+        return self._to_domain(obj, data_type)
+
+    @read_replica
     def get_all_without_pagination(self, filters: DataFilter) -> List[UnifiedDataItem]:
         """
         필터 조건에 맞는 모든 데이터를 조회 (페이지네이션 없음)
@@ -110,28 +237,71 @@ class DataRepository:
         Returns:
             UnifiedDataItem 리스트
         """
-        # 1. 데이터 유형별로 QuerySet 가져오기
-        querysets = self._get_querysets_by_type(filters.data_type)
+        # 1. 데이터 유형별 QuerySet에 필터 적용
+        filtered_querysets = self._get_filtered_querysets(filters)
 
-        # 2. 각 QuerySet에 필터 적용
-        filtered_querysets = []
-        for data_type, queryset in querysets:
-            filtered_qs = self._apply_filters(queryset, data_type, filters)
-            filtered_querysets.append((data_type, filtered_qs))
-
-        # 3. 모든 QuerySet을 UnifiedDataItem으로 변환
+        # 2. 모든 QuerySet을 UnifiedDataItem으로 변환
         all_items: List[UnifiedDataItem] = []
         for data_type, queryset in filtered_querysets:
-            items = [self._to_domain(obj, data_type) for obj in queryset]
-            all_items.extend(items)
+            to_domain = self._domain_mapper(data_type)
+            all_items.extend(to_domain(obj) for obj in queryset)
 
-        # 4. 정렬 적용
+        # 3. 정렬 적용
         all_items = self._apply_ordering(all_items, filters.ordering)
 
         return all_items
 
+    @read_replica
+    async def aiter_all(self, filters: DataFilter) -> AsyncIterator[UnifiedDataItem]:
+        """
+        get_all_without_pagination과 같은 항목을 같은 순서로 하나씩 돌려주는 비동기 이터레이터
+
+        단일 유형의 날짜 정렬은 DB에서 정렬하여 EXPORT_CHUNK_ROWS행씩 가져오므로
+        전체 결과를 메모리에 올리지 않습니다. 여러 유형을 합치거나 다른 기준으로 정렬할 때는
+        get_all_without_pagination처럼 모두 읽어 정렬한 뒤 돌려줍니다.
+        """
+        filtered_querysets = self._get_filtered_querysets(filters)
+
+        if len(filtered_querysets) == 1:
+            data_type, queryset = filtered_querysets[0]
+            db_ordering = self._db_ordering(queryset, data_type, filters.ordering)
+            if db_ordering is not None:
+                to_domain = self._domain_mapper(data_type)
+                async for obj in queryset.order_by(*db_ordering).aiterator(chunk_size=EXPORT_CHUNK_ROWS):
+                    yield to_domain(obj)
+                return
+
+        all_items: List[UnifiedDataItem] = []
+        for data_type, queryset in filtered_querysets:
+            to_domain = self._domain_mapper(data_type)
+            all_items.extend([to_domain(obj) async for obj in queryset])
+
+        for item in self._apply_ordering(all_items, filters.ordering):
+            yield item
+
     # ========== Private Methods ==========
 
+    def _get_filtered_querysets(self, filters: DataFilter) -> List[tuple]:
+        """필터가 적용된 데이터 유형별 QuerySet 목록 (List[(DataType, QuerySet)])"""
+        return [
+            (data_type, self._apply_filters(queryset, data_type, filters))
+            for data_type, queryset in self._get_querysets_by_type(filters.data_type)
+        ]
+
+    def _db_ordering(self, queryset: QuerySet, data_type: DataType, ordering: str) -> Optional[List]:
+        """
+        _apply_ordering과 같은 순서를 내는 DB 정렬 (날짜 정렬만, 그 외에는 None)
+
+        파이썬 정렬은 안정 정렬이므로 날짜가 같은 항목은 모델 기본 정렬(Meta.ordering) 순서를 유지합니다.
+        날짜 컬럼이 없는 유형은 도메인 변환과 같이 생성일(UTC 날짜)을 사용합니다.
+        """
+        if ordering.lstrip('-') != 'date':
+            return None
+        date_field = SCHEMAS[data_type.value].summary.date
+        expression = F(date_field) if date_field else TruncDate('created_at', tzinfo=timezone.utc)
+        key = expression.desc() if ordering.startswith('-') else expression.asc()
+        return [key, *queryset.model._meta.ordering]
+
     def _get_querysets_by_type(self, data_type: Optional[DataType] = None) -> List[tuple]:
         """
         데이터 유형별로 QuerySet을 가져옵니다.
@@ -278,100 +448,11 @@ class DataRepository:
         Returns:
             UnifiedDataItem
         """
-        # uploaded_by는 현재 모델에 없으므로 임시로 시스템 사용자로 설정
-        # TODO: 향후 uploaded_by ForeignKey 추가 후 수정
-        uploaded_by_email = "system@university.ac.kr"
-
-        if data_type == DataType.DEPARTMENT_KPI:
-            return UnifiedDataItem(
-                id=obj.id,
-                data_type=data_type,
-                date=obj.created_at.date(),  # 평가년도는 extra_fields에
-                title=f"{obj.evaluation_year}년 {obj.department}",
-                uploaded_at=obj.created_at,
-                uploaded_by=uploaded_by_email,
-                amount=obj.tech_transfer_income,  # 기술이전 수입액
-                category=obj.college,
-                description=None,
-                extra_fields={
-                    "evaluation_year": obj.evaluation_year,
-                    "department": obj.department,
-                    "employment_rate": float(obj.employment_rate),
-                    "full_time_faculty": obj.full_time_faculty,
-                    "visiting_faculty": obj.visiting_faculty,
-                    "tech_transfer_income": float(obj.tech_transfer_income),
-                    "intl_conferences": obj.intl_conferences,
-                }
-            )
-
-        elif data_type == DataType.PUBLICATION:
-            return UnifiedDataItem(
-                id=obj.id,
-                data_type=data_type,
-                date=obj.publication_date,
-                title=obj.paper_title,
-                uploaded_at=obj.created_at,
-                uploaded_by=uploaded_by_email,
-                category=obj.department,
-                description=None,
-                extra_fields={
-                    "paper_id": obj.paper_id,
-                    "college": obj.college,
-                    "lead_author": obj.lead_author,
-                    "co_authors": obj.co_authors or "",
-                    "journal_name": obj.journal_name,
-                    "journal_grade": obj.journal_grade,
-                    "impact_factor": float(obj.impact_factor) if obj.impact_factor else None,
-                    "project_linked": obj.project_linked,
-                }
-            )
-
-        elif data_type == DataType.RESEARCH_PROJECT:
-            return UnifiedDataItem(
-                id=obj.id,
-                data_type=data_type,
-                date=obj.execution_date,
-                title=obj.project_name,
-                uploaded_at=obj.created_at,
-                uploaded_by=uploaded_by_email,
-                amount=obj.execution_amount,  # 집행금액
-                category=obj.department,
-                description=obj.remarks or "",
-                extra_fields={
-                    "execution_id": obj.execution_id,
-                    "project_number": obj.project_number,
-                    "principal_investigator": obj.principal_investigator,
-                    "funding_agency": obj.funding_agency,
-                    "total_budget": obj.total_budget,
-                    "execution_item": obj.execution_item,
-                    "execution_amount": obj.execution_amount,
-                    "status": obj.status,
-                }
-            )
-
-        elif data_type == DataType.STUDENT_ROSTER:
-            # Student는 날짜가 없으므로 created_at 사용
-            return UnifiedDataItem(
-                id=obj.id,
-                data_type=data_type,
-                date=obj.created_at.date(),  # datetime을 date로 변환
-                title=obj.name,
-                uploaded_at=obj.created_at,
-                uploaded_by=uploaded_by_email,
-                category=obj.department,
-                description=None,
-                extra_fields={
-                    "student_id": obj.student_id,
-                    "college": obj.college,
-                    "grade": obj.grade,
-                    "program_type": obj.program_type,
-                    "enrollment_status": obj.enrollment_status,
-                    "gender": obj.gender,
-                    "admission_year": obj.admission_year,
-                    "advisor": obj.advisor or "",
-                    "email": obj.email,
-                }
-            )
-
-        else:
-            raise ValueError(f"Unknown data_type: {data_type}")
+        return self._domain_mapper(data_type)(obj)
+
+    def _domain_mapper(self, data_type: DataType) -> Callable[[Any], UnifiedDataItem]:
+        """데이터 유형별로 미리 컴파일된 ORM → UnifiedDataItem 변환 함수"""
+        try:
+            return DOMAIN_MAPPERS[data_type]
+        except KeyError:
+            raise ValueError(f"Unknown data_type: {data_type}") from None
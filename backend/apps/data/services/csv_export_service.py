@@ -7,11 +7,51 @@ CSVExportService
 
 import csv
 from io import StringIO
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from datetime import date, datetime
 
 from apps.data.domain.models import DataType, DataFilter, UnifiedDataItem
 from apps.data.repositories.data_repository import DataRepository
+from apps.uploads.services.schema_registry import SCHEMAS, DataSchema
+
+
+def _cell(value: Any) -> str:
+    """CSV 셀 문자열 (None은 빈 값, 날짜는 ISO 형식)"""
+    if value is None:
+        return ""
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _compile_row_converter(schema: DataSchema) -> Callable[[UnifiedDataItem], List[str]]:
+    """
+    스키마에서 UnifiedDataItem → CSV 행 변환 함수 생성
+
+    컬럼마다 값이 공통 필드(title/category/date/description)에 있는지
+    extra_fields에 있는지를 미리 결정해 둡니다.
+    """
+    def reader(field_name: str) -> Callable[[UnifiedDataItem], Any]:
+        slot = schema.summary_slot(field_name)
+        if slot is not None:
+            return lambda item: getattr(item, slot)
+        return lambda item: (item.extra_fields or {}).get(field_name)
+
+    readers = tuple(reader(column.field) for column in schema.columns)
+
+    def to_row(item: UnifiedDataItem) -> List[str]:
+        return [_cell(read(item)) for read in readers]
+
+    return to_row
+
+
+# 데이터 유형별 CSV 행 변환 함수 (모듈 로드 시 한 번 컴파일)
+ROW_CONVERTERS: Dict[DataType, Callable[[UnifiedDataItem], List[str]]] = {
+    data_type: _compile_row_converter(SCHEMAS[data_type.value]) for data_type in DataType
+}
+
+# 스트리밍 내보내기에서 한 번에 내보내는 CSV 조각의 대략적인 크기 (문자 수)
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class CSVExportService:
@@ -24,20 +64,9 @@ class CSVExportService:
     - 데이터 유형별 컬럼 헤더 정의
     """
 
-    # 데이터 유형별 CSV 헤더 정의 (설계 문서 기준)
+    # 데이터 유형별 CSV 헤더 (스키마 레지스트리의 내보내기 헤더)
     HEADERS = {
-        DataType.DEPARTMENT_KPI: [
-            "평가년도", "단과대학", "학과", "취업률", "전임교원수", "초빙교원수", "기술이전수입", "학술대회개최"
-        ],
-        DataType.PUBLICATION: [
-            "논문ID", "게재일", "단과대학", "학과", "논문제목", "주저자", "참여저자", "학술지명", "저널등급", "ImpactFactor", "과제연계"
-        ],
-        DataType.RESEARCH_PROJECT: [
-            "집행ID", "과제번호", "과제명", "연구책임자", "소속학과", "지원기관", "총연구비", "집행일자", "집행항목", "집행금액", "상태", "비고"
-        ],
-        DataType.STUDENT_ROSTER: [
-            "학번", "이름", "단과대학", "학과", "학년", "과정구분", "학적상태", "성별", "입학년도", "지도교수", "이메일"
-        ],
+        data_type: SCHEMAS[data_type.value].export_headers for data_type in DataType
     }
 
     def __init__(self, data_repository: Optional[DataRepository] = None):
@@ -72,6 +101,45 @@ class CSVExportService:
         # 3. CSV 생성
         return self._generate_csv_content(items, data_type)
 
+    async def astream_csv(self, filters: DataFilter) -> AsyncIterator[str]:
+        """
+        export_to_csv와 같은 CSV를 STREAM_CHUNK_SIZE 정도의 조각으로 나누어 돌려주는 비동기 이터레이터
+
+        행은 DataRepository.aiter_all에서 받는 대로 변환하므로, 단일 유형 내보내기는
+        전체 결과를 메모리에 올리지 않고 ASGI 응답으로 흘려보낼 수 있습니다.
+
+        Args:
+            filters: 필터 조건
+
+        Returns:
+            CSV 문자열 조각 (첫 조각은 BOM과 헤더로 시작)
+        """
+        items = self.data_repository.aiter_all(filters)
+        try:
+            # 유형이 지정되지 않았으면 첫 번째 항목의 유형으로 헤더 결정 (export_to_csv와 동일)
+            first = await anext(items, None)
+            data_type = filters.data_type or (first.data_type if first else DataType.DEPARTMENT_KPI)
+
+            output = StringIO()
+            output.write('\ufeff')
+            writer = csv.writer(output, quoting=csv.QUOTE_MINIMAL)
+            writer.writerow(self._get_csv_headers(data_type))
+            if first is not None:
+                writer.writerow(self._item_to_csv_row(first))
+
+            async for item in items:
+                writer.writerow(self._item_to_csv_row(item))
+                if output.tell() >= STREAM_CHUNK_SIZE:
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate()
+
+            if output.tell():
+                yield output.getvalue()
+        finally:
+            # 클라이언트가 중간에 연결을 끊어도 DB 이터레이터를 정리
+            await items.aclose()
+
     def generate_filename(self, data_type: DataType) -> str:
         """
         CSV 파일명 생성
@@ -107,72 +175,8 @@ class CSVExportService:
         Returns:
             CSV 행 (리스트)
         """
-        extra = item.extra_fields or {}
-
-        if item.data_type == DataType.DEPARTMENT_KPI:
-            # "평가년도", "단과대학", "학과", "취업률", "전임교원수", "초빙교원수", "기술이전수입", "학술대회개최"
-            return [
-                str(extra.get("evaluation_year", "")),
-                item.category or "",  # college
-                extra.get("department", ""),
-                str(extra.get("employment_rate", "")),
-                str(extra.get("full_time_faculty", "")),
-                str(extra.get("visiting_faculty", "")),
-                str(extra.get("tech_transfer_income", "")),
-                str(extra.get("intl_conferences", "")),
-            ]
-
-        elif item.data_type == DataType.PUBLICATION:
-            # "논문ID", "게재일", "단과대학", "학과", "논문제목", "주저자", "참여저자", "학술지명", "저널등급", "ImpactFactor", "과제연계"
-            return [
-                extra.get("paper_id", ""),
-                item.date.isoformat() if item.date else "",
-                extra.get("college", ""),
-                item.category or "",  # department
-                item.title or "",  # paper_title
-                extra.get("lead_author", ""),
-                extra.get("co_authors", ""),
-                extra.get("journal_name", ""),
-                extra.get("journal_grade", ""),
-                str(extra.get("impact_factor", "")) if extra.get("impact_factor") is not None else "",
-                extra.get("project_linked", ""),
-            ]
-
-        elif item.data_type == DataType.RESEARCH_PROJECT:
-            # "집행ID", "과제번호", "과제명", "연구책임자", "소속학과", "지원기관", "총연구비", "집행일자", "집행항목", "집행금액", "상태", "비고"
-            return [
-                extra.get("execution_id", ""),
-                extra.get("project_number", ""),
-                item.title or "",  # project_name
-                extra.get("principal_investigator", ""),
-                item.category or "",  # department
-                extra.get("funding_agency", ""),
-                str(extra.get("total_budget", "")),
-                item.date.isoformat() if item.date else "",  # execution_date
-                extra.get("execution_item", ""),
-                str(extra.get("execution_amount", "")),
-                extra.get("status", ""),
-                item.description or "",  # remarks
-            ]
-
-        elif item.data_type == DataType.STUDENT_ROSTER:
-            # "학번", "이름", "단과대학", "학과", "학년", "과정구분", "학적상태", "성별", "입학년도", "지도교수", "이메일"
-            return [
-                extra.get("student_id", ""),
-                item.title or "",  # name
-                extra.get("college", ""),
-                item.category or "",  # department
-                str(extra.get("grade", "")),
-                extra.get("program_type", ""),
-                extra.get("enrollment_status", ""),
-                extra.get("gender", ""),
-                str(extra.get("admission_year", "")),
-                extra.get("advisor", ""),
-                extra.get("email", ""),
-            ]
-
-        else:
-            return []
+        to_row = ROW_CONVERTERS.get(item.data_type)
+        return to_row(item) if to_row else []
 
     def _generate_csv_content(self, items: List[UnifiedDataItem], data_type: DataType) -> str:
         """
@@ -195,9 +199,7 @@ class CSVExportService:
         headers = self._get_csv_headers(data_type)
         writer.writerow(headers)
 
-        # 데이터 행 작성
-        for item in items:
-            row = self._item_to_csv_row(item)
-            writer.writerow(row)
+        # 데이터 행 작성 (유형별로 미리 컴파일된 변환 함수 사용)
+        writer.writerows(map(self._item_to_csv_row, items))
 
         return output.getvalue()
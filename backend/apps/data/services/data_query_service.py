@@ -47,6 +47,15 @@ class DataQueryService:
         # Repository에 위임
         return self.data_repository.get_all_with_filters(filters, page, page_size)
 
+    async def aget_filtered_data(
+        self,
+        filters: DataFilter,
+        page: int,
+        page_size: int
+    ) -> PaginatedDataResult:
+        """get_filtered_data의 비동기 버전"""
+        return await self.data_repository.aget_all_with_filters(filters, page, page_size)
+
     def get_data_by_id(
         self,
         data_type: DataType,
@@ -63,3 +72,11 @@ class DataQueryService:
             UnifiedDataItem 또는 None
         """
         return self.data_repository.get_by_id(data_type, obj_id)
+
+    async def aget_data_by_id(
+        self,
+        data_type: DataType,
+        obj_id: int
+    ) -> Optional[UnifiedDataItem]:
+        """get_data_by_id의 비동기 버전"""
+        return await self.data_repository.aget_by_id(data_type, obj_id)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+ASGI 비동기 뷰 테스트
+
+AsyncClient(ASGI 요청)로 대시보드/데이터 조회/내보내기를 호출하여
+WSGI(APIClient)와 같은 응답을 내는지 확인합니다.
+"""
+import time
+
+import jwt
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from rest_framework.test import APIClient
+
+from apps.dashboard.persistence.models import Publication
+from infrastructure.authentication.supabase_auth import SupabaseUser
+from infrastructure.testing.query_budget import load_budget_data
+
+
+@pytest.fixture
+def synthetic_data(db):
+    load_budget_data()
+
+
+@pytest.fixture
+def asgi_get():
+    """인증 헤더를 붙여 AsyncClient로 GET 요청 (스트리밍 응답은 본문까지 읽음)"""
+    token = jwt.encode({
+        'sub': 'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
+        'role': 'authenticated',
+        'aud': 'authenticated',
+        'exp': int(time.time()) + 3600,
+    }, 'test-secret-key', algorithm='HS256')
+    client = AsyncClient()
+
+    async def get(path, data=None):
+        response = await client.get(path, data, headers={'Authorization': f'Bearer {token}'})
+        if response.streaming:
+            response.body = b''.join([chunk async for chunk in response.streaming_content])
+        else:
+            response.body = response.content
+        return response
+
+    return async_to_sync(get)
+
+
+@pytest.fixture
+def wsgi_client():
+    client = APIClient()
+    client.force_authenticate(user=SupabaseUser(user_id='wsgi-user'))
+    return client
+
+
+def test_dashboard_matches_wsgi_response(synthetic_data, asgi_get, wsgi_client):
+    """ASGI 대시보드 응답은 WSGI 응답과 같다"""
+    # Act
+    asgi = asgi_get('/api/dashboard/', {'year': 2024})
+    wsgi = wsgi_client.get('/api/dashboard/', {'year': 2024})
+
+    # Assert
+    assert asgi.status_code == 200
+    assert asgi.body == wsgi.content
+
+
+def test_data_detail_uses_async_orm(synthetic_data, asgi_get):
+    """ASGI 상세 조회는 항목을 돌려주고, 없는 ID는 404"""
+    # Arrange
+    publication = Publication.objects.first()
+
+    # Act
+    found = asgi_get(f'/api/data/publication/{publication.id}/')
+    missing = asgi_get('/api/data/publication/999999/')
+
+    # Assert
+    assert found.status_code == 200
+    assert found.json()['title']
+    assert missing.status_code == 404
+
+
+@pytest.mark.parametrize('params', [{'type': 'publication'}, {'type': 'department_kpi', 'year': 2024}, {}])
+def test_export_streams_same_csv_as_wsgi(synthetic_data, asgi_get, wsgi_client, params):
+    """ASGI 내보내기는 스트리밍 응답이며 본문은 WSGI 응답과 같다"""
+    # Act
+    asgi = asgi_get('/api/data/export/', params)
+    wsgi = wsgi_client.get('/api/data/export/', params)
+
+    # Assert
+    assert asgi.streaming
+    assert asgi['Content-Type'] == 'text/csv; charset=utf-8-sig'
+    assert asgi.body == wsgi.content
+    assert asgi.body.count(b'\n') > 1
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+데이터 조회/내보내기 쿼리 예산 테스트
+
+합성 데이터 위에서 조회/내보내기 경로의 쿼리 수/조회 행 수가 선언된 예산 이내인지 확인합니다.
+"""
+import pytest
+from rest_framework.test import APIClient
+
+from apps.data.domain.models import DataFilter, DataType
+from apps.data.repositories.data_repository import DataRepository
+from apps.data.services.csv_export_service import CSVExportService
+from infrastructure.authentication.supabase_auth import SupabaseUser
+from infrastructure.testing.query_budget import assert_query_budget, load_budget_data
+
+
+@pytest.fixture
+def synthetic_data(db):
+    """예산 측정용 합성 데이터"""
+    load_budget_data()
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    client.force_authenticate(user=SupabaseUser(user_id='budget-user'))
+    return client
+
+
+@pytest.mark.parametrize('name, filters', [
+    ('DataRepository.get_all_with_filters', DataFilter()),
+    ('DataRepository.get_all_with_filters[search]', DataFilter(search='공학')),
+    ('DataRepository.get_all_with_filters[data_type]', DataFilter(data_type=DataType.PUBLICATION)),
+])
+def test_repository_within_budget(synthetic_data, name, filters):
+    """DataRepository.get_all_with_filters는 예산 이내의 쿼리로 한 페이지를 조회한다"""
+    # Act
+    result = assert_query_budget(name, lambda: DataRepository().get_all_with_filters(filters, 1, 20))
+
+    # Assert
+    assert len(result.results) == 20
+
+
+def test_export_service_within_budget(synthetic_data):
+    """CSVExportService.export_to_csv는 예산 이내의 쿼리로 CSV를 만든다"""
+    # Act
+    content = assert_query_budget(
+        'CSVExportService.export_to_csv',
+        lambda: CSVExportService().export_to_csv(DataFilter(data_type=DataType.PUBLICATION))
+    )
+
+    # Assert
+    assert content.count('\n') == 61
+
+
+def test_data_endpoints_within_budget(synthetic_data, api_client):
+    """GET /api/data/, /api/data/export/ 는 예산 이내의 쿼리로 응답한다"""
+    # Act
+    listing = assert_query_budget('GET /api/data/', lambda: api_client.get('/api/data/', {'page': 1}))
+    export = assert_query_budget(
+        'GET /api/data/export/', lambda: api_client.get('/api/data/export/', {'type': 'publication'})
+    )
+
+    # Assert
+    assert listing.status_code == 200
+    assert export.status_code == 200
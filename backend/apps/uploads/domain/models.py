@@ -3,22 +3,64 @@
 
 순수 비즈니스 엔티티 정의 (프레임워크 독립적)
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from datetime import datetime
 
 
 @dataclass
 class UploadRecord:
-    """업로드 이력 도메인 모델"""
+    """업로드 이력 도메인 모델 (백그라운드 업로드 작업 포함)"""
 
     id: Optional[int]
     filename: str
-    data_type: str  # 'performance', 'paper', 'student', 'budget'
-    rows_processed: int
+    data_type: str  # 'department_kpi', 'publication', 'research_project', 'student_roster'
+    rows_processed: int  # DB 저장 완료 행 수
     uploaded_at: datetime
     uploaded_by: str  # 사용자 이메일
-    status: str  # 'success', 'failed', 'partial'
+    status: str  # 'pending', 'processing', 'success', 'failed', 'partial'
+    stage: str = 'done'  # 'queued', 'parsing', 'validating', 'inserting', 'done'
+    rows_parsed: int = 0
+    rows_validated: int = 0
+    error_message: Optional[str] = None
+    stored_file: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    content_hash: Optional[str] = None  # 파일 내용 SHA-256
+    mode: str = 'strict'  # 'strict' (전체 성공/실패), 'partial' (유효한 행만 저장)
+    rows_rejected: int = 0
+    error_report: Optional[str] = None  # 거부된 행 오류 CSV ID
+    heartbeat_at: Optional[datetime] = None  # 워커가 마지막으로 처리 중임을 기록한 시각
+    attempts: int = 0  # 워커가 작업을 선점한 횟수
+
+    def elapsed_seconds(self, now: datetime) -> Optional[float]:
+        """처리 경과 시간 (초, 시작 전이면 None)"""
+        if self.started_at is None:
+            return None
+        end = self.finished_at or now
+        return max((end - self.started_at).total_seconds(), 0.0)
+
+    def throughput(self, now: datetime) -> Optional[float]:
+        """
+        처리량 (행/초)
+
+        가장 많이 진행된 단계의 행 수를 경과 시간으로 나눕니다.
+        """
+        elapsed = self.elapsed_seconds(now)
+        if not elapsed:
+            return None
+        rows = max(self.rows_parsed, self.rows_validated, self.rows_processed)
+        return round(rows / elapsed, 1)
+
+    def can_rerun(self) -> bool:
+        """
+        중단된 작업을 처음부터 다시 처리해도 되는지 여부
+
+        strict 모드는 전체 저장이 하나의 트랜잭션이라 중단되면 롤백되지만,
+        partial 모드는 저장 단계에 들어서면 청크마다 커밋하므로 (진행 기록보다 커밋이 먼저일 수 있어)
+        이미 저장된 행이 다시 처리되며 중복 오류로 기록됩니다.
+        """
+        return not (self.mode == 'partial' and self.stage == 'inserting')
 
 
 @dataclass
@@ -47,3 +89,39 @@ class UploadResult:
     success: bool
     upload_record: UploadRecord
     errors: Optional[List[str]]
+
+
+@dataclass
+class UploadSession:
+    """이어받기 업로드 세션 도메인 모델"""
+
+    id: str
+    filename: str
+    data_type: Optional[str]  # ZIP 묶음은 None
+    mode: str
+    total_size: int
+    chunk_size: int
+    status: str  # 'open', 'completed', 'failed'
+    uploaded_by: str
+    created_at: datetime
+    expires_at: datetime
+    received_chunks: List[int] = field(default_factory=list)  # 수신 완료 청크 번호
+    job_id: Optional[int] = None  # 완료 시 등록된 업로드 작업
+
+    @property
+    def chunk_count(self) -> int:
+        """전체 청크 수"""
+        return -(-self.total_size // self.chunk_size)
+
+    def chunk_length(self, index: int) -> int:
+        """청크 크기 (마지막 청크는 남은 크기)"""
+        return min(self.chunk_size, self.total_size - index * self.chunk_size)
+
+    def missing_offsets(self) -> List[int]:
+        """아직 수신하지 않은 청크의 시작 오프셋"""
+        received = set(self.received_chunks)
+        return [index * self.chunk_size for index in range(self.chunk_count) if index not in received]
+
+    def received_bytes(self) -> int:
+        """수신 완료 바이트 수"""
+        return sum(self.chunk_length(index) for index in set(self.received_chunks))
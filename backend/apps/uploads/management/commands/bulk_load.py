@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+대량 적재 명령
+
+4가지 데이터 유형 파일(CSV / CSV.GZ / XLSX / Parquet)을 테이블에 적재합니다.
+PostgreSQL은 COPY FROM, 그 밖의 DB는 배치 bulk_create를 사용하며,
+테이블별로 별도 프로세스에서 병렬 적재합니다. 환경 초기화/갱신의 표준 방법입니다.
+
+사용법:
+    python manage.py bulk_load --dir ../docs/inputdata
+    python manage.py bulk_load publication=papers.parquet student_roster=students.csv.gz
+    python manage.py bulk_load --dir data --append --workers 1 --defer-indexes
+"""
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.uploads.services.bulk_loader import BulkLoader
+
+
+class Command(BaseCommand):
+    help = '데이터 유형별 파일을 COPY / bulk_create로 대량 적재합니다'
+
+    # --dir 사용 시 데이터 유형별 파일명 (확장자 제외)
+    DEFAULT_FILES = {
+        'department_kpi': 'department_kpi',
+        'publication': 'publication_list',
+        'research_project': 'research_project_data',
+        'student_roster': 'student_roster',
+    }
+
+    # --dir에서 찾는 확장자 (앞에 있는 것 우선)
+    EXTENSIONS = ('.parquet', '.csv.gz', '.csv', '.xlsx')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'files',
+            nargs='*',
+            metavar='data_type=path',
+            help='적재할 파일 (예: publication=papers.csv)'
+        )
+        parser.add_argument(
+            '--dir',
+            help='데이터 유형별 기본 파일명(department_kpi, publication_list, ...)으로 찾을 디렉토리'
+        )
+        parser.add_argument(
+            '--append',
+            action='store_true',
+            help='기존 데이터를 지우지 않고 추가'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=min(4, os.cpu_count() or 1),
+            help='병렬 적재 프로세스 수 (1이면 현재 프로세스에서 순차 적재)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BulkLoader.DEFAULT_BATCH_SIZE,
+            help='COPY / bulk_create 배치 크기'
+        )
+        parser.add_argument(
+            '--defer-indexes',
+            action='store_true',
+            help='적재 동안 보조 인덱스를 지웠다가 끝난 뒤 다시 생성'
+        )
+        parser.add_argument(
+            '--skip-validation',
+            action='store_true',
+            help='DataValidator 검증 생략'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='적재할 DB alias'
+        )
+
+    def handle(self, *args, **options):
+        tasks = self._tasks(options['files'], options['dir'])
+        if not tasks:
+            raise CommandError("적재할 파일이 없습니다 (data_type=path 또는 --dir 지정)")
+
+        loader = BulkLoader(
+            batch_size=options['batch_size'],
+            replace=not options['append'],
+            defer_indexes=options['defer_indexes'],
+            validate=not options['skip_validation'],
+            using=options['database'],
+        )
+
+        try:
+            results = loader.load_many(tasks, workers=options['workers'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        for result in results:
+            self.stdout.write(
+                f"[{result.data_type}] {result.path}: {result.rows}행, "
+                f"{result.seconds:.2f}초, {result.rows_per_second} rows/s ({result.method})"
+            )
+
+        total_rows = sum(result.rows for result in results)
+        elapsed = max(result.seconds for result in results)
+        rate = int(total_rows / elapsed) if elapsed > 0 else total_rows
+        self.stdout.write(self.style.SUCCESS(f"적재 완료: {total_rows}행, {rate} rows/s"))
+
+    def _tasks(self, files, directory):
+        """(데이터 유형, 경로) 목록"""
+        tasks = {}
+
+        if directory:
+            for data_type, name in self.DEFAULT_FILES.items():
+                for extension in self.EXTENSIONS:
+                    path = os.path.join(directory, name + extension)
+                    if os.path.exists(path):
+                        tasks[data_type] = path
+                        break
+
+        for spec in files:
+            data_type, separator, path = spec.partition('=')
+            if not separator or not path:
+                raise CommandError(f"data_type=path 형식이어야 합니다: {spec}")
+            if data_type not in self.DEFAULT_FILES:
+                raise CommandError(f"지원하지 않는 데이터 타입입니다: {data_type}")
+            if not os.path.exists(path):
+                raise CommandError(f"파일이 존재하지 않습니다: {path}")
+            tasks[data_type] = path
+
+        return list(tasks.items())
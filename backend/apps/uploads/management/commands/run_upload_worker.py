@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+업로드 워커 명령
+
+대기 중인 백그라운드 업로드 작업을 처리합니다.
+
+사용법:
+    python manage.py run_upload_worker            # 계속 실행 (폴링)
+    python manage.py run_upload_worker --once     # 대기 작업을 모두 처리하고 종료
+"""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.uploads.services.upload_job_service import UploadJobService
+
+
+class Command(BaseCommand):
+    help = '대기 중인 백그라운드 업로드 작업을 처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기 중인 작업을 모두 처리한 뒤 종료'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=settings.UPLOAD_WORKER_POLL_INTERVAL,
+            help='대기 작업이 없을 때 다시 확인하기까지의 시간 (초)'
+        )
+
+    def handle(self, *args, **options):
+        service = UploadJobService()
+        processed = 0
+
+        try:
+            while True:
+                job = service.run_next()
+
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                processed += 1
+                self.stdout.write(
+                    f"[job {job.id}] {job.filename} ({job.data_type}): "
+                    f"{job.status}, {job.rows_processed}행 저장, {job.throughput(timezone.now())} rows/s"
+                )
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f"처리한 작업: {processed}건"))
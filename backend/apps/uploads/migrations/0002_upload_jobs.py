@@ -0,0 +1,90 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:14
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("uploads", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="finished_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="처리 종료 일시"
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="rows_parsed",
+            field=models.IntegerField(
+                default=0,
+                validators=[django.core.validators.MinValueValidator(0)],
+                verbose_name="파싱된 행 수",
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="rows_validated",
+            field=models.IntegerField(
+                default=0,
+                validators=[django.core.validators.MinValueValidator(0)],
+                verbose_name="검증된 행 수",
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="stage",
+            field=models.CharField(
+                choices=[
+                    ("queued", "대기"),
+                    ("parsing", "파싱"),
+                    ("validating", "검증"),
+                    ("inserting", "저장"),
+                    ("done", "완료"),
+                ],
+                default="done",
+                max_length=20,
+                verbose_name="처리 단계",
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="started_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="처리 시작 일시"
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="stored_file",
+            field=models.CharField(
+                blank=True, max_length=500, null=True, verbose_name="저장 파일 경로"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="uploadhistory",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "대기 중"),
+                    ("processing", "처리 중"),
+                    ("success", "전체 성공"),
+                    ("partial", "부분 성공"),
+                    ("failed", "전체 실패"),
+                ],
+                max_length=20,
+                verbose_name="업로드 상태",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="uploadhistory",
+            index=models.Index(
+                fields=["status", "uploaded_at"], name="idx_upload_history_queue"
+            ),
+        ),
+    ]
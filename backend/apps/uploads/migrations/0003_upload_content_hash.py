@@ -0,0 +1,26 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("uploads", "0002_upload_jobs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, max_length=64, null=True, verbose_name="파일 해시 (SHA-256)"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="uploadhistory",
+            index=models.Index(
+                fields=["data_type", "content_hash"], name="idx_upload_history_hash"
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:32
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("uploads", "0003_upload_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="error_report",
+            field=models.CharField(
+                blank=True, max_length=64, null=True, verbose_name="오류 리포트 ID"
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="mode",
+            field=models.CharField(
+                choices=[
+                    ("strict", "전체 성공 또는 전체 실패"),
+                    ("partial", "유효한 행만 저장"),
+                ],
+                default="strict",
+                max_length=10,
+                verbose_name="처리 모드",
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="rows_rejected",
+            field=models.IntegerField(
+                default=0,
+                validators=[django.core.validators.MinValueValidator(0)],
+                verbose_name="거부된 행 수",
+            ),
+        ),
+    ]
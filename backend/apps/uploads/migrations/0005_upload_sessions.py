@@ -0,0 +1,145 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:40
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("uploads", "0004_partial_uploads"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UploadSession",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="세션 ID",
+                    ),
+                ),
+                ("file_name", models.CharField(max_length=255, verbose_name="파일명")),
+                (
+                    "data_type",
+                    models.CharField(
+                        blank=True, max_length=50, null=True, verbose_name="데이터 유형"
+                    ),
+                ),
+                (
+                    "mode",
+                    models.CharField(
+                        default="strict", max_length=10, verbose_name="처리 모드"
+                    ),
+                ),
+                (
+                    "total_size",
+                    models.BigIntegerField(
+                        validators=[django.core.validators.MinValueValidator(1)],
+                        verbose_name="전체 크기 (바이트)",
+                    ),
+                ),
+                (
+                    "chunk_size",
+                    models.IntegerField(
+                        validators=[django.core.validators.MinValueValidator(1)],
+                        verbose_name="청크 크기 (바이트)",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("open", "업로드 중"),
+                            ("completed", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="open",
+                        max_length=20,
+                        verbose_name="세션 상태",
+                    ),
+                ),
+                (
+                    "uploaded_by",
+                    models.CharField(max_length=100, verbose_name="업로드 사용자"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 일시"),
+                ),
+                ("expires_at", models.DateTimeField(verbose_name="만료 일시")),
+            ],
+            options={
+                "verbose_name": "업로드 세션",
+                "verbose_name_plural": "업로드 세션 목록",
+                "db_table": "upload_session",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "expires_at"],
+                        name="idx_upload_session_expiry",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="UploadSessionChunk",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "index",
+                    models.IntegerField(
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="청크 번호",
+                    ),
+                ),
+                (
+                    "size",
+                    models.IntegerField(
+                        validators=[django.core.validators.MinValueValidator(1)],
+                        verbose_name="청크 크기 (바이트)",
+                    ),
+                ),
+                (
+                    "checksum",
+                    models.CharField(max_length=64, verbose_name="청크 해시 (SHA-256)"),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chunks",
+                        to="uploads.uploadsession",
+                        verbose_name="업로드 세션",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "업로드 세션 청크",
+                "verbose_name_plural": "업로드 세션 청크 목록",
+                "db_table": "upload_session_chunk",
+                "ordering": ["index"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="uploadsessionchunk",
+            constraint=models.UniqueConstraint(
+                fields=("session", "index"), name="uniq_upload_session_chunk"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.1 on 2026-10-19 14:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("uploads", "0005_upload_sessions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadsession",
+            name="job",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="sessions",
+                to="uploads.uploadhistory",
+                verbose_name="업로드 작업",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.1 on 2026-10-19 14:45
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("uploads", "0006_upload_session_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="attempts",
+            field=models.IntegerField(
+                default=0,
+                validators=[django.core.validators.MinValueValidator(0)],
+                verbose_name="처리 시도 횟수",
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadhistory",
+            name="heartbeat_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="워커 확인 일시"
+            ),
+        ),
+    ]
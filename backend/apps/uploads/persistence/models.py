@@ -4,6 +4,8 @@ Uploads Persistence 모델
 
 CSV 파일 업로드 이력 추적 모델
 """
+import uuid
+
 from django.db import models
 from django.core.validators import MinValueValidator
 
@@ -17,11 +19,25 @@ class UploadHistory(models.Model):
     Attributes:
         file_name: 파일명
         data_type: 데이터 유형 (4가지 CSV 타입 중 하나)
-        rows_processed: 성공적으로 처리된 행 수
-        status: 업로드 상태 (success/partial/failed)
+        rows_processed: 성공적으로 처리된 행 수 (DB 저장 완료)
+        status: 업로드 상태 (pending/processing/success/partial/failed)
         error_message: 오류 발생 시 상세 메시지
         uploaded_by: 업로드한 사용자
         uploaded_at: 업로드 시각
+        content_hash: 파일 내용 SHA-256 (동일 파일 재업로드 감지)
+        mode: 처리 모드 (strict: 전체 성공 또는 전체 실패, partial: 유효한 행만 저장)
+        rows_rejected: 거부된 행 수 (partial 모드)
+        error_report: 거부된 행 오류 CSV ID (partial 모드)
+
+    백그라운드 업로드 작업(job) 필드:
+        stage: 처리 단계 (queued/parsing/validating/inserting/done)
+        stored_file: 워커가 처리할 저장 파일 경로
+        rows_parsed: 파싱된 행 수
+        rows_validated: 검증을 통과한 행 수
+        started_at: 처리 시작 시각
+        finished_at: 처리 종료 시각
+        heartbeat_at: 워커가 마지막으로 처리 중임을 기록한 시각 (오래되면 다시 대기열로)
+        attempts: 워커가 작업을 선점한 횟수
     """
     file_name = models.CharField(
         max_length=255,
@@ -45,12 +61,42 @@ class UploadHistory(models.Model):
     status = models.CharField(
         max_length=20,
         choices=[
+            ('pending', '대기 중'),
+            ('processing', '처리 중'),
             ('success', '전체 성공'),
             ('partial', '부분 성공'),
             ('failed', '전체 실패'),
         ],
         verbose_name="업로드 상태"
     )
+    stage = models.CharField(
+        max_length=20,
+        choices=[
+            ('queued', '대기'),
+            ('parsing', '파싱'),
+            ('validating', '검증'),
+            ('inserting', '저장'),
+            ('done', '완료'),
+        ],
+        default='done',
+        verbose_name="처리 단계"
+    )
+    stored_file = models.CharField(
+        max_length=500,
+        blank=True,
+        null=True,
+        verbose_name="저장 파일 경로"
+    )
+    rows_parsed = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        verbose_name="파싱된 행 수"
+    )
+    rows_validated = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        verbose_name="검증된 행 수"
+    )
     error_message = models.TextField(
         blank=True,
         null=True,
@@ -60,10 +106,56 @@ class UploadHistory(models.Model):
         max_length=100,
         verbose_name="업로드 사용자"
     )
+    mode = models.CharField(
+        max_length=10,
+        choices=[
+            ('strict', '전체 성공 또는 전체 실패'),
+            ('partial', '유효한 행만 저장'),
+        ],
+        default='strict',
+        verbose_name="처리 모드"
+    )
+    rows_rejected = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        verbose_name="거부된 행 수"
+    )
+    error_report = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        verbose_name="오류 리포트 ID"
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        verbose_name="파일 해시 (SHA-256)"
+    )
     uploaded_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name="업로드 일시"
     )
+    started_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name="처리 시작 일시"
+    )
+    finished_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name="처리 종료 일시"
+    )
+    heartbeat_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name="워커 확인 일시"
+    )
+    attempts = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        verbose_name="처리 시도 횟수"
+    )
 
     class Meta:
         db_table = 'upload_history'
@@ -74,8 +166,145 @@ class UploadHistory(models.Model):
             models.Index(fields=['data_type'], name='idx_upload_history_type'),
             models.Index(fields=['status'], name='idx_upload_history_status'),
             models.Index(fields=['uploaded_by'], name='idx_upload_history_user'),
+            models.Index(fields=['status', 'uploaded_at'], name='idx_upload_history_queue'),
+            models.Index(fields=['data_type', 'content_hash'], name='idx_upload_history_hash'),
         ]
         ordering = ['-uploaded_at']
 
     def __str__(self):
         return f"{self.file_name} - {self.status} ({self.uploaded_at})"
+
+
+class UploadSession(models.Model):
+    """
+    이어받기(resumable) 업로드 세션 ORM 모델
+
+    파일을 chunk_size 단위 청크로 나누어 여러 요청에 걸쳐 업로드합니다.
+    수신한 청크는 UPLOAD_SESSION_DIR/<id>.part 파일의 해당 오프셋에 기록됩니다.
+    완료하면 조립 파일을 백그라운드 업로드 작업(job)으로 넘깁니다.
+
+    Attributes:
+        id: 세션 ID (UUID)
+        file_name: 원본 파일명
+        data_type: 데이터 유형 (ZIP 묶음은 null)
+        mode: 처리 모드 (strict/partial)
+        total_size: 전체 파일 크기 (바이트)
+        chunk_size: 청크 크기 (바이트, 마지막 청크만 더 작을 수 있음)
+        status: 세션 상태 (open/completed/failed, failed는 다시 완료 가능)
+        uploaded_by: 업로드한 사용자
+        job: 완료 시 등록된 업로드 작업
+        created_at: 세션 생성 시각
+        expires_at: 세션 만료 시각 (만료된 open/failed 세션은 삭제)
+    """
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+        verbose_name="세션 ID"
+    )
+    file_name = models.CharField(
+        max_length=255,
+        verbose_name="파일명"
+    )
+    data_type = models.CharField(
+        max_length=50,
+        blank=True,
+        null=True,
+        verbose_name="데이터 유형"
+    )
+    mode = models.CharField(
+        max_length=10,
+        default='strict',
+        verbose_name="처리 모드"
+    )
+    total_size = models.BigIntegerField(
+        validators=[MinValueValidator(1)],
+        verbose_name="전체 크기 (바이트)"
+    )
+    chunk_size = models.IntegerField(
+        validators=[MinValueValidator(1)],
+        verbose_name="청크 크기 (바이트)"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ('open', '업로드 중'),
+            ('completed', '완료'),
+            ('failed', '실패'),
+        ],
+        default='open',
+        verbose_name="세션 상태"
+    )
+    uploaded_by = models.CharField(
+        max_length=100,
+        verbose_name="업로드 사용자"
+    )
+    job = models.ForeignKey(
+        UploadHistory,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='sessions',
+        verbose_name="업로드 작업"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="생성 일시"
+    )
+    expires_at = models.DateTimeField(
+        verbose_name="만료 일시"
+    )
+
+    class Meta:
+        db_table = 'upload_session'
+        verbose_name = '업로드 세션'
+        verbose_name_plural = '업로드 세션 목록'
+        indexes = [
+            models.Index(fields=['status', 'expires_at'], name='idx_upload_session_expiry'),
+        ]
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.file_name} - {self.status} ({self.id})"
+
+
+class UploadSessionChunk(models.Model):
+    """
+    업로드 세션의 수신 완료 청크
+
+    Attributes:
+        session: 업로드 세션
+        index: 청크 번호 (오프셋 / chunk_size)
+        size: 청크 크기 (바이트)
+        checksum: 청크 SHA-256 (재전송 시 동일 내용 확인)
+    """
+    session = models.ForeignKey(
+        UploadSession,
+        on_delete=models.CASCADE,
+        related_name='chunks',
+        verbose_name="업로드 세션"
+    )
+    index = models.IntegerField(
+        validators=[MinValueValidator(0)],
+        verbose_name="청크 번호"
+    )
+    size = models.IntegerField(
+        validators=[MinValueValidator(1)],
+        verbose_name="청크 크기 (바이트)"
+    )
+    checksum = models.CharField(
+        max_length=64,
+        verbose_name="청크 해시 (SHA-256)"
+    )
+
+    class Meta:
+        db_table = 'upload_session_chunk'
+        verbose_name = '업로드 세션 청크'
+        verbose_name_plural = '업로드 세션 청크 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['session', 'index'], name='uniq_upload_session_chunk'),
+        ]
+        ordering = ['index']
+
+    def __str__(self):
+        return f"{self.session_id} #{self.index}"
@@ -6,24 +6,53 @@ CSV 파일 업로드 요청/응답 직렬화
 """
 from rest_framework import serializers
 
+# 데이터 유형 선택지
+DATA_TYPE_CHOICES = [
+    ('department_kpi', '학과 KPI 데이터'),
+    ('publication', '논문 목록'),
+    ('research_project', '연구 과제 데이터'),
+    ('student_roster', '학생 명단')
+]
+
+# 처리 모드 선택지
+MODE_CHOICES = [
+    ('strict', '전체 성공 또는 전체 실패'),
+    ('partial', '유효한 행만 저장하고 거부된 행은 오류 CSV로 제공'),
+]
+
 
 class FileUploadSerializer(serializers.Serializer):
     """
     CSV 파일 업로드 요청 Serializer
     """
+    # 확장자별 최대 파일 크기 (Excel은 읽기 전용 스트리밍으로 처리)
+    MAX_FILE_SIZES = {
+        '.csv': 10 * 1024 * 1024,  # 10MB
+        '.csv.gz': 10 * 1024 * 1024,  # 10MB (압축 크기)
+        '.xlsx': 50 * 1024 * 1024,  # 50MB
+        '.zip': 50 * 1024 * 1024,  # 50MB (4종 CSV 묶음)
+    }
+
+    # 데이터 유형을 파일 내용으로 판별하는 묶음 파일 확장자
+    BUNDLE_EXTENSION = '.zip'
+
     file = serializers.FileField(
         required=True,
-        help_text="CSV 파일 (UTF-8 인코딩)"
+        help_text=(
+            "CSV 파일 (UTF-8 또는 CP949/EUC-KR 인코딩, gzip 압축 .csv.gz 가능), "
+            "Excel(.xlsx) 파일 또는 여러 CSV를 묶은 ZIP 파일"
+        )
     )
     data_type = serializers.ChoiceField(
-        required=True,
-        choices=[
-            ('department_kpi', '학과 KPI 데이터'),
-            ('publication', '논문 목록'),
-            ('research_project', '연구 과제 데이터'),
-            ('student_roster', '학생 명단')
-        ],
-        help_text="데이터 유형"
+        required=False,
+        choices=DATA_TYPE_CHOICES,
+        help_text="데이터 유형 (ZIP 묶음은 파일명/헤더로 자동 판별하므로 생략)"
+    )
+    mode = serializers.ChoiceField(
+        required=False,
+        default='strict',
+        choices=MODE_CHOICES,
+        help_text="처리 모드"
     )
 
     def validate_file(self, value):
@@ -40,11 +69,14 @@ class FileUploadSerializer(serializers.Serializer):
             ValidationError: 파일 형식 또는 크기 오류
         """
         # 파일 확장자 검증
-        if not value.name.lower().endswith('.csv'):
-            raise serializers.ValidationError("CSV 파일만 업로드 가능합니다")
+        extension = self._extension(value.name)
+        if extension is None:
+            raise serializers.ValidationError(
+                "CSV(.csv, .csv.gz), Excel(.xlsx) 또는 ZIP(.zip) 파일만 업로드 가능합니다"
+            )
 
-        # 파일 크기 검증 (최대 10MB)
-        max_size = 10 * 1024 * 1024  # 10MB
+        # 파일 크기 검증 (CSV 10MB, Excel/ZIP 50MB)
+        max_size = self.MAX_FILE_SIZES[extension]
         if value.size > max_size:
             raise serializers.ValidationError(
                 f"파일 크기는 {max_size // (1024 * 1024)}MB 이하여야 합니다"
@@ -52,6 +84,86 @@ class FileUploadSerializer(serializers.Serializer):
 
         return value
 
+    def validate(self, attrs):
+        """ZIP 묶음이 아니면 데이터 유형 필수"""
+        if 'data_type' not in attrs and self._extension(attrs['file'].name) != self.BUNDLE_EXTENSION:
+            raise serializers.ValidationError({'data_type': ["이 필드는 필수 항목입니다."]})
+        return attrs
+
+    def _extension(self, filename: str):
+        """허용된 확장자 중 파일명과 일치하는 것 ('.csv.gz' 같은 이중 확장자 포함)"""
+        name = filename.lower()
+        return next((extension for extension in self.MAX_FILE_SIZES if name.endswith(extension)), None)
+
+
+class UploadPreviewSerializer(serializers.Serializer):
+    """
+    업로드 미리보기(dry-run) 요청 Serializer
+
+    파일 크기 제한은 적용하지 않습니다 (앞부분만 읽음).
+    """
+    file = serializers.FileField(
+        required=True,
+        help_text="CSV(.csv, .csv.gz) 또는 Excel(.xlsx) 파일 (CSV는 파일 앞부분만 보내도 됨)"
+    )
+    data_type = serializers.ChoiceField(
+        required=True,
+        choices=DATA_TYPE_CHOICES,
+        help_text="데이터 유형"
+    )
+    rows = serializers.IntegerField(
+        required=False,
+        default=20,
+        min_value=1,
+        max_value=1000,
+        help_text="확인할 데이터 행 수"
+    )
+    total_size = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        help_text="원본 파일 전체 크기 (바이트, 파일 앞부분만 보낼 때 행 수 추정용)"
+    )
+
+
+class UploadSessionCreateSerializer(serializers.Serializer):
+    """
+    이어받기 업로드 세션 생성 요청 Serializer
+    """
+    filename = serializers.CharField(max_length=255, help_text="원본 파일명 (.csv, .csv.gz, .xlsx)")
+    data_type = serializers.ChoiceField(
+        choices=DATA_TYPE_CHOICES,
+        help_text="데이터 유형"
+    )
+    total_size = serializers.IntegerField(min_value=1, help_text="전체 파일 크기 (바이트)")
+    chunk_size = serializers.IntegerField(
+        required=False, min_value=1, help_text="희망 청크 크기 (바이트, 서버 제한에 맞춰 조정됨)"
+    )
+    mode = serializers.ChoiceField(
+        required=False,
+        default='strict',
+        choices=MODE_CHOICES,
+        help_text="처리 모드"
+    )
+
+
+class UploadSessionSerializer(serializers.Serializer):
+    """
+    이어받기 업로드 세션 상태 응답 Serializer
+    """
+    session_id = serializers.CharField(help_text="세션 ID")
+    status = serializers.CharField(help_text="세션 상태 (open/completed/failed, failed는 다시 완료 가능)")
+    filename = serializers.CharField(help_text="파일명")
+    data_type = serializers.CharField(allow_null=True, help_text="데이터 유형")
+    mode = serializers.CharField(help_text="처리 모드 (strict/partial)")
+    total_size = serializers.IntegerField(help_text="전체 파일 크기 (바이트)")
+    chunk_size = serializers.IntegerField(help_text="청크 크기 (바이트)")
+    received_bytes = serializers.IntegerField(help_text="수신 완료 바이트 수")
+    missing_offsets = serializers.ListField(
+        child=serializers.IntegerField(), help_text="아직 수신하지 않은 청크의 시작 오프셋"
+    )
+    expires_at = serializers.DateTimeField(help_text="세션 만료 시각")
+    job_id = serializers.IntegerField(allow_null=True, help_text="완료 시 등록된 업로드 작업 ID")
+
 
 class UploadResponseSerializer(serializers.Serializer):
     """
@@ -66,3 +178,49 @@ class UploadResponseSerializer(serializers.Serializer):
         required=False,
         help_text="오류 메시지 목록"
     )
+    duplicate_of = serializers.IntegerField(
+        required=False,
+        help_text="동일 파일의 이전 업로드 ID (재업로드 시)"
+    )
+    status = serializers.CharField(
+        required=False,
+        help_text="처리 결과 (partial 모드: success/partial/failed)"
+    )
+    rows_rejected = serializers.IntegerField(
+        required=False,
+        help_text="거부된 행 수 (partial 모드)"
+    )
+    error_report_url = serializers.CharField(
+        required=False,
+        allow_null=True,
+        help_text="거부된 행 오류 CSV 다운로드 URL (partial 모드)"
+    )
+    members = serializers.ListField(
+        child=serializers.DictField(),
+        required=False,
+        help_text="ZIP 묶음의 파일별 처리 결과"
+    )
+
+
+class UploadJobSerializer(serializers.Serializer):
+    """
+    백그라운드 업로드 작업 상태 응답 Serializer
+    """
+    job_id = serializers.IntegerField(help_text="작업 ID")
+    status = serializers.CharField(help_text="작업 상태 (pending/processing/success/failed)")
+    stage = serializers.CharField(help_text="처리 단계 (queued/parsing/validating/inserting/done)")
+    filename = serializers.CharField(help_text="파일명")
+    data_type = serializers.CharField(help_text="데이터 유형")
+    rows_parsed = serializers.IntegerField(help_text="파싱된 행 수")
+    rows_validated = serializers.IntegerField(help_text="검증을 통과한 행 수")
+    rows_inserted = serializers.IntegerField(help_text="DB에 저장된 행 수")
+    rows_rejected = serializers.IntegerField(help_text="거부된 행 수 (partial 모드)")
+    mode = serializers.CharField(help_text="처리 모드 (strict/partial)")
+    error_report_url = serializers.CharField(
+        allow_null=True, help_text="거부된 행 오류 CSV 다운로드 URL (partial 모드)"
+    )
+    elapsed_seconds = serializers.FloatField(allow_null=True, help_text="처리 경과 시간 (초)")
+    rows_per_second = serializers.FloatField(allow_null=True, help_text="처리량 (행/초)")
+    error_message = serializers.CharField(allow_null=True, help_text="오류 메시지")
+    uploaded_at = serializers.DateTimeField(help_text="작업 등록 시각")
+    finished_at = serializers.DateTimeField(allow_null=True, help_text="처리 종료 시각")
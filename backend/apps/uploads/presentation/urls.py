@@ -3,10 +3,36 @@
 Upload URL Configuration
 """
 from django.urls import path
-from apps.uploads.presentation.views import FileUploadView
+from apps.uploads.presentation.views import (
+    FileUploadView,
+    UploadErrorReportView,
+    UploadJobCreateView,
+    UploadJobStatusView,
+    UploadPreviewView,
+    UploadSessionChunkView,
+    UploadSessionCompleteView,
+    UploadSessionCreateView,
+    UploadSessionDetailView,
+)
 
 app_name = 'uploads'
 
 urlpatterns = [
     path('', FileUploadView.as_view(), name='file_upload'),
+    path('preview/', UploadPreviewView.as_view(), name='upload_preview'),
+    path('jobs/', UploadJobCreateView.as_view(), name='upload_job_create'),
+    path('jobs/<int:job_id>/', UploadJobStatusView.as_view(), name='upload_job_status'),
+    path('errors/<str:report_id>/', UploadErrorReportView.as_view(), name='upload_error_report'),
+    path('sessions/', UploadSessionCreateView.as_view(), name='upload_session_create'),
+    path('sessions/<str:session_id>/', UploadSessionDetailView.as_view(), name='upload_session_detail'),
+    path(
+        'sessions/<str:session_id>/chunks/<int:offset>/',
+        UploadSessionChunkView.as_view(),
+        name='upload_session_chunk'
+    ),
+    path(
+        'sessions/<str:session_id>/complete/',
+        UploadSessionCompleteView.as_view(),
+        name='upload_session_complete'
+    ),
 ]
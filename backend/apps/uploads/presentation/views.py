@@ -4,14 +4,44 @@ Upload API Views
 
 CSV 파일 업로드 API 엔드포인트
 """
+import os
+
+from django.http import FileResponse
+from django.urls import reverse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import AllowAny  # 인증 없이 접근 허용
 
-from apps.uploads.presentation.serializers import FileUploadSerializer
+from apps.uploads.presentation.serializers import (
+    FileUploadSerializer,
+    UploadJobSerializer,
+    UploadPreviewSerializer,
+    UploadSessionCreateSerializer,
+    UploadSessionSerializer,
+)
+from apps.uploads.services.error_report import report_path
 from apps.uploads.services.file_processor import FileProcessorService
+from apps.uploads.services.upload_job_service import UploadJobService
+from apps.uploads.services.upload_preview_service import UploadPreviewService
+from apps.uploads.services.upload_session_service import UploadSessionService
+
+
+def _with_report_url(request, result: dict) -> dict:
+    """오류 리포트 ID를 다운로드 URL로 변환 (ZIP 묶음은 파일별 결과 포함)"""
+    for member in result.get('members', []):
+        _with_report_url(request, member)
+
+    if 'error_report' not in result:
+        return result
+
+    report_id = result.pop('error_report')
+    result['error_report_url'] = (
+        request.build_absolute_uri(reverse('uploads:upload_error_report', args=[report_id]))
+        if report_id else None
+    )
+    return result
 
 
 class FileUploadView(APIView):
@@ -19,8 +49,11 @@ class FileUploadView(APIView):
     CSV 파일 업로드 API
 
     POST /api/uploads/
-        - 4가지 타입의 CSV 파일 업로드
+        - 4가지 타입의 CSV(.csv, .csv.gz) / Excel(.xlsx) 파일 업로드
+        - ZIP 묶음: 파일별 데이터 유형을 파일명/헤더로 판별하여 동시에 처리 후 통합 결과 반환
         - 파싱, 검증, DB 저장까지 수행
+        - 이미 성공한 동일 파일(SHA-256)은 처리 없이 이전 결과 반환
+        - mode=partial: 유효한 행만 저장하고 건수와 오류 CSV 링크만 반환
 
     Note: 개발 환경에서는 인증 없이 테스트 가능하도록 AllowAny 설정
     """
@@ -33,8 +66,8 @@ class FileUploadView(APIView):
 
         Args:
             request: HTTP 요청
-                - file: CSV 파일
-                - data_type: 데이터 유형
+                - file: CSV(.csv, .csv.gz), Excel(.xlsx) 또는 ZIP 파일
+                - data_type: 데이터 유형 (ZIP은 생략)
 
         Returns:
             Response: 업로드 결과
@@ -52,11 +85,15 @@ class FileUploadView(APIView):
 
         # 2. 파일 처리
         file = serializer.validated_data['file']
-        data_type = serializer.validated_data['data_type']
+        data_type = serializer.validated_data.get('data_type')
+        mode = serializer.validated_data['mode']
+        uploaded_by = getattr(request.user, 'email', None) or 'anonymous'
 
         try:
             processor = FileProcessorService()
-            result = processor.process_file(file, data_type)
+            result = _with_report_url(
+                request, processor.process_file(file, data_type, uploaded_by, mode)
+            )
 
             # 3. 검증 실패 시
             if not result['success']:
@@ -84,3 +121,374 @@ class FileUploadView(APIView):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class UploadPreviewView(APIView):
+    """
+    업로드 미리보기(dry-run) API
+
+    POST /api/uploads/preview/
+        - 헤더와 앞쪽 N개 행만 읽어 필수 컬럼, 표본 행 검증 오류, 전체 행 수 추정값 반환
+        - DB에 저장하지 않으며 파일 크기와 관계없이 빠르게 응답
+    """
+    parser_classes = (MultiPartParser, FormParser)
+    permission_classes = [AllowAny]  # FileUploadView와 동일 (개발용)
+
+    def post(self, request):
+        """
+        업로드 미리보기
+
+        Args:
+            request: HTTP 요청
+                - file: CSV(.csv, .csv.gz) 또는 Excel(.xlsx) 파일
+                - data_type: 데이터 유형
+                - rows: 확인할 데이터 행 수 (기본 20)
+                - total_size: 원본 파일 크기 (파일 앞부분만 보낼 때)
+
+        Returns:
+            Response: 미리보기 결과 (문제가 있어도 200, success로 구분)
+        """
+        serializer = UploadPreviewSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'success': False,
+                    'errors': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = serializer.validated_data
+        try:
+            result = UploadPreviewService().preview(
+                data['file'], data['data_type'], data['rows'], data.get('total_size')
+            )
+        except ValueError as e:
+            return Response(
+                {
+                    'success': False,
+                    'errors': [str(e)]
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class UploadJobCreateView(APIView):
+    """
+    백그라운드 업로드 작업 등록 API
+
+    POST /api/uploads/jobs/
+        - 파일을 저장하고 작업 ID를 즉시 반환 (202 Accepted)
+        - 파싱, 검증, DB 저장은 업로드 워커가 수행
+          (python manage.py run_upload_worker)
+    """
+    parser_classes = (MultiPartParser, FormParser)
+    permission_classes = [AllowAny]  # FileUploadView와 동일 (개발용)
+
+    def post(self, request):
+        """
+        업로드 작업 등록
+
+        Args:
+            request: HTTP 요청
+                - file: CSV 또는 Excel(.xlsx) 파일
+                - data_type: 데이터 유형
+
+        Returns:
+            Response: 작업 상태 (202)
+        """
+        serializer = FileUploadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'success': False,
+                    'errors': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        file = serializer.validated_data['file']
+        data_type = serializer.validated_data.get('data_type')
+        mode = serializer.validated_data['mode']
+        uploaded_by = getattr(request.user, 'email', None) or 'anonymous'
+
+        try:
+            service = UploadJobService()
+            job = service.submit(file, data_type, uploaded_by, mode)
+        except ValueError as e:
+            return Response(
+                {
+                    'success': False,
+                    'errors': [str(e)]
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 동일 파일이 이미 처리된 경우 이전 작업 상태를 바로 반환
+        job_status = UploadJobSerializer(_with_report_url(request, service.get_status(job.id))).data
+        if job.status != 'pending':
+            return Response(job_status, status=status.HTTP_200_OK)
+
+        return Response(job_status, status=status.HTTP_202_ACCEPTED)
+
+
+class UploadJobStatusView(APIView):
+    """
+    백그라운드 업로드 작업 상태 조회 API
+
+    GET /api/uploads/jobs/<job_id>/
+        - 처리 단계, 단계별 행 수(파싱/검증/저장), 처리량(행/초) 반환
+    """
+    permission_classes = [AllowAny]  # FileUploadView와 동일 (개발용)
+
+    def get(self, request, job_id):
+        """
+        작업 상태 조회
+
+        Args:
+            request: HTTP 요청
+            job_id: 작업 ID
+
+        Returns:
+            Response: 작업 상태
+        """
+        job_status = UploadJobService().get_status(job_id)
+        if job_status is None:
+            return Response(
+                {
+                    'success': False,
+                    'errors': [f"업로드 작업을 찾을 수 없습니다: {job_id}"]
+                },
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        job_status = _with_report_url(request, job_status)
+        return Response(UploadJobSerializer(job_status).data, status=status.HTTP_200_OK)
+
+
+class UploadErrorReportView(APIView):
+    """
+    부분 성공 업로드 오류 리포트 다운로드 API
+
+    GET /api/uploads/errors/<report_id>/
+        - 거부된 행(원본 컬럼 + 원본 행 번호 + 오류 사유) CSV 다운로드
+    """
+    permission_classes = [AllowAny]  # FileUploadView와 동일 (개발용)
+
+    def get(self, request, report_id):
+        """
+        오류 CSV 다운로드
+
+        Args:
+            request: HTTP 요청
+            report_id: 오류 리포트 ID
+
+        Returns:
+            FileResponse: 오류 CSV 파일
+        """
+        path = report_path(report_id)
+        if path is None or not os.path.exists(path):
+            return Response(
+                {
+                    'success': False,
+                    'errors': [f"오류 리포트를 찾을 수 없습니다: {report_id}"]
+                },
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return FileResponse(
+            open(path, 'rb'),
+            as_attachment=True,
+            filename=f"upload_errors_{report_id}.csv",
+            content_type='text/csv; charset=utf-8'
+        )
+
+
+def _session_not_found(session_id) -> Response:
+    """업로드 세션 404 응답"""
+    return Response(
+        {
+            'success': False,
+            'errors': [f"업로드 세션을 찾을 수 없습니다: {session_id}"]
+        },
+        status=status.HTTP_404_NOT_FOUND
+    )
+
+
+class UploadSessionCreateView(APIView):
+    """
+    이어받기 업로드 세션 생성 API
+
+    POST /api/uploads/sessions/
+        - 요청 크기 제한(10MB)을 넘는 파일을 청크로 나누어 업로드하기 위한 세션 생성
+        - 응답의 chunk_size 단위로 PUT /api/uploads/sessions/<id>/chunks/<offset>/ 전송
+    """
+    permission_classes = [AllowAny]  # FileUploadView와 동일 (개발용)
+
+    def post(self, request):
+        """
+        세션 생성
+
+        Args:
+            request: HTTP 요청
+                - filename: 원본 파일명
+                - data_type: 데이터 유형 (ZIP 묶음은 POST /api/uploads/ 사용)
+                - total_size: 전체 파일 크기 (바이트)
+                - chunk_size: 희망 청크 크기 (선택)
+                - mode: 처리 모드 (선택)
+
+        Returns:
+            Response: 세션 상태 (201)
+        """
+        serializer = UploadSessionCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'success': False,
+                    'errors': serializer.errors
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = serializer.validated_data
+        uploaded_by = getattr(request.user, 'email', None) or 'anonymous'
+
+        try:
+            service = UploadSessionService()
+            session = service.create(
+                data['filename'],
+                data.get('data_type'),
+                data['total_size'],
+                uploaded_by,
+                data['mode'],
+                data.get('chunk_size')
+            )
+        except ValueError as e:
+            return Response(
+                {
+                    'success': False,
+                    'errors': [str(e)]
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            UploadSessionSerializer(service.get_status(session.id)).data,
+            status=status.HTTP_201_CREATED
+        )
+
+
+class UploadSessionDetailView(APIView):
+    """
+    이어받기 업로드 세션 상태 조회 API
+
+    GET /api/uploads/sessions/<session_id>/
+        - 수신 바이트 수와 아직 수신하지 않은 청크 오프셋 반환 (연결이 끊긴 뒤 재개용)
+    """
+    permission_classes = [AllowAny]  # FileUploadView와 동일 (개발용)
+
+    def get(self, request, session_id):
+        """
+        세션 상태 조회
+
+        Args:
+            request: HTTP 요청
+            session_id: 세션 ID
+
+        Returns:
+            Response: 세션 상태
+        """
+        session_status = UploadSessionService().get_status(session_id)
+        if session_status is None:
+            return _session_not_found(session_id)
+
+        return Response(UploadSessionSerializer(session_status).data, status=status.HTTP_200_OK)
+
+
+class UploadSessionChunkView(APIView):
+    """
+    이어받기 업로드 청크 전송 API
+
+    PUT /api/uploads/sessions/<session_id>/chunks/<offset>/
+        - 요청 본문: 청크 바이트 (application/octet-stream)
+        - X-Chunk-SHA256 헤더: 청크 SHA-256 (hex), 불일치 시 400
+        - 같은 청크를 다시 보내도 안전 (재시도)
+    """
+    permission_classes = [AllowAny]  # FileUploadView와 동일 (개발용)
+
+    def put(self, request, session_id, offset):
+        """
+        청크 기록
+
+        Args:
+            request: HTTP 요청 (본문: 청크 바이트)
+            session_id: 세션 ID
+            offset: 청크 시작 오프셋
+
+        Returns:
+            Response: 세션 상태
+        """
+        try:
+            session_status = UploadSessionService().write_chunk(
+                session_id, offset, request.body, request.headers.get('X-Chunk-SHA256', '')
+            )
+        except ValueError as e:
+            return Response(
+                {
+                    'success': False,
+                    'errors': [str(e)]
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if session_status is None:
+            return _session_not_found(session_id)
+
+        return Response(UploadSessionSerializer(session_status).data, status=status.HTTP_200_OK)
+
+
+class UploadSessionCompleteView(APIView):
+    """
+    이어받기 업로드 완료 API
+
+    POST /api/uploads/sessions/<session_id>/complete/
+        - 모든 청크 수신 확인 후 조립된 파일을 백그라운드 업로드 작업으로 등록 (202 Accepted)
+        - checksum (선택): 전체 파일 SHA-256, 전달 시 조립 결과 검증
+        - 응답은 POST /api/uploads/jobs/ 와 동일 (처리 결과는 GET /api/uploads/jobs/<job_id>/)
+        - 작업이 실패하면 세션이 'failed'가 되며 다시 완료 요청할 수 있음
+    """
+    permission_classes = [AllowAny]  # FileUploadView와 동일 (개발용)
+
+    def post(self, request, session_id):
+        """
+        업로드 완료
+
+        Args:
+            request: HTTP 요청
+                - checksum: 전체 파일 SHA-256 (선택)
+            session_id: 세션 ID
+
+        Returns:
+            Response: 작업 상태 (202, 이미 처리된 동일 파일이면 이전 작업 상태 200)
+        """
+        try:
+            job_status = UploadSessionService().complete(session_id, request.data.get('checksum'))
+        except ValueError as e:
+            return Response(
+                {
+                    'success': False,
+                    'errors': [str(e)]
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if job_status is None:
+            return _session_not_found(session_id)
+
+        job_status = UploadJobSerializer(_with_report_url(request, job_status)).data
+        if job_status['status'] != 'pending':
+            return Response(job_status, status=status.HTTP_200_OK)
+
+        return Response(job_status, status=status.HTTP_202_ACCEPTED)
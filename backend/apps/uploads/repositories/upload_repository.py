@@ -1,16 +1,25 @@
 """
 업로드 Repository
 
-업로드 파일 메타데이터 저장 및 조회
+업로드 이력 및 백그라운드 업로드 작업(job) 저장/조회
 """
-from typing import Optional, List
 from datetime import datetime
+from typing import Optional, List
+
+from django.db.models import F, Q
+from django.utils import timezone
+
 from apps.uploads.domain.models import UploadRecord
-from apps.uploads.persistence.models import UploadedFile
+from apps.uploads.persistence.models import UploadHistory
 
 
 class UploadRepository:
-    """업로드 Repository"""
+    """
+    업로드 Repository
+
+    UploadHistory 테이블을 업로드 작업 큐로도 사용합니다.
+    (status='pending' 행이 대기 중인 작업)
+    """
 
     def create_upload_record(self, upload_data: UploadRecord) -> UploadRecord:
         """
@@ -22,15 +31,19 @@ class UploadRepository:
         Returns:
             생성된 업로드 레코드 (ID 포함)
         """
-        orm_obj = UploadedFile.objects.create(
-            filename=upload_data.filename,
+        orm_obj = UploadHistory.objects.create(
+            file_name=upload_data.filename,
             data_type=upload_data.data_type,
-            file_size=upload_data.file_size,
             rows_processed=upload_data.rows_processed,
-            rows_failed=upload_data.rows_failed,
             uploaded_by=upload_data.uploaded_by,
             status=upload_data.status,
+            stage=upload_data.stage,
             error_message=upload_data.error_message,
+            stored_file=upload_data.stored_file,
+            content_hash=upload_data.content_hash,
+            mode=upload_data.mode,
+            rows_rejected=upload_data.rows_rejected,
+            error_report=upload_data.error_report,
         )
 
         return self._to_domain(orm_obj)
@@ -49,7 +62,7 @@ class UploadRepository:
             (upload_records, total_count) 튜플
         """
         offset = (page - 1) * page_size
-        queryset = UploadedFile.objects.all()
+        queryset = UploadHistory.objects.all()
 
         total_count = queryset.count()
         records = queryset[offset : offset + page_size]
@@ -57,22 +70,33 @@ class UploadRepository:
         return [self._to_domain(record) for record in records], total_count
 
     def update_upload_status(
-        self, upload_id: int, status: str, rows_processed: int, rows_failed: int = 0
+        self,
+        upload_id: int,
+        status: str,
+        rows_processed: int,
+        error_message: Optional[str] = None,
+        rows_rejected: int = 0,
+        error_report: Optional[str] = None
     ) -> None:
         """
-        업로드 상태 업데이트
+        업로드 상태 업데이트 (처리 종료)
 
         Args:
             upload_id: 업로드 ID
             status: 상태 ('success', 'failed', 'partial')
-            rows_processed: 처리된 행 수
-            rows_failed: 실패한 행 수
+            rows_processed: DB에 저장된 행 수
+            error_message: 오류 메시지 (실패 시)
+            rows_rejected: 거부된 행 수 (partial 모드)
+            error_report: 오류 CSV ID (partial 모드)
         """
-        UploadedFile.objects.filter(id=upload_id).update(
+        UploadHistory.objects.filter(id=upload_id).update(
             status=status,
+            stage='done',
             rows_processed=rows_processed,
-            rows_failed=rows_failed,
-            completed_at=datetime.now()
+            error_message=error_message,
+            rows_rejected=rows_rejected,
+            error_report=error_report,
+            finished_at=timezone.now()
         )
 
     def get_by_id(self, upload_id: int) -> Optional[UploadRecord]:
@@ -86,23 +110,189 @@ class UploadRepository:
             UploadRecord 또는 None
         """
         try:
-            orm_obj = UploadedFile.objects.get(id=upload_id)
+            orm_obj = UploadHistory.objects.get(id=upload_id)
             return self._to_domain(orm_obj)
-        except UploadedFile.DoesNotExist:
+        except UploadHistory.DoesNotExist:
             return None
 
-    def _to_domain(self, orm_obj: UploadedFile) -> UploadRecord:
+    def find_completed_by_hash(self, data_type: str, content_hash: str) -> Optional[UploadRecord]:
+        """
+        같은 내용으로 성공한 이전 업로드 조회
+
+        Args:
+            data_type: 데이터 유형
+            content_hash: 파일 내용 SHA-256
+
+        Returns:
+            가장 최근에 성공한 업로드 레코드 또는 None
+        """
+        orm_obj = (
+            UploadHistory.objects
+            .filter(data_type=data_type, content_hash=content_hash, status='success')
+            .order_by('-uploaded_at', '-id')
+            .first()
+        )
+        return self._to_domain(orm_obj) if orm_obj else None
+
+    # ========== 업로드 작업 큐 ==========
+
+    def create_job(
+        self,
+        filename: str,
+        data_type: str,
+        uploaded_by: str,
+        stored_file: str,
+        content_hash: Optional[str] = None,
+        mode: str = 'strict'
+    ) -> UploadRecord:
+        """
+        대기 중인 업로드 작업 생성
+
+        Args:
+            filename: 원본 파일명
+            data_type: 데이터 유형
+            uploaded_by: 업로드 사용자
+            stored_file: 워커가 처리할 저장 파일 경로
+            content_hash: 파일 내용 SHA-256
+            mode: 처리 모드 ('strict', 'partial')
+
+        Returns:
+            생성된 작업 (status='pending')
+        """
+        return self.create_upload_record(
+            UploadRecord(
+                id=None,
+                filename=filename,
+                data_type=data_type,
+                rows_processed=0,
+                uploaded_at=timezone.now(),
+                uploaded_by=uploaded_by,
+                status='pending',
+                stage='queued',
+                stored_file=stored_file,
+                content_hash=content_hash,
+                mode=mode,
+            )
+        )
+
+    def claim_next_job(self) -> Optional[UploadRecord]:
+        """
+        가장 오래된 대기 작업을 처리 중으로 전환하고 반환
+
+        조건부 UPDATE(status='pending')로 선점하므로 여러 워커가 동시에
+        실행되어도 같은 작업을 두 번 처리하지 않습니다.
+
+        Returns:
+            선점한 작업 또는 None (대기 작업 없음)
+        """
+        pending = UploadHistory.objects.filter(status='pending').order_by('uploaded_at', 'id')
+
+        for job_id in pending.values_list('id', flat=True)[:10]:
+            now = timezone.now()
+            claimed = UploadHistory.objects.filter(id=job_id, status='pending').update(
+                status='processing',
+                stage='parsing',
+                started_at=now,
+                heartbeat_at=now,
+                attempts=F('attempts') + 1
+            )
+            if claimed:
+                return self.get_by_id(job_id)
+
+        return None
+
+    def heartbeat(self, job_id: int) -> None:
+        """처리 중인 작업의 워커 확인 시각 갱신"""
+        UploadHistory.objects.filter(id=job_id, status='processing').update(heartbeat_at=timezone.now())
+
+    def find_stale_jobs(self, before: datetime) -> List[UploadRecord]:
+        """
+        워커 확인 시각이 before보다 오래된 처리 중 작업 (워커가 비정상 종료된 작업)
+
+        Args:
+            before: 기준 시각
+
+        Returns:
+            List[UploadRecord]: 오래된 처리 중 작업 목록
+        """
+        return [self._to_domain(orm_obj) for orm_obj in self._stale(before)]
+
+    def requeue_stale_job(self, job_id: int, before: datetime) -> bool:
+        """
+        오래된 처리 중 작업을 다시 대기 상태로 전환
+
+        조건부 UPDATE이므로 여러 워커가 동시에 호출해도 한 번만 전환되며,
+        그 사이 워커 확인 시각이 갱신된 작업과 청크를 커밋하기 시작한 partial 작업
+        (UploadRecord.can_rerun 참고)은 전환하지 않습니다.
+
+        Returns:
+            bool: 전환했으면 True
+        """
+        return self._stale(before).filter(id=job_id).exclude(mode='partial', stage='inserting').update(
+            status='pending',
+            stage='queued',
+            started_at=None,
+            heartbeat_at=None,
+            rows_parsed=0,
+            rows_validated=0,
+            rows_processed=0,
+            rows_rejected=0
+        ) == 1
+
+    def fail_stale_job(self, job_id: int, before: datetime, error_message: str) -> bool:
+        """
+        오래된 처리 중 작업을 실패로 종료 (재시도 횟수를 모두 쓴 경우)
+
+        Returns:
+            bool: 종료했으면 True
+        """
+        return self._stale(before).filter(id=job_id).update(
+            status='failed',
+            stage='done',
+            error_message=error_message,
+            finished_at=timezone.now()
+        ) == 1
+
+    def _stale(self, before: datetime):
+        """워커 확인 시각(기록 전이면 시작 시각)이 before보다 오래된 처리 중 작업"""
+        return UploadHistory.objects.filter(status='processing').filter(
+            Q(heartbeat_at__lt=before) | Q(heartbeat_at__isnull=True, started_at__lt=before)
+        )
+
+    def update_progress(self, upload_id: int, stage: str, **counts: int) -> None:
+        """
+        작업 진행 상황 업데이트
+
+        Args:
+            upload_id: 업로드 ID
+            stage: 현재 처리 단계
+            **counts: rows_parsed / rows_validated / rows_processed / rows_rejected
+        """
+        allowed = {'rows_parsed', 'rows_validated', 'rows_processed', 'rows_rejected'}
+        fields = {name: value for name, value in counts.items() if name in allowed}
+        UploadHistory.objects.filter(id=upload_id).update(stage=stage, **fields)
+
+    def _to_domain(self, orm_obj: UploadHistory) -> UploadRecord:
         """ORM 모델 → 도메인 모델 변환"""
         return UploadRecord(
             id=orm_obj.id,
-            filename=orm_obj.filename,
+            filename=orm_obj.file_name,
             data_type=orm_obj.data_type,
-            file_size=orm_obj.file_size,
             rows_processed=orm_obj.rows_processed,
-            rows_failed=orm_obj.rows_failed,
-            uploaded_at=orm_obj.created_at,
+            uploaded_at=orm_obj.uploaded_at,
             uploaded_by=orm_obj.uploaded_by,
             status=orm_obj.status,
+            stage=orm_obj.stage,
+            rows_parsed=orm_obj.rows_parsed,
+            rows_validated=orm_obj.rows_validated,
             error_message=orm_obj.error_message,
-            completed_at=orm_obj.completed_at,
+            stored_file=orm_obj.stored_file,
+            started_at=orm_obj.started_at,
+            finished_at=orm_obj.finished_at,
+            content_hash=orm_obj.content_hash,
+            mode=orm_obj.mode,
+            rows_rejected=orm_obj.rows_rejected,
+            error_report=orm_obj.error_report,
+            heartbeat_at=orm_obj.heartbeat_at,
+            attempts=orm_obj.attempts,
         )
@@ -0,0 +1,148 @@
+"""
+업로드 세션 Repository
+
+이어받기(resumable) 업로드 세션과 수신 청크 저장/조회
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+
+from apps.uploads.domain.models import UploadSession
+from apps.uploads.persistence.models import UploadSession as UploadSessionORM
+from apps.uploads.persistence.models import UploadSessionChunk
+
+
+class UploadSessionRepository:
+    """업로드 세션 Repository"""
+
+    def create(
+        self,
+        filename: str,
+        data_type: Optional[str],
+        mode: str,
+        total_size: int,
+        chunk_size: int,
+        uploaded_by: str,
+        expires_at: datetime
+    ) -> UploadSession:
+        """
+        업로드 세션 생성
+
+        Returns:
+            생성된 세션 (status='open')
+        """
+        orm_obj = UploadSessionORM.objects.create(
+            file_name=filename,
+            data_type=data_type,
+            mode=mode,
+            total_size=total_size,
+            chunk_size=chunk_size,
+            uploaded_by=uploaded_by,
+            expires_at=expires_at,
+        )
+        return self._to_domain(orm_obj, [])
+
+    def get_by_id(self, session_id: str) -> Optional[UploadSession]:
+        """
+        세션 조회 (수신 청크 번호 포함)
+
+        Args:
+            session_id: 세션 ID (UUID 문자열)
+
+        Returns:
+            세션 또는 None (존재하지 않거나 ID 형식이 잘못된 경우)
+        """
+        try:
+            orm_obj = UploadSessionORM.objects.get(id=session_id)
+        except (UploadSessionORM.DoesNotExist, DjangoValidationError):
+            return None
+
+        received = list(orm_obj.chunks.values_list('index', flat=True))
+        return self._to_domain(orm_obj, received)
+
+    def get_chunk_checksum(self, session_id: str, index: int) -> Optional[str]:
+        """수신 완료 청크의 SHA-256 (미수신이면 None)"""
+        return (
+            UploadSessionChunk.objects
+            .filter(session_id=session_id, index=index)
+            .values_list('checksum', flat=True)
+            .first()
+        )
+
+    def add_chunk(self, session_id: str, index: int, size: int, checksum: str) -> bool:
+        """
+        수신 청크 기록
+
+        같은 청크가 동시에 기록되면 먼저 기록된 것을 유지합니다.
+        호출한 쪽의 트랜잭션 안에서 호출하면 그 트랜잭션이 끝날 때까지 같은 청크의 기록은 대기합니다.
+
+        Returns:
+            bool: 새로 기록되었으면 True
+        """
+        try:
+            with transaction.atomic():
+                UploadSessionChunk.objects.create(
+                    session_id=session_id, index=index, size=size, checksum=checksum
+                )
+        except IntegrityError:
+            return False
+        return True
+
+    def update_status(self, session_id: str, status: str) -> None:
+        """세션 상태 업데이트"""
+        UploadSessionORM.objects.filter(id=session_id).update(status=status)
+
+    def claim_for_completion(self, session_id: str) -> bool:
+        """
+        완료 처리 선점 (status='open'/'failed' → 'completed' 조건부 업데이트)
+
+        같은 세션에 대한 중복 완료 요청 중 하나만 True를 받습니다.
+        """
+        return UploadSessionORM.objects.filter(
+            id=session_id, status__in=('open', 'failed')
+        ).update(status='completed') == 1
+
+    def set_job(self, session_id: str, job_id: int) -> None:
+        """완료 시 등록된 업로드 작업 기록"""
+        UploadSessionORM.objects.filter(id=session_id).update(job_id=job_id)
+
+    def fail_for_job(self, job_id: int) -> bool:
+        """
+        작업이 실패한 세션을 다시 완료할 수 있도록 'failed'로 전환
+
+        Returns:
+            bool: 작업에 연결된 세션이 있었으면 True
+        """
+        return UploadSessionORM.objects.filter(job_id=job_id, status='completed').update(status='failed') > 0
+
+    def find_expired_ids(self, now: datetime) -> List[str]:
+        """만료된 open/failed 세션 ID 목록"""
+        return [
+            str(session_id)
+            for session_id in UploadSessionORM.objects.filter(
+                status__in=('open', 'failed'), expires_at__lt=now
+            ).values_list('id', flat=True)
+        ]
+
+    def delete(self, session_ids: List[str]) -> None:
+        """세션 삭제 (청크 기록 포함)"""
+        UploadSessionORM.objects.filter(id__in=session_ids).delete()
+
+    def _to_domain(self, orm_obj: UploadSessionORM, received: List[int]) -> UploadSession:
+        """ORM 모델 → 도메인 모델 변환"""
+        return UploadSession(
+            id=str(orm_obj.id),
+            filename=orm_obj.file_name,
+            data_type=orm_obj.data_type,
+            mode=orm_obj.mode,
+            total_size=orm_obj.total_size,
+            chunk_size=orm_obj.chunk_size,
+            status=orm_obj.status,
+            uploaded_by=orm_obj.uploaded_by,
+            created_at=orm_obj.created_at,
+            expires_at=orm_obj.expires_at,
+            received_chunks=sorted(received),
+            job_id=orm_obj.job_id,
+        )
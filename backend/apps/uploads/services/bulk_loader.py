@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""
+Bulk Loader
+
+환경 초기화/갱신용 대량 적재 (python manage.py bulk_load).
+
+CSV(.csv, .csv.gz) / Excel(.xlsx) / Parquet 파일을 스키마 레지스트리의 파서로 변환하고,
+PostgreSQL에서는 COPY FROM STDIN으로, 그 밖의 DB에서는 배치 bulk_create로 저장합니다.
+보조 인덱스 재생성과 ANALYZE는 적재가 끝난 뒤 한 번만 수행합니다.
+
+여러 테이블은 별도 프로세스에서 병렬로 적재할 수 있도록, Django 모델은
+함수 안에서 import합니다 (bundle_worker와 동일한 방식).
+"""
+import csv
+import io
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+import pandas as pd
+
+from apps.uploads.services import bundle_worker
+
+# Parquet 파일 서명
+PARQUET_SIGNATURE = b'PAR1'
+
+# COPY csv 형식의 NULL 표기 (빈 문자열과 구분)
+COPY_NULL = '\\N'
+
+
+class BulkLoadResult(NamedTuple):
+    """
+    테이블 하나의 적재 결과
+
+    Attributes:
+        data_type: 데이터 유형
+        path: 원본 파일 경로
+        rows: 적재한 행 수
+        seconds: 읽기부터 ANALYZE까지 걸린 시간
+        method: 저장 방식 ('copy' 또는 'bulk_create')
+    """
+    data_type: str
+    path: str
+    rows: int
+    seconds: float
+    method: str
+
+    @property
+    def rows_per_second(self) -> int:
+        return int(self.rows / self.seconds) if self.seconds > 0 else self.rows
+
+
+class BulkLoader:
+    """
+    대량 적재기
+
+    Attributes:
+        batch_size: COPY / bulk_create 한 번에 보내는 행 수
+        replace: 적재 전 기존 데이터 삭제 여부
+        defer_indexes: 적재 동안 보조 인덱스(Meta.indexes)를 지웠다가 끝난 뒤 다시 생성
+        validate: DataValidator 검증 수행 여부
+    """
+
+    DEFAULT_BATCH_SIZE = 5000
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        replace: bool = True,
+        defer_indexes: bool = False,
+        validate: bool = True,
+        using: str = 'default'
+    ):
+        self.batch_size = max(1, batch_size)
+        self.replace = replace
+        self.defer_indexes = defer_indexes
+        self.validate = validate
+        self.using = using
+
+    def load(self, data_type: str, path: str) -> BulkLoadResult:
+        """
+        파일 하나를 데이터 유형 테이블에 적재
+
+        Args:
+            data_type: 데이터 유형
+            path: 파일 경로 (CSV / CSV.GZ / XLSX / Parquet)
+
+        Returns:
+            BulkLoadResult
+
+        Raises:
+            ValueError: 지원하지 않는 데이터 유형, 읽을 수 없는 파일, 변환/검증 오류,
+                DB 제약 조건 위반 (추가 모드의 중복 등)
+        """
+        from django.db import DataError, IntegrityError, connections, transaction
+
+        from apps.uploads.services.file_processor import FileProcessorService
+
+        started = time.perf_counter()
+        if data_type not in FileProcessorService.PARSER_MAP:
+            raise ValueError(f"지원하지 않는 데이터 타입입니다: {data_type}")
+
+        rows = self._parse(data_type, self.read_frame(path))
+        model = self._model(data_type)
+        connection = connections[self.using]
+        method = 'copy' if connection.vendor == 'postgresql' else 'bulk_create'
+
+        indexes = list(model._meta.indexes) if self.defer_indexes else []
+        self._edit_indexes(model, indexes, 'remove_index')
+        try:
+            with transaction.atomic(using=self.using):
+                if self.replace:
+                    self._clear(model, connection)
+                if method == 'copy':
+                    self._copy(model, rows, connection)
+                else:
+                    self._bulk_create(model, rows)
+        except (IntegrityError, DataError) as e:
+            raise ValueError(f"[{data_type}] DB 저장 오류: {str(e)}")
+        finally:
+            self._edit_indexes(model, indexes, 'add_index')
+
+        self._analyze(model, connection)
+        return BulkLoadResult(data_type, str(path), len(rows), time.perf_counter() - started, method)
+
+    def load_many(self, tasks: Sequence[Tuple[str, str]], workers: int = 1) -> List[BulkLoadResult]:
+        """
+        여러 파일을 테이블별 프로세스에서 병렬 적재
+
+        워커가 1개 이하이거나 파일이 하나뿐이면, 또는 SQLite이면 현재 프로세스에서 적재합니다.
+
+        Args:
+            tasks: (데이터 유형, 파일 경로) 목록 (데이터 유형은 중복 불가)
+            workers: 최대 프로세스 수
+
+        Returns:
+            List[BulkLoadResult]: tasks 순서의 결과
+        """
+        data_types = [data_type for data_type, _ in tasks]
+        if len(set(data_types)) != len(data_types):
+            raise ValueError("같은 데이터 유형을 두 번 적재할 수 없습니다")
+
+        from django.db import connections
+
+        workers = min(workers, len(tasks))
+        # SQLite는 동시에 하나의 쓰기 트랜잭션만 허용하므로 순차 적재
+        if workers <= 1 or connections[self.using].vendor == 'sqlite':
+            return [self.load(data_type, path) for data_type, path in tasks]
+
+        # 부모 프로세스의 연결을 닫아 워커와 공유하지 않도록 함
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=bundle_worker.init_worker
+        ) as pool:
+            options = self._options()
+            return list(pool.map(
+                load_table, [options] * len(tasks), data_types, [path for _, path in tasks]
+            ))
+
+    @staticmethod
+    def read_frame(path: str) -> pd.DataFrame:
+        """
+        파일을 DataFrame으로 읽기 (Parquet은 서명으로 판별)
+
+        Raises:
+            ValueError: 읽을 수 없는 파일 또는 Parquet 엔진(pyarrow) 미설치
+        """
+        from apps.uploads.services.parsers.source import read_table
+
+        with open(path, 'rb') as stream:
+            is_parquet = stream.read(len(PARQUET_SIGNATURE)) == PARQUET_SIGNATURE
+
+        if not is_parquet:
+            return read_table(path)
+
+        try:
+            return pd.read_parquet(path)
+        except ImportError as e:
+            raise ValueError(f"Parquet 파일을 읽으려면 pyarrow가 필요합니다: {str(e)}")
+
+    @staticmethod
+    def _model(data_type: str):
+        """데이터 유형 → ORM 모델"""
+        from apps.dashboard.persistence.models import DepartmentKPI, Publication, ResearchProject, Student
+
+        return {
+            'department_kpi': DepartmentKPI,
+            'publication': Publication,
+            'research_project': ResearchProject,
+            'student_roster': Student,
+        }[data_type]
+
+    def _options(self) -> Dict:
+        """워커 프로세스에 전달할 생성 인자"""
+        return {
+            'batch_size': self.batch_size,
+            'replace': self.replace,
+            'defer_indexes': self.defer_indexes,
+            'validate': self.validate,
+            'using': self.using,
+        }
+
+    def _parse(self, data_type: str, frame: pd.DataFrame) -> List[Dict]:
+        """파서 변환 + 검증 (첫 오류에서 중단)"""
+        from apps.uploads.services.data_validator import DataValidator
+        from apps.uploads.services.file_processor import FileProcessorService
+
+        rows = FileProcessorService.PARSER_MAP[data_type].parse_frame(frame)
+
+        if self.validate:
+            report = DataValidator.validate(data_type, rows, max_errors=10)
+            if not report.is_valid:
+                raise ValueError(f"데이터 검증 실패: {'; '.join(report.errors)}")
+
+        return rows
+
+    def clear(self, data_type: str) -> None:
+        """데이터 유형 테이블 비우기 (트랜잭션 안에서 호출하면 롤백 가능)"""
+        from django.db import connections
+
+        self._clear(self._model(data_type), connections[self.using])
+
+    def _clear(self, model, connection) -> None:
+        """기존 데이터 삭제 (PostgreSQL은 TRUNCATE)"""
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f"TRUNCATE TABLE {connection.ops.quote_name(model._meta.db_table)}")
+        else:
+            model.objects.using(self.using).all().delete()
+
+    def _bulk_create(self, model, rows: List[Dict]) -> None:
+        """배치 bulk_create"""
+        manager = model.objects.using(self.using)
+        for start in range(0, len(rows), self.batch_size):
+            manager.bulk_create(
+                [model(**row) for row in rows[start:start + self.batch_size]],
+                batch_size=self.batch_size
+            )
+
+    def _copy(self, model, rows: List[Dict], connection) -> None:
+        """COPY ... FROM STDIN (csv) 배치 전송"""
+        from django.utils import timezone
+
+        if not rows:
+            return
+
+        names = list(rows[0])
+        quote = connection.ops.quote_name
+        columns = [model._meta.get_field(name).column for name in names] + ['created_at', 'updated_at']
+        sql = (
+            f"COPY {quote(model._meta.db_table)} ({', '.join(map(quote, columns))}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+        )
+        now = timezone.now()
+
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+            for start in range(0, len(rows), self.batch_size):
+                buffer = self._copy_buffer(rows[start:start + self.batch_size], names, now)
+                if hasattr(raw, 'copy_expert'):
+                    # psycopg2
+                    raw.copy_expert(sql, buffer)
+                else:
+                    # psycopg 3
+                    with raw.copy(sql) as copy:
+                        copy.write(buffer.getvalue())
+
+    @staticmethod
+    def _copy_buffer(rows: List[Dict], names: List[str], now) -> io.StringIO:
+        """COPY csv 본문 (None은 COPY_NULL)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(
+            [COPY_NULL if row[name] is None else row[name] for name in names] + [now, now]
+            for row in rows
+        )
+        buffer.seek(0)
+        return buffer
+
+    def _edit_indexes(self, model, indexes: List, operation: str) -> None:
+        """보조 인덱스 삭제/생성 (remove_index / add_index)"""
+        if not indexes:
+            return
+
+        from django.db import connections
+
+        with connections[self.using].schema_editor() as editor:
+            for index in indexes:
+                getattr(editor, operation)(model, index)
+
+    @staticmethod
+    def _analyze(model, connection) -> None:
+        """통계 갱신 (PostgreSQL / SQLite)"""
+        if connection.vendor not in ('postgresql', 'sqlite'):
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+
+
+def load_table(options: Dict, data_type: str, path: str) -> BulkLoadResult:
+    """워커 프로세스 진입점 (테이블 하나 적재)"""
+    return BulkLoader(**options).load(data_type, path)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+ZIP 묶음 업로드 워커
+
+ZIP 묶음의 각 파일을 별도 프로세스에서 처리하기 위한 함수입니다.
+워커 프로세스는 spawn 방식으로 시작되므로, 이 모듈은 Django 초기화 전에
+import될 수 있도록 모델을 함수 안에서 import합니다.
+"""
+import hashlib
+import io
+import logging
+import zipfile
+from typing import BinaryIO, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def init_worker() -> None:
+    """워커 프로세스 초기화 (Django 설정 로드, DB 연결은 프로세스별로 새로 생성)"""
+    import django
+
+    django.setup()
+
+
+def process_member(archive_path: str, member: str, data_type: str, mode: str) -> Dict:
+    """
+    ZIP 묶음의 파일 하나를 파싱 → 검증 → DB 저장
+
+    파일은 ZIP에서 스트리밍으로 압축을 풀며 읽습니다 (임시 파일로 풀지 않음).
+    업로드 이력의 content_hash용 SHA-256은 파서가 읽는 동안 HashingReader로 함께 계산합니다.
+    처리 중 어떤 예외가 나도 다른 파일의 처리에 영향을 주지 않도록 실패 결과로 돌려줍니다.
+
+    Args:
+        archive_path: ZIP 파일 경로
+        member: ZIP 내부 파일명
+        data_type: 판별된 데이터 유형
+        mode: 처리 모드 ('strict' 또는 'partial')
+
+    Returns:
+        Dict: 업로드 결과 (FileProcessorService.process_source와 동일한 형식)
+            + 'content_hash': 파일 내용 SHA-256 (ZIP에서 읽지 못하면 None)
+    """
+    from apps.uploads.services.file_processor import FileProcessorService
+
+    content_hash = None
+    try:
+        with zipfile.ZipFile(archive_path) as archive, archive.open(member) as stream:
+            reader = HashingReader(stream)
+            try:
+                result = FileProcessorService().process_source(reader, member, data_type, mode=mode)
+            finally:
+                content_hash = reader.hexdigest()
+    except ValueError as e:
+        result = failed_member(member, data_type, str(e))
+    except Exception as e:
+        logger.exception("ZIP 묶음 파일 처리 실패: %s", member)
+        result = failed_member(member, data_type, f"파일 처리 중 오류가 발생했습니다: {e}")
+
+    result['content_hash'] = content_hash
+    return result
+
+
+class HashingReader(io.RawIOBase):
+    """
+    읽는 동안 내용의 SHA-256을 계산하는 되감기 가능한 스트림
+
+    앞에서부터 이어지는 구간만 해시에 더하므로 되감아 다시 읽은 부분(인코딩 판별 등)은 두 번 더하지 않습니다.
+    CSV처럼 처음부터 끝까지 읽으면 압축은 한 번만 풀리며, 파서가 건너뛰거나 읽지 않은 나머지는
+    hexdigest()가 이어서 읽어 계산합니다 (xlsx는 ZIP 구조를 임의 위치에서 읽으므로 이때 다시 풉니다).
+    """
+
+    def __init__(self, stream: BinaryIO):
+        super().__init__()
+        self._stream = stream
+        self._digest = hashlib.sha256()
+        self._hashed = 0  # 해시에 더한 앞부분 길이
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def readinto(self, target) -> int:
+        start = self._stream.tell()
+        data = self._stream.read(len(target))
+        size = len(data)
+        target[:size] = data
+        if start <= self._hashed < start + size:
+            self._digest.update(memoryview(data)[self._hashed - start:])
+            self._hashed = start + size
+        return size
+
+    def hexdigest(self) -> str:
+        """전체 내용의 SHA-256 (아직 해시에 더하지 않은 나머지를 1MB씩 읽어 계산)"""
+        self._stream.seek(self._hashed)
+        for block in iter(lambda: self._stream.read(1024 * 1024), b''):
+            self._digest.update(block)
+            self._hashed += len(block)
+        return self._digest.hexdigest()
+
+
+def failed_member(member: str, data_type: str, error: str) -> Dict:
+    """처리하지 못한 파일의 업로드 결과"""
+    return {
+        'success': False,
+        'filename': member,
+        'data_type': data_type,
+        'rows_processed': 0,
+        'errors': [error]
+    }
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+업로드 오류 리포트
+
+부분 성공 업로드에서 거부된 행과 사유를 CSV로 기록합니다.
+원본 컬럼을 그대로 유지하므로 수정 후 오류 리포트 파일을 다시 업로드할 수 있습니다
+(추가 컬럼인 '원본 행', '오류 사유'는 파서가 무시함).
+"""
+import csv
+import os
+import re
+import uuid
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+# 오류 리포트 ID 형식 (uuid4 hex)
+REPORT_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+
+class ErrorReportWriter:
+    """
+    거부된 행 오류 CSV 작성기
+
+    첫 번째 거부 행이 기록될 때 파일을 생성하며, 거부 행이 없으면 파일을 만들지 않습니다.
+    """
+
+    LINE_COLUMN = '원본 행'
+    REASON_COLUMN = '오류 사유'
+
+    def __init__(self, columns: List[str]):
+        """
+        Args:
+            columns: 원본 CSV 컬럼 목록
+        """
+        self.columns = list(columns)
+        self.report_id: Optional[str] = None
+        self.rejected_count = 0
+        self._file = None
+        self._writer = None
+
+    def __enter__(self) -> 'ErrorReportWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def write(self, line: int, values: Dict[str, Any], reason: str) -> None:
+        """
+        거부된 행 기록
+
+        Args:
+            line: 원본 파일 행 번호
+            values: 원본 컬럼명 → 값
+            reason: 거부 사유
+        """
+        if self._writer is None:
+            self._open()
+
+        self._writer.writerow(
+            [line]
+            + ['' if values.get(column) is None else values[column] for column in self.columns]
+            + [reason]
+        )
+        self.rejected_count += 1
+
+    def close(self) -> Optional[str]:
+        """
+        파일 닫기
+
+        Returns:
+            오류 리포트 ID (거부 행이 없으면 None)
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return self.report_id
+
+    def _open(self) -> None:
+        report_dir = str(settings.UPLOAD_ERROR_REPORT_DIR)
+        os.makedirs(report_dir, exist_ok=True)
+
+        self.report_id = uuid.uuid4().hex
+        # utf-8-sig: Excel에서 한글이 깨지지 않도록 BOM 포함
+        self._file = open(
+            report_path(self.report_id), 'w', encoding='utf-8-sig', newline=''
+        )
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([self.LINE_COLUMN] + self.columns + [self.REASON_COLUMN])
+
+
+def report_path(report_id: str) -> Optional[str]:
+    """
+    오류 리포트 파일 경로
+
+    Args:
+        report_id: 오류 리포트 ID
+
+    Returns:
+        파일 경로 (ID 형식이 올바르지 않으면 None)
+    """
+    if not REPORT_ID_PATTERN.fullmatch(report_id or ''):
+        return None
+    return os.path.join(str(settings.UPLOAD_ERROR_REPORT_DIR), f"{report_id}.csv")
@@ -2,22 +2,37 @@
 Excel 파서
 
 openpyxl을 사용하여 Excel 파일을 파싱합니다.
+
+워크북은 읽기 전용(read_only) + 값 전용(values_only) 모드로 열어
+셀 객체를 만들지 않고 행 튜플을 순서대로 읽습니다.
 """
+import zipfile
+from itertools import islice
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
 import openpyxl
-from typing import List, Dict
+import pandas as pd
+from openpyxl.utils.exceptions import InvalidFileException
+
 from apps.uploads.domain.models import ParsedData
 from apps.core.exceptions import ValidationError
 
+# xlsx 파일은 ZIP 컨테이너
+XLSX_SIGNATURE = b'PK\x03\x04'
+
 
 class ExcelParser:
     """Excel 파일 파서"""
 
-    def parse(self, file_path: str) -> ParsedData:
+    # DataFrame으로 변환할 때 한 번에 모으는 행 수
+    CHUNK_SIZE = 10000
+
+    def parse(self, file_path: Union[str, BinaryIO]) -> ParsedData:
         """
         Excel 파일 파싱
 
         Args:
-            file_path: Excel 파일 경로
+            file_path: Excel 파일 경로 또는 바이너리 스트림
 
         Returns:
             ParsedData: 헤더, 데이터 행, 총 행 수
@@ -26,45 +41,128 @@ class ExcelParser:
             ValidationError: 파일 파싱 실패 시
         """
         try:
-            workbook = openpyxl.load_workbook(file_path)
-            worksheet = workbook.active
-
-            headers = self._extract_headers(worksheet)
-            rows = self._extract_rows(worksheet, start_row=2)
+            headers, row_iter = self.iter_rows(file_path)
+            rows = self._extract_rows(headers, row_iter)
 
             if not rows:
                 raise ValidationError("파일이 비어있습니다")
 
             return ParsedData(headers=headers, rows=rows, total_rows=len(rows))
 
-        except openpyxl.utils.exceptions.InvalidFileException:
+        except ValidationError:
+            raise
+        except InvalidFileException:
             raise ValidationError("파일이 손상되었거나 올바른 Excel 형식이 아닙니다")
         except Exception as e:
             raise ValidationError(f"파일 파싱 중 오류 발생: {str(e)}")
 
-    def _extract_headers(self, worksheet) -> List[str]:
-        """헤더 행 추출 (1행)"""
-        headers = []
-        for cell in worksheet[1]:
-            if cell.value:
-                headers.append(str(cell.value).strip())
-        return headers
+    def iter_rows(
+        self, source: Union[str, BinaryIO]
+    ) -> Tuple[List[str], Iterator[Tuple[int, tuple]]]:
+        """
+        첫 번째 시트를 행 단위로 스트리밍
 
-    def _extract_rows(self, worksheet, start_row: int) -> List[Dict]:
-        """데이터 행 추출 (2행부터)"""
-        headers = self._extract_headers(worksheet)
-        rows = []
+        Args:
+            source: Excel 파일 경로 또는 되감기 가능한 바이너리 스트림
 
-        for row_idx, row in enumerate(
-            worksheet.iter_rows(min_row=start_row), start=start_row
-        ):
-            row_data = {}
-            for col_idx, cell in enumerate(row):
-                if col_idx < len(headers):
-                    row_data[headers[col_idx]] = cell.value
+        Returns:
+            (headers, rows): 헤더(1행)와 (시트 행 번호, 값 튜플) 이터레이터
+                빈 행은 제외되며, 값 튜플은 헤더 길이에 맞춰집니다.
+        """
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+        worksheet = workbook.worksheets[0]
+        sheet_rows = worksheet.iter_rows(values_only=True)
+
+        header_row = next(sheet_rows, None) or ()
+        headers = self._extract_headers(header_row)
+
+        def rows() -> Iterator[Tuple[int, tuple]]:
+            try:
+                width = len(headers)
+                for row_number, values in enumerate(sheet_rows, start=2):
+                    values = tuple(values[:width]) + (None,) * (width - len(values))
+                    if any(value is not None and value != '' for value in values):
+                        yield row_number, values
+            finally:
+                workbook.close()
+
+        return headers, rows()
+
+    def read_frame(
+        self, source: Union[str, BinaryIO], max_rows: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        첫 번째 시트를 DataFrame으로 읽기
+
+        CHUNK_SIZE 행씩 DataFrame으로 만들어 이어 붙입니다.
+        인덱스는 '시트 행 번호 - 2'로 설정되어 CSV 파서와 같은 방식(idx + 2)으로
+        행 번호를 표시할 수 있습니다.
 
-            # 빈 행 제외
-            if any(row_data.values()):
-                rows.append(row_data)
+        Args:
+            source: Excel 파일 경로 또는 되감기 가능한 바이너리 스트림
+            max_rows: 읽을 최대 데이터 행 수 (None이면 전체)
+
+        Returns:
+            pd.DataFrame: 셀 값을 그대로 담은 object 타입 DataFrame
+
+        Raises:
+            ValueError: 올바른 Excel 파일이 아닌 경우
+        """
+        try:
+            headers, row_iter = self.iter_rows(source)
+        except (InvalidFileException, zipfile.BadZipFile, KeyError) as e:
+            raise ValueError(f"올바른 Excel(.xlsx) 파일이 아닙니다: {str(e)}")
+
+        if max_rows is not None:
+            row_iter = islice(row_iter, max_rows)
+
+        frames = []
+        while True:
+            chunk = list(islice(row_iter, self.CHUNK_SIZE))
+            if not chunk:
+                break
+            row_numbers, values = zip(*chunk)
+            frames.append(pd.DataFrame(
+                list(values),
+                columns=headers,
+                index=[number - 2 for number in row_numbers],
+                dtype=object
+            ))
+
+        if not frames:
+            return pd.DataFrame(columns=headers, dtype=object)
+
+        return pd.concat(frames) if len(frames) > 1 else frames[0]
+
+    def declared_row_count(self, source: Union[str, BinaryIO]) -> Optional[int]:
+        """
+        첫 번째 시트에 기록된 데이터 행 수 (헤더 제외)
+
+        시트의 dimension 정보만 읽으므로 행을 순회하지 않습니다.
+        빈 행도 포함된 값이며, dimension이 없는 파일은 None을 반환합니다.
+
+        Args:
+            source: Excel 파일 경로 또는 되감기 가능한 바이너리 스트림
+        """
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+        try:
+            max_row = workbook.worksheets[0].max_row
+        finally:
+            workbook.close()
+        return max(max_row - 1, 0) if max_row else None
+
+    @staticmethod
+    def is_xlsx(prefix: bytes) -> bool:
+        """파일 앞부분이 xlsx(ZIP) 서명인지 확인"""
+        return bytes(prefix[:len(XLSX_SIGNATURE)]) == XLSX_SIGNATURE
+
+    def _extract_headers(self, header_row: tuple) -> List[str]:
+        """헤더 행 추출 (1행, 마지막 빈 헤더 제외)"""
+        headers = ['' if value is None else str(value).strip() for value in header_row]
+        while headers and not headers[-1]:
+            headers.pop()
+        return headers
 
-        return rows
+    def _extract_rows(self, headers: List[str], rows: Iterator[Tuple[int, tuple]]) -> List[Dict]:
+        """데이터 행 추출 (2행부터, 빈 행 제외)"""
+        return [dict(zip(headers, values)) for _, values in rows]
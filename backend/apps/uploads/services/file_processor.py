@@ -2,13 +2,28 @@
 """
 File Processor Service
 
-CSV 파일 업로드 전체 프로세스를 오케스트레이션합니다.
+CSV(.csv, .csv.gz) / Excel(.xlsx) 파일과 ZIP 묶음 업로드 전체 프로세스를 오케스트레이션합니다.
 """
+import hashlib
+import io
+import logging
+import mmap
+import multiprocessing
 import os
+import posixpath
 import tempfile
-from typing import Optional, Tuple, List, Dict
-from django.db import transaction
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple, Dict
+from django.conf import settings
+from django.db import DataError, IntegrityError, transaction
 from django.core.files.uploadedfile import UploadedFile
+from django.utils import timezone
+
+from apps.uploads.domain.models import UploadRecord
+from apps.uploads.repositories.upload_repository import UploadRepository
 
 from apps.uploads.services.parsers import (
     DepartmentKPIParser,
@@ -16,11 +31,20 @@ from apps.uploads.services.parsers import (
     ResearchProjectParser,
     StudentRosterParser
 )
+from apps.uploads.services.parsers.source import Source, read_header
+from apps.uploads.services import bundle_worker
 from apps.uploads.services.data_validator import DataValidator
+from apps.uploads.services.error_report import ErrorReportWriter
 from apps.dashboard.repositories.department_kpi_repository import DepartmentKPIRepository
 from apps.dashboard.repositories.publication_repository import PublicationRepository
 from apps.dashboard.repositories.research_project_repository import ResearchProjectRepository
 from apps.dashboard.repositories.student_repository import StudentRepository
+from infrastructure.metrics.metrics import UPLOAD_ROWS, UPLOAD_ROWS_PER_SECOND
+
+logger = logging.getLogger(__name__)
+
+# 처리 단계 완료 콜백: (stage, rows)
+ProgressCallback = Callable[[str, int], None]
 
 
 class FileProcessorService:
@@ -30,6 +54,12 @@ class FileProcessorService:
     파일 저장, 파싱, 검증, DB 저장을 담당합니다.
     """
 
+    # 업로드 가능한 파일 확장자 (Excel은 첫 번째 시트를 읽음, .csv.gz는 스트리밍 압축 해제)
+    ALLOWED_EXTENSIONS = ('.csv', '.csv.gz', '.xlsx')
+
+    # 여러 데이터 파일을 묶은 ZIP (파일별 데이터 유형은 파일명/헤더로 판별)
+    BUNDLE_EXTENSION = '.zip'
+
     # 데이터 타입별 파서 매핑
     PARSER_MAP = {
         'department_kpi': DepartmentKPIParser,
@@ -54,17 +84,34 @@ class FileProcessorService:
         'student_roster': DataValidator.validate_student_roster
     }
 
-    @transaction.atomic
+    # 처리 모드 (strict: 전체 성공 또는 전체 실패, partial: 유효한 행만 저장)
+    MODES = ('strict', 'partial')
+
+    # partial 모드에서 한 번에 커밋하는 행 수
+    INSERT_CHUNK_SIZE = 1000
+
+    def __init__(self, upload_repository: Optional[UploadRepository] = None):
+        self.upload_repository = upload_repository or UploadRepository()
+
     def process_file(
-        self, file: UploadedFile, data_type: str
+        self,
+        file: UploadedFile,
+        data_type: str,
+        uploaded_by: str = 'anonymous',
+        mode: str = 'strict'
     ) -> Dict:
         """
         CSV 파일 업로드 전체 프로세스
 
+        같은 데이터 유형으로 이미 성공한 파일(SHA-256 동일)이 다시 업로드되면
+        파싱/검증/저장 없이 이전 결과를 반환합니다.
+
         Args:
             file: 업로드된 파일
             data_type: 데이터 유형
                 ('department_kpi', 'publication', 'research_project', 'student_roster')
+            uploaded_by: 업로드 사용자 (업로드 이력 기록용)
+            mode: 처리 모드 ('strict' 또는 'partial')
 
         Returns:
             Dict: 업로드 결과
@@ -73,84 +120,565 @@ class FileProcessorService:
                     'filename': str,
                     'data_type': str,
                     'rows_processed': int,
-                    'errors': List[str] (optional)
+                    'errors': List[str] (optional, strict 모드),
+                    'status': str (partial 모드: 'success' / 'partial' / 'failed'),
+                    'rows_rejected': int (partial 모드),
+                    'error_report': str (partial 모드, 거부 행이 있을 때 오류 CSV ID),
+                    'duplicate_of': int (optional, 동일 파일의 이전 업로드 ID)
                 }
 
         Raises:
             ValueError: 데이터 타입 또는 파일 형식 오류
         """
-        temp_file_path: Optional[str] = None
+        # ZIP 묶음은 파일별로 데이터 유형을 판별하여 처리
+        if self.is_bundle(file.name):
+            return self.process_bundle(file, uploaded_by, mode)
 
-        try:
-            # 1. 데이터 타입 검증
-            if data_type not in self.PARSER_MAP:
-                raise ValueError(
-                    f"지원하지 않는 데이터 유형입니다: {data_type}. "
-                    f"허용된 값: {', '.join(self.PARSER_MAP.keys())}"
-                )
-
-            # 2. 파일 확장자 검증 (.csv만 허용)
-            if not file.name.lower().endswith('.csv'):
-                raise ValueError("CSV 파일만 업로드 가능합니다")
-
-            # 3. 임시 파일 저장
-            temp_file_path = self._save_temp_file(file)
-
-            # 4. 파일 파싱
-            parser_class = self.PARSER_MAP[data_type]
-            parsed_data = parser_class.parse(temp_file_path)
-
-            # 5. 데이터 검증
-            validator_func = self.VALIDATOR_MAP[data_type]
-            is_valid, errors = validator_func(parsed_data)
-
-            if not is_valid:
-                return {
+        # 1. 데이터 타입, 파일 확장자, 처리 모드 검증
+        self.validate_request(file.name, data_type, mode)
+
+        # 2. 업로드 내용을 복사 없이 버퍼로 열기 (SHA-256 계산 포함)
+        with self._open_upload(file) as (buffer, content_hash):
+            # 3. 동일 파일 재업로드 시 이전 결과 반환
+            previous = self.upload_repository.find_completed_by_hash(data_type, content_hash)
+            if previous is not None:
+                return self._duplicate_result(previous, file.name)
+
+            # 4. 파싱, 검증, 저장
+            result = self.process_source(buffer, file.name, data_type, mode=mode)
+
+        # 5. 업로드 이력 기록
+        self._record_history(result, uploaded_by, content_hash, mode)
+
+        return result
+
+    def validate_request(self, filename: str, data_type: str, mode: str = 'strict') -> None:
+        """
+        데이터 타입, 파일 확장자, 처리 모드 검증
+
+        Args:
+            filename: 파일명
+            data_type: 데이터 유형
+            mode: 처리 모드
+
+        Raises:
+            ValueError: 지원하지 않는 데이터 유형/처리 모드 또는 CSV/Excel(.xlsx)이 아닌 파일
+        """
+        if self.is_bundle(filename):
+            raise ValueError("ZIP 묶음 파일은 /api/uploads/ 로 업로드해 주세요")
+
+        if data_type not in self.PARSER_MAP:
+            raise ValueError(
+                f"지원하지 않는 데이터 유형입니다: {data_type}. "
+                f"허용된 값: {', '.join(self.PARSER_MAP.keys())}"
+            )
+
+        if not filename.lower().endswith(self.ALLOWED_EXTENSIONS):
+            raise ValueError("CSV(.csv, .csv.gz) 또는 Excel(.xlsx) 파일만 업로드 가능합니다")
+
+        self._validate_mode(mode)
+
+    def is_bundle(self, filename: str) -> bool:
+        """ZIP 묶음 파일 여부"""
+        return filename.lower().endswith(self.BUNDLE_EXTENSION)
+
+    def process_bundle(self, file: UploadedFile, uploaded_by: str = 'anonymous', mode: str = 'strict') -> Dict:
+        """
+        ZIP 묶음 업로드
+
+        각 파일의 데이터 유형을 파일명 또는 헤더로 판별한 뒤,
+        UPLOAD_BUNDLE_WORKERS개의 프로세스 풀에서 동시에 처리합니다.
+        파일마다 별도의 트랜잭션으로 저장되며 업로드 이력도 파일별로 기록됩니다.
+
+        Args:
+            file: 업로드된 ZIP 파일
+            uploaded_by: 업로드 사용자 (업로드 이력 기록용)
+            mode: 처리 모드 ('strict' 또는 'partial')
+
+        Returns:
+            Dict: 통합 업로드 결과
+                {
+                    'success': bool (하나 이상의 파일이 저장되면 True),
+                    'status': str ('success' / 'partial' / 'failed'),
+                    'filename': str,
+                    'data_type': 'bundle',
+                    'rows_processed': int (전체 합계),
+                    'rows_rejected': int (partial 모드, 전체 합계),
+                    'members': List[Dict] (파일별 업로드 결과)
+                }
+
+        Raises:
+            ValueError: 올바른 ZIP 파일이 아니거나 처리할 파일이 없는 경우
+        """
+        self._validate_mode(mode)
+
+        with self._bundle_path(file) as archive_path:
+            try:
+                with zipfile.ZipFile(archive_path) as archive:
+                    routes = self.route_bundle(archive)
+            except zipfile.BadZipFile as e:
+                raise ValueError(f"올바른 ZIP 파일이 아닙니다: {str(e)}")
+
+            if not routes:
+                raise ValueError("ZIP 파일에 처리할 CSV/Excel 파일이 없습니다")
+
+            tasks = [(member, data_type) for member, data_type in routes if data_type]
+            processed = dict(zip(
+                [member for member, _ in tasks],
+                self._run_bundle(archive_path, tasks, mode)
+            ))
+
+        members = []
+        for member, data_type in routes:
+            if data_type is None:
+                members.append({
                     'success': False,
-                    'filename': file.name,
-                    'data_type': data_type,
+                    'filename': member,
+                    'data_type': None,
                     'rows_processed': 0,
-                    'errors': errors
-                }
+                    'errors': [f"데이터 유형을 판별할 수 없습니다: {member}"]
+                })
+                continue
 
-            # 6. 데이터 저장
-            repository = self.REPOSITORY_MAP[data_type]
-            rows_processed = repository.bulk_create(parsed_data)
+            result = processed[member]
+            self._record_history(result, uploaded_by, result.pop('content_hash', None), mode)
+            members.append(result)
+
+        return self._bundle_result(file.name, members, mode)
+
+    def route_bundle(self, archive: zipfile.ZipFile) -> List[Tuple[str, Optional[str]]]:
+        """
+        ZIP 내부 파일별 데이터 유형 판별
+
+        1. 파일명이 데이터 유형으로 시작하면 해당 유형 (예: publication_list.csv → publication)
+        2. 아니면 헤더에 필수 컬럼이 모두 있는 유형 (여러 유형이 맞으면 필수 컬럼이 가장 많은 유형)
 
-            # 7. 성공 결과 반환
+        Args:
+            archive: 열린 ZIP 파일
+
+        Returns:
+            List[Tuple[str, Optional[str]]]: (내부 파일명, 데이터 유형 또는 None)
+                디렉토리, 숨김 파일, 지원하지 않는 확장자는 제외
+        """
+        routes = []
+        for info in archive.infolist():
+            basename = posixpath.basename(info.filename)
+            if info.is_dir() or basename.startswith('.') or info.filename.startswith('__MACOSX/'):
+                continue
+            if not basename.lower().endswith(self.ALLOWED_EXTENSIONS):
+                continue
+
+            data_type = next(
+                (data_type for data_type in self.PARSER_MAP if basename.lower().startswith(data_type)),
+                None
+            )
+            if data_type is None:
+                try:
+                    with archive.open(info) as stream:
+                        data_type = self._match_header(read_header(stream))
+                except ValueError:
+                    data_type = None
+
+            routes.append((info.filename, data_type))
+
+        return routes
+
+    def _match_header(self, headers: List[str]) -> Optional[str]:
+        """헤더에 필수 컬럼이 모두 있는 데이터 유형 (모호하면 None)"""
+        candidates = sorted(
+            (
+                (len(parser_class.REQUIRED_COLUMNS), data_type)
+                for data_type, parser_class in self.PARSER_MAP.items()
+                if set(parser_class.REQUIRED_COLUMNS) <= set(headers)
+            ),
+            reverse=True
+        )
+        if not candidates or (len(candidates) > 1 and candidates[0][0] == candidates[1][0]):
+            return None
+        return candidates[0][1]
+
+    def _run_bundle(self, archive_path: str, tasks: List[Tuple[str, str]], mode: str) -> List[Dict]:
+        """
+        ZIP 내부 파일들을 프로세스 풀에서 처리
+
+        워커가 1개 이하이거나 파일이 하나뿐이면 현재 프로세스에서 처리합니다.
+        워커 프로세스가 비정상 종료되는 등 결과를 받지 못한 파일은 그 파일만 실패로 기록합니다.
+
+        Returns:
+            List[Dict]: tasks 순서의 파일별 업로드 결과
+        """
+        workers = min(settings.UPLOAD_BUNDLE_WORKERS, len(tasks))
+        if workers <= 1:
+            return [
+                bundle_worker.process_member(archive_path, member, data_type, mode)
+                for member, data_type in tasks
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=bundle_worker.init_worker
+        ) as pool:
+            futures = [
+                pool.submit(bundle_worker.process_member, archive_path, member, data_type, mode)
+                for member, data_type in tasks
+            ]
+            results = []
+            for (member, data_type), future in zip(tasks, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.exception("ZIP 묶음 파일 처리 실패: %s", member)
+                    results.append(
+                        bundle_worker.failed_member(member, data_type, f"파일 처리 중 오류가 발생했습니다: {e}")
+                    )
+            return results
+
+    def _bundle_result(self, filename: str, members: List[Dict], mode: str) -> Dict:
+        """파일별 업로드 결과 → 통합 결과"""
+        succeeded = sum(1 for member in members if member['success'])
+        if succeeded == len(members) and not any(member.get('rows_rejected') for member in members):
+            status = 'success'
+        elif succeeded:
+            status = 'partial'
+        else:
+            status = 'failed'
+
+        result = {
+            'success': status != 'failed',
+            'status': status,
+            'filename': filename,
+            'data_type': 'bundle',
+            'rows_processed': sum(member['rows_processed'] for member in members),
+            'members': members
+        }
+        if mode == 'partial':
+            result['rows_rejected'] = sum(member.get('rows_rejected', 0) for member in members)
+        return result
+
+    @contextmanager
+    def _bundle_path(self, file: UploadedFile) -> Iterator[str]:
+        """
+        ZIP 파일 경로 (워커 프로세스가 직접 열 수 있도록)
+
+        디스크 업로드는 Django 임시 파일을 그대로 사용하고,
+        메모리 업로드는 고유한 이름의 임시 파일에 기록합니다.
+        """
+        if hasattr(file, 'temporary_file_path'):
+            yield file.temporary_file_path()
+            return
+
+        with tempfile.NamedTemporaryFile(suffix=self.BUNDLE_EXTENSION) as spool:
+            for chunk in file.chunks():
+                spool.write(chunk)
+            spool.flush()
+            yield spool.name
+
+    def _validate_mode(self, mode: str) -> None:
+        """처리 모드 검증"""
+        if mode not in self.MODES:
+            raise ValueError(
+                f"지원하지 않는 처리 모드입니다: {mode}. 허용된 값: {', '.join(self.MODES)}"
+            )
+
+    def process_source(
+        self,
+        source: Source,
+        filename: str,
+        data_type: str,
+        progress: Optional[ProgressCallback] = None,
+        mode: str = 'strict'
+    ) -> Dict:
+        """
+        파일 파싱 → 검증 → DB 저장
+
+        동기 업로드와 백그라운드 업로드 워커가 공유하는 처리 경로입니다.
+        strict 모드의 DB 저장은 하나의 트랜잭션으로 수행됩니다 (전체 성공 또는 전체 롤백).
+
+        Args:
+            source: 파싱할 파일 경로 또는 버퍼 (bytes/memoryview)
+            filename: 원본 파일명 (결과 표시용)
+            data_type: 데이터 유형
+            progress: 단계 완료 시 호출되는 콜백 (stage, rows)
+                stage는 'parsed', 'validated', 'inserted' 중 하나
+            mode: 처리 모드 ('strict' 또는 'partial')
+
+        Returns:
+            Dict: 업로드 결과 (process_file과 동일한 형식)
+        """
+        notify = progress or (lambda stage, rows: None)
+        started = time.perf_counter()
+
+        if mode == 'partial':
+            result = self._process_partial(source, filename, data_type, notify)
+        else:
+            result = self._process_strict(source, filename, data_type, notify)
+
+        self._record_metrics(data_type, result.get('rows_processed', 0), time.perf_counter() - started)
+        return result
+
+    def _process_strict(self, source: Source, filename: str, data_type: str, notify: ProgressCallback) -> Dict:
+        """strict 모드: 검증 오류가 하나라도 있으면 저장하지 않음"""
+        # 1. 파일 파싱
+        parser_class = self.PARSER_MAP[data_type]
+        parsed_data = parser_class.parse(source)
+        notify('parsed', len(parsed_data))
+
+        # 2. 데이터 검증
+        validator_func = self.VALIDATOR_MAP[data_type]
+        is_valid, errors = validator_func(parsed_data)
+
+        if not is_valid:
             return {
-                'success': True,
-                'filename': file.name,
+                'success': False,
+                'filename': filename,
                 'data_type': data_type,
-                'rows_processed': rows_processed
+                'rows_processed': 0,
+                'errors': errors
             }
 
-        finally:
-            # 8. 임시 파일 삭제
-            if temp_file_path:
-                self._cleanup_temp_file(temp_file_path)
+        notify('validated', len(parsed_data))
+
+        # 3. 데이터 저장
+        repository = self.REPOSITORY_MAP[data_type]
+        with transaction.atomic():
+            rows_processed = repository.bulk_create(parsed_data)
+        notify('inserted', rows_processed)
+
+        # 4. 성공 결과 반환
+        return {
+            'success': True,
+            'filename': filename,
+            'data_type': data_type,
+            'rows_processed': rows_processed
+        }
+
+    @staticmethod
+    def _record_metrics(data_type: str, rows: int, seconds: float) -> None:
+        """저장 행 수와 처리 속도(행/초) 기록"""
+        if rows <= 0:
+            return
+        UPLOAD_ROWS.inc(rows, data_type=data_type)
+        UPLOAD_ROWS_PER_SECOND.observe(rows / max(seconds, 1e-6), data_type=data_type)
+
+    def _process_partial(
+        self, source: Source, filename: str, data_type: str, notify: ProgressCallback
+    ) -> Dict:
+        """
+        부분 성공 처리
+
+        변환/검증/DB 저장에 실패한 행은 사유와 함께 오류 CSV에 기록하고,
+        유효한 행은 INSERT_CHUNK_SIZE 단위로 커밋합니다.
+
+        Returns:
+            Dict: 업로드 결과 (건수와 오류 리포트 ID만 포함)
+        """
+        parser_class = self.PARSER_MAP[data_type]
+        repository = self.REPOSITORY_MAP[data_type]
+
+        with ErrorReportWriter(parser_class.REQUIRED_COLUMNS) as report:
+            # 1. 파일 파싱 (변환 실패 행은 원본 값 그대로 거부)
+            lines: List[int] = []
+            parsed_data: List[Dict] = []
+            for row in parser_class.iter_rows(source):
+                if row.error is not None:
+                    report.write(row.line, row.raw, f"파싱 오류: {row.error}")
+                else:
+                    lines.append(row.line)
+                    parsed_data.append(row.data)
+            notify('parsed', len(parsed_data))
+
+            # 2. 데이터 검증 (오류 행은 모든 사유를 기록)
+            row_errors = DataValidator.explain(data_type, parsed_data)
+            for index, messages in row_errors:
+                values = parser_class.to_columns(parsed_data[index])
+                report.write(lines[index], values, '; '.join(messages))
+
+            valid_rows = [
+                (line, data)
+                for line, data, invalid in zip(lines, parsed_data, row_errors.invalid_rows)
+                if not invalid
+            ]
+            notify('validated', len(valid_rows))
+
+            # 3. 유효한 행을 청크 단위로 커밋
+            rows_processed = 0
+            for start in range(0, len(valid_rows), self.INSERT_CHUNK_SIZE):
+                chunk = valid_rows[start:start + self.INSERT_CHUNK_SIZE]
+                rows_processed += self._insert_chunk(repository, parser_class, chunk, report)
+                notify('inserted', rows_processed)
+
+        rows_rejected = report.rejected_count
+        if not rows_rejected:
+            status = 'success'
+        elif rows_processed:
+            status = 'partial'
+        else:
+            status = 'failed'
+
+        return {
+            'success': status != 'failed',
+            'status': status,
+            'filename': filename,
+            'data_type': data_type,
+            'rows_processed': rows_processed,
+            'rows_rejected': rows_rejected,
+            'error_report': report.report_id
+        }
+
+    def _insert_chunk(
+        self,
+        repository,
+        parser_class,
+        chunk: List[Tuple[int, Dict]],
+        report: ErrorReportWriter
+    ) -> int:
+        """
+        청크 하나를 커밋
+
+        청크 저장이 제약 조건 위반으로 실패하면 행 단위로 다시 저장하여
+        실패한 행만 오류 CSV에 기록합니다.
+
+        Returns:
+            int: 저장된 행 수
+        """
+        try:
+            with transaction.atomic():
+                return repository.bulk_create([data for _, data in chunk])
+        except (IntegrityError, DataError):
+            pass
+
+        rows_processed = 0
+        for line, data in chunk:
+            try:
+                with transaction.atomic():
+                    rows_processed += repository.bulk_create([data])
+            except (IntegrityError, DataError) as e:
+                report.write(line, parser_class.to_columns(data), f"저장 오류: {e}")
+        return rows_processed
+
+    def _duplicate_result(self, previous: UploadRecord, filename: str) -> Dict:
+        """이전 업로드 레코드 → 업로드 결과"""
+        return {
+            'success': True,
+            'filename': filename,
+            'data_type': previous.data_type,
+            'rows_processed': previous.rows_processed,
+            'duplicate_of': previous.id
+        }
+
+    def _record_history(self, result: Dict, uploaded_by: str, content_hash: str, mode: str) -> None:
+        """
+        업로드 결과를 업로드 이력에 기록
+
+        Args:
+            result: process_source 결과
+            uploaded_by: 업로드 사용자
+            content_hash: 파일 내용 SHA-256
+            mode: 처리 모드
+        """
+        errors = result.get('errors') or []
+        self.upload_repository.create_upload_record(
+            UploadRecord(
+                id=None,
+                filename=result['filename'],
+                data_type=result['data_type'],
+                rows_processed=result['rows_processed'],
+                uploaded_at=timezone.now(),
+                uploaded_by=uploaded_by,
+                status=result.get('status') or ('success' if result['success'] else 'failed'),
+                error_message='\n'.join(errors) or None,
+                content_hash=content_hash,
+                mode=mode,
+                rows_rejected=result.get('rows_rejected', 0),
+                error_report=result.get('error_report'),
+            )
+        )
+
+    @contextmanager
+    def _open_upload(self, file: UploadedFile) -> Iterator[Tuple[memoryview, str]]:
+        """
+        업로드 파일 내용을 memoryview로 열고 SHA-256 계산
+
+        - 메모리 업로드(InMemoryUploadedFile): 업로드 버퍼를 그대로 사용
+        - 디스크 업로드(TemporaryUploadedFile): Django가 고유한 이름으로 저장한 파일을 mmap
+        - 그 외 스트림: 익명 임시 파일에 한 번 기록(SHA-256 동시 계산) 후 mmap
+
+        공유 경로에 파일명을 그대로 쓰지 않으므로 같은 이름의 동시 업로드가 충돌하지 않습니다.
+
+        Args:
+            file: 업로드된 파일
+
+        Yields:
+            Tuple[memoryview, str]: (파일 내용, SHA-256 hex)
+        """
+        if hasattr(file, 'temporary_file_path'):
+            with open(file.temporary_file_path(), 'rb') as stream:
+                with self._map_file(stream) as view:
+                    yield view, hashlib.sha256(view).hexdigest()
+            return
+
+        if isinstance(file.file, io.BytesIO):
+            view = file.file.getbuffer()
+            try:
+                yield view, hashlib.sha256(view).hexdigest()
+            finally:
+                view.release()
+            return
+
+        with tempfile.TemporaryFile() as spool:
+            digest = hashlib.sha256()
+            for chunk in file.chunks():
+                digest.update(chunk)
+                spool.write(chunk)
+            spool.flush()
+
+            with self._map_file(spool) as view:
+                yield view, digest.hexdigest()
+
+    @contextmanager
+    def _map_file(self, stream) -> Iterator[memoryview]:
+        """
+        파일을 읽기 전용 mmap으로 매핑
+
+        Args:
+            stream: 열린 파일 객체
+
+        Yields:
+            memoryview: 파일 내용 (빈 파일이면 빈 버퍼)
+        """
+        if os.fstat(stream.fileno()).st_size == 0:
+            yield memoryview(b'')
+            return
+
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
 
-    def _save_temp_file(self, file: UploadedFile) -> str:
+    def write_chunks(self, file: UploadedFile, file_path: str) -> str:
         """
-        임시 파일 저장
+        업로드 파일을 경로에 기록하고 SHA-256 계산
 
         Args:
             file: 업로드된 파일
+            file_path: 저장할 경로
 
         Returns:
-            str: 임시 파일 경로
+            str: 파일 내용 SHA-256 hex
         """
-        # 임시 디렉토리에 저장
-        temp_dir = tempfile.gettempdir()
-        temp_file_path = os.path.join(temp_dir, file.name)
+        digest = hashlib.sha256()
 
-        with open(temp_file_path, "wb") as temp_file:
+        with open(file_path, "wb") as out:
             for chunk in file.chunks():
-                temp_file.write(chunk)
+                digest.update(chunk)
+                out.write(chunk)
 
-        return temp_file_path
+        return digest.hexdigest()
 
-    def _cleanup_temp_file(self, file_path: str):
+    def cleanup_temp_file(self, file_path: str):
         """
         임시 파일 삭제
 
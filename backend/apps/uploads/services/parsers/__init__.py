@@ -4,12 +4,15 @@ CSV Parsers
 
 4가지 타입의 CSV 파일을 파싱합니다.
 """
+from .base import BaseCSVParser, ParsedRow
 from .department_kpi_parser import DepartmentKPIParser
 from .publication_parser import PublicationParser
 from .research_project_parser import ResearchProjectParser
 from .student_roster_parser import StudentRosterParser
 
 __all__ = [
+    'BaseCSVParser',
+    'ParsedRow',
     'DepartmentKPIParser',
     'PublicationParser',
     'ResearchProjectParser',
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Base CSV Parser
+
+4가지 CSV 파서의 공통 흐름 (파일 읽기 → 컬럼 검증 → 행 변환)
+"""
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+import pandas as pd
+
+from apps.uploads.services.schema_registry import DataSchema
+
+from .source import Source, read_table
+
+
+class ParsedRow(NamedTuple):
+    """
+    변환된 행 하나
+
+    Attributes:
+        line: 파일 행 번호 (헤더가 1행)
+        data: 변환된 데이터 (변환 실패 시 None)
+        error: 변환 오류 메시지 (성공 시 None)
+        raw: 원본 컬럼 값 (변환 실패 시에만 채워짐)
+    """
+    line: int
+    data: Optional[Dict]
+    error: Optional[str] = None
+    raw: Optional[Dict] = None
+
+
+class BaseCSVParser:
+    """
+    CSV 파서 기본 클래스
+
+    하위 클래스는 SCHEMA(스키마 레지스트리의 데이터 유형 스키마)를 지정합니다.
+    REQUIRED_COLUMNS와 FIELD_MAP은 스키마에서 만들어집니다.
+    """
+
+    SCHEMA: Optional[DataSchema] = None
+
+    REQUIRED_COLUMNS: List[str] = []
+
+    # 변환된 필드명 → CSV 컬럼명 (오류 리포트를 원본 형식으로 되돌릴 때 사용)
+    FIELD_MAP: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.SCHEMA is not None:
+            cls.REQUIRED_COLUMNS = list(cls.SCHEMA.headers)
+            cls.FIELD_MAP = dict(cls.SCHEMA.field_map)
+
+    @classmethod
+    def parse(cls, source: Source) -> List[Dict]:
+        """
+        CSV / Excel(.xlsx) 파일 파싱
+
+        Args:
+            source: 파일 경로, 바이너리 스트림 또는 버퍼(bytes/memoryview)
+
+        Returns:
+            List[Dict]: 파싱된 데이터 리스트
+
+        Raises:
+            ValueError: 필수 컬럼 누락 또는 행 변환 오류 시
+        """
+        return cls._collect(cls.iter_rows(source))
+
+    @classmethod
+    def parse_frame(cls, df: pd.DataFrame) -> List[Dict]:
+        """
+        이미 읽은 DataFrame 파싱 (CSV 외 형식, 예: Parquet)
+
+        Raises:
+            ValueError: 필수 컬럼 누락 또는 행 변환 오류 시
+        """
+        return cls._collect(cls.iter_frame(df))
+
+    @staticmethod
+    def _collect(rows: Iterator[ParsedRow]) -> List[Dict]:
+        """변환 결과 수집 (첫 변환 오류에서 중단)"""
+        parsed_data = []
+        for row in rows:
+            if row.error is not None:
+                raise ValueError(f"{row.line}행 파싱 오류: {row.error}")
+            parsed_data.append(row.data)
+
+        return parsed_data
+
+    @classmethod
+    def iter_rows(cls, source: Source) -> Iterator[ParsedRow]:
+        """
+        행 단위 변환 (변환 오류가 있어도 중단하지 않음)
+
+        Args:
+            source: 파일 경로, 바이너리 스트림 또는 버퍼(bytes/memoryview)
+
+        Yields:
+            ParsedRow: 변환 결과 (오류 행은 error와 raw가 채워짐)
+
+        Raises:
+            ValueError: 필수 컬럼 누락 시
+        """
+        # 파일 읽기 (CSV: 인코딩 자동 판별 / Excel: 읽기 전용 스트리밍)
+        return cls.iter_frame(read_table(source))
+
+    @classmethod
+    def iter_frame(cls, df: pd.DataFrame) -> Iterator[ParsedRow]:
+        """
+        이미 읽은 DataFrame을 행 단위로 변환
+
+        Args:
+            df: 원본 헤더를 컬럼명으로 갖는 DataFrame (인덱스 + 2 = 파일 행 번호)
+
+        Yields:
+            ParsedRow: 변환 결과 (오류 행은 error와 raw가 채워짐)
+
+        Raises:
+            ValueError: 필수 컬럼 누락 시
+        """
+        # 컬럼명 정규화 (앞뒤 공백 제거)
+        df.columns = [str(column).strip() for column in df.columns]
+
+        # 필수 컬럼 검증
+        missing_columns = cls.missing_columns(df.columns)
+        if missing_columns:
+            raise ValueError(f"필수 컬럼이 누락되었습니다: {', '.join(missing_columns)}")
+
+        return cls._convert_rows(df)
+
+    @classmethod
+    def missing_columns(cls, columns) -> List[str]:
+        """누락된 필수 컬럼 (REQUIRED_COLUMNS 순서)"""
+        present = {str(column).strip() for column in columns}
+        return [column for column in cls.REQUIRED_COLUMNS if column not in present]
+
+    @classmethod
+    def _convert_rows(cls, df: pd.DataFrame) -> Iterator[ParsedRow]:
+        """
+        행 변환 (변환 오류가 있어도 중단하지 않음)
+
+        필수 컬럼만 헤더 순서로 잘라 튜플 단위로 순회하고, 스키마에서 컴파일된
+        변환 함수(DataSchema.convert)를 적용합니다.
+        """
+        columns = cls.REQUIRED_COLUMNS
+        convert = cls.SCHEMA.convert
+        values_iter = df[columns].itertuples(index=False, name=None)
+        for idx, values in zip(df.index, values_iter):
+            try:
+                yield ParsedRow(idx + 2, convert(values))
+            except (ValueError, KeyError, TypeError, ArithmeticError) as e:
+                raw = {column: cls._raw_value(value) for column, value in zip(columns, values)}
+                yield ParsedRow(idx + 2, None, str(e), raw)
+
+    @classmethod
+    def parse_row(cls, row: pd.Series) -> Dict:
+        """
+        CSV 행 하나를 도메인 데이터로 변환
+
+        Args:
+            row: 원본 행 (CSV 컬럼명 → 값)
+
+        Returns:
+            Dict: 변환된 데이터
+        """
+        return cls.SCHEMA.convert([row[column] for column in cls.REQUIRED_COLUMNS])
+
+    @classmethod
+    def to_columns(cls, data: Dict) -> Dict[str, Any]:
+        """
+        변환된 데이터를 CSV 컬럼 형식으로 되돌리기
+
+        Args:
+            data: parse_row 결과
+
+        Returns:
+            Dict: CSV 컬럼명 → 값 (다시 업로드할 수 있는 형식)
+        """
+        return {column: data.get(field) for field, column in cls.FIELD_MAP.items()}
+
+    @staticmethod
+    def _raw_value(value: Any) -> Any:
+        """원본 셀 값 (NaN은 빈 값)"""
+        return None if pd.isna(value) else value
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""
+CSV 입력 소스
+
+파서가 파일 경로, 바이너리 스트림, 메모리 버퍼(bytes/memoryview/mmap)를
+같은 방식으로 읽을 수 있도록 바이너리 스트림으로 변환합니다.
+버퍼는 복사하지 않고 memoryview 슬라이스로 직접 읽습니다.
+
+인코딩은 파일 앞부분(SNIFF_SIZE)만 보고 판별하며(BOM → UTF-8 → CP949),
+변환은 파서가 스트림을 읽는 동안 점진적으로 이루어집니다.
+
+xlsx 파일(ZIP 서명)은 같은 입력으로 받아 읽기 전용 Excel 리더로 읽습니다.
+gzip 압축 파일(.csv.gz)은 전체를 풀어 두지 않고 읽는 동안 점진적으로 압축을 해제합니다.
+"""
+import codecs
+import gzip
+import io
+import os
+import zlib
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Union
+
+import pandas as pd
+
+from apps.uploads.services.excel_parser import ExcelParser
+
+# 파서 입력 타입: 파일 경로, 바이너리 스트림 또는 버퍼
+Source = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+# 인코딩 판별에 사용하는 앞부분 크기 (바이트)
+SNIFF_SIZE = 64 * 1024
+
+# BOM → 인코딩 (긴 BOM부터 검사)
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# BOM이 없을 때 순서대로 시도하는 인코딩 (CP949는 EUC-KR의 상위 집합)
+CANDIDATE_ENCODINGS = ('utf-8-sig', 'cp949')
+
+# gzip 파일 서명
+GZIP_SIGNATURE = b'\x1f\x8b'
+
+# 미리보기에서 읽는 CSV 앞부분 최대 크기 (압축 해제 후 바이트)
+PREVIEW_READ_SIZE = 1024 * 1024
+
+
+class TableSample(NamedTuple):
+    """
+    파일 앞부분 표본
+
+    Attributes:
+        frame: 헤더와 앞쪽 데이터 행
+        estimated_rows: 전체 데이터 행 수 추정값 (추정할 수 없으면 None)
+        exact: 파일 전체를 읽어 행 수가 정확한지 여부
+    """
+    frame: pd.DataFrame
+    estimated_rows: Optional[int]
+    exact: bool = False
+
+
+class MemoryViewReader(io.RawIOBase):
+    """
+    memoryview 위의 읽기 전용 스트림
+
+    io.BytesIO(buffer)와 달리 원본 버퍼를 복사하지 않습니다.
+    """
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._view = memoryview(buffer).cast('B')
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        remaining = len(self._view) - self._position
+        size = min(len(target), remaining)
+        if size <= 0:
+            return 0
+
+        target[:size] = self._view[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"지원하지 않는 whence 값입니다: {whence}")
+
+        self._position = max(position, 0)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def detect_encoding(prefix: bytes) -> str:
+    """
+    파일 앞부분으로 인코딩 판별
+
+    앞부분 끝에서 잘린 멀티바이트 문자는 오류로 보지 않습니다.
+
+    Args:
+        prefix: 파일 앞부분 바이트
+
+    Returns:
+        str: 인코딩 이름 ('utf-8-sig', 'utf-16', 'cp949')
+
+    Raises:
+        ValueError: UTF-8과 CP949 모두로 해석할 수 없는 경우
+    """
+    for bom, encoding in BOM_ENCODINGS:
+        if prefix.startswith(bom):
+            return encoding
+
+    for encoding in CANDIDATE_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(prefix, final=False)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+
+    raise ValueError("파일 인코딩을 인식할 수 없습니다 (UTF-8 또는 CP949/EUC-KR 파일만 지원합니다)")
+
+
+def sniff_encoding(stream: BinaryIO) -> str:
+    """
+    스트림 앞부분을 읽어 인코딩 판별 (읽은 위치는 되돌림)
+
+    Args:
+        stream: 바이너리 스트림 (open_binary로 연 스트림)
+
+    Returns:
+        str: 인코딩 이름
+    """
+    if stream.seekable():
+        start = stream.tell()
+        prefix = stream.read(SNIFF_SIZE)
+        stream.seek(start)
+    else:
+        prefix = stream.peek(SNIFF_SIZE)[:SNIFF_SIZE]
+
+    return detect_encoding(bytes(prefix))
+
+
+class _Unclosed(io.RawIOBase):
+    """호출자 스트림을 닫지 않는 RawIOBase 어댑터"""
+
+    def __init__(self, stream: BinaryIO):
+        super().__init__()
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        data = self._stream.read(len(target))
+        size = len(data)
+        target[:size] = data
+        return size
+
+
+@contextmanager
+def open_binary(source: Source) -> Iterator[BinaryIO]:
+    """
+    입력 소스를 바이너리 스트림으로 열기
+
+    경로는 파일로 열고 닫으며, 버퍼는 MemoryViewReader로 감쌉니다.
+    호출자가 넘긴 스트림은 그대로 사용하고 닫지 않습니다
+    (되감을 수 없는 스트림은 인코딩 판별을 위해 BufferedReader로 감쌈).
+
+    Args:
+        source: 파일 경로, 바이너리 스트림 또는 버퍼
+
+    Yields:
+        BinaryIO: 바이너리 스트림
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as stream:
+            yield stream
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        with io.BufferedReader(MemoryViewReader(source)) as stream:
+            yield stream
+    elif source.seekable():
+        yield source
+    else:
+        yield io.BufferedReader(_Unclosed(source), buffer_size=SNIFF_SIZE)
+
+
+@contextmanager
+def open_table(source: Source) -> Iterator[BinaryIO]:
+    """
+    입력 소스를 표 데이터 스트림으로 열기
+
+    gzip 서명이 있으면 압축 해제 스트림으로 감쌉니다 (확장자에 의존하지 않음).
+    되감을 수 없는 입력은 인코딩 판별을 위해 BufferedReader로 한 번 더 감쌉니다.
+
+    Args:
+        source: 파일 경로, 바이너리 스트림 또는 버퍼
+
+    Yields:
+        BinaryIO: CSV 또는 xlsx 내용 스트림
+    """
+    with open_binary(source) as stream:
+        if _peek(stream, len(GZIP_SIGNATURE)) == GZIP_SIGNATURE:
+            with gzip.GzipFile(fileobj=stream, mode='rb') as unpacked:
+                if stream.seekable():
+                    yield unpacked
+                else:
+                    yield io.BufferedReader(_Unclosed(unpacked), buffer_size=SNIFF_SIZE)
+        else:
+            yield stream
+
+
+def read_table(source: Source) -> pd.DataFrame:
+    """
+    CSV 또는 Excel(.xlsx) 파일을 DataFrame으로 읽기
+
+    파일 앞부분의 서명으로 형식을 판별합니다 (확장자에 의존하지 않음).
+
+    Args:
+        source: 파일 경로, 바이너리 스트림 또는 버퍼 (gzip 압축 가능)
+
+    Returns:
+        pd.DataFrame: 원본 헤더를 컬럼명으로 갖는 DataFrame
+
+    Raises:
+        ValueError: 인코딩을 인식할 수 없거나 올바른 Excel/gzip 파일이 아닌 경우
+    """
+    with open_table(source) as stream:
+        try:
+            if ExcelParser.is_xlsx(_peek(stream, 4)):
+                return ExcelParser().read_frame(stream)
+
+            return pd.read_csv(stream, encoding=sniff_encoding(stream))
+        except (gzip.BadGzipFile, EOFError) as e:
+            raise ValueError(f"올바른 gzip 압축 파일이 아닙니다: {str(e)}")
+
+
+def read_header(source: Source) -> List[str]:
+    """
+    헤더(첫 행)만 읽기
+
+    Args:
+        source: 파일 경로, 바이너리 스트림 또는 버퍼 (gzip 압축 가능)
+
+    Returns:
+        List[str]: 컬럼명 목록 (앞뒤 공백 제거)
+
+    Raises:
+        ValueError: 인코딩을 인식할 수 없거나 올바른 Excel/gzip 파일이 아닌 경우
+    """
+    with open_table(source) as stream:
+        try:
+            if ExcelParser.is_xlsx(_peek(stream, 4)):
+                headers = ExcelParser().read_frame(stream, max_rows=0).columns
+            else:
+                headers = pd.read_csv(stream, encoding=sniff_encoding(stream), nrows=0).columns
+        except (gzip.BadGzipFile, EOFError) as e:
+            raise ValueError(f"올바른 gzip 압축 파일이 아닙니다: {str(e)}")
+
+    return [str(header).strip() for header in headers]
+
+
+def read_sample(source: Source, rows: int, total_size: Optional[int] = None) -> TableSample:
+    """
+    헤더와 앞쪽 rows개 행만 읽고 전체 행 수 추정
+
+    - CSV: 앞부분(최대 PREVIEW_READ_SIZE)만 읽어 행 평균 크기로 전체 크기를 나눔
+      (gzip은 읽은 구간의 압축률로 압축 해제 크기를 추정)
+    - Excel: 시트의 dimension 정보 사용
+
+    CSV는 파일 앞부분만 담은 입력도 처리할 수 있습니다 (total_size에 원본 크기 지정).
+
+    Args:
+        source: 파일 경로, 바이너리 스트림 또는 버퍼 (gzip 압축 가능)
+        rows: 읽을 데이터 행 수
+        total_size: 원본 파일 전체 크기 (source가 파일 앞부분만 담고 있을 때 지정)
+
+    Returns:
+        TableSample: 표본 DataFrame과 전체 행 수 추정값
+
+    Raises:
+        ValueError: 인코딩을 인식할 수 없거나 올바른 Excel/gzip 파일이 아닌 경우
+    """
+    with open_binary(source) as raw:
+        available = _stream_size(raw)
+        size = total_size or available
+        truncated = total_size is not None and available is not None and total_size > available
+
+        if ExcelParser.is_xlsx(_peek(raw, 4)):
+            parser = ExcelParser()
+            start = raw.tell()
+            frame = parser.read_frame(raw, max_rows=rows)
+            raw.seek(start)
+            return TableSample(frame, parser.declared_row_count(raw))
+
+        if _peek(raw, len(GZIP_SIGNATURE)) == GZIP_SIGNATURE:
+            prefix, expanded, consumed, exhausted = _inflate_prefix(raw, PREVIEW_READ_SIZE)
+        else:
+            prefix = raw.read(PREVIEW_READ_SIZE)
+            expanded = consumed = len(prefix)
+            exhausted = len(prefix) < PREVIEW_READ_SIZE
+
+    at_end = exhausted and not truncated
+
+    # 잘린 마지막 행은 제외하고 헤더 + rows개 행까지만 파싱
+    complete = prefix if at_end else prefix[:prefix.rfind(b'\n') + 1]
+    frame = pd.read_csv(
+        io.BytesIO(complete[:_line_end(complete, rows + 1)]), encoding=detect_encoding(prefix)
+    )
+
+    lines = complete.count(b'\n') + (1 if at_end and complete and not complete.endswith(b'\n') else 0)
+    if at_end:
+        return TableSample(frame, max(lines - 1, 0), exact=True)
+
+    if not size or lines <= 1:
+        return TableSample(frame, None)
+
+    # 전체 크기 (gzip은 읽은 구간의 압축률로 압축 해제 후 크기 추정)
+    expanded_size = size * expanded / consumed
+    header_size = _line_end(complete, 1)
+    row_size = (len(complete) - header_size) / (lines - 1)
+    return TableSample(frame, int(round((expanded_size - header_size) / row_size)))
+
+
+def _inflate_prefix(stream: BinaryIO, limit: int):
+    """
+    gzip 스트림 앞부분 압축 해제 (끝까지 받지 않은 파일도 가능)
+
+    Returns:
+        (prefix, expanded, consumed, exhausted):
+            압축 해제된 앞부분(최대 limit), 압축 해제한 전체 바이트 수,
+            읽은 압축 바이트 수, 입력을 끝까지 읽었는지 여부
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    blocks = []
+    expanded = consumed = 0
+
+    while expanded < limit and not decompressor.eof:
+        block = stream.read(16 * 1024)
+        if not block:
+            break
+        consumed += len(block)
+        try:
+            data = decompressor.decompress(block)
+        except zlib.error as e:
+            raise ValueError(f"올바른 gzip 압축 파일이 아닙니다: {str(e)}")
+        blocks.append(data)
+        expanded += len(data)
+
+    exhausted = decompressor.eof or not stream.read(1)
+    return b''.join(blocks)[:limit], expanded, consumed, exhausted and expanded <= limit
+
+
+def _line_end(data: bytes, count: int) -> int:
+    """count번째 줄바꿈 다음 위치 (줄이 부족하면 데이터 끝)"""
+    position = 0
+    for _ in range(count):
+        newline = data.find(b'\n', position)
+        if newline < 0:
+            return len(data)
+        position = newline + 1
+    return position
+
+
+def _stream_size(stream: BinaryIO) -> Optional[int]:
+    """되감기 가능한 스트림의 전체 크기 (위치는 유지)"""
+    if not stream.seekable():
+        return None
+    start = stream.tell()
+    size = stream.seek(0, io.SEEK_END)
+    stream.seek(start)
+    return size - start
+
+
+def _peek(stream: BinaryIO, size: int) -> bytes:
+    """읽은 위치를 옮기지 않고 앞부분 읽기"""
+    if stream.seekable():
+        start = stream.tell()
+        prefix = stream.read(size)
+        stream.seek(start)
+        return prefix
+    return stream.peek(size)[:size]
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+"""
+데이터 유형 스키마 레지스트리
+
+4가지 데이터 유형의 컬럼(필드명, 업로드/내보내기 헤더, 타입, NULL 허용)과
+검증 규칙을 한 곳에 선언합니다. 파서, 검증기, CSV 내보내기, 통합 조회 변환은
+모두 이 선언에서 만들어진 변환 함수를 사용합니다.
+
+변환 함수는 모듈 로드 시 한 번 컴파일되며, 행 변환 시에는 필드별 타입 분기 없이
+컬럼 순서대로 미리 고른 변환 함수만 호출합니다.
+"""
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from apps.uploads.services.validation_rules import (
+    ChoiceRule,
+    ColumnFrame,
+    CompiledRuleSet,
+    ConditionRule,
+    GroupSumRule,
+    LengthRule,
+    NumberRule,
+    PatternRule,
+    RangeRule,
+    Rule,
+    UniqueRule,
+)
+
+
+# 컬럼 타입
+INT = 'int'
+DECIMAL = 'decimal'
+TEXT = 'text'
+CODE = 'code'  # 대문자 코드 값 (예: SCIE/KCI, Y/N)
+DATE = 'date'
+
+
+def _to_text(value: Any) -> str:
+    return str(value).strip()
+
+
+def _to_code(value: Any) -> str:
+    return str(value).strip().upper()
+
+
+def _to_decimal(value: Any) -> Decimal:
+    return Decimal(str(value))
+
+
+def _to_date(value: Any) -> date:
+    # ISO 형식(YYYY-MM-DD) 문자열은 pandas 형식 추론 없이 바로 변환
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value.strip())
+        except ValueError:
+            pass
+    return pd.to_datetime(value).date()
+
+
+# 타입별 셀 값 변환 함수
+CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    INT: int,
+    DECIMAL: _to_decimal,
+    TEXT: _to_text,
+    CODE: _to_code,
+    DATE: _to_date,
+}
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    컬럼 정의
+
+    Attributes:
+        field: 변환된 필드명 (ORM 모델 필드명과 동일)
+        header: 업로드 CSV 헤더
+        type: 컬럼 타입 (INT, DECIMAL, TEXT, CODE, DATE)
+        nullable: 빈 값 허용 여부 (빈 값은 default로 변환)
+        default: 빈 값일 때 사용할 값
+        export_header: 내보내기 CSV 헤더 (기본값: header)
+    """
+    field: str
+    header: str
+    type: str = TEXT
+    nullable: bool = False
+    default: Any = None
+    export_header: Optional[str] = None
+
+    @property
+    def export_name(self) -> str:
+        return self.export_header or self.header
+
+    def compile(self) -> Callable[[Any], Any]:
+        """셀 값 하나를 변환하는 함수"""
+        convert = CONVERTERS[self.type]
+        if not self.nullable:
+            return convert
+
+        default = self.default
+
+        def convert_nullable(value: Any) -> Any:
+            # NaN / 빈 문자열 / 'nan' 문자열은 빈 값
+            if value is None or pd.isna(value):
+                return default
+            text = str(value).strip()
+            if not text or text.lower() == 'nan':
+                return default
+            return convert(text)
+
+        return convert_nullable
+
+
+class Summary(NamedTuple):
+    """
+    통합 조회(UnifiedDataItem) 공통 필드에 대응하는 컬럼
+
+    date가 None이면 생성일(created_at)을 사용합니다.
+    title은 필드명 또는 '{필드명}' 자리표시자를 포함한 템플릿입니다.
+    여기에 쓰인 필드(amount 제외)는 extra_fields에서 빠집니다.
+    """
+    title: str
+    category: str
+    date: Optional[str] = None
+    amount: Optional[str] = None
+    description: Optional[str] = None
+
+
+@dataclass
+class DataSchema:
+    """
+    데이터 유형 하나의 스키마
+
+    Attributes:
+        name: 데이터 유형 (예: 'department_kpi')
+        columns: 컬럼 정의 (CSV 컬럼 순서)
+        summary: 통합 조회 공통 필드 매핑
+        rules: 행 검증 규칙 (한 행 안에서는 선언 순서대로 메시지가 생성됨)
+        group_rules: 그룹 단위 검증 규칙
+    """
+    name: str
+    columns: Tuple[Column, ...]
+    summary: Summary
+    rules: Sequence[Rule] = ()
+    group_rules: Sequence[GroupSumRule] = ()
+
+    headers: List[str] = field(init=False)
+    field_map: Dict[str, str] = field(init=False)
+    rule_set: CompiledRuleSet = field(init=False)
+
+    def __post_init__(self):
+        self.headers = [column.header for column in self.columns]
+        self.field_map = {column.field: column.header for column in self.columns}
+        self.rule_set = CompiledRuleSet(self.rules, self.group_rules)
+        self._fields = tuple(column.field for column in self.columns)
+        self._converters = tuple(column.compile() for column in self.columns)
+
+    @property
+    def export_headers(self) -> List[str]:
+        return [column.export_name for column in self.columns]
+
+    def summary_slot(self, field_name: str) -> Optional[str]:
+        """
+        필드가 통합 조회 공통 필드로 쓰이면 해당 속성명 ('title', 'category', 'date', 'description')
+
+        None이면 extra_fields에 들어가는 필드입니다.
+        """
+        for slot in ('title', 'category', 'date', 'description'):
+            if getattr(self.summary, slot) == field_name:
+                return slot
+        return None
+
+    def convert(self, values: Sequence[Any]) -> Dict[str, Any]:
+        """
+        헤더 순서의 셀 값 튜플 하나를 변환
+
+        Raises:
+            ValueError, TypeError, ArithmeticError: 셀 값을 변환할 수 없는 경우
+        """
+        return dict(zip(self._fields, [
+            convert(value) for convert, value in zip(self._converters, values)
+        ]))
+
+
+def _scie_without_impact_factor(frame: ColumnFrame) -> np.ndarray:
+    """SCIE 논문인데 Impact Factor가 없는 행"""
+    return (frame.text('journal_grade') == 'SCIE').to_numpy() & frame.null('impact_factor')
+
+
+def _graduate_with_grade(frame: ColumnFrame) -> np.ndarray:
+    """석사/박사인데 학년이 0이 아닌 행"""
+    grade = frame.numeric('grade')
+    graduate = frame.text('program_type').isin(('석사', '박사')).to_numpy()
+    return graduate & np.isfinite(grade) & (grade != 0)
+
+
+DEPARTMENT_KPI = DataSchema(
+    name='department_kpi',
+    columns=(
+        Column('evaluation_year', '평가년도', INT),
+        Column('college', '단과대학'),
+        Column('department', '학과'),
+        Column('employment_rate', '졸업생 취업률 (%)', DECIMAL, export_header='취업률'),
+        Column('full_time_faculty', '전임교원 수 (명)', INT, export_header='전임교원수'),
+        Column('visiting_faculty', '초빙교원 수 (명)', INT, export_header='초빙교원수'),
+        Column('tech_transfer_income', '연간 기술이전 수입액 (억원)', DECIMAL, export_header='기술이전수입'),
+        Column('intl_conferences', '국제학술대회 개최 횟수', INT, export_header='학술대회개최'),
+    ),
+    summary=Summary(
+        title='{evaluation_year}년 {department}',
+        category='college',
+        amount='tech_transfer_income',
+    ),
+    rules=[
+        NumberRule('evaluation_year', "평가년도는 숫자여야 합니다: {evaluation_year}"),
+        RangeRule(
+            'evaluation_year', "평가년도는 2020~2030 범위여야 합니다: {evaluation_year}",
+            low=2020, high=2030
+        ),
+        NumberRule('employment_rate', "취업률은 숫자여야 합니다: {employment_rate}"),
+        RangeRule(
+            'employment_rate', "취업률은 0~100 범위여야 합니다: {employment_rate}",
+            low=0, high=100
+        ),
+        NumberRule('full_time_faculty', "전임교원 수는 숫자여야 합니다: {full_time_faculty}"),
+        RangeRule('full_time_faculty', "전임교원 수는 음수일 수 없습니다", low=0),
+        NumberRule('visiting_faculty', "초빙교원 수는 숫자여야 합니다: {visiting_faculty}"),
+        RangeRule('visiting_faculty', "초빙교원 수는 음수일 수 없습니다", low=0),
+        NumberRule('tech_transfer_income', "기술이전 수입액은 숫자여야 합니다: {tech_transfer_income}"),
+        RangeRule('tech_transfer_income', "기술이전 수입액은 음수일 수 없습니다", low=0),
+        NumberRule('intl_conferences', "국제학술대회 개최 횟수는 숫자여야 합니다: {intl_conferences}"),
+        RangeRule('intl_conferences', "국제학술대회 개최 횟수는 음수일 수 없습니다", low=0),
+        UniqueRule(
+            ('evaluation_year', 'department'),
+            "{evaluation_year}년 {department}는 이미 존재합니다"
+        ),
+    ],
+)
+
+PUBLICATION = DataSchema(
+    name='publication',
+    columns=(
+        Column('paper_id', '논문ID'),
+        Column('publication_date', '게재일', DATE),
+        Column('college', '단과대학'),
+        Column('department', '학과'),
+        Column('paper_title', '논문제목'),
+        Column('lead_author', '주저자'),
+        Column('co_authors', '참여저자', nullable=True, default=''),
+        Column('journal_name', '학술지명'),
+        Column('journal_grade', '저널등급', CODE),
+        Column('impact_factor', 'Impact Factor', DECIMAL, nullable=True, export_header='ImpactFactor'),
+        Column('project_linked', '과제연계여부', CODE, export_header='과제연계'),
+    ),
+    summary=Summary(
+        title='paper_title',
+        category='department',
+        date='publication_date',
+    ),
+    rules=[
+        PatternRule(
+            'paper_id', r'PUB-\d{2}-\d{3,}',
+            "논문ID 형식이 올바르지 않습니다: {paper_id} (PUB-YY-NNN 필요)"
+        ),
+        UniqueRule(('paper_id',), "논문ID가 이미 존재합니다: {paper_id}"),
+        ChoiceRule(
+            'journal_grade', ('SCIE', 'KCI'),
+            "저널 등급은 SCIE 또는 KCI여야 합니다: {journal_grade}"
+        ),
+        ConditionRule(
+            ('journal_grade', 'impact_factor'), _scie_without_impact_factor,
+            "SCIE 논문은 Impact Factor가 필수입니다"
+        ),
+        NumberRule(
+            'impact_factor', "Impact Factor는 숫자여야 합니다: {impact_factor}", nullable=True
+        ),
+        RangeRule('impact_factor', "Impact Factor는 음수일 수 없습니다", low=0),
+        ChoiceRule(
+            'project_linked', ('Y', 'N'),
+            "과제연계여부는 Y 또는 N이어야 합니다: {project_linked}"
+        ),
+        LengthRule('paper_title', 1, 500, "논문 제목은 1자 이상 500자 이하여야 합니다"),
+    ],
+)
+
+RESEARCH_PROJECT = DataSchema(
+    name='research_project',
+    columns=(
+        Column('execution_id', '집행ID'),
+        Column('project_number', '과제번호'),
+        Column('project_name', '과제명'),
+        Column('principal_investigator', '연구책임자'),
+        Column('department', '소속학과'),
+        Column('funding_agency', '지원기관'),
+        Column('total_budget', '총연구비', INT),
+        Column('execution_date', '집행일자', DATE),
+        Column('execution_item', '집행항목'),
+        Column('execution_amount', '집행금액', INT),
+        Column('status', '상태'),
+        Column('remarks', '비고', nullable=True),
+    ),
+    summary=Summary(
+        title='project_name',
+        category='department',
+        date='execution_date',
+        amount='execution_amount',
+        description='remarks',
+    ),
+    rules=[
+        PatternRule(
+            'execution_id', r'T\d{4}\d{3,}',
+            "집행ID 형식이 올바르지 않습니다: {execution_id} (T2324NNN 형식 필요)"
+        ),
+        UniqueRule(('execution_id',), "집행ID가 이미 존재합니다: {execution_id}"),
+        NumberRule('total_budget', "총연구비는 숫자여야 합니다: {total_budget}"),
+        RangeRule('total_budget', "총연구비는 음수일 수 없습니다", low=0),
+        NumberRule('execution_amount', "집행금액은 숫자여야 합니다: {execution_amount}"),
+        RangeRule('execution_amount', "집행금액은 음수일 수 없습니다", low=0),
+        ChoiceRule(
+            'status', ('집행완료', '처리중'),
+            "상태는 '집행완료' 또는 '처리중'이어야 합니다: {status}"
+        ),
+    ],
+    group_rules=[
+        GroupSumRule(
+            'project_number', 'execution_amount', 'total_budget',
+            "과제 {group}의 집행액 합계({total})가 총연구비({limit})를 초과합니다"
+        ),
+    ],
+)
+
+STUDENT_ROSTER = DataSchema(
+    name='student_roster',
+    columns=(
+        Column('student_id', '학번'),
+        Column('name', '이름'),
+        Column('college', '단과대학'),
+        Column('department', '학과'),
+        Column('grade', '학년', INT),
+        Column('program_type', '과정구분'),
+        Column('enrollment_status', '학적상태'),
+        Column('gender', '성별'),
+        Column('admission_year', '입학년도', INT),
+        Column('advisor', '지도교수', nullable=True),
+        Column('email', '이메일'),
+    ),
+    summary=Summary(
+        title='name',
+        category='department',
+    ),
+    rules=[
+        PatternRule(
+            'student_id', r'\d{8,9}',
+            "학번 형식이 올바르지 않습니다: {student_id} (YYYYMMNNN 필요)"
+        ),
+        UniqueRule(('student_id',), "학번이 이미 존재합니다: {student_id}"),
+        LengthRule('name', 2, 50, "이름은 2자 이상 50자 이하여야 합니다: {name}"),
+        NumberRule('grade', "학년은 숫자여야 합니다: {grade}"),
+        RangeRule('grade', "학년은 0~4 범위여야 합니다: {grade}", low=0, high=4),
+        ChoiceRule(
+            'program_type', ('학사', '석사', '박사'),
+            "과정구분은 학사, 석사, 박사 중 하나여야 합니다: {program_type}"
+        ),
+        ConditionRule(
+            ('program_type', 'grade'), _graduate_with_grade,
+            "석사/박사는 학년이 0이어야 합니다: {program_type}, {grade}"
+        ),
+        ChoiceRule(
+            'enrollment_status', ('재학', '휴학', '졸업'),
+            "학적상태는 재학, 휴학, 졸업 중 하나여야 합니다: {enrollment_status}"
+        ),
+        ChoiceRule('gender', ('남', '여'), "성별은 남 또는 여여야 합니다: {gender}"),
+        NumberRule('admission_year', "입학년도는 숫자여야 합니다: {admission_year}"),
+        RangeRule(
+            'admission_year', "입학년도는 2015~2025 범위여야 합니다: {admission_year}",
+            low=2015, high=2025
+        ),
+        PatternRule(
+            'email', r'[^\s@]+@[^\s@]+\.[^\s@]+',
+            "이메일 형식이 올바르지 않습니다: {email}"
+        ),
+    ],
+)
+
+# 데이터 유형 → 스키마
+SCHEMAS: Dict[str, DataSchema] = {
+    schema.name: schema
+    for schema in (DEPARTMENT_KPI, PUBLICATION, RESEARCH_PROJECT, STUDENT_ROSTER)
+}
+
+
+def get_schema(data_type: str) -> DataSchema:
+    """
+    데이터 유형 스키마 조회
+
+    Raises:
+        ValueError: 지원하지 않는 데이터 유형
+    """
+    try:
+        return SCHEMAS[data_type]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 데이터 유형입니다: {data_type}") from None
@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic Data Generator
+
+대용량(10^5~10^7행) 동작 확인용 합성 데이터 생성기.
+
+규모 인자(scale) 1당 학생 10,000명, 논문 3,000건, 연구과제 1,000건(집행 내역 약 5,000행)을
+만들며, 학과 수는 규모의 제곱근에 비례해 늘어납니다 (캠퍼스 단위로 학과 복제).
+
+현실성 규칙:
+- 학과별 비중은 치우친(Zipf형) 분포를 따르며, 단과대학은 항상 학과와 일치
+- 학과별 전임교원 명단을 먼저 만들고, KPI 전임교원 수/논문 주저자/연구책임자/지도교수는
+  모두 해당 학과 명단에서 선택
+- 과제별 집행금액 합계는 항상 총연구비 이하
+- 논문ID, 집행ID, 학번 등은 DataValidator의 형식 규칙을 만족하며 중복 없음
+
+생성 결과는 업로드 CSV와 같은 헤더의 DataFrame이며, 청크 단위로 생성하므로
+큰 규모도 메모리에 한 번에 올리지 않고 파일로 쓸 수 있습니다.
+"""
+import gzip
+import math
+import os
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from apps.uploads.services.schema_registry import get_schema
+
+
+class SyntheticDataGenerator:
+    """
+    합성 데이터 생성기
+
+    같은 scale/seed이면 항상 같은 데이터를 생성합니다.
+    """
+
+    # 단과대학 → 학과
+    COLLEGES = {
+        '공과대학': ['컴퓨터공학과', '전자공학과', '기계공학과', '화학공학과', '건축공학과', '산업공학과'],
+        '자연과학대학': ['수학과', '물리학과', '화학과', '생명과학과', '통계학과'],
+        '인문대학': ['국어국문학과', '영어영문학과', '사학과', '철학과'],
+        '사회과학대학': ['경제학과', '정치외교학과', '심리학과', '사회학과'],
+        '경영대학': ['경영학과', '회계학과'],
+        '의과대학': ['의예과', '간호학과'],
+    }
+
+    # 규모 인자 1당 행 수 (연구과제는 과제 수, 집행 내역은 과제당 평균 5건)
+    ROWS_PER_SCALE = {
+        'student_roster': 10000,
+        'publication': 3000,
+        'research_project': 1000,
+    }
+
+    # KPI 평가년도 / 논문·과제 연도 범위
+    YEARS = (2020, 2021, 2022, 2023, 2024)
+
+    # 데이터 유형별 기본 파일명 (bulk_load --dir과 동일)
+    FILE_NAMES = {
+        'department_kpi': 'department_kpi',
+        'publication': 'publication_list',
+        'research_project': 'research_project_data',
+        'student_roster': 'student_roster',
+    }
+
+    # 한 번에 생성하는 최대 행 수
+    CHUNK_ROWS = 200000
+
+    SURNAMES = ('김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오', '서', '신', '권')
+    SURNAME_WEIGHTS = (21, 15, 8, 5, 4, 2.3, 2.1, 2, 2, 1.7, 1.5, 1.5, 1.5, 1.4, 1.3)
+    GIVEN_SYLLABLES = (
+        '민', '서', '지', '현', '준', '우', '도', '예', '하', '윤', '수', '연', '진', '은', '영',
+        '훈', '원', '호', '아', '유', '재', '성', '경', '혜', '태', '희', '주', '빈', '솔', '린'
+    )
+
+    AGENCIES = (
+        ('한국연구재단', 'NRF'),
+        ('정보통신기획평가원', 'IITP'),
+        ('한국산업기술평가관리원', 'KEIT'),
+        ('중소벤처기업부', 'SMBA'),
+        ('산업통상자원부', 'MOTIE'),
+    )
+    EXECUTION_ITEMS = (
+        '연구장비 도입', '연구재료비', '외부전문가 활용비', '국내 출장비',
+        '해외 학회 참가비', '연구활동비', '인건비', '위탁연구비'
+    )
+    TOPICS = (
+        'AI 반도체', '자율주행', '탄소중립', '바이오 신약', '양자 컴퓨팅', '디지털 인문학',
+        '고령화 사회', '스마트 제조', '이차전지', '기후 변화', '금융 데이터', '공공 정책'
+    )
+    TITLE_PREFIXES = ('차세대', '지능형', '융합', '지속가능한', '데이터 기반', '초저전력')
+    TITLE_SUFFIXES = ('설계', '플랫폼 개발', '핵심기술 연구', '모델링', '실증 연구', '분석')
+    SCIE_JOURNALS = (
+        'IEEE Transactions on Circuits and Systems', 'Nature Communications', 'Physical Review B',
+        'Journal of Finance', 'The Lancet', 'Chemical Engineering Journal'
+    )
+    KCI_JOURNALS = ('한국정보과학회논문지', '철학연구', '경영학연구', '한국물리학회지', '사회과학연구')
+
+    def __init__(self, scale: float = 1.0, seed: int = 42):
+        """
+        Args:
+            scale: 규모 인자 (0보다 커야 함)
+            seed: 난수 시드
+
+        Raises:
+            ValueError: scale이 0 이하인 경우
+        """
+        if scale <= 0:
+            raise ValueError(f"규모 인자는 0보다 커야 합니다: {scale}")
+
+        self.scale = scale
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        self._departments = self._build_departments()
+        self._professors, self._professor_start = self._build_professors()
+
+    def counts(self) -> Dict[str, int]:
+        """데이터 유형별 생성 행 수 (연구과제는 과제 수 기준 추정치)"""
+        return {
+            'department_kpi': len(self._departments) * len(self.YEARS),
+            'publication': self._rows('publication'),
+            'research_project': self._rows('research_project') * 5,
+            'student_roster': self._rows('student_roster'),
+        }
+
+    def iter_frames(self, data_type: str) -> Iterator[pd.DataFrame]:
+        """
+        데이터 유형 하나를 청크 단위로 생성
+
+        Args:
+            data_type: 데이터 유형
+
+        Yields:
+            pd.DataFrame: 업로드 CSV 헤더를 컬럼명으로 갖는 청크
+
+        Raises:
+            ValueError: 지원하지 않는 데이터 유형
+        """
+        field_map = get_schema(data_type).field_map
+        builder = {
+            'department_kpi': self._kpi_chunks,
+            'publication': self._publication_chunks,
+            'research_project': self._research_chunks,
+            'student_roster': self._student_chunks,
+        }[data_type]
+
+        # 데이터 유형마다 독립된 난수열 사용 (생성 순서와 무관하게 같은 결과)
+        rng = np.random.default_rng([self.seed, list(self.FILE_NAMES).index(data_type)])
+        for chunk in builder(rng):
+            yield chunk[list(field_map)].rename(columns=field_map)
+
+    def write(
+        self,
+        directory: str,
+        data_types: List[str] = None,
+        compress: bool = False
+    ) -> List[Tuple[str, str, int]]:
+        """
+        CSV 파일로 저장 (bulk_load --dir / 업로드 테스트용)
+
+        Args:
+            directory: 저장 디렉토리
+            data_types: 생성할 데이터 유형 (기본값: 전체)
+            compress: True이면 .csv.gz로 저장
+
+        Returns:
+            List[(데이터 유형, 파일 경로, 행 수)]
+        """
+        os.makedirs(directory, exist_ok=True)
+        written = []
+
+        for data_type in data_types or list(self.FILE_NAMES):
+            extension = '.csv.gz' if compress else '.csv'
+            path = os.path.join(directory, self.FILE_NAMES[data_type] + extension)
+            opener = gzip.open if compress else open
+            rows = 0
+
+            with opener(path, 'wt', encoding='utf-8', newline='') as stream:
+                for chunk in self.iter_frames(data_type):
+                    chunk.to_csv(stream, header=rows == 0, index=False)
+                    rows += len(chunk)
+
+            written.append((data_type, path, rows))
+
+        return written
+
+    # ========== 기준 데이터 ==========
+
+    def _rows(self, data_type: str) -> int:
+        return max(1, int(round(self.ROWS_PER_SCALE[data_type] * self.scale)))
+
+    def _build_departments(self) -> pd.DataFrame:
+        """학과 목록 (캠퍼스 단위 복제, 치우친 비중, 전임교원 수)"""
+        campuses = max(1, int(round(math.sqrt(self.scale))))
+        base = [(college, name) for college, names in self.COLLEGES.items() for name in names]
+
+        rows = []
+        for campus in range(1, campuses + 1):
+            for college, name in base:
+                department = name if campus == 1 else f"{name}({campus}캠퍼스)"
+                rows.append((college, department))
+
+        departments = pd.DataFrame(rows, columns=['college', 'department'])
+
+        # Zipf형 비중을 무작위 순서로 배정
+        weights = 1.0 / np.arange(1, len(departments) + 1) ** 0.9
+        departments['weight'] = self._rng.permutation(weights / weights.sum())
+
+        # 비중이 큰 학과일수록 전임교원이 많음 (8~60명)
+        relative = departments['weight'] / departments['weight'].max()
+        departments['faculty'] = (8 + np.round(52 * relative ** 0.7)).astype(int)
+        return departments
+
+    def _build_professors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """학과별 전임교원 이름 (전체를 이어 붙인 배열과 학과별 시작 위치)"""
+        faculty = self._departments['faculty'].to_numpy()
+        names = self._names(self._rng, int(faculty.sum()))
+        start = np.concatenate(([0], np.cumsum(faculty)[:-1]))
+        return names, start
+
+    def _names(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """한국식 이름"""
+        weights = np.array(self.SURNAME_WEIGHTS) / sum(self.SURNAME_WEIGHTS)
+        surnames = rng.choice(self.SURNAMES, size=size, p=weights)
+        first = rng.choice(self.GIVEN_SYLLABLES, size=size)
+        second = rng.choice(self.GIVEN_SYLLABLES, size=size)
+        return np.char.add(np.char.add(surnames, first), second).astype(object)
+
+    def _pick_departments(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """비중에 따라 학과 번호 선택"""
+        return rng.choice(len(self._departments), size=size, p=self._departments['weight'].to_numpy())
+
+    def _pick_professors(self, rng: np.random.Generator, departments: np.ndarray) -> np.ndarray:
+        """학과별 전임교원 명단에서 한 명씩 선택"""
+        faculty = self._departments['faculty'].to_numpy()[departments]
+        offset = (rng.random(len(departments)) * faculty).astype(int)
+        return self._professors[self._professor_start[departments] + offset]
+
+    def _department_columns(self, departments: np.ndarray) -> Dict[str, np.ndarray]:
+        return {
+            'college': self._departments['college'].to_numpy()[departments],
+            'department': self._departments['department'].to_numpy()[departments],
+        }
+
+    def _titles(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        prefix = rng.choice(self.TITLE_PREFIXES, size=size)
+        topic = rng.choice(self.TOPICS, size=size)
+        suffix = rng.choice(self.TITLE_SUFFIXES, size=size)
+        return np.char.add(np.char.add(np.char.add(prefix, ' '), np.char.add(topic, ' ')), suffix).astype(object)
+
+    @staticmethod
+    def _dates(rng: np.random.Generator, years: np.ndarray) -> pd.Series:
+        """연도 안의 임의 날짜 (YYYY-MM-DD)"""
+        start = pd.to_datetime(pd.Series(years).astype(str) + '-01-01')
+        days = rng.integers(0, 365, size=len(years))
+        return (start + pd.to_timedelta(days, unit='D')).dt.strftime('%Y-%m-%d')
+
+    def _chunk_sizes(self, total: int) -> Iterator[int]:
+        for start in range(0, total, self.CHUNK_ROWS):
+            yield min(self.CHUNK_ROWS, total - start)
+
+    # ========== 데이터 유형별 생성 ==========
+
+    def _kpi_chunks(self, rng: np.random.Generator) -> Iterator[pd.DataFrame]:
+        """학과 × 평가년도 KPI (전임교원 수는 학과 명단 인원)"""
+        departments = self._departments
+        count = len(departments)
+        base_rate = rng.uniform(55, 92, size=count)
+        base_income = rng.lognormal(mean=0.5, sigma=0.9, size=count)
+
+        frames = []
+        for year_index, year in enumerate(self.YEARS):
+            frames.append(pd.DataFrame({
+                'evaluation_year': year,
+                'college': departments['college'],
+                'department': departments['department'],
+                'employment_rate': np.clip(base_rate + rng.normal(0, 3, size=count), 0, 100).round(1),
+                # 과거 연도는 현재 명단보다 조금 적음
+                'full_time_faculty': np.maximum(
+                    1, departments['faculty'] - (len(self.YEARS) - 1 - year_index) // 2
+                ),
+                'visiting_faculty': rng.poisson(3, size=count),
+                'tech_transfer_income': (base_income * rng.uniform(0.7, 1.3, size=count)).round(1),
+                'intl_conferences': rng.poisson(1.5, size=count),
+            }))
+
+        yield pd.concat(frames, ignore_index=True)
+
+    def _publication_chunks(self, rng: np.random.Generator) -> Iterator[pd.DataFrame]:
+        """논문 (주저자는 학과 전임교원, SCIE만 Impact Factor)"""
+        sequence = {}
+        for size in self._chunk_sizes(self._rows('publication')):
+            departments = self._pick_departments(rng, size)
+            years = rng.choice(self.YEARS, size=size)
+            scie = rng.random(size) < 0.4
+
+            co_author_count = rng.integers(0, 4, size=size)
+            co_names = self._names(rng, int(co_author_count.sum()))
+            co_authors = [';'.join(names) for names in np.split(co_names, np.cumsum(co_author_count)[:-1])]
+
+            frame = pd.DataFrame({
+                'paper_id': self._sequence_ids(years, sequence, lambda y, n: f"PUB-{y % 100:02d}-{n:06d}"),
+                'publication_date': self._dates(rng, years),
+                **self._department_columns(departments),
+                'paper_title': self._titles(rng, size),
+                'lead_author': self._pick_professors(rng, departments),
+                'co_authors': co_authors,
+                'journal_name': np.where(
+                    scie, rng.choice(self.SCIE_JOURNALS, size=size), rng.choice(self.KCI_JOURNALS, size=size)
+                ),
+                'journal_grade': np.where(scie, 'SCIE', 'KCI'),
+                'impact_factor': np.where(scie, rng.lognormal(1.0, 0.6, size=size).round(2), np.nan),
+                'project_linked': np.where(rng.random(size) < 0.45, 'Y', 'N'),
+            })
+            yield frame
+
+    def _research_chunks(self, rng: np.random.Generator) -> Iterator[pd.DataFrame]:
+        """연구과제 집행 내역 (과제별 집행 합계 ≤ 총연구비)"""
+        execution_seq = 0
+        project_seq = 0
+        project_chunk = max(1, self.CHUNK_ROWS // 5)
+
+        for start in range(0, self._rows('research_project'), project_chunk):
+            projects = min(project_chunk, self._rows('research_project') - start)
+            departments = self._pick_departments(rng, projects)
+            years = rng.choice(self.YEARS, size=projects)
+            agencies = rng.integers(0, len(self.AGENCIES), size=projects)
+
+            # 총연구비: 3천만~30억 (천만원 단위)
+            budgets = (np.clip(rng.lognormal(19.5, 0.8, size=projects), 3e7, 3e9) // 1e7 * 1e7).astype(np.int64)
+            numbers = np.array([
+                f"{self.AGENCIES[agency][1]}-{year}-{project_seq + i + 1:05d}"
+                for i, (agency, year) in enumerate(zip(agencies, years))
+            ], dtype=object)
+            project_seq += projects
+
+            # 과제별 집행 건수와 금액 (Dirichlet 비율 × 집행률, 천원 단위 내림)
+            executions = 1 + rng.poisson(4, size=projects)
+            owner = np.repeat(np.arange(projects), executions)
+            shares = rng.gamma(1.0, size=len(owner))
+            shares /= np.bincount(owner, weights=shares)[owner]
+            utilization = rng.uniform(0.4, 0.98, size=projects)
+            amounts = (budgets[owner] * utilization[owner] * shares // 1000 * 1000).astype(np.int64)
+
+            dates = pd.to_datetime(self._dates(rng, years[owner]))
+            ids = [
+                f"T{date.year % 100:02d}{date.month:02d}{execution_seq + i + 1:06d}"
+                for i, date in enumerate(dates)
+            ]
+            execution_seq += len(owner)
+
+            frame = pd.DataFrame({
+                'execution_id': ids,
+                'project_number': numbers[owner],
+                'project_name': self._titles(rng, projects)[owner],
+                'principal_investigator': self._pick_professors(rng, departments)[owner],
+                'department': self._departments['department'].to_numpy()[departments][owner],
+                'funding_agency': np.array([name for name, _ in self.AGENCIES], dtype=object)[agencies][owner],
+                'total_budget': budgets[owner],
+                'execution_date': dates.dt.strftime('%Y-%m-%d'),
+                'execution_item': rng.choice(self.EXECUTION_ITEMS, size=len(owner)),
+                'execution_amount': amounts,
+                # 마지막 두 달 집행분은 처리중
+                'status': np.where(dates >= pd.Timestamp(self.YEARS[-1], 11, 1), '처리중', '집행완료'),
+                'remarks': np.where(rng.random(len(owner)) < 0.2, '증빙 보완 예정', ''),
+            })
+            yield frame
+
+    def _student_chunks(self, rng: np.random.Generator) -> Iterator[pd.DataFrame]:
+        """학생 명단 (대학원생 지도교수는 학과 전임교원, 학번은 입학년도별 일련번호)"""
+        sequence = {}
+        current_year = self.YEARS[-1]
+
+        for size in self._chunk_sizes(self._rows('student_roster')):
+            departments = self._pick_departments(rng, size)
+            program = rng.choice(('학사', '석사', '박사'), size=size, p=(0.82, 0.13, 0.05))
+            undergraduate = program == '학사'
+            status = rng.choice(('재학', '휴학', '졸업'), size=size, p=(0.8, 0.12, 0.08))
+            # 학부 졸업생은 4학년
+            grade = np.where(
+                undergraduate, np.where(status == '졸업', 4, rng.integers(1, 5, size=size)), 0
+            )
+
+            # 학부생: 학년 + 휴학 기간으로 입학년도 역산 / 대학원생: 최근 6년
+            leave = np.where(status == '휴학', rng.integers(0, 3, size=size), 0)
+            admission = np.where(
+                undergraduate,
+                current_year - grade + 1 - leave,
+                rng.integers(current_year - 5, current_year + 1, size=size)
+            )
+            admission = np.clip(admission, 2015, 2025)
+
+            student_ids = self._sequence_ids(admission, sequence, lambda y, n: f"{y % 100:02d}{n:07d}")
+            advised = ~undergraduate | (rng.random(size) < 0.4)
+
+            yield pd.DataFrame({
+                'student_id': student_ids,
+                'name': self._names(rng, size),
+                **self._department_columns(departments),
+                'grade': grade,
+                'program_type': program,
+                'enrollment_status': status,
+                'gender': np.where(rng.random(size) < 0.5, '남', '여'),
+                'admission_year': admission,
+                'advisor': np.where(advised, self._pick_professors(rng, departments), ''),
+                'email': [f"s{student_id}@university.ac.kr" for student_id in student_ids],
+            })
+
+    @staticmethod
+    def _sequence_ids(years: np.ndarray, sequence: Dict[int, int], formatter) -> List[str]:
+        """연도별 일련번호 ID (청크를 넘어 이어지는 번호)"""
+        ids = []
+        for year in years.tolist():
+            number = sequence.get(year, 0) + 1
+            sequence[year] = number
+            ids.append(formatter(year, number))
+        return ids
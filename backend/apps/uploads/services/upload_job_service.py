@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""
+Upload Job Service
+
+대용량 파일 업로드를 백그라운드 작업으로 처리합니다.
+
+HTTP 요청은 파일을 저장하고 작업 ID만 즉시 반환하며,
+실제 파싱/검증/저장은 워커(python manage.py run_upload_worker)가 수행합니다.
+이어받기 업로드 세션도 완료 시 조립 파일을 그대로 작업으로 등록합니다 (submit_stored).
+
+워커는 처리 중 UPLOAD_JOB_HEARTBEAT_INTERVAL마다 작업의 heartbeat_at을 갱신합니다.
+워커가 비정상 종료되어 heartbeat_at이 UPLOAD_JOB_STALE_SECONDS보다 오래된 작업은
+다음 작업을 선점할 때 다시 대기열로 돌리며, UPLOAD_JOB_MAX_ATTEMPTS번 선점된 작업은 실패로 종료합니다.
+"""
+import logging
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import DatabaseError, connections
+from django.utils import timezone
+
+from apps.uploads.domain.models import UploadRecord
+from apps.uploads.repositories.upload_repository import UploadRepository
+from apps.uploads.repositories.upload_session_repository import UploadSessionRepository
+from apps.uploads.services.file_processor import FileProcessorService
+from infrastructure.database.replica_pins import pin_user
+
+logger = logging.getLogger(__name__)
+
+
+class UploadJobService:
+    """
+    백그라운드 업로드 작업 서비스
+
+    작업 등록(submit), 워커 실행(run_next / run_job), 상태 조회(get_status)를 담당합니다.
+    """
+
+    # FileProcessorService 진행 이벤트 → (다음 처리 단계, 갱신할 카운터)
+    PROGRESS_STAGES = {
+        'parsed': ('validating', 'rows_parsed'),
+        'validated': ('inserting', 'rows_validated'),
+        'inserted': ('inserting', 'rows_processed'),
+    }
+
+    def __init__(
+        self,
+        repository: Optional[UploadRepository] = None,
+        processor: Optional[FileProcessorService] = None,
+        session_repository: Optional[UploadSessionRepository] = None
+    ):
+        self.repository = repository or UploadRepository()
+        self.processor = processor or FileProcessorService()
+        self.session_repository = session_repository or UploadSessionRepository()
+
+    def submit(
+        self, file: UploadedFile, data_type: str, uploaded_by: str, mode: str = 'strict'
+    ) -> UploadRecord:
+        """
+        업로드 작업 등록
+
+        Args:
+            file: 업로드된 파일
+            data_type: 데이터 유형
+            uploaded_by: 업로드 사용자
+            mode: 처리 모드 ('strict' 또는 'partial')
+
+        Returns:
+            UploadRecord: 등록된 작업 (status='pending')
+                같은 내용의 파일이 이미 성공적으로 처리된 경우 이전 작업(status='success')
+
+        Raises:
+            ValueError: 데이터 타입 또는 파일 형식 오류
+        """
+        self.processor.validate_request(file.name, data_type, mode)
+        stored_file, content_hash = self._store_file(file)
+
+        try:
+            job = self.submit_stored(stored_file, file.name, data_type, uploaded_by, content_hash, mode)
+        except Exception:
+            self.processor.cleanup_temp_file(stored_file)
+            raise
+
+        if job.status != 'pending':
+            self.processor.cleanup_temp_file(stored_file)
+        return job
+
+    def submit_stored(
+        self,
+        stored_file: str,
+        filename: str,
+        data_type: str,
+        uploaded_by: str,
+        content_hash: str,
+        mode: str = 'strict'
+    ) -> UploadRecord:
+        """
+        이미 저장된 파일을 작업으로 등록 (요청 검증은 호출한 쪽에서 수행)
+
+        Args:
+            stored_file: 워커가 처리할 파일 경로 (작업이 끝나면 삭제됨)
+            filename: 원본 파일명
+            data_type: 데이터 유형
+            uploaded_by: 업로드 사용자
+            content_hash: 파일 내용 SHA-256
+            mode: 처리 모드 ('strict' 또는 'partial')
+
+        Returns:
+            UploadRecord: 등록된 작업 (status='pending')
+                같은 내용의 파일이 이미 성공적으로 처리된 경우 이전 작업 (파일은 호출한 쪽에서 정리)
+        """
+        previous = self.repository.find_completed_by_hash(data_type, content_hash)
+        if previous is not None:
+            return previous
+
+        return self.repository.create_job(filename, data_type, uploaded_by, stored_file, content_hash, mode)
+
+    def run_next(self) -> Optional[UploadRecord]:
+        """
+        대기 중인 작업 하나를 선점하여 처리 (선점 전에 비정상 종료된 워커의 작업을 정리)
+
+        Returns:
+            처리 완료된 작업 또는 None (대기 작업 없음)
+        """
+        self.requeue_stale_jobs()
+        job = self.repository.claim_next_job()
+        if job is None:
+            return None
+
+        self.run_job(job)
+        return self.repository.get_by_id(job.id)
+
+    def requeue_stale_jobs(self) -> int:
+        """
+        워커가 비정상 종료되어 처리 중으로 남은 작업을 다시 대기열로 전환
+
+        선점 횟수가 UPLOAD_JOB_MAX_ATTEMPTS에 도달한 작업은 (워커를 죽게 하는 파일일 수 있으므로)
+        다시 시도하지 않고 실패로 종료합니다. 청크를 커밋하기 시작한 partial 작업도
+        다시 처리하면 저장된 행이 중복 오류로 기록되므로 실패로 종료합니다.
+
+        Returns:
+            int: 대기열로 돌리거나 실패로 종료한 작업 수
+        """
+        before = timezone.now() - timedelta(seconds=settings.UPLOAD_JOB_STALE_SECONDS)
+        recovered = 0
+
+        for job in self.repository.find_stale_jobs(before):
+            if not job.can_rerun():
+                message = f"부분 성공 작업이 저장 중 중단되었습니다 (저장 확인된 행 {job.rows_processed}건)"
+            elif job.attempts < settings.UPLOAD_JOB_MAX_ATTEMPTS:
+                if self.repository.requeue_stale_job(job.id, before):
+                    logger.warning("응답 없는 업로드 작업 %s를 다시 대기열로 돌립니다 (시도 %d회)", job.id, job.attempts)
+                    recovered += 1
+                continue
+            else:
+                message = f"워커가 처리 중 종료되었습니다 (시도 {job.attempts}회)"
+
+            if self.repository.fail_stale_job(job.id, before, message):
+                logger.error("업로드 작업 %s를 다시 처리하지 않고 실패로 종료합니다: %s", job.id, message)
+                self._release_file(job, failed=True)
+                recovered += 1
+
+        return recovered
+
+    def run_job(self, job: UploadRecord) -> None:
+        """
+        선점된 작업 처리
+
+        처리 결과(성공/검증 실패/예외)는 모두 작업 상태로 기록되며,
+        저장 파일은 처리 후 삭제됩니다. 단, 이어받기 업로드 세션의 작업이 실패하면
+        세션을 'failed'로 돌려 다시 완료할 수 있도록 조립 파일을 남겨 둡니다.
+        작업이 끝나면 업로드한 사용자를 기본 DB로 고정하여, 작업이 오래 걸려도
+        완료 직후의 조회가 복제 지연으로 예전 데이터를 보지 않게 합니다.
+
+        Args:
+            job: 처리할 작업 (status='processing')
+        """
+        def on_progress(event: str, rows: int) -> None:
+            stage, counter = self.PROGRESS_STAGES[event]
+            self.repository.update_progress(job.id, stage, **{counter: rows})
+
+        failed = True
+        try:
+            with self._heartbeat(job.id):
+                result = self.processor.process_source(
+                    job.stored_file, job.filename, job.data_type, progress=on_progress, mode=job.mode
+                )
+        except Exception as e:
+            logger.exception("업로드 작업 %s 처리 실패", job.id)
+            self.repository.update_upload_status(job.id, 'failed', 0, str(e))
+        else:
+            if 'status' in result:
+                # partial 모드: 건수와 오류 리포트만 기록
+                self.repository.update_upload_status(
+                    job.id,
+                    result['status'],
+                    result['rows_processed'],
+                    rows_rejected=result['rows_rejected'],
+                    error_report=result['error_report']
+                )
+                failed = result['status'] == 'failed'
+            elif result['success']:
+                self.repository.update_upload_status(job.id, 'success', result['rows_processed'])
+                failed = False
+            else:
+                self.repository.update_upload_status(
+                    job.id, 'failed', 0, '\n'.join(result.get('errors', []))
+                )
+        finally:
+            self._release_file(job, failed)
+            pin_user(email=job.uploaded_by)
+
+    def get_status(self, job_id: int) -> Optional[Dict]:
+        """
+        작업 상태 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Dict: 작업 상태 (처리 단계별 행 수, 경과 시간, 처리량) 또는 None
+        """
+        job = self.repository.get_by_id(job_id)
+        if job is None:
+            return None
+
+        now = timezone.now()
+        elapsed = job.elapsed_seconds(now)
+
+        return {
+            'job_id': job.id,
+            'status': job.status,
+            'stage': job.stage,
+            'filename': job.filename,
+            'data_type': job.data_type,
+            'rows_parsed': job.rows_parsed,
+            'rows_validated': job.rows_validated,
+            'rows_inserted': job.rows_processed,
+            'rows_rejected': job.rows_rejected,
+            'mode': job.mode,
+            'error_report': job.error_report,
+            'elapsed_seconds': round(elapsed, 3) if elapsed is not None else None,
+            'rows_per_second': job.throughput(now),
+            'error_message': job.error_message,
+            'uploaded_at': job.uploaded_at,
+            'finished_at': job.finished_at,
+        }
+
+    def _release_file(self, job: UploadRecord, failed: bool) -> None:
+        """작업 파일 삭제 (실패한 이어받기 업로드 세션의 조립 파일은 다시 완료할 수 있도록 남김)"""
+        if not (failed and self.session_repository.fail_for_job(job.id)):
+            self.processor.cleanup_temp_file(job.stored_file)
+
+    @contextmanager
+    def _heartbeat(self, job_id: int) -> Iterator[None]:
+        """처리하는 동안 별도 스레드에서 UPLOAD_JOB_HEARTBEAT_INTERVAL마다 워커 확인 시각 갱신"""
+        stop = threading.Event()
+
+        def beat() -> None:
+            try:
+                while not stop.wait(settings.UPLOAD_JOB_HEARTBEAT_INTERVAL):
+                    try:
+                        self.repository.heartbeat(job_id)
+                    except DatabaseError:
+                        logger.warning("업로드 작업 %s의 heartbeat 기록 실패", job_id, exc_info=True)
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=beat, name=f'upload-job-{job_id}-heartbeat', daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _store_file(self, file: UploadedFile) -> Tuple[str, str]:
+        """
+        작업 파일 저장 (작업마다 고유한 파일명 사용)
+
+        Args:
+            file: 업로드된 파일
+
+        Returns:
+            Tuple[str, str]: (저장된 파일 경로, 파일 내용 SHA-256 hex)
+        """
+        job_dir = str(settings.UPLOAD_JOB_DIR)
+        os.makedirs(job_dir, exist_ok=True)
+
+        extension = os.path.splitext(file.name)[1].lower()
+        file_path = os.path.join(job_dir, f"{uuid.uuid4().hex}{extension}")
+
+        return file_path, self.processor.write_chunks(file, file_path)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Upload Preview Service
+
+전체 파이프라인을 실행하기 전에 파일 앞부분만 읽어 문제를 미리 확인합니다 (dry-run).
+DB에는 아무것도 저장하지 않습니다.
+"""
+import json
+import time
+from typing import Dict, Optional
+
+from django.core.files.uploadedfile import UploadedFile
+
+from apps.uploads.services.data_validator import DataValidator
+from apps.uploads.services.file_processor import FileProcessorService
+from apps.uploads.services.parsers.source import read_sample
+
+
+class UploadPreviewService:
+    """
+    업로드 미리보기 서비스
+
+    헤더와 앞쪽 N개 행만 읽어 필수 컬럼, 행 변환/검증 오류, 전체 행 수 추정값을 반환합니다.
+    """
+
+    # 기본 / 최대 표본 행 수
+    DEFAULT_SAMPLE_ROWS = 20
+    MAX_SAMPLE_ROWS = 1000
+
+    def __init__(self, processor: Optional[FileProcessorService] = None):
+        self.processor = processor or FileProcessorService()
+
+    def preview(
+        self,
+        file: UploadedFile,
+        data_type: str,
+        sample_rows: int = DEFAULT_SAMPLE_ROWS,
+        total_size: Optional[int] = None
+    ) -> Dict:
+        """
+        업로드 미리보기
+
+        CSV는 파일 앞부분만 보내도 됩니다 (total_size에 원본 크기를 지정하면 행 수 추정에 사용).
+
+        Args:
+            file: 업로드된 파일 (또는 CSV 앞부분)
+            data_type: 데이터 유형
+            sample_rows: 확인할 데이터 행 수 (최대 MAX_SAMPLE_ROWS)
+            total_size: 원본 파일 전체 크기 (바이트, 선택)
+
+        Returns:
+            Dict: 미리보기 결과
+                {
+                    'success': bool (필수 컬럼이 모두 있고 표본에 오류가 없으면 True),
+                    'filename': str,
+                    'data_type': str,
+                    'columns': List[str],
+                    'missing_columns': List[str],
+                    'sample_rows': int,
+                    'rows': List[Dict] (표본 원본 값),
+                    'errors': List[Dict] ({'line': int, 'messages': List[str]}),
+                    'estimated_rows': int 또는 None,
+                    'estimated_rows_exact': bool,
+                    'elapsed_ms': float
+                }
+
+        Raises:
+            ValueError: 데이터 타입/파일 형식 오류 또는 읽을 수 없는 파일
+        """
+        started = time.perf_counter()
+        self.processor.validate_request(file.name, data_type)
+        sample_rows = max(1, min(sample_rows, self.MAX_SAMPLE_ROWS))
+
+        # 파일 전체를 읽는 해시 계산/복사 없이 앞부분만 읽음
+        if hasattr(file, 'temporary_file_path'):
+            sample = read_sample(file.temporary_file_path(), sample_rows, total_size)
+        else:
+            file.seek(0)
+            sample = read_sample(file.file, sample_rows, total_size)
+
+        parser_class = self.processor.PARSER_MAP[data_type]
+        frame = sample.frame
+        frame.columns = [str(column).strip() for column in frame.columns]
+        missing_columns = parser_class.missing_columns(frame.columns)
+
+        errors = [] if missing_columns else self._sample_errors(parser_class, data_type, frame)
+
+        return {
+            'success': not missing_columns and not errors,
+            'filename': file.name,
+            'data_type': data_type,
+            'columns': list(frame.columns),
+            'missing_columns': missing_columns,
+            'sample_rows': len(frame),
+            'rows': json.loads(frame.to_json(orient='records', force_ascii=False, date_format='iso')),
+            'errors': errors,
+            'estimated_rows': sample.estimated_rows,
+            'estimated_rows_exact': sample.exact,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def _sample_errors(self, parser_class, data_type: str, frame) -> list:
+        """표본 행 변환/검증 오류 (행 번호 순)"""
+        errors = {}
+        lines = []
+        parsed_data = []
+        for row in parser_class.iter_frame(frame.copy()):
+            if row.error is not None:
+                errors[row.line] = [f"파싱 오류: {row.error}"]
+            else:
+                lines.append(row.line)
+                parsed_data.append(row.data)
+
+        for index, messages in DataValidator.explain(data_type, parsed_data):
+            errors[lines[index]] = list(messages)
+
+        return [{'line': line, 'messages': errors[line]} for line in sorted(errors)]
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+Upload Session Service
+
+요청 크기 제한(DATA_UPLOAD_MAX_MEMORY_SIZE)을 넘는 파일을 청크 단위로 업로드합니다.
+
+1. 세션 생성 (POST /api/uploads/sessions/): 파일명, 데이터 유형, 전체 크기 등록
+2. 청크 전송 (PUT /api/uploads/sessions/<id>/chunks/<offset>/): 청크 SHA-256 헤더와 함께 전송
+3. 완료 (POST /api/uploads/sessions/<id>/complete/): 조립된 파일을 백그라운드 업로드 작업으로 등록
+   (처리 결과는 GET /api/uploads/jobs/<job_id>/ 로 조회)
+
+연결이 끊기면 세션 상태(GET /api/uploads/sessions/<id>/)의 missing_offsets 청크만 다시 보내면 됩니다.
+청크는 순서와 관계없이(병렬로도) 보낼 수 있습니다.
+작업이 실패하면 세션은 'failed'가 되고 조립 파일이 남으므로 청크를 다시 보내지 않고 다시 완료할 수 있습니다.
+ZIP 묶음은 작업 워커가 처리하지 않으므로 POST /api/uploads/ 로 업로드합니다.
+"""
+import hashlib
+import logging
+import os
+from datetime import timedelta
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.uploads.domain.models import UploadSession
+from apps.uploads.repositories.upload_session_repository import UploadSessionRepository
+from apps.uploads.services.file_processor import FileProcessorService
+from apps.uploads.services.upload_job_service import UploadJobService
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSessionService:
+    """
+    이어받기 업로드 세션 서비스
+
+    세션 생성(create), 청크 기록(write_chunk), 상태 조회(get_status), 완료(complete)를 담당합니다.
+    """
+
+    def __init__(
+        self,
+        repository: Optional[UploadSessionRepository] = None,
+        processor: Optional[FileProcessorService] = None,
+        job_service: Optional[UploadJobService] = None
+    ):
+        self.repository = repository or UploadSessionRepository()
+        self.processor = processor or FileProcessorService()
+        self.job_service = job_service or UploadJobService(processor=self.processor, session_repository=self.repository)
+
+    def create(
+        self,
+        filename: str,
+        data_type: Optional[str],
+        total_size: int,
+        uploaded_by: str,
+        mode: str = 'strict',
+        chunk_size: Optional[int] = None
+    ) -> UploadSession:
+        """
+        업로드 세션 생성
+
+        조립 파일을 전체 크기로 미리 만들어 두고 청크를 해당 오프셋에 기록합니다.
+
+        Args:
+            filename: 원본 파일명
+            data_type: 데이터 유형
+            total_size: 전체 파일 크기 (바이트)
+            uploaded_by: 업로드 사용자
+            mode: 처리 모드 ('strict' 또는 'partial')
+            chunk_size: 희망 청크 크기 (요청 크기 제한을 넘지 않도록 조정됨)
+
+        Returns:
+            UploadSession: 생성된 세션
+
+        Raises:
+            ValueError: 데이터 타입/파일 형식/처리 모드 오류 (ZIP 묶음 포함) 또는 크기 제한 초과
+        """
+        self.processor.validate_request(filename, data_type, mode)
+
+        max_size = settings.UPLOAD_SESSION_MAX_SIZE
+        if not 0 < total_size <= max_size:
+            raise ValueError(f"파일 크기는 1바이트 이상 {max_size // (1024 * 1024)}MB 이하여야 합니다")
+
+        self.purge_expired()
+
+        # 청크 하나가 요청 본문 크기 제한(DATA_UPLOAD_MAX_MEMORY_SIZE)을 넘지 않도록 조정
+        chunk_size = max(1, min(
+            chunk_size or settings.UPLOAD_SESSION_CHUNK_SIZE,
+            settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        ))
+
+        session = self.repository.create(
+            filename=filename,
+            data_type=data_type,
+            mode=mode,
+            total_size=total_size,
+            chunk_size=chunk_size,
+            uploaded_by=uploaded_by,
+            expires_at=timezone.now() + timedelta(hours=settings.UPLOAD_SESSION_TTL_HOURS),
+        )
+
+        os.makedirs(str(settings.UPLOAD_SESSION_DIR), exist_ok=True)
+        with open(self._part_path(session.id), 'wb') as part:
+            part.truncate(total_size)
+
+        return session
+
+    def write_chunk(self, session_id: str, offset: int, data: bytes, checksum: str) -> Optional[Dict]:
+        """
+        청크 기록
+
+        같은 청크를 같은 내용으로 다시 보내면 무시합니다 (재시도 안전).
+        청크 행을 먼저 선점한 트랜잭션 안에서 파일에 기록하므로, 같은 청크가 동시에 전송되어도
+        나중 요청은 선점이 끝날 때까지 기다렸다가 기록된 체크섬과 비교만 합니다.
+        (파일 내용과 기록된 체크섬이 어긋나지 않고, 파일 기록 전에는 수신 완료로 보이지 않음)
+
+        Args:
+            session_id: 세션 ID
+            offset: 청크 시작 오프셋 (chunk_size의 배수)
+            data: 청크 내용
+            checksum: 클라이언트가 계산한 청크 SHA-256 (hex)
+
+        Returns:
+            Dict: 세션 상태 또는 None (세션 없음)
+
+        Raises:
+            ValueError: 세션이 닫혔거나, 오프셋/크기가 맞지 않거나, 체크섬 불일치
+        """
+        session = self._get_open(session_id)
+        if session is None:
+            return None
+
+        if offset % session.chunk_size or not 0 <= offset < session.total_size:
+            raise ValueError(
+                f"청크 오프셋은 {session.chunk_size}의 배수이고 파일 크기보다 작아야 합니다: {offset}"
+            )
+
+        index = offset // session.chunk_size
+        expected_size = session.chunk_length(index)
+        if len(data) != expected_size:
+            raise ValueError(f"청크 크기가 올바르지 않습니다: {len(data)} (기대값 {expected_size})")
+
+        actual = hashlib.sha256(data).hexdigest()
+        if actual != (checksum or '').lower():
+            raise ValueError("청크 체크섬(SHA-256)이 일치하지 않습니다. 청크를 다시 전송해 주세요")
+
+        with transaction.atomic():
+            claimed = self.repository.add_chunk(session.id, index, len(data), actual)
+            if claimed:
+                # 기록에 실패하면 선점도 롤백되어 청크를 다시 보낼 수 있음
+                self._write_part(session.id, offset, data)
+
+        if not claimed and self.repository.get_chunk_checksum(session.id, index) != actual:
+            raise ValueError(f"이미 다른 내용으로 수신된 청크입니다 (오프셋 {offset})")
+
+        return self.get_status(session.id)
+
+    def get_status(self, session_id: str) -> Optional[Dict]:
+        """
+        세션 상태 조회
+
+        Returns:
+            Dict: 세션 상태 (수신 바이트, 미수신 청크 오프셋) 또는 None
+        """
+        session = self.repository.get_by_id(session_id)
+        if session is None:
+            return None
+
+        return {
+            'session_id': session.id,
+            'status': session.status,
+            'filename': session.filename,
+            'data_type': session.data_type,
+            'mode': session.mode,
+            'total_size': session.total_size,
+            'chunk_size': session.chunk_size,
+            'received_bytes': session.received_bytes(),
+            'missing_offsets': session.missing_offsets(),
+            'expires_at': session.expires_at,
+            'job_id': session.job_id,
+        }
+
+    def complete(self, session_id: str, checksum: Optional[str] = None) -> Optional[Dict]:
+        """
+        업로드 완료 → 조립 파일을 백그라운드 업로드 작업으로 등록
+
+        'failed' 세션(작업 실패)도 조립 파일이 남아 있으므로 다시 완료할 수 있습니다.
+
+        Args:
+            session_id: 세션 ID
+            checksum: 전체 파일 SHA-256 (선택, 전달 시 조립 결과 검증)
+
+        Returns:
+            Dict: 작업 상태 (UploadJobService.get_status 결과) 또는 None (세션 없음)
+                같은 내용의 파일이 이미 처리된 경우 이전 작업의 상태
+
+        Raises:
+            ValueError: 미수신 청크가 있거나 전체 체크섬 불일치, 이미 완료된 세션
+        """
+        session = self.repository.get_by_id(session_id)
+        if session is None:
+            return None
+        if session.status not in ('open', 'failed'):
+            raise ValueError(f"이미 종료된 업로드 세션입니다 (상태: {session.status})")
+
+        missing = session.missing_offsets()
+        if missing:
+            raise ValueError(f"수신하지 않은 청크가 있습니다 (오프셋: {', '.join(map(str, missing[:10]))})")
+
+        path = self._part_path(session.id)
+        content_hash = self._file_checksum(path)
+        if checksum and content_hash != checksum.lower():
+            raise ValueError("파일 체크섬(SHA-256)이 일치하지 않습니다")
+
+        if not self.repository.claim_for_completion(session.id):
+            raise ValueError("이미 완료 처리 중인 업로드 세션입니다")
+
+        try:
+            job = self.job_service.submit_stored(
+                path, session.filename, session.data_type, session.uploaded_by, content_hash, session.mode
+            )
+            self.repository.set_job(session.id, job.id)
+        except Exception:
+            # 조립 파일은 남겨 두어 다시 완료할 수 있게 함
+            self.repository.update_status(session.id, 'failed')
+            raise
+
+        if job.status != 'pending':
+            # 같은 내용의 파일이 이미 처리됨: 조립 파일은 필요 없음
+            self._remove_part(session.id)
+        return self.job_service.get_status(job.id)
+
+    def purge_expired(self) -> int:
+        """
+        만료된 open/failed 세션과 조립 파일 삭제
+
+        Returns:
+            int: 삭제된 세션 수
+        """
+        expired = self.repository.find_expired_ids(timezone.now())
+        for session_id in expired:
+            self._remove_part(session_id)
+        self.repository.delete(expired)
+        return len(expired)
+
+    def _get_open(self, session_id: str) -> Optional[UploadSession]:
+        """open 상태 세션 조회 (닫힌 세션은 ValueError)"""
+        session = self.repository.get_by_id(session_id)
+        if session is not None and session.status != 'open':
+            raise ValueError(f"이미 종료된 업로드 세션입니다 (상태: {session.status})")
+        return session
+
+    def _part_path(self, session_id: str) -> str:
+        """조립 파일 경로"""
+        return os.path.join(str(settings.UPLOAD_SESSION_DIR), f"{session_id}.part")
+
+    def _write_part(self, session_id: str, offset: int, data: bytes) -> None:
+        """조립 파일의 offset 위치에 청크 기록"""
+        with open(self._part_path(session_id), 'r+b') as part:
+            part.seek(offset)
+            part.write(data)
+            part.flush()
+            os.fsync(part.fileno())
+
+    def _remove_part(self, session_id: str) -> None:
+        """조립 파일 삭제 (실패는 무시)"""
+        try:
+            os.remove(self._part_path(session_id))
+        except OSError:
+            pass
+
+    def _file_checksum(self, path: str) -> str:
+        """파일 SHA-256 (1MB씩 읽음)"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as stream:
+            for block in iter(lambda: stream.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
@@ -0,0 +1,566 @@
+# -*- coding: utf-8 -*-
+"""
+컬럼 단위 검증 규칙 엔진
+
+데이터 유형별 검증 규칙을 한 번만 선언하고, 이를 컬럼(NumPy/pandas) 단위의
+벡터 연산으로 평가하여 규칙별 오류 마스크(boolean 배열)를 생성합니다.
+오류 메시지는 실패한 행에 대해서만, 최대 개수까지만 생성합니다.
+"""
+import re
+from operator import itemgetter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+# 오류 메시지 렌더링 시 한 번에 처리하는 행 블록 크기
+RENDER_BLOCK_SIZE = 10000
+
+
+class ColumnFrame:
+    """
+    검증 대상 데이터를 컬럼 단위로 제공하는 래퍼
+
+    파싱 결과(List[Dict]) 또는 DataFrame을 받아, 규칙이 요구하는 컬럼만
+    필요한 시점에 변환하고 캐시합니다.
+    """
+
+    def __init__(self, data: Union[List[Dict], pd.DataFrame]):
+        if isinstance(data, pd.DataFrame):
+            self._df = data
+            self._records = None
+            self.size = len(data)
+        else:
+            self._df = None
+            self._records = data
+            self.size = len(data)
+
+        self._raw: Dict[str, np.ndarray] = {}
+        self._numeric: Dict[str, np.ndarray] = {}
+        self._text: Dict[str, pd.Series] = {}
+
+    def has(self, name: str) -> bool:
+        """컬럼 존재 여부"""
+        if self._df is not None:
+            return name in self._df.columns
+        return not self._records or name in self._records[0]
+
+    def raw(self, name: str) -> np.ndarray:
+        """원본 값 배열 (object)"""
+        if name not in self._raw:
+            if self._df is not None:
+                values = self._df[name].to_numpy(dtype=object)
+            else:
+                values = np.empty(self.size, dtype=object)
+                try:
+                    values[:] = list(map(itemgetter(name), self._records))
+                except KeyError:
+                    values[:] = [record.get(name) for record in self._records]
+            self._raw[name] = values
+        return self._raw[name]
+
+    def numeric(self, name: str) -> np.ndarray:
+        """숫자 배열 (변환할 수 없는 값은 NaN)"""
+        if name not in self._numeric:
+            self._numeric[name] = _to_numeric(self.raw(name))
+        return self._numeric[name]
+
+    def text(self, name: str) -> pd.Series:
+        """문자열 연산용 Series"""
+        if name not in self._text:
+            self._text[name] = pd.Series(self.raw(name), dtype=object)
+        return self._text[name]
+
+    def null(self, name: str) -> np.ndarray:
+        """NULL(None/NaN) 여부 마스크"""
+        return pd.isna(self.text(name)).to_numpy()
+
+
+def _to_numeric(values: np.ndarray) -> np.ndarray:
+    """
+    object 배열을 숫자 배열로 변환
+
+    정수만 있으면 int64를 유지하고, Decimal/float는 float64로 변환합니다.
+    None이나 문자열처럼 변환할 수 없는 값은 NaN이 됩니다.
+    """
+    if len(values) == 0:
+        return np.empty(0, dtype=float)
+
+    try:
+        converted = np.array(values.tolist())
+        if converted.dtype.kind in 'iu':
+            return converted.astype(np.int64, copy=False)
+        if converted.dtype.kind == 'f':
+            return converted
+        return converted.astype(float)
+    except (TypeError, ValueError, OverflowError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=float)
+
+
+def _isnan(values: np.ndarray) -> np.ndarray:
+    """정수 배열도 지원하는 NaN 마스크"""
+    if values.dtype.kind == 'f':
+        return np.isnan(values)
+    return np.zeros(len(values), dtype=bool)
+
+
+class Rule:
+    """
+    행 단위 검증 규칙 기본 클래스
+
+    Attributes:
+        fields: 규칙이 참조하는 필드 목록 (메시지 렌더링에도 사용)
+        message: 오류 메시지 템플릿 ('{필드명}' 자리표시자 사용)
+    """
+
+    fields: Tuple[str, ...] = ()
+    message: str = ''
+
+    def mask(self, frame: ColumnFrame) -> np.ndarray:
+        """
+        오류 마스크 계산
+
+        Returns:
+            np.ndarray: 규칙을 위반한 행이 True인 boolean 배열
+        """
+        raise NotImplementedError
+
+    def render(self, frame: ColumnFrame, row: int) -> str:
+        """실패한 행 하나에 대한 오류 메시지 생성"""
+        values = {name: frame.raw(name)[row] for name in self.fields}
+        return self.message.format(**values)
+
+
+class NumberRule(Rule):
+    """숫자 형식 규칙 (nullable이면 빈 값 허용)"""
+
+    def __init__(self, name: str, message: str, nullable: bool = False):
+        self.fields = (name,)
+        self.message = message
+        self.nullable = nullable
+
+    def mask(self, frame: ColumnFrame) -> np.ndarray:
+        name = self.fields[0]
+        invalid = _isnan(frame.numeric(name))
+        if self.nullable:
+            invalid &= ~frame.null(name)
+        return invalid
+
+
+class RangeRule(Rule):
+    """숫자 범위 규칙 (숫자가 아닌 값은 NumberRule에서 처리)"""
+
+    def __init__(
+        self,
+        name: str,
+        message: str,
+        low: Optional[float] = None,
+        high: Optional[float] = None
+    ):
+        self.fields = (name,)
+        self.message = message
+        self.low = low
+        self.high = high
+
+    def mask(self, frame: ColumnFrame) -> np.ndarray:
+        values = frame.numeric(self.fields[0])
+        invalid = np.zeros(len(values), dtype=bool)
+        if self.low is not None:
+            invalid |= values < self.low
+        if self.high is not None:
+            invalid |= values > self.high
+        return invalid & ~_isnan(values)
+
+
+class PatternRule(Rule):
+    """
+    정규식 형식 규칙 (값 전체가 패턴과 일치해야 함)
+
+    패턴은 생성 시 한 번만 컴파일합니다. 모든 값이 문자열이면 컬럼 전체를
+    한 번의 정규식 스캔으로 검사하고, 불일치가 있을 때만 행 단위로 확인합니다.
+    """
+
+    def __init__(self, name: str, pattern: str, message: str):
+        self.fields = (name,)
+        self.message = message
+        self.pattern = re.compile(pattern)
+        self._lines = re.compile(f'^(?:{pattern})$', re.MULTILINE)
+
+    def mask(self, frame: ColumnFrame) -> np.ndarray:
+        values = frame.raw(self.fields[0])
+        if self._all_match(values):
+            return np.zeros(len(values), dtype=bool)
+
+        fullmatch = self.pattern.fullmatch
+        return ~np.fromiter(
+            (isinstance(value, str) and fullmatch(value) is not None for value in values),
+            dtype=bool,
+            count=len(values)
+        )
+
+    def _all_match(self, values: np.ndarray) -> bool:
+        """줄바꿈으로 이어 붙인 컬럼에서 일치한 줄 수로 전체 통과 여부 판단"""
+        try:
+            joined = '\n'.join(values)
+        except TypeError:
+            return False
+        if joined.count('\n') != len(values) - 1:
+            return False
+        return len(self._lines.findall(joined)) == len(values)
+
+
+class ChoiceRule(Rule):
+    """허용 값 목록 규칙"""
+
+    def __init__(self, name: str, choices: Iterable[Any], message: str):
+        self.fields = (name,)
+        self.message = message
+        self.choices = frozenset(choices)
+
+    def mask(self, frame: ColumnFrame) -> np.ndarray:
+        return ~frame.text(self.fields[0]).isin(self.choices).to_numpy()
+
+
+class LengthRule(Rule):
+    """문자열 길이 규칙"""
+
+    def __init__(self, name: str, low: int, high: int, message: str):
+        self.fields = (name,)
+        self.message = message
+        self.low = low
+        self.high = high
+
+    def mask(self, frame: ColumnFrame) -> np.ndarray:
+        values = frame.raw(self.fields[0])
+        try:
+            lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+        except TypeError:
+            lengths = frame.text(self.fields[0]).str.len().to_numpy(dtype=float)
+        return ~((lengths >= self.low) & (lengths <= self.high))
+
+
+class UniqueRule(Rule):
+    """파일 내 중복 규칙 (처음 등장한 행은 통과, 이후 행이 실패)"""
+
+    def __init__(self, names: Sequence[str], message: str):
+        self.fields = tuple(names)
+        self.message = message
+
+    def mask(self, frame: ColumnFrame) -> np.ndarray:
+        if len(self.fields) == 1:
+            return frame.text(self.fields[0]).duplicated(keep='first').to_numpy()
+        keys = pd.DataFrame({name: frame.raw(name) for name in self.fields})
+        return keys.duplicated(keep='first').to_numpy()
+
+
+class ConditionRule(Rule):
+    """
+    복합 조건 규칙
+
+    predicate는 ColumnFrame을 받아 오류 마스크를 반환하는 함수입니다.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        predicate: Callable[[ColumnFrame], np.ndarray],
+        message: str
+    ):
+        self.fields = tuple(names)
+        self.message = message
+        self.predicate = predicate
+
+    def mask(self, frame: ColumnFrame) -> np.ndarray:
+        return np.asarray(self.predicate(frame), dtype=bool)
+
+
+class GroupSumRule:
+    """
+    그룹 단위 합계 규칙
+
+    group_field별로 sum_field 합계가 limit_field(그룹의 첫 값)를 초과하면 실패합니다.
+    실패한 그룹에 속한 모든 행은 오류 행으로 표시됩니다.
+    """
+
+    def __init__(self, group_field: str, sum_field: str, limit_field: str, message: str):
+        self.group_field = group_field
+        self.sum_field = sum_field
+        self.limit_field = limit_field
+        self.message = message
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return (self.group_field, self.sum_field, self.limit_field)
+
+    def evaluate(self, frame: ColumnFrame) -> Tuple[List[str], np.ndarray, int]:
+        """
+        Returns:
+            (오류 메시지 리스트, 오류 행 마스크, 오류 건수)
+        """
+        failures, rows = self.failures(frame)
+        return list(failures.values()), rows, len(failures)
+
+    def failures(self, frame: ColumnFrame) -> Tuple[Dict[Any, str], np.ndarray]:
+        """
+        Returns:
+            (그룹 키 → 오류 메시지, 오류 행 마스크)
+        """
+        groups = frame.text(self.group_field)
+        amounts = pd.Series(frame.numeric(self.sum_field))
+        limits = pd.Series(frame.numeric(self.limit_field))
+
+        grouped = pd.DataFrame({'key': groups, 'amount': amounts, 'limit': limits}).groupby(
+            'key', sort=False
+        ).agg(amount=('amount', 'sum'), limit=('limit', 'first'))
+        exceeded = grouped[grouped['amount'] > grouped['limit']]
+
+        if exceeded.empty:
+            return {}, np.zeros(frame.size, dtype=bool)
+
+        failures = {
+            key: self.message.format(group=key, total=_plain(row.amount), limit=_plain(row.limit))
+            for key, row in exceeded.iterrows()
+        }
+        rows = groups.isin(exceeded.index).to_numpy()
+        return failures, rows
+
+
+def _plain(value: Any) -> Any:
+    """NumPy 스칼라를 메시지 출력용 파이썬 값으로 변환"""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return int(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+@dataclass
+class ValidationReport:
+    """
+    검증 결과
+
+    Attributes:
+        total_rows: 검증한 행 수
+        error_count: 전체 오류 건수 (메시지 상한과 무관)
+        errors: 렌더링된 오류 메시지 (최대 max_errors개 + 요약 1줄)
+        invalid_rows: 오류가 있는 행 마스크
+    """
+    total_rows: int
+    error_count: int
+    errors: List[str] = field(default_factory=list)
+    invalid_rows: Optional[np.ndarray] = None
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error_count == 0
+
+    @property
+    def invalid_row_count(self) -> int:
+        return int(self.invalid_rows.sum()) if self.invalid_rows is not None else 0
+
+
+class RowErrors:
+    """
+    행별 오류 사유
+
+    부분 성공 업로드에서 거부된 행마다 모든 오류 사유를 제공합니다.
+    메시지는 순회할 때 오류 행에 대해서만 생성됩니다.
+    """
+
+    def __init__(
+        self,
+        frame: ColumnFrame,
+        invalid_rows: np.ndarray,
+        failing: Sequence[Tuple[Rule, np.ndarray]] = (),
+        group_failures: Sequence[Tuple[GroupSumRule, Dict[Any, str], np.ndarray]] = (),
+        missing_message: Optional[str] = None
+    ):
+        self.frame = frame
+        self.invalid_rows = invalid_rows
+        self.failing = list(failing)
+        self.group_failures = list(group_failures)
+        self.missing_message = missing_message
+
+    def __iter__(self) -> Iterator[Tuple[int, List[str]]]:
+        """(행 인덱스, 오류 메시지 리스트)를 행 순서대로 생성"""
+        for index in np.flatnonzero(self.invalid_rows):
+            yield int(index), self.messages(int(index))
+
+    def messages(self, index: int) -> List[str]:
+        """행 하나의 오류 메시지 (규칙 선언 순서 → 그룹 규칙)"""
+        if self.missing_message is not None:
+            return [self.missing_message]
+
+        messages = [rule.render(self.frame, index) for rule, mask in self.failing if mask[index]]
+        for group_rule, failures, rows in self.group_failures:
+            if rows[index]:
+                key = self.frame.text(group_rule.group_field).iat[index]
+                messages.append(failures[key])
+        return messages
+
+
+class CompiledRuleSet:
+    """
+    데이터 유형 하나의 검증 규칙 묶음
+
+    규칙 선언 순서가 한 행 안에서의 메시지 순서가 됩니다.
+    """
+
+    def __init__(self, rules: Sequence[Rule], group_rules: Sequence[GroupSumRule] = ()):
+        self.rules = list(rules)
+        self.group_rules = list(group_rules)
+
+        names: List[str] = []
+        for rule in [*self.rules, *self.group_rules]:
+            for name in rule.fields:
+                if name not in names:
+                    names.append(name)
+        self.fields = tuple(names)
+
+    def evaluate(
+        self,
+        data: Union[List[Dict], pd.DataFrame],
+        max_errors: int
+    ) -> ValidationReport:
+        """
+        전체 규칙 평가
+
+        Args:
+            data: 파싱된 데이터 (List[Dict] 또는 DataFrame)
+            max_errors: 렌더링할 최대 오류 메시지 수
+
+        Returns:
+            ValidationReport
+        """
+        frame = ColumnFrame(data)
+        invalid_rows = np.zeros(frame.size, dtype=bool)
+
+        if frame.size == 0:
+            return ValidationReport(total_rows=0, error_count=0, invalid_rows=invalid_rows)
+
+        missing_message = self._missing_message(frame)
+        if missing_message:
+            invalid_rows[:] = True
+            return ValidationReport(
+                total_rows=frame.size,
+                error_count=1,
+                errors=[missing_message],
+                invalid_rows=invalid_rows
+            )
+
+        # 1. 규칙별 오류 마스크 (오류가 있는 규칙만 유지)
+        failing, error_count = self._failing_rules(frame, invalid_rows)
+
+        # 2. 실패한 행에 대해서만 메시지 렌더링
+        errors = self._render(frame, failing, max_errors)
+
+        # 3. 그룹 규칙 (행 오류 뒤에 추가)
+        for group_rule in self.group_rules:
+            messages, rows, count = group_rule.evaluate(frame)
+            error_count += count
+            invalid_rows |= rows
+            remaining = max_errors - len(errors)
+            if remaining > 0:
+                errors.extend(messages[:remaining])
+
+        if error_count > len(errors):
+            errors.append(
+                f"외 {error_count - len(errors)}건의 오류가 더 있습니다 (총 {error_count}건)"
+            )
+
+        return ValidationReport(
+            total_rows=frame.size,
+            error_count=error_count,
+            errors=errors,
+            invalid_rows=invalid_rows
+        )
+
+    def explain(self, data: Union[List[Dict], pd.DataFrame]) -> RowErrors:
+        """
+        행별 오류 사유 계산 (메시지 상한 없음)
+
+        Args:
+            data: 파싱된 데이터 (List[Dict] 또는 DataFrame)
+
+        Returns:
+            RowErrors: 오류 행 마스크와 행별 메시지
+        """
+        frame = ColumnFrame(data)
+        invalid_rows = np.zeros(frame.size, dtype=bool)
+
+        if frame.size == 0:
+            return RowErrors(frame, invalid_rows)
+
+        missing_message = self._missing_message(frame)
+        if missing_message:
+            invalid_rows[:] = True
+            return RowErrors(frame, invalid_rows, missing_message=missing_message)
+
+        failing, _ = self._failing_rules(frame, invalid_rows)
+
+        group_failures = []
+        for group_rule in self.group_rules:
+            failures, rows = group_rule.failures(frame)
+            if failures:
+                group_failures.append((group_rule, failures, rows))
+                invalid_rows |= rows
+
+        return RowErrors(frame, invalid_rows, failing, group_failures)
+
+    def _missing_message(self, frame: ColumnFrame) -> Optional[str]:
+        """규칙이 참조하는 필드 중 누락된 필드가 있으면 오류 메시지"""
+        missing = [name for name in self.fields if not frame.has(name)]
+        if missing:
+            return f"필수 필드가 누락되었습니다: {', '.join(missing)}"
+        return None
+
+    def _failing_rules(
+        self, frame: ColumnFrame, invalid_rows: np.ndarray
+    ) -> Tuple[List[Tuple[Rule, np.ndarray]], int]:
+        """
+        규칙별 오류 마스크 계산 (invalid_rows에 누적)
+
+        Returns:
+            (오류가 있는 규칙과 마스크 리스트, 오류 건수)
+        """
+        failing: List[Tuple[Rule, np.ndarray]] = []
+        error_count = 0
+        for rule in self.rules:
+            mask = rule.mask(frame)
+            count = int(mask.sum())
+            if count:
+                failing.append((rule, mask))
+                error_count += count
+                invalid_rows |= mask
+        return failing, error_count
+
+    @staticmethod
+    def _render(
+        frame: ColumnFrame,
+        failing: List[Tuple[Rule, np.ndarray]],
+        max_errors: int
+    ) -> List[str]:
+        """
+        행 순서 → 규칙 선언 순서로 오류 메시지 생성
+
+        행 블록 단위로 처리하므로 오류가 많은 파일도 메모리 사용량이 제한됩니다.
+        """
+        errors: List[str] = []
+        if not failing or max_errors <= 0:
+            return errors
+
+        masks = np.column_stack([mask for _, mask in failing])
+        rules = [rule for rule, _ in failing]
+
+        for start in range(0, frame.size, RENDER_BLOCK_SIZE):
+            block = masks[start:start + RENDER_BLOCK_SIZE]
+            rows, cols = np.nonzero(block)
+            for row, col in zip(rows, cols):
+                index = start + int(row)
+                errors.append(f"{index + 1}행: {rules[col].render(frame, index)}")
+                if len(errors) >= max_errors:
+                    return errors
+
+        return errors
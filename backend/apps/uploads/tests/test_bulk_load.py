@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+대량 적재(bulk_load) 테스트
+
+데이터 유형별 파일을 교체/추가 모드로 적재하고 처리 속도를 보고하는지 검증합니다.
+"""
+import io
+from datetime import datetime
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.dashboard.persistence.models import DepartmentKPI, Student
+from apps.uploads.services.bulk_loader import COPY_NULL, BulkLoader
+
+
+KPI_CSV = (
+    "평가년도,단과대학,학과,졸업생 취업률 (%),전임교원 수 (명),"
+    "초빙교원 수 (명),연간 기술이전 수입액 (억원),국제학술대회 개최 횟수\n"
+    "2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3\n"
+    "2024,공과대학,전자공학과,80.0,18,4,1.0,2\n"
+)
+
+STUDENT_CSV = (
+    "학번,이름,단과대학,학과,학년,과정구분,학적상태,성별,입학년도,지도교수,이메일\n"
+    "202400001,김유진,공과대학,컴퓨터공학과,1,학사,재학,여,2024,,yj@university.ac.kr\n"
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """기본 파일명으로 데이터 파일을 둔 디렉토리"""
+    (tmp_path / 'department_kpi.csv').write_text(KPI_CSV, encoding='utf-8')
+    (tmp_path / 'student_roster.csv').write_text(STUDENT_CSV, encoding='utf-8')
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestBulkLoadCommand:
+    """bulk_load 명령 테스트"""
+
+    def test_loads_directory_and_reports_rate(self, data_dir):
+        """디렉토리의 데이터 유형별 파일을 적재하고 rows/s를 출력한다"""
+        # Arrange
+        DepartmentKPI.objects.create(
+            evaluation_year=2023, college='인문대학', department='철학과', employment_rate=50,
+            full_time_faculty=5, visiting_faculty=1, tech_transfer_income=0, intl_conferences=0
+        )
+        out = io.StringIO()
+
+        # Act
+        call_command('bulk_load', '--dir', str(data_dir), '--workers', '1', stdout=out)
+
+        # Assert
+        assert list(DepartmentKPI.objects.values_list('department', flat=True).order_by('id')) == [
+            '컴퓨터공학과', '전자공학과'
+        ]
+        assert Student.objects.get().advisor is None
+        assert 'rows/s' in out.getvalue()
+        assert '적재 완료: 3행' in out.getvalue()
+
+    def test_append_conflict_is_reported(self, data_dir):
+        """추가 모드에서 기존 데이터와 중복되면 명령 오류로 중단한다"""
+        # Arrange
+        path = str(data_dir / 'department_kpi.csv')
+        call_command('bulk_load', f'department_kpi={path}', '--workers', '1', stdout=io.StringIO())
+
+        # Act & Assert
+        with pytest.raises(CommandError, match="DB 저장 오류"):
+            call_command(
+                'bulk_load', f'department_kpi={path}', '--append', '--workers', '1', stdout=io.StringIO()
+            )
+        assert DepartmentKPI.objects.count() == 2
+
+    def test_validation_error_stops_load(self, tmp_path):
+        """검증 오류가 있으면 적재하지 않는다"""
+        # Arrange
+        path = tmp_path / 'kpi.csv'
+        path.write_text(KPI_CSV.replace('85.5', '150'), encoding='utf-8')
+
+        # Act & Assert
+        with pytest.raises(CommandError, match="취업률은 0~100 범위여야 합니다"):
+            call_command('bulk_load', f'department_kpi={path}', '--workers', '1', stdout=io.StringIO())
+        assert DepartmentKPI.objects.count() == 0
+
+
+class TestCopyBuffer:
+    """COPY 본문 생성 테스트"""
+
+    def test_null_and_empty_string_are_distinguished(self):
+        """None은 NULL 표기로, 빈 문자열은 빈 값으로 쓴다"""
+        # Arrange
+        now = datetime(2024, 1, 1, 9, 0)
+        rows = [{'co_authors': '', 'impact_factor': None, 'paper_title': 'A, B'}]
+
+        # Act
+        buffer = BulkLoader._copy_buffer(rows, ['co_authors', 'impact_factor', 'paper_title'], now)
+
+        # Assert
+        assert buffer.getvalue() == f',{COPY_NULL},"A, B",{now},{now}\r\n'
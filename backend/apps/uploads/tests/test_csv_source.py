@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+CSV 입력 소스 테스트
+
+인코딩 판별(BOM / UTF-8 / CP949)과 버퍼·스트림 입력을 검증합니다.
+"""
+import codecs
+import io
+
+import pytest
+
+from apps.uploads.services.parsers import DepartmentKPIParser
+from apps.uploads.services.parsers.source import SNIFF_SIZE, detect_encoding, sniff_encoding
+
+
+KPI_TEXT = (
+    "평가년도,단과대학,학과,졸업생 취업률 (%),전임교원 수 (명),"
+    "초빙교원 수 (명),연간 기술이전 수입액 (억원),국제학술대회 개최 횟수\n"
+    "2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3\n"
+)
+
+
+class _NonSeekable(io.RawIOBase):
+    """되감을 수 없는 업로드 스트림"""
+
+    def __init__(self, data):
+        super().__init__()
+        self._stream = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        data = self._stream.read(len(target))
+        target[:len(data)] = data
+        return len(data)
+
+
+class TestDetectEncoding:
+    """인코딩 판별 테스트"""
+
+    @pytest.mark.parametrize('prefix, expected', [
+        (codecs.BOM_UTF8 + '학과'.encode('utf-8'), 'utf-8-sig'),
+        ('학과'.encode('utf-16'), 'utf-16'),
+        ('학과'.encode('utf-8'), 'utf-8-sig'),
+        ('학과'.encode('cp949'), 'cp949'),
+    ])
+    def test_detects_encoding_from_prefix(self, prefix, expected):
+        """BOM, UTF-8 유효성, CP949 순서로 인코딩을 판별한다"""
+        assert detect_encoding(prefix) == expected
+
+    def test_truncated_multibyte_at_prefix_end_is_utf8(self):
+        """앞부분 끝에서 잘린 UTF-8 문자는 오류로 보지 않는다"""
+        assert detect_encoding('학과'.encode('utf-8')[:-1]) == 'utf-8-sig'
+
+    def test_undecodable_prefix_raises(self):
+        """UTF-8/CP949 어느 쪽으로도 해석되지 않으면 ValueError를 발생시킨다"""
+        with pytest.raises(ValueError, match="인코딩"):
+            detect_encoding(b'\x80\x80\x80')
+
+    def test_sniff_reads_bounded_prefix_and_rewinds(self):
+        """앞부분만 읽고 스트림 위치를 되돌린다"""
+        # Arrange
+        stream = io.BytesIO(('가' * SNIFF_SIZE).encode('cp949'))
+
+        # Act
+        encoding = sniff_encoding(stream)
+
+        # Assert
+        assert encoding == 'cp949'
+        assert stream.tell() == 0
+
+
+class TestParserEncodings:
+    """파서 인코딩 처리 테스트"""
+
+    @pytest.mark.parametrize('encoding', ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr'])
+    def test_parses_korean_csv_in_any_supported_encoding(self, encoding):
+        """UTF-8 및 CP949/EUC-KR 파일을 한 번에 파싱한다"""
+        # Arrange
+        data = KPI_TEXT.encode(encoding)
+
+        # Act
+        rows = DepartmentKPIParser.parse(memoryview(data))
+
+        # Assert
+        assert rows[0]['college'] == '공과대학'
+        assert rows[0]['department'] == '컴퓨터공학과'
+
+    def test_parses_non_seekable_stream(self):
+        """되감을 수 없는 스트림도 인코딩을 판별하여 파싱한다"""
+        # Arrange
+        stream = _NonSeekable(KPI_TEXT.encode('cp949'))
+
+        # Act
+        rows = DepartmentKPIParser.parse(stream)
+
+        # Assert
+        assert rows[0]['department'] == '컴퓨터공학과'
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+DataValidator 단위 테스트
+
+컬럼 단위 규칙 엔진의 오류 마스크, 메시지 상한, 전체 건수 집계를 검증합니다.
+"""
+import pytest
+from decimal import Decimal
+
+import pandas as pd
+
+from apps.uploads.services.data_validator import DataValidator
+
+
+def _student(**overrides):
+    """유효한 학생 데이터 한 행"""
+    data = {
+        'student_id': '20201101',
+        'name': '김유진',
+        'college': '공과대학',
+        'department': '컴퓨터공학과',
+        'grade': 4,
+        'program_type': '학사',
+        'enrollment_status': '재학',
+        'gender': '여',
+        'admission_year': 2020,
+        'advisor': '이서연',
+        'email': 'yjkim@university.ac.kr',
+    }
+    data.update(overrides)
+    return data
+
+
+def _execution(execution_id, project_number, total_budget, execution_amount):
+    """연구 과제 집행 데이터 한 행"""
+    return {
+        'execution_id': execution_id,
+        'project_number': project_number,
+        'project_name': '차세대 AI 반도체 설계',
+        'principal_investigator': '김민준',
+        'department': '전자공학과',
+        'funding_agency': '한국연구재단',
+        'total_budget': total_budget,
+        'execution_date': None,
+        'execution_item': '연구장비 도입',
+        'execution_amount': execution_amount,
+        'status': '집행완료',
+        'remarks': None,
+    }
+
+
+class TestDataValidator:
+    """DataValidator 단위 테스트"""
+
+    def test_valid_rows_produce_no_errors(self):
+        """유효한 데이터는 오류 없이 통과"""
+        # Arrange
+        rows = [_student(student_id=f'2020{i:05d}') for i in range(1000)]
+
+        # Act
+        is_valid, errors = DataValidator.validate_student_roster(rows)
+
+        # Assert
+        assert is_valid is True
+        assert errors == []
+
+    def test_errors_are_rendered_in_row_then_rule_order(self):
+        """오류 메시지는 행 순서, 같은 행 안에서는 규칙 선언 순서"""
+        # Arrange
+        rows = [
+            _student(),
+            _student(student_id='ABC', gender='X'),
+            _student(student_id='20201102', program_type='석사', grade=2),
+        ]
+
+        # Act
+        is_valid, errors = DataValidator.validate_student_roster(rows)
+
+        # Assert
+        assert is_valid is False
+        assert errors == [
+            "2행: 학번 형식이 올바르지 않습니다: ABC (YYYYMMNNN 필요)",
+            "2행: 성별은 남 또는 여여야 합니다: X",
+            "3행: 석사/박사는 학년이 0이어야 합니다: 석사, 2",
+        ]
+
+    def test_duplicate_keys_flag_only_later_rows(self):
+        """파일 내 중복은 두 번째 이후 행만 오류"""
+        # Arrange
+        rows = [_student(), _student(), _student(student_id='20201102')]
+
+        # Act
+        report = DataValidator.validate('student_roster', rows)
+
+        # Assert
+        assert report.errors == ["2행: 학번이 이미 존재합니다: 20201101"]
+        assert report.invalid_rows.tolist() == [False, True, False]
+
+    def test_error_messages_are_capped_with_total_count(self):
+        """오류 메시지는 상한까지만 생성하고 전체 건수를 요약"""
+        # Arrange
+        rows = [_student(student_id=f'2020{i:05d}', email='invalid') for i in range(5000)]
+
+        # Act
+        report = DataValidator.validate('student_roster', rows, max_errors=10)
+
+        # Assert
+        assert report.error_count == 5000
+        assert len(report.errors) == 11
+        assert report.errors[0] == "1행: 이메일 형식이 올바르지 않습니다: invalid"
+        assert report.errors[-1] == "외 4990건의 오류가 더 있습니다 (총 5000건)"
+        assert report.invalid_row_count == 5000
+
+    def test_non_numeric_value_is_reported_once(self):
+        """숫자가 아닌 값은 형식 오류 한 건만 보고 (범위 오류 중복 없음)"""
+        # Arrange
+        rows = [_student(grade=None)]
+
+        # Act
+        is_valid, errors = DataValidator.validate_student_roster(rows)
+
+        # Assert
+        assert is_valid is False
+        assert errors == ["1행: 학년은 숫자여야 합니다: None"]
+
+    def test_nullable_impact_factor_for_kci(self):
+        """KCI 논문은 Impact Factor가 없어도 통과, SCIE는 필수"""
+        # Arrange
+        base = {
+            'publication_date': None,
+            'college': '인문대학',
+            'department': '철학과',
+            'paper_title': '현대 분석철학의 언어적 전회에 관한 고찰',
+            'lead_author': '윤지원',
+            'co_authors': '',
+            'journal_name': '철학연구',
+            'project_linked': 'N',
+        }
+        rows = [
+            dict(base, paper_id='PUB-23-001', journal_grade='KCI', impact_factor=None),
+            dict(base, paper_id='PUB-23-002', journal_grade='SCIE', impact_factor=None),
+            dict(base, paper_id='PUB-23-003', journal_grade='SCIE', impact_factor=Decimal('-1.0')),
+        ]
+
+        # Act
+        is_valid, errors = DataValidator.validate_publication(rows)
+
+        # Assert
+        assert errors == [
+            "2행: SCIE 논문은 Impact Factor가 필수입니다",
+            "3행: Impact Factor는 음수일 수 없습니다",
+        ]
+
+    def test_project_execution_sum_exceeding_budget(self):
+        """과제별 집행액 합계가 총연구비를 넘으면 과제 단위 오류"""
+        # Arrange
+        rows = [
+            _execution('T2301001', 'NRF-2023-015', 100, 60),
+            _execution('T2301002', 'NRF-2023-015', 100, 50),
+            _execution('T2301003', 'IITP-A-23-101', 500, 100),
+        ]
+
+        # Act
+        report = DataValidator.validate('research_project', rows)
+
+        # Assert
+        assert report.errors == ["과제 NRF-2023-015의 집행액 합계(110)가 총연구비(100)를 초과합니다"]
+        assert report.invalid_rows.tolist() == [True, True, False]
+
+    def test_accepts_dataframe_columns(self):
+        """DataFrame 입력도 같은 규칙으로 검증"""
+        # Arrange
+        frame = pd.DataFrame([_student(), _student(student_id='20201102', grade=7)])
+
+        # Act
+        report = DataValidator.validate('student_roster', frame)
+
+        # Assert
+        assert report.errors == ["2행: 학년은 0~4 범위여야 합니다: 7"]
+
+    def test_missing_field_is_reported_once(self):
+        """필수 필드가 없으면 행마다가 아니라 한 번만 보고"""
+        # Arrange
+        rows = [{k: v for k, v in _student().items() if k != 'email'}] * 3
+
+        # Act
+        report = DataValidator.validate('student_roster', rows)
+
+        # Assert
+        assert report.errors == ["필수 필드가 누락되었습니다: email"]
+        assert report.invalid_row_count == 3
+
+    def test_unknown_data_type_raises(self):
+        """지원하지 않는 데이터 유형"""
+        with pytest.raises(ValueError):
+            DataValidator.validate('performance', [])
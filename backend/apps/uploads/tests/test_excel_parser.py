@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Excel(.xlsx) 업로드 테스트
+
+읽기 전용 스트리밍 리더와 업로드 파이프라인 연결을 검증합니다.
+"""
+import io
+from datetime import datetime
+
+import openpyxl
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.dashboard.persistence.models import Publication
+from apps.uploads.services.excel_parser import ExcelParser
+from apps.uploads.services.file_processor import FileProcessorService
+from apps.uploads.services.parsers import PublicationParser
+
+
+PUBLICATION_HEADER = [
+    '논문ID', '게재일', '단과대학', '학과', '논문제목', '주저자', '참여저자',
+    '학술지명', '저널등급', 'Impact Factor', '과제연계여부'
+]
+
+
+def _workbook(*rows, header=PUBLICATION_HEADER):
+    """xlsx 파일 바이트 생성"""
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    worksheet.append(header)
+    for row in rows:
+        worksheet.append(row)
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _publication(paper_id, grade='SCIE', impact_factor=3.2):
+    return [
+        paper_id, datetime(2024, 3, 15), '공과대학', '컴퓨터공학과', '딥러닝 기반 분석',
+        '김민준', None, 'IEEE Access', grade, impact_factor, 'Y'
+    ]
+
+
+class TestExcelParser:
+    """ExcelParser 스트리밍 테스트"""
+
+    def test_read_frame_skips_blank_rows_and_keeps_sheet_row_numbers(self):
+        """빈 행은 건너뛰고 인덱스는 시트 행 번호 기준을 유지한다"""
+        # Arrange
+        data = _workbook(_publication('PUB-24-001'), [], _publication('PUB-24-002'))
+
+        # Act
+        df = ExcelParser().read_frame(io.BytesIO(data))
+
+        # Assert
+        assert list(df['논문ID']) == ['PUB-24-001', 'PUB-24-002']
+        assert list(df.index + 2) == [2, 4]
+
+    def test_publication_parser_reads_xlsx_buffer(self):
+        """CSV 파서가 xlsx 버퍼를 같은 방식으로 파싱한다"""
+        # Arrange
+        data = _workbook(_publication('PUB-24-001'), _publication('PUB-24-002', 'KCI', None))
+
+        # Act
+        rows = PublicationParser.parse(memoryview(data))
+
+        # Assert
+        assert rows[0]['publication_date'].isoformat() == '2024-03-15'
+        assert rows[0]['co_authors'] == ''
+        assert rows[1]['impact_factor'] is None
+
+    def test_parse_error_reports_sheet_row_number(self):
+        """파싱 오류 메시지에 시트 행 번호가 표시된다"""
+        # Arrange
+        broken = _publication('PUB-24-002')
+        broken[1] = '게재일 아님'
+        data = _workbook(_publication('PUB-24-001'), [], broken)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="4행 파싱 오류"):
+            PublicationParser.parse(memoryview(data))
+
+
+@pytest.mark.django_db
+def test_file_processor_accepts_xlsx_upload():
+    """FileProcessorService가 .xlsx 업로드를 파싱, 검증, 저장한다"""
+    # Arrange
+    upload = SimpleUploadedFile(
+        'publications.xlsx',
+        _workbook(_publication('PUB-24-001'), _publication('PUB-24-002')),
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    )
+
+    # Act
+    result = FileProcessorService().process_file(upload, 'publication')
+
+    # Assert
+    assert result['success'] is True
+    assert result['rows_processed'] == 2
+    assert Publication.objects.count() == 2
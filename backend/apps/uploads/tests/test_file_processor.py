@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+FileProcessorService 테스트
+
+동일 파일 재업로드(SHA-256) 감지, 업로드 이력 기록, 부분 성공 업로드,
+압축(.csv.gz) 및 ZIP 묶음 업로드를 검증합니다.
+"""
+import gzip
+import hashlib
+import io
+import zipfile
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.dashboard.persistence.models import DepartmentKPI
+from apps.uploads.persistence.models import UploadHistory
+from apps.uploads.services.bundle_worker import HashingReader
+from apps.uploads.services.file_processor import FileProcessorService
+from apps.uploads.services.parsers import DepartmentKPIParser
+
+
+KPI_CSV = (
+    "평가년도,단과대학,학과,졸업생 취업률 (%),전임교원 수 (명),"
+    "초빙교원 수 (명),연간 기술이전 수입액 (억원),국제학술대회 개최 횟수\n"
+    "2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3\n"
+    "2024,공과대학,전자공학과,80.0,18,4,1.0,2\n"
+).encode('utf-8')
+
+
+def _upload(content=KPI_CSV, name='kpi.csv'):
+    return SimpleUploadedFile(name, content, content_type='text/csv')
+
+
+class CountingStream(io.BytesIO):
+    """읽은 바이트 수를 기록하는 스트림"""
+
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+@pytest.mark.django_db
+class TestContentHashDeduplication:
+    """동일 파일 재업로드 테스트"""
+
+    def test_records_history_with_content_hash(self):
+        """처리 결과와 파일 SHA-256이 업로드 이력에 기록된다"""
+        # Arrange
+        processor = FileProcessorService()
+
+        # Act
+        result = processor.process_file(_upload(), 'department_kpi', 'admin@x.kr')
+
+        # Assert
+        record = UploadHistory.objects.get()
+        assert result['success'] is True
+        assert record.status == 'success'
+        assert record.rows_processed == 2
+        assert record.uploaded_by == 'admin@x.kr'
+        assert record.content_hash == hashlib.sha256(KPI_CSV).hexdigest()
+
+    def test_identical_upload_returns_previous_result_without_parsing(self, monkeypatch):
+        """같은 파일을 다시 올리면 파싱/저장 없이 이전 결과를 반환한다"""
+        # Arrange
+        processor = FileProcessorService()
+        first = processor.process_file(_upload(), 'department_kpi')
+        previous_id = UploadHistory.objects.get().id
+
+        def fail_parse(file_path):
+            raise AssertionError("중복 업로드는 파싱하지 않아야 합니다")
+
+        monkeypatch.setattr(processor.PARSER_MAP['department_kpi'], 'parse', fail_parse)
+
+        # Act
+        second = processor.process_file(_upload(name='kpi_again.csv'), 'department_kpi')
+
+        # Assert
+        assert second['success'] is True
+        assert second['rows_processed'] == first['rows_processed']
+        assert second['duplicate_of'] == previous_id
+        assert second['filename'] == 'kpi_again.csv'
+        assert DepartmentKPI.objects.count() == 2
+        assert UploadHistory.objects.count() == 1
+
+    def test_failed_upload_is_not_reused(self):
+        """검증에 실패한 이전 업로드는 재사용하지 않는다"""
+        # Arrange
+        processor = FileProcessorService()
+        invalid = KPI_CSV.replace(b'85.5', b'150')
+        processor.process_file(_upload(invalid), 'department_kpi')
+
+        # Act
+        result = processor.process_file(_upload(invalid), 'department_kpi')
+
+        # Assert
+        assert result['success'] is False
+        assert 'duplicate_of' not in result
+        assert UploadHistory.objects.filter(status='failed').count() == 2
+
+
+class TestUploadBuffer:
+    """업로드 버퍼 처리 테스트 (임시 파일 복사 없음)"""
+
+    def test_parser_reads_memoryview_without_copy(self):
+        """파서는 파일 경로 대신 memoryview를 직접 읽을 수 있다"""
+        # Arrange
+        view = memoryview(KPI_CSV)
+
+        # Act
+        rows = DepartmentKPIParser.parse(view)
+
+        # Assert
+        assert [row['department'] for row in rows] == ['컴퓨터공학과', '전자공학과']
+
+    def test_disk_upload_is_mapped_in_place(self):
+        """디스크에 저장된 업로드는 공유 경로로 복사하지 않고 그대로 매핑한다"""
+        # Arrange
+        processor = FileProcessorService()
+        upload = TemporaryUploadedFile('kpi.csv', 'text/csv', len(KPI_CSV), None)
+        upload.write(KPI_CSV)
+        upload.flush()
+
+        # Act
+        with processor._open_upload(upload) as (buffer, content_hash):
+            rows = DepartmentKPIParser.parse(buffer)
+
+        # Assert
+        assert len(rows) == 2
+        assert content_hash == hashlib.sha256(KPI_CSV).hexdigest()
+        upload.close()
+
+
+@pytest.fixture
+def report_dir(settings, tmp_path):
+    """오류 리포트 디렉토리를 임시 경로로 변경"""
+    settings.UPLOAD_ERROR_REPORT_DIR = str(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestPartialUpload:
+    """부분 성공 업로드 테스트"""
+
+    CSV = (
+        "평가년도,단과대학,학과,졸업생 취업률 (%),전임교원 수 (명),"
+        "초빙교원 수 (명),연간 기술이전 수입액 (억원),국제학술대회 개최 횟수\n"
+        "2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3\n"
+        "2024,공과대학,전자공학과,150,18,4,1.0,2\n"
+        "2024,공과대학,기계공학과,70.0,둘,4,1.0,2\n"
+        "2024,공과대학,화학공학과,75.0,15,3,0.5,1\n"
+    ).encode('utf-8')
+
+    def test_commits_valid_rows_and_reports_rejects(self, report_dir):
+        """유효한 행은 저장하고 거부된 행은 사유와 함께 오류 CSV에 기록한다"""
+        # Arrange
+        processor = FileProcessorService()
+
+        # Act
+        result = processor.process_file(_upload(self.CSV), 'department_kpi', mode='partial')
+
+        # Assert
+        assert result['status'] == 'partial'
+        assert result['rows_processed'] == 2
+        assert result['rows_rejected'] == 2
+        assert 'errors' not in result
+        assert sorted(DepartmentKPI.objects.values_list('department', flat=True)) == ['컴퓨터공학과', '화학공학과']
+
+        report = (report_dir / f"{result['error_report']}.csv").read_text(encoding='utf-8-sig')
+        assert report.splitlines()[0].startswith('원본 행,평가년도,단과대학')
+        assert '3,2024,공과대학,전자공학과,150' in report
+        assert '취업률은 0~100 범위여야 합니다' in report
+        assert '4,2024,공과대학,기계공학과,70.0,둘' in report
+        assert '파싱 오류' in report
+
+        record = UploadHistory.objects.get()
+        assert record.status == 'partial'
+        assert record.rows_rejected == 2
+        assert record.error_report == result['error_report']
+
+    def test_rejected_report_can_be_fixed_and_reuploaded(self, report_dir):
+        """오류 CSV를 수정하여 거부된 행만 다시 업로드할 수 있다"""
+        # Arrange
+        processor = FileProcessorService()
+        result = processor.process_file(_upload(self.CSV), 'department_kpi', mode='partial')
+        report = (report_dir / f"{result['error_report']}.csv").read_bytes()
+        fixed = report.replace('150'.encode(), b'90').replace('둘'.encode(), b'2')
+
+        # Act
+        retry = processor.process_file(_upload(fixed, 'fixed.csv'), 'department_kpi', mode='partial')
+
+        # Assert
+        assert retry['status'] == 'success'
+        assert retry['rows_processed'] == 2
+        assert retry['error_report'] is None
+        assert DepartmentKPI.objects.count() == 4
+
+    def test_rows_conflicting_with_existing_data_are_rejected(self, report_dir):
+        """이미 저장된 데이터와 충돌하는 행만 저장 오류로 거부한다"""
+        # Arrange
+        processor = FileProcessorService()
+        processor.process_file(_upload(), 'department_kpi')
+        overlapping = KPI_CSV + "2024,공과대학,화학공학과,75.0,15,3,0.5,1\n".encode('utf-8')
+
+        # Act
+        result = processor.process_file(_upload(overlapping), 'department_kpi', mode='partial')
+
+        # Assert
+        assert result['status'] == 'partial'
+        assert result['rows_processed'] == 1
+        assert result['rows_rejected'] == 2
+        report = (report_dir / f"{result['error_report']}.csv").read_text(encoding='utf-8-sig')
+        assert report.count('저장 오류') == 2
+
+    def test_upload_view_returns_counts_and_report_link(self, report_dir):
+        """API 응답은 건수와 오류 CSV 링크만 포함하고, 링크로 CSV를 내려받을 수 있다"""
+        # Arrange
+        client = APIClient()
+
+        # Act
+        response = client.post(
+            '/api/uploads/',
+            {'file': _upload(self.CSV), 'data_type': 'department_kpi', 'mode': 'partial'},
+            format='multipart'
+        )
+        download = client.get(response.data['error_report_url'])
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['rows_processed'] == 2
+        assert response.data['rows_rejected'] == 2
+        assert 'errors' not in response.data
+        assert download.status_code == status.HTTP_200_OK
+        assert b''.join(download.streaming_content).decode('utf-8-sig').count('\n') == 3
+
+
+def _zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+PUBLICATION_CSV = (
+    "논문ID,게재일,단과대학,학과,논문제목,주저자,참여저자,학술지명,저널등급,Impact Factor,과제연계여부\n"
+    "PUB-24-001,2024-02-18,공과대학,전자공학과,A Study,김민준,박지훈,IEEE,SCIE,3.9,Y\n"
+).encode('utf-8')
+
+
+@pytest.mark.django_db
+class TestCompressedUpload:
+    """gzip CSV / ZIP 묶음 업로드 테스트"""
+
+    def test_gzip_csv_is_decompressed_while_parsing(self):
+        """.csv.gz 파일은 압축을 풀어 CSV와 동일하게 처리한다"""
+        # Arrange
+        processor = FileProcessorService()
+
+        # Act
+        result = processor.process_file(_upload(gzip.compress(KPI_CSV), 'kpi.csv.gz'), 'department_kpi')
+
+        # Assert
+        assert result['success'] is True
+        assert result['rows_processed'] == 2
+        assert DepartmentKPI.objects.count() == 2
+
+    def test_bundle_members_are_routed_by_name_and_header(self, settings):
+        """ZIP 묶음의 파일은 파일명 또는 헤더로 데이터 유형을 판별하여 처리한다"""
+        # Arrange
+        settings.UPLOAD_BUNDLE_WORKERS = 1
+        bundle = _zip({
+            'export/department_kpi.csv.gz': gzip.compress(KPI_CSV),
+            'export/논문.csv': PUBLICATION_CSV,
+            'export/readme.csv': '안내\n내보내기 파일\n'.encode('utf-8'),
+            'export/': b'',
+        })
+        processor = FileProcessorService()
+
+        # Act
+        result = processor.process_file(_upload(bundle, 'nightly.zip'), None, 'admin@x.kr')
+
+        # Assert
+        assert result['status'] == 'partial'
+        assert result['data_type'] == 'bundle'
+        assert result['rows_processed'] == 3
+        members = {member['filename']: member for member in result['members']}
+        assert members['export/department_kpi.csv.gz']['data_type'] == 'department_kpi'
+        assert members['export/논문.csv']['data_type'] == 'publication'
+        assert members['export/readme.csv']['success'] is False
+        assert sorted(UploadHistory.objects.values_list('data_type', flat=True)) == [
+            'department_kpi', 'publication'
+        ]
+        assert UploadHistory.objects.get(data_type='publication').content_hash == (
+            hashlib.sha256(PUBLICATION_CSV).hexdigest()
+        )
+        assert 'content_hash' not in members['export/논문.csv']
+
+    def test_hashing_reader_hashes_while_parsing_in_one_pass(self):
+        """파서가 앞부분을 되감아 다시 읽어도 해시는 한 번씩만 더하고, 끝까지 읽었으면 다시 읽지 않는다"""
+        # Arrange
+        stream = CountingStream(KPI_CSV)
+        reader = HashingReader(stream)
+
+        # Act
+        rows = list(DepartmentKPIParser.iter_rows(reader))
+        read_by_parser = stream.bytes_read
+        content_hash = reader.hexdigest()
+
+        # Assert
+        assert len(rows) == 2
+        assert content_hash == hashlib.sha256(KPI_CSV).hexdigest()
+        assert stream.bytes_read == read_by_parser
+
+    def test_hashing_reader_reads_skipped_and_unread_parts(self):
+        """파서가 건너뛰거나 읽지 않은 부분은 hexdigest가 이어서 읽어 계산한다"""
+        # Arrange
+        reader = HashingReader(io.BytesIO(KPI_CSV))
+        reader.read(10)
+        reader.seek(-5, io.SEEK_END)
+        reader.read()
+
+        # Act
+        content_hash = reader.hexdigest()
+
+        # Assert
+        assert content_hash == hashlib.sha256(KPI_CSV).hexdigest()
+
+    def test_bundle_member_error_fails_only_that_member(self, settings, monkeypatch):
+        """ZIP 묶음의 한 파일에서 예상치 못한 예외가 나도 그 파일만 실패로 기록하고 나머지는 처리한다"""
+        # Arrange
+        settings.UPLOAD_BUNDLE_WORKERS = 1
+        process_source = FileProcessorService.process_source
+
+        def broken_for_publication(self, source, filename, data_type, progress=None, mode='strict'):
+            if data_type == 'publication':
+                raise RuntimeError('parser crashed')
+            return process_source(self, source, filename, data_type, progress, mode)
+
+        monkeypatch.setattr(FileProcessorService, 'process_source', broken_for_publication)
+        bundle = _zip({'department_kpi.csv': KPI_CSV, 'publication.csv': PUBLICATION_CSV})
+
+        # Act
+        result = FileProcessorService().process_file(_upload(bundle, 'nightly.zip'), None, 'admin@x.kr')
+
+        # Assert
+        members = {member['filename']: member for member in result['members']}
+        assert result['status'] == 'partial'
+        assert members['department_kpi.csv']['success'] is True
+        assert members['publication.csv']['success'] is False
+        assert 'parser crashed' in members['publication.csv']['errors'][0]
+        assert UploadHistory.objects.get(data_type='publication').status == 'failed'
+
+    def test_bundle_upload_view_does_not_require_data_type(self, settings):
+        """ZIP 묶음은 data_type 없이 업로드할 수 있다"""
+        # Arrange
+        settings.UPLOAD_BUNDLE_WORKERS = 1
+        client = APIClient()
+
+        # Act
+        response = client.post(
+            '/api/uploads/',
+            {'file': _upload(_zip({'department_kpi.csv': KPI_CSV}), 'nightly.zip')},
+            format='multipart'
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['status'] == 'success'
+        assert response.data['members'][0]['rows_processed'] == 2
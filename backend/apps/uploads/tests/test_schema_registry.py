@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+스키마 레지스트리 테스트
+
+한 곳에 선언된 컬럼 정의에서 파서, 검증 규칙, 통합 조회 변환, CSV 내보내기가
+일관되게 만들어지는지 검증합니다.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from apps.data.domain.models import DataType
+from apps.data.repositories.data_repository import DataRepository
+from apps.data.services.csv_export_service import CSVExportService
+from apps.uploads.services.data_validator import DataValidator
+from apps.uploads.services.parsers import PublicationParser
+from apps.uploads.services.schema_registry import SCHEMAS, get_schema
+
+
+PUBLICATION_ORM = SimpleNamespace(
+    id=7,
+    created_at=datetime(2024, 5, 1, 9, 0),
+    paper_id='PUB-24-001',
+    publication_date=date(2024, 3, 2),
+    college='공과대학',
+    department='컴퓨터공학과',
+    paper_title='딥러닝 연구',
+    lead_author='김교수',
+    co_authors=None,
+    journal_name='AI Journal',
+    journal_grade='SCIE',
+    impact_factor=Decimal('3.25'),
+    project_linked='Y',
+)
+
+
+class TestSchemaRegistry:
+    """스키마 레지스트리 테스트"""
+
+    def test_parser_columns_come_from_schema(self):
+        """파서의 필수 컬럼/필드 매핑과 검증 규칙은 스키마 선언을 따른다"""
+        # Arrange
+        schema = get_schema('publication')
+
+        # Assert
+        assert PublicationParser.REQUIRED_COLUMNS == schema.headers
+        assert PublicationParser.FIELD_MAP['impact_factor'] == 'Impact Factor'
+        assert DataValidator.RULES['publication'] is schema.rule_set
+        assert set(SCHEMAS) == {data_type.value for data_type in DataType}
+
+    def test_compiled_row_converter(self):
+        """컴파일된 변환 함수는 타입/대문자/빈 값 규칙을 적용한다"""
+        # Arrange
+        df = pd.DataFrame([[
+            ' PUB-24-001 ', '2024-03-02', '공과대학', '컴퓨터공학과', '딥러닝 연구', '김교수',
+            float('nan'), 'AI Journal', 'kci', 'nan', 'n'
+        ]], columns=PublicationParser.REQUIRED_COLUMNS)
+
+        # Act
+        row = next(PublicationParser.iter_frame(df))
+
+        # Assert
+        assert row.line == 2
+        assert row.data['paper_id'] == 'PUB-24-001'
+        assert row.data['publication_date'] == date(2024, 3, 2)
+        assert row.data['co_authors'] == ''
+        assert row.data['journal_grade'] == 'KCI'
+        assert row.data['impact_factor'] is None
+        assert row.data['project_linked'] == 'N'
+
+    def test_unknown_data_type(self):
+        """등록되지 않은 데이터 유형은 ValueError"""
+        with pytest.raises(ValueError, match="지원하지 않는 데이터 유형"):
+            get_schema('budget')
+
+    def test_domain_mapping_and_export_follow_schema(self):
+        """통합 조회 변환과 CSV 행은 스키마의 공통 필드 매핑과 컬럼 순서를 따른다"""
+        # Act
+        item = DataRepository()._to_domain(PUBLICATION_ORM, DataType.PUBLICATION)
+        row = CSVExportService(data_repository=object())._item_to_csv_row(item)
+
+        # Assert
+        assert (item.title, item.category, item.date) == ('딥러닝 연구', '컴퓨터공학과', date(2024, 3, 2))
+        assert item.extra_fields['impact_factor'] == 3.25
+        assert item.extra_fields['co_authors'] == ''
+        assert 'paper_title' not in item.extra_fields
+        assert CSVExportService.HEADERS[DataType.PUBLICATION][9] == 'ImpactFactor'
+        assert row == [
+            'PUB-24-001', '2024-03-02', '공과대학', '컴퓨터공학과', '딥러닝 연구', '김교수',
+            '', 'AI Journal', 'SCIE', '3.25', 'Y'
+        ]
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+백그라운드 업로드 작업 테스트
+
+작업 등록 → 워커 처리 → 상태 조회 흐름을 검증합니다.
+"""
+import os
+from datetime import timedelta
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.dashboard.persistence.models import DepartmentKPI
+from apps.uploads.persistence.models import UploadHistory
+from apps.uploads.services.upload_job_service import UploadJobService
+
+
+KPI_HEADER = (
+    "평가년도,단과대학,학과,졸업생 취업률 (%),전임교원 수 (명),"
+    "초빙교원 수 (명),연간 기술이전 수입액 (억원),국제학술대회 개최 횟수\n"
+)
+
+
+def _kpi_csv(*rows, name='kpi.csv'):
+    """학과 KPI CSV 업로드 파일"""
+    content = KPI_HEADER + ''.join(row + '\n' for row in rows)
+    return SimpleUploadedFile(name, content.encode('utf-8'), content_type='text/csv')
+
+
+@pytest.fixture
+def job_dir(settings, tmp_path):
+    """작업 파일 저장 디렉토리를 임시 경로로 변경"""
+    settings.UPLOAD_JOB_DIR = str(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestUploadJobService:
+    """UploadJobService 테스트"""
+
+    def test_submit_stores_file_and_queues_job(self, job_dir):
+        """작업 등록 시 고유한 이름으로 파일을 저장하고 대기 상태로 기록한다"""
+        # Arrange
+        service = UploadJobService()
+
+        # Act
+        first = service.submit(_kpi_csv('2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3'), 'department_kpi', 'a@x.kr')
+        second = service.submit(_kpi_csv('2024,공과대학,전자공학과,80.0,18,4,1.0,2'), 'department_kpi', 'a@x.kr')
+
+        # Assert
+        assert first.status == 'pending'
+        assert first.stage == 'queued'
+        assert first.stored_file != second.stored_file
+        assert os.path.dirname(first.stored_file) == str(job_dir)
+        assert os.path.exists(first.stored_file)
+
+    def test_run_next_processes_job_and_records_progress(self, job_dir):
+        """워커가 작업을 처리하면 단계별 행 수와 처리 결과가 기록된다"""
+        # Arrange
+        service = UploadJobService()
+        job = service.submit(
+            _kpi_csv(
+                '2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3',
+                '2024,공과대학,전자공학과,80.0,18,4,1.0,2',
+            ),
+            'department_kpi',
+            'a@x.kr'
+        )
+
+        # Act
+        finished = service.run_next()
+        job_status = service.get_status(job.id)
+
+        # Assert
+        assert finished.id == job.id
+        assert job_status['status'] == 'success'
+        assert job_status['stage'] == 'done'
+        assert job_status['rows_parsed'] == 2
+        assert job_status['rows_validated'] == 2
+        assert job_status['rows_inserted'] == 2
+        assert job_status['elapsed_seconds'] is not None
+        assert DepartmentKPI.objects.count() == 2
+        assert not os.path.exists(job.stored_file)
+        assert service.run_next() is None
+
+    def test_run_next_records_validation_failure(self, job_dir):
+        """검증 실패 시 작업은 실패 상태가 되고 데이터는 저장되지 않는다"""
+        # Arrange
+        service = UploadJobService()
+        job = service.submit(
+            _kpi_csv('2024,공과대학,컴퓨터공학과,150,20,5,1.5,3'), 'department_kpi', 'a@x.kr'
+        )
+
+        # Act
+        service.run_next()
+
+        # Assert
+        record = UploadHistory.objects.get(id=job.id)
+        assert record.status == 'failed'
+        assert '취업률은 0~100 범위여야 합니다' in record.error_message
+        assert record.rows_parsed == 1
+        assert record.rows_processed == 0
+        assert DepartmentKPI.objects.count() == 0
+
+    def test_claim_next_job_skips_claimed_jobs(self, job_dir):
+        """이미 선점된 작업은 다시 선점되지 않는다"""
+        # Arrange
+        service = UploadJobService()
+        service.submit(_kpi_csv('2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3'), 'department_kpi', 'a@x.kr')
+
+        # Act
+        claimed = service.repository.claim_next_job()
+        again = service.repository.claim_next_job()
+
+        # Assert
+        assert claimed.status == 'processing'
+        assert claimed.started_at is not None
+        assert again is None
+
+    def test_stale_processing_job_is_requeued_and_processed(self, job_dir, settings):
+        """워커가 죽어 heartbeat가 오래된 처리 중 작업은 다시 대기열로 돌아가 처리된다"""
+        # Arrange
+        settings.UPLOAD_JOB_STALE_SECONDS = 60
+        service = UploadJobService()
+        job = service.submit(_kpi_csv('2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3'), 'department_kpi', 'a@x.kr')
+        service.repository.claim_next_job()
+        UploadHistory.objects.filter(id=job.id).update(heartbeat_at=timezone.now() - timedelta(seconds=61))
+
+        # Act
+        finished = service.run_next()
+
+        # Assert
+        assert finished.id == job.id
+        assert finished.status == 'success'
+        assert finished.attempts == 2
+        assert DepartmentKPI.objects.count() == 1
+
+    def test_live_processing_job_is_not_requeued(self, job_dir, settings):
+        """heartbeat가 최근인 처리 중 작업은 다른 워커가 가져가지 않는다"""
+        # Arrange
+        settings.UPLOAD_JOB_STALE_SECONDS = 60
+        service = UploadJobService()
+        job = service.submit(_kpi_csv('2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3'), 'department_kpi', 'a@x.kr')
+        service.repository.claim_next_job()
+
+        # Act
+        result = service.run_next()
+
+        # Assert
+        assert result is None
+        assert UploadHistory.objects.get(id=job.id).status == 'processing'
+
+    def test_stale_job_fails_after_max_attempts(self, job_dir, settings):
+        """선점 횟수를 모두 쓴 오래된 작업은 다시 시도하지 않고 실패로 종료하며 파일을 지운다"""
+        # Arrange
+        settings.UPLOAD_JOB_STALE_SECONDS = 60
+        settings.UPLOAD_JOB_MAX_ATTEMPTS = 1
+        service = UploadJobService()
+        job = service.submit(_kpi_csv('2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3'), 'department_kpi', 'a@x.kr')
+        service.repository.claim_next_job()
+        UploadHistory.objects.filter(id=job.id).update(heartbeat_at=timezone.now() - timedelta(seconds=61))
+
+        # Act
+        recovered = service.requeue_stale_jobs()
+
+        # Assert
+        record = UploadHistory.objects.get(id=job.id)
+        assert recovered == 1
+        assert record.status == 'failed'
+        assert '시도 1회' in record.error_message
+        assert not os.path.exists(job.stored_file)
+
+    def test_partial_job_crashed_while_inserting_is_not_rerun(self, job_dir, settings):
+        """청크를 커밋하던 중 워커가 죽은 partial 작업은 다시 처리하지 않고 실패로 종료한다"""
+        # Arrange
+        settings.UPLOAD_JOB_STALE_SECONDS = 60
+        service = UploadJobService()
+        service.processor.INSERT_CHUNK_SIZE = 1
+        job = service.submit(
+            _kpi_csv(
+                '2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3',
+                '2024,공과대학,전자공학과,80.0,18,4,1.0,2',
+            ),
+            'department_kpi',
+            'a@x.kr',
+            mode='partial'
+        )
+        insert_chunk = service.processor._insert_chunk
+        calls = []
+
+        def crash_on_second_chunk(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise SystemExit("worker killed")
+            return insert_chunk(*args)
+
+        service.processor._insert_chunk = crash_on_second_chunk
+        claimed = service.repository.claim_next_job()
+        with pytest.raises(SystemExit):
+            service.run_job(claimed)
+        UploadHistory.objects.filter(id=job.id).update(heartbeat_at=timezone.now() - timedelta(seconds=61))
+
+        # Act
+        recovered = service.requeue_stale_jobs()
+        rerun = service.run_next()
+
+        # Assert
+        record = UploadHistory.objects.get(id=job.id)
+        assert recovered == 1
+        assert rerun is None
+        assert record.status == 'failed'
+        assert '저장 확인된 행 1건' in record.error_message
+        assert DepartmentKPI.objects.count() == 1
+
+    def test_partial_job_crashed_before_inserting_is_requeued(self, job_dir, settings):
+        """저장 단계 전에 워커가 죽은 partial 작업은 다시 대기열로 돌아가 처리된다"""
+        # Arrange
+        settings.UPLOAD_JOB_STALE_SECONDS = 60
+        service = UploadJobService()
+        job = service.submit(
+            _kpi_csv('2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3'), 'department_kpi', 'a@x.kr', mode='partial'
+        )
+        service.repository.claim_next_job()
+        UploadHistory.objects.filter(id=job.id).update(
+            stage='validating', heartbeat_at=timezone.now() - timedelta(seconds=61)
+        )
+
+        # Act
+        finished = service.run_next()
+
+        # Assert
+        assert finished.id == job.id
+        assert finished.status == 'success'
+        assert finished.rows_processed == 1
+        assert DepartmentKPI.objects.count() == 1
+
+    def test_submit_identical_file_returns_completed_job(self, job_dir):
+        """이미 처리된 파일과 같은 내용이면 새 작업 없이 이전 작업을 반환한다"""
+        # Arrange
+        service = UploadJobService()
+        row = '2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3'
+        first = service.submit(_kpi_csv(row), 'department_kpi', 'a@x.kr')
+        service.run_next()
+
+        # Act
+        second = service.submit(_kpi_csv(row), 'department_kpi', 'a@x.kr')
+
+        # Assert
+        assert second.id == first.id
+        assert second.status == 'success'
+        assert UploadHistory.objects.count() == 1
+        assert list(job_dir.iterdir()) == []
+
+
+@pytest.mark.django_db
+class TestUploadJobViews:
+    """업로드 작업 API 테스트"""
+
+    def test_create_job_returns_202_with_job_id(self, job_dir):
+        """작업 등록 API는 처리 전에 작업 ID를 반환한다"""
+        # Arrange
+        client = APIClient()
+        file = _kpi_csv('2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3')
+
+        # Act
+        response = client.post(
+            '/api/uploads/jobs/', {'file': file, 'data_type': 'department_kpi'}, format='multipart'
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data['status'] == 'pending'
+        assert DepartmentKPI.objects.count() == 0
+
+        status_response = client.get(f"/api/uploads/jobs/{response.data['job_id']}/")
+        assert status_response.status_code == status.HTTP_200_OK
+        assert status_response.data['stage'] == 'queued'
+
+    def test_unknown_job_returns_404(self):
+        """존재하지 않는 작업 조회 시 404를 반환한다"""
+        # Arrange
+        client = APIClient()
+
+        # Act
+        response = client.get('/api/uploads/jobs/9999/')
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+업로드 미리보기(dry-run) 테스트
+
+헤더와 앞쪽 행만 읽어 필수 컬럼/표본 오류/행 수 추정값을 반환하는지 검증합니다.
+"""
+import gzip
+import io
+
+import openpyxl
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.dashboard.persistence.models import DepartmentKPI
+from apps.uploads.services.parsers.source import read_sample
+from apps.uploads.services.upload_preview_service import UploadPreviewService
+
+
+KPI_HEADER = (
+    "평가년도,단과대학,학과,졸업생 취업률 (%),전임교원 수 (명),"
+    "초빙교원 수 (명),연간 기술이전 수입액 (억원),국제학술대회 개최 횟수\n"
+)
+KPI_ROW = "2024,공과대학,컴퓨터공학과{},85.5,20,5,1.5,3\n"
+
+
+def _kpi_csv(rows):
+    return (KPI_HEADER + ''.join(KPI_ROW.format(i) for i in range(rows))).encode('utf-8')
+
+
+class TestReadSample:
+    """read_sample 테스트"""
+
+    def test_small_file_is_counted_exactly(self):
+        """앞부분 안에 파일 전체가 들어오면 행 수가 정확하다"""
+        # Act
+        sample = read_sample(_kpi_csv(30), 5)
+
+        # Assert
+        assert len(sample.frame) == 5
+        assert sample.estimated_rows == 30
+        assert sample.exact is True
+
+    def test_prefix_upload_estimates_rows_from_total_size(self):
+        """파일 앞부분만 받아도 원본 크기로 전체 행 수를 추정한다"""
+        # Arrange
+        content = _kpi_csv(10000)
+        prefix = content[:4000]
+
+        # Act
+        sample = read_sample(prefix, 5, total_size=len(content))
+
+        # Assert
+        assert len(sample.frame) == 5
+        assert sample.exact is False
+        assert 9000 <= sample.estimated_rows <= 11000
+
+    def test_gzip_estimate_uses_compression_ratio(self, monkeypatch):
+        """gzip 파일은 읽은 구간의 압축률로 행 수를 추정한다"""
+        # Arrange
+        monkeypatch.setattr('apps.uploads.services.parsers.source.PREVIEW_READ_SIZE', 64 * 1024)
+        content = gzip.compress(_kpi_csv(50000))
+
+        # Act
+        sample = read_sample(content, 3)
+
+        # Assert
+        assert len(sample.frame) == 3
+        assert 25000 <= sample.estimated_rows <= 100000
+
+    def test_xlsx_uses_sheet_dimension(self):
+        """Excel 파일은 시트 dimension으로 행 수를 구한다"""
+        # Arrange
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['학번', '이름'])
+        for i in range(50):
+            sheet.append([20200000 + i, '김유진'])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+
+        # Act
+        sample = read_sample(buffer.getvalue(), 10)
+
+        # Assert
+        assert len(sample.frame) == 10
+        assert sample.estimated_rows == 50
+
+
+@pytest.mark.django_db
+class TestUploadPreviewService:
+    """UploadPreviewService 테스트"""
+
+    def test_reports_missing_columns(self):
+        """필수 컬럼이 없으면 표본 검증 없이 누락 컬럼을 반환한다"""
+        # Arrange
+        upload = SimpleUploadedFile('kpi.csv', "평가년도,학과\n2024,컴퓨터공학과\n".encode('utf-8'))
+
+        # Act
+        result = UploadPreviewService().preview(upload, 'department_kpi')
+
+        # Assert
+        assert result['success'] is False
+        assert result['missing_columns'][0] == '단과대학'
+        assert result['errors'] == []
+
+    def test_reports_sample_row_errors_without_saving(self):
+        """표본 행의 변환/검증 오류를 행 번호와 함께 반환하고 저장하지 않는다"""
+        # Arrange
+        content = (
+            KPI_HEADER
+            + "2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3\n"
+            + "2024,공과대학,전자공학과,150,18,4,1.0,2\n"
+            + "2024,공과대학,기계공학과,70.0,둘,4,1.0,2\n"
+        ).encode('utf-8')
+
+        # Act
+        result = UploadPreviewService().preview(SimpleUploadedFile('kpi.csv', content), 'department_kpi')
+
+        # Assert
+        assert result['success'] is False
+        assert [error['line'] for error in result['errors']] == [3, 4]
+        assert '취업률은 0~100 범위여야 합니다' in result['errors'][0]['messages'][0]
+        assert result['errors'][1]['messages'][0].startswith('파싱 오류')
+        assert result['rows'][0]['학과'] == '컴퓨터공학과'
+        assert DepartmentKPI.objects.count() == 0
+
+    def test_preview_view(self):
+        """미리보기 API는 표본 결과를 200으로 반환한다"""
+        # Arrange
+        upload = SimpleUploadedFile('kpi.csv', _kpi_csv(3))
+
+        # Act
+        response = APIClient().post(
+            '/api/uploads/preview/',
+            {'file': upload, 'data_type': 'department_kpi', 'rows': 2},
+            format='multipart'
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['success'] is True
+        assert response.data['sample_rows'] == 2
+        assert response.data['estimated_rows'] == 3
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+이어받기(resumable) 업로드 세션 테스트
+
+세션 생성 → 청크 전송(순서 무관, 재시도) → 완료(업로드 작업 등록) 흐름을 검증합니다.
+"""
+import hashlib
+import os
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.dashboard.persistence.models import DepartmentKPI
+from apps.uploads.persistence.models import UploadHistory
+from apps.uploads.repositories.upload_session_repository import UploadSessionRepository
+from apps.uploads.services.upload_job_service import UploadJobService
+from apps.uploads.services.upload_session_service import UploadSessionService
+
+
+KPI_CSV = (
+    "평가년도,단과대학,학과,졸업생 취업률 (%),전임교원 수 (명),"
+    "초빙교원 수 (명),연간 기술이전 수입액 (억원),국제학술대회 개최 횟수\n"
+    "2024,공과대학,컴퓨터공학과,85.5,20,5,1.5,3\n"
+    "2024,공과대학,전자공학과,80.0,18,4,1.0,2\n"
+).encode('utf-8')
+
+CHUNK_SIZE = 64
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _chunks(content=KPI_CSV):
+    return [(offset, content[offset:offset + CHUNK_SIZE]) for offset in range(0, len(content), CHUNK_SIZE)]
+
+
+@pytest.fixture
+def session_dir(settings, tmp_path):
+    """조립 파일 디렉토리를 임시 경로로 변경"""
+    settings.UPLOAD_SESSION_DIR = str(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestUploadSessionService:
+    """UploadSessionService 테스트"""
+
+    def test_chunks_in_any_order_are_assembled_and_processed(self, session_dir):
+        """청크를 순서와 관계없이 보내고 재전송해도 조립된 파일이 업로드 작업으로 처리된다"""
+        # Arrange
+        service = UploadSessionService()
+        session = service.create('kpi.csv', 'department_kpi', len(KPI_CSV), 'a@x.kr', chunk_size=CHUNK_SIZE)
+        chunks = _chunks()
+
+        # Act
+        for offset, data in reversed(chunks):
+            service.write_chunk(session.id, offset, data, _sha256(data))
+        offset, data = chunks[0]
+        progress = service.write_chunk(session.id, offset, data, _sha256(data))
+        job_status = service.complete(session.id, _sha256(KPI_CSV))
+        UploadJobService().run_next()
+
+        # Assert
+        assert progress['received_bytes'] == len(KPI_CSV)
+        assert progress['missing_offsets'] == []
+        assert job_status['status'] == 'pending'
+        assert service.get_status(session.id)['job_id'] == job_status['job_id']
+        assert UploadJobService().get_status(job_status['job_id'])['rows_inserted'] == 2
+        assert DepartmentKPI.objects.count() == 2
+        assert UploadHistory.objects.get().content_hash == _sha256(KPI_CSV)
+        assert service.get_status(session.id)['status'] == 'completed'
+        assert os.listdir(session_dir) == []
+
+    def test_failed_job_keeps_part_file_for_retry(self, session_dir):
+        """작업이 실패하면 세션은 failed가 되고 조립 파일을 남겨 다시 완료할 수 있다"""
+        # Arrange
+        content = KPI_CSV.replace(b'85.5', b'abc')
+        service = UploadSessionService()
+        session = service.create('kpi.csv', 'department_kpi', len(content), 'a@x.kr', chunk_size=CHUNK_SIZE)
+        for offset, data in _chunks(content):
+            service.write_chunk(session.id, offset, data, _sha256(data))
+
+        # Act
+        first = service.complete(session.id)
+        UploadJobService().run_next()
+        failed = service.get_status(session.id)
+        retry = service.complete(session.id)
+
+        # Assert
+        assert UploadJobService().get_status(first['job_id'])['status'] == 'failed'
+        assert failed['status'] == 'failed'
+        assert os.listdir(session_dir) == [f'{session.id}.part']
+        assert retry['status'] == 'pending'
+        assert retry['job_id'] != first['job_id']
+
+    def test_chunk_claimed_with_other_content_is_not_written(self, session_dir):
+        """같은 청크가 먼저 다른 내용으로 선점되었으면 파일에 기록하지 않고 거부한다"""
+        # Arrange
+        service = UploadSessionService()
+        session = service.create('kpi.csv', 'department_kpi', len(KPI_CSV), 'a@x.kr', chunk_size=CHUNK_SIZE)
+        offset, data = _chunks()[0]
+        UploadSessionRepository().add_chunk(session.id, 0, len(data), _sha256(b'other'))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="다른 내용"):
+            service.write_chunk(session.id, offset, data, _sha256(data))
+        with open(session_dir / f'{session.id}.part', 'rb') as part:
+            assert part.read(len(data)) == bytes(len(data))
+
+    def test_bundle_is_rejected(self, session_dir):
+        """작업 워커가 처리하지 않는 ZIP 묶음은 세션으로 올릴 수 없다"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="ZIP"):
+            UploadSessionService().create('bundle.zip', None, 100, 'a@x.kr')
+
+    def test_checksum_mismatch_rejects_chunk(self, session_dir):
+        """청크 체크섬이 맞지 않으면 기록하지 않는다"""
+        # Arrange
+        service = UploadSessionService()
+        session = service.create('kpi.csv', 'department_kpi', len(KPI_CSV), 'a@x.kr', chunk_size=CHUNK_SIZE)
+        offset, data = _chunks()[0]
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="체크섬"):
+            service.write_chunk(session.id, offset, data, _sha256(b'other'))
+        assert service.get_status(session.id)['received_bytes'] == 0
+
+    def test_complete_requires_every_chunk(self, session_dir):
+        """미수신 청크가 있으면 완료할 수 없다"""
+        # Arrange
+        service = UploadSessionService()
+        session = service.create('kpi.csv', 'department_kpi', len(KPI_CSV), 'a@x.kr', chunk_size=CHUNK_SIZE)
+        offset, data = _chunks()[0]
+        service.write_chunk(session.id, offset, data, _sha256(data))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match=f"오프셋: {CHUNK_SIZE}"):
+            service.complete(session.id)
+        assert DepartmentKPI.objects.count() == 0
+
+    def test_chunk_size_is_capped_by_request_limit(self, session_dir, settings):
+        """청크 크기는 요청 본문 크기 제한을 넘지 않는다"""
+        # Arrange
+        settings.DATA_UPLOAD_MAX_MEMORY_SIZE = 1024
+        service = UploadSessionService()
+
+        # Act
+        session = service.create('kpi.csv', 'department_kpi', 10 * 1024, 'a@x.kr', chunk_size=4096)
+
+        # Assert
+        assert session.chunk_size == 1024
+        assert len(service.get_status(session.id)['missing_offsets']) == 10
+
+
+@pytest.mark.django_db
+class TestUploadSessionViews:
+    """업로드 세션 API 테스트"""
+
+    def test_init_put_complete(self, session_dir):
+        """세션 생성 → 청크 PUT → 완료 API 흐름 (완료는 작업 ID를 바로 반환)"""
+        # Arrange
+        client = APIClient()
+
+        # Act
+        created = client.post(
+            '/api/uploads/sessions/',
+            {'filename': 'kpi.csv', 'data_type': 'department_kpi',
+             'total_size': len(KPI_CSV), 'chunk_size': CHUNK_SIZE},
+            format='json'
+        )
+        session_id = created.data['session_id']
+        for offset, data in _chunks():
+            client.put(
+                f'/api/uploads/sessions/{session_id}/chunks/{offset}/',
+                data,
+                content_type='application/octet-stream',
+                HTTP_X_CHUNK_SHA256=_sha256(data)
+            )
+        completed = client.post(f'/api/uploads/sessions/{session_id}/complete/', {}, format='json')
+
+        # Assert
+        assert created.status_code == status.HTTP_201_CREATED
+        assert created.data['missing_offsets'] == [offset for offset, _ in _chunks()]
+        assert completed.status_code == status.HTTP_202_ACCEPTED
+        assert completed.data['status'] == 'pending'
+        assert UploadHistory.objects.get(id=completed.data['job_id']).stored_file
+
+    def test_unknown_session_returns_404(self, session_dir):
+        """존재하지 않는 세션은 404"""
+        # Act
+        response = APIClient().get('/api/uploads/sessions/not-a-session/')
+
+        # Assert
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,21 @@
+"""
+ASGI config for university dashboard project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+
+비동기 뷰(대시보드, 데이터 조회/내보내기)를 이벤트 루프에서 실행하는 배포 방식입니다.
+gunicorn -c gunicorn.asgi.conf.py 로 실행합니다 (UvicornWorker).
+MIDDLEWARE는 모두 비동기를 지원하므로 요청 처리 중 동기 전환(스레드 점유)은 동기 뷰에서만 일어납니다.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+# Railway에서는 DJANGO_SETTINGS_MODULE이 자동 설정됨
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.production')
+
+application = get_asgi_application()
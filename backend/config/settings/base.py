@@ -35,8 +35,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'infrastructure.middleware.timing_middleware.RequestTimingMiddleware',  # Server-Timing / SQL instrumentation
+    'infrastructure.middleware.profiling_middleware.ProfilingMiddleware',  # Opt-in (PROFILING_ENABLED)
+    'infrastructure.middleware.replica_middleware.ReplicaPinningMiddleware',  # Only with DATABASE_REPLICAS
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',  # Static files serving
+    'infrastructure.middleware.static_middleware.AsyncWhiteNoiseMiddleware',  # Static files serving (WhiteNoise)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # CORS
     'django.middleware.common.CommonMiddleware',
@@ -138,6 +141,9 @@ SUPABASE_URL = config('SUPABASE_URL', default='')
 SUPABASE_ANON_KEY = config('SUPABASE_ANON_KEY', default='')
 SUPABASE_JWT_SECRET = config('SUPABASE_JWT_SECRET', default='')
 
+# Verified JWT claims cached per process until the token expires (0 = disabled)
+SUPABASE_TOKEN_CACHE_SIZE = config('SUPABASE_TOKEN_CACHE_SIZE', default=1024, cast=int)
+
 # Database (will be overridden in development.py and production.py)
 DATABASES = {
     'default': {
@@ -150,10 +156,53 @@ DATABASES = {
     }
 }
 
+# Read replicas: aliases in DATABASES that serve dashboard / data browser / export reads
+# (set in development.py / production.py; empty = everything uses 'default')
+DATABASE_ROUTERS = ['infrastructure.database.router.ReplicaRouter']
+DATABASE_REPLICAS = []
+REPLICA_HEALTH_CHECK_INTERVAL = config('REPLICA_HEALTH_CHECK_INTERVAL', default=5.0, cast=float)
+REPLICA_MAX_LAG_SECONDS = config('REPLICA_MAX_LAG_SECONDS', default=10.0, cast=float)
+# After a write (e.g. an upload, or when its background job finishes) the same user reads from 'default'
+# for this long (read-your-writes). Pins are keyed by JWT sub/email in a cache shared by all processes.
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', default=30, cast=int)
+REPLICA_PIN_CACHE = 'replica_pins'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # python manage.py createcachetable
+    'replica_pins': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'replica_pin_cache',
+    },
+}
+
 # File upload settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 
+# Background upload jobs (python manage.py run_upload_worker)
+UPLOAD_JOB_DIR = config('UPLOAD_JOB_DIR', default=str(MEDIA_ROOT / 'upload_jobs'))
+UPLOAD_WORKER_POLL_INTERVAL = config('UPLOAD_WORKER_POLL_INTERVAL', default=2.0, cast=float)
+# Workers record a heartbeat while processing; jobs whose heartbeat is older than UPLOAD_JOB_STALE_SECONDS
+# (crashed worker) are requeued, and failed once they have been claimed UPLOAD_JOB_MAX_ATTEMPTS times
+UPLOAD_JOB_HEARTBEAT_INTERVAL = config('UPLOAD_JOB_HEARTBEAT_INTERVAL', default=30.0, cast=float)
+UPLOAD_JOB_STALE_SECONDS = config('UPLOAD_JOB_STALE_SECONDS', default=300, cast=int)
+UPLOAD_JOB_MAX_ATTEMPTS = config('UPLOAD_JOB_MAX_ATTEMPTS', default=3, cast=int)
+
+# Rejected-row CSV reports for partial-success uploads
+UPLOAD_ERROR_REPORT_DIR = config('UPLOAD_ERROR_REPORT_DIR', default=str(MEDIA_ROOT / 'upload_errors'))
+
+# Worker processes for the files of a ZIP bundle upload (1 = process in the request)
+UPLOAD_BUNDLE_WORKERS = config('UPLOAD_BUNDLE_WORKERS', default=4, cast=int)
+
+# Resumable chunked uploads (each chunk is one request, capped by DATA_UPLOAD_MAX_MEMORY_SIZE)
+UPLOAD_SESSION_DIR = config('UPLOAD_SESSION_DIR', default=str(MEDIA_ROOT / 'upload_sessions'))
+UPLOAD_SESSION_MAX_SIZE = config('UPLOAD_SESSION_MAX_SIZE', default=1024 * 1024 * 1024, cast=int)  # 1GB
+UPLOAD_SESSION_CHUNK_SIZE = config('UPLOAD_SESSION_CHUNK_SIZE', default=8 * 1024 * 1024, cast=int)  # 8MB
+UPLOAD_SESSION_TTL_HOURS = config('UPLOAD_SESSION_TTL_HOURS', default=24, cast=int)
+
 # Logging
 LOGGING = {
     'version': 1,
@@ -175,3 +224,34 @@ LOGGING = {
         'level': 'INFO',
     },
 }
+
+# Request instrumentation: requests slower than this are logged with their full query list
+SLOW_REQUEST_THRESHOLD_MS = config('SLOW_REQUEST_THRESHOLD_MS', default=1000, cast=int)
+REQUEST_TIMING_TOP_QUERIES = 5
+REQUEST_TIMING_MAX_QUERIES = 1000
+
+# Metrics: per-process snapshots in METRICS_DIR are summed across gunicorn workers ('' = this process only)
+METRICS_DIR = config('METRICS_DIR', default='')
+METRICS_FLUSH_INTERVAL = config('METRICS_FLUSH_INTERVAL', default=1.0, cast=float)
+# Bearer token required by /api/metrics/ when set; without a token the endpoint is only served when METRICS_PUBLIC
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+METRICS_PUBLIC = True
+
+# Opt-in request profiling: admins send 'X-Profile: 1' to record cProfile + collapsed stacks
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=False, cast=bool)
+PROFILING_DIR = config('PROFILING_DIR', default='/tmp/dashboard-profiles')
+PROFILING_MAX_PROFILES = config('PROFILING_MAX_PROFILES', default=50, cast=int)
+PROFILING_SAMPLE_INTERVAL = 0.005
+
+# Slow-query capture: queries slower than the threshold are kept with their EXPLAIN plan (per-process ring buffer)
+SLOW_QUERY_CAPTURE_ENABLED = config('SLOW_QUERY_CAPTURE_ENABLED', default=False, cast=bool)
+SLOW_QUERY_THRESHOLD_MS = config('SLOW_QUERY_THRESHOLD_MS', default=200, cast=int)
+SLOW_QUERY_EXPLAIN = config('SLOW_QUERY_EXPLAIN', default=True, cast=bool)
+SLOW_QUERY_BUFFER_SIZE = 500
+
+# Async views: independent dashboard queries run concurrently on up to this many threads
+# (pool backend only, capped at DB_POOL_MAX_SIZE - 1); without the pool they run sequentially
+ASYNC_DB_CONCURRENCY = config('ASYNC_DB_CONCURRENCY', default=3, cast=int)
+
+# Fraction of DEBUG/INFO records kept by StructuredLogger.debug/info (warnings and errors are always kept)
+LOG_SAMPLE_RATE = config('LOG_SAMPLE_RATE', default=1.0, cast=float)
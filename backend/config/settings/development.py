@@ -30,6 +30,19 @@ DATABASES = {
     }
 }
 
+# 로컬 읽기 복제본 (선택): 같은 서버의 두 번째 DB를 복제본으로 사용
+# 스키마는 python manage.py migrate --database replica 로 만들고, 데이터는 복제/덤프로 맞춥니다.
+REPLICA_DB_NAME = config('REPLICA_DB_NAME', default='')
+if REPLICA_DB_NAME:
+    DATABASES['replica'] = dict(
+        DATABASES['default'],
+        NAME=REPLICA_DB_NAME,
+        HOST=config('REPLICA_DB_HOST', default=DATABASES['default']['HOST']),
+        PORT=config('REPLICA_DB_PORT', default=DATABASES['default']['PORT']),
+        TEST={'MIRROR': 'default'},
+    )
+    DATABASE_REPLICAS = ['replica']
+
 # SQLite를 사용하려면 아래 주석을 해제하고 위의 PostgreSQL 설정을 주석 처리하세요
 # DATABASES = {
 #     'default': {
@@ -89,6 +89,33 @@ else:
         }
     }
 
+# Read replicas (comma-separated DATABASE_URLs) for dashboard / data browser / export reads
+replica_urls = [url.strip() for url in config('READ_REPLICA_URLS', default='').split(',') if url.strip()]
+for number, replica_url in enumerate(replica_urls, 1):
+    DATABASES[f'replica_{number}'] = dj_database_url.parse(replica_url, conn_max_age=600, conn_health_checks=True)
+DATABASE_REPLICAS = [f'replica_{number}' for number in range(1, len(replica_urls) + 1)]
+
+# Client-side connection pool (per gunicorn worker and database, shared by its threads)
+# 요청이 끝나면 연결을 풀에 반납하므로 CONN_MAX_AGE=0, 상태 확인은 풀이 담당
+if config('DB_POOL_ENABLED', default=True, cast=bool):
+    for database in DATABASES.values():
+        database.update({
+            'ENGINE': 'infrastructure.database.postgresql_pool',
+            'CONN_MAX_AGE': 0,
+            'CONN_HEALTH_CHECKS': False,
+            'POOL': {
+                'min_size': config('DB_POOL_MIN_SIZE', default=1, cast=int),
+                'max_size': config('DB_POOL_MAX_SIZE', default=4, cast=int),  # gunicorn threads
+                'timeout': config('DB_POOL_TIMEOUT', default=10.0, cast=float),
+                'max_idle': config('DB_POOL_MAX_IDLE', default=300.0, cast=float),
+                'max_lifetime': config('DB_POOL_MAX_LIFETIME', default=1800.0, cast=float),
+                'check_interval': config('DB_POOL_CHECK_INTERVAL', default=5.0, cast=float),
+            },
+        })
+
+# /api/metrics/ is never public in production: scrapers must send METRICS_TOKEN (unset = endpoint closed)
+METRICS_PUBLIC = False
+
 # Security settings
 # Railway는 자체 프록시에서 HTTPS를 처리하므로 Django에서 리다이렉트하면 안 됨
 # CORS preflight 요청 시 리다이렉트가 발생하면 에러 발생
@@ -126,5 +153,13 @@ if SENTRY_DSN:
         send_default_pii=False,
     )
 
-# Use less verbose logging in production
-LOGGING['root']['level'] = 'WARNING'
+# Use less verbose logging in production (LOG_LEVEL=DEBUG to enable request detail)
+LOGGING['root']['level'] = config('LOG_LEVEL', default='WARNING')
+
+# Write log records from a background thread so request threads never block on stdout
+LOGGING['handlers']['console'] = {
+    '()': 'infrastructure.logging.handlers.QueueingStreamHandler',
+    'fmt': LOGGING['formatters']['verbose']['format'],
+    'style': LOGGING['formatters']['verbose']['style'],
+    'stream': 'ext://sys.stdout',
+}
@@ -8,6 +8,10 @@ from django.conf.urls.static import static
 from django.http import JsonResponse
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from infrastructure.metrics.views import metrics_view
+from infrastructure.profiling.views import ProfileArtifactView, ProfileIndexView
+from infrastructure.slow_queries.views import SlowQueryView
+
 
 def health_check(request):
     """Health check endpoint for Railway"""
@@ -25,6 +29,16 @@ urlpatterns = [
     
     # Health check
     path('api/health/', health_check, name='health_check'),
+
+    # Metrics (Prometheus text format)
+    path('api/metrics/', metrics_view, name='metrics'),
+
+    # Request profiles (admin only, recorded when PROFILING_ENABLED)
+    path('api/profiles/', ProfileIndexView.as_view(), name='profile_index'),
+    path('api/profiles/<str:profile_id>/<str:kind>/', ProfileArtifactView.as_view(), name='profile_artifact'),
+
+    # Slow queries with EXPLAIN plans (admin only, recorded when SLOW_QUERY_CAPTURE_ENABLED)
+    path('api/slow-queries/', SlowQueryView.as_view(), name='slow_queries'),
     
     # API Documentation
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
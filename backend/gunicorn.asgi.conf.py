@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Gunicorn 설정 파일 (ASGI)
+
+비동기 뷰를 이벤트 루프에서 실행하는 배포 방식 (UvicornWorker + config.asgi)
+    gunicorn -c gunicorn.asgi.conf.py
+
+gunicorn.conf.py(WSGI, sync 워커)와 로그/재시작/메트릭 설정은 같고 워커만 다릅니다.
+워커 하나가 여러 요청을 동시에 처리하므로 threads는 쓰지 않습니다.
+"""
+import os
+
+# 워커 설정
+workers = 2
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = 120
+
+# 로그 설정 - 모든 로그를 stdout으로
+accesslog = "-"  # stdout
+errorlog = "-"   # stdout
+loglevel = "info"
+
+# Django ASGI 애플리케이션
+wsgi_app = "config.asgi:application"
+
+# 프로세스 이름
+proc_name = "django-app"
+
+# 재시작 설정
+max_requests = 1000
+max_requests_jitter = 50
+
+# Railway 환경에서 포트 동적 할당
+port = os.environ.get("PORT", "8080")
+bind = f"0.0.0.0:{port}"
+
+# 메트릭 스냅샷 디렉토리 (워커별 메트릭을 /api/metrics/ 에서 합산)
+os.environ.setdefault("METRICS_DIR", "/tmp/dashboard-metrics")
+
+# 워커당 커넥션 풀: 동시 요청의 동기 ORM 스레드와 대시보드 동시 조회(ASYNC_DB_CONCURRENCY)가 함께 사용
+os.environ.setdefault("DB_POOL_MAX_SIZE", "16")
+
+
+def on_starting(server):
+    """이전 실행의 메트릭 스냅샷 삭제 (카운터를 0부터 시작)"""
+    from infrastructure.metrics.registry import MetricsRegistry
+
+    MetricsRegistry.clear_directory(os.environ["METRICS_DIR"])
@@ -39,3 +39,13 @@ max_requests_jitter = 50
 import os
 port = os.environ.get("PORT", "8080")
 bind = f"0.0.0.0:{port}"
+
+# 메트릭 스냅샷 디렉토리 (워커별 메트릭을 /api/metrics/ 에서 합산)
+os.environ.setdefault("METRICS_DIR", "/tmp/dashboard-metrics")
+
+
+def on_starting(server):
+    """이전 실행의 메트릭 스냅샷 삭제 (카운터를 0부터 시작)"""
+    from infrastructure.metrics.registry import MetricsRegistry
+
+    MetricsRegistry.clear_directory(os.environ["METRICS_DIR"])
@@ -25,30 +25,27 @@ def require_admin(view_func):
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
         # 인증 확인
-        if not request.user or not hasattr(request.user, '__iter__'):
+        if not getattr(request.user, 'is_authenticated', False):
             raise PermissionDenied('로그인이 필요합니다')
 
-        # JWT에서 역할 추출 (user_id, token)
-        user_id, token = request.user
-
-        # JWT 토큰 디코드
-        import jwt
-        from django.conf import settings
+        # SupabaseAuthentication이 첨부한 claims 재사용 (없으면 캐시를 거쳐 검증)
+        payload = getattr(request, 'supabase_claims', None)
+        if payload is None:
+            import jwt
+            from .supabase_auth import SupabaseAuthentication
 
-        try:
-            payload = jwt.decode(
-                token,
-                settings.SUPABASE_JWT_SECRET,
-                algorithms=['HS256']
-            )
+            if not isinstance(request.auth, str):
+                raise PermissionDenied('유효하지 않은 토큰입니다')
 
-            role = payload.get('role', 'user')
+            try:
+                payload = SupabaseAuthentication.verify_token(request.auth)
+            except jwt.InvalidTokenError:
+                raise PermissionDenied('유효하지 않은 토큰입니다')
 
-            if role != 'admin':
-                raise PermissionDenied('관리자 권한이 필요합니다')
+        role = payload.get('role', 'user')
 
-        except jwt.InvalidTokenError:
-            raise PermissionDenied('유효하지 않은 토큰입니다')
+        if role != 'admin':
+            raise PermissionDenied('관리자 권한이 필요합니다')
 
         return view_func(request, *args, **kwargs)
 
@@ -5,15 +5,25 @@ Supabase JWT 인증 클래스
 - HTTP 요청에서 JWT 토큰 추출
 - Supabase JWT Secret으로 토큰 서명 검증
 - 토큰 만료 여부 확인
+- 검증된 토큰 claims 캐시 (토큰 만료 시각까지, 프로세스별 LRU)
 - 사용자 ID 및 역할 추출
-- 요청 객체에 사용자 정보 첨부
+- 요청 객체에 사용자 정보와 claims 첨부 (request.supabase_claims)
 """
+import time
 import jwt
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from django.conf import settings
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
+from infrastructure.logging.logger import StructuredLogger
+from infrastructure.metrics.metrics import JWT_VERIFY_SECONDS
+
+from .token_cache import TokenCache
+
+# 검증된 토큰 claims 캐시 (대시보드 화면의 여러 API 호출이 같은 토큰을 반복 검증하지 않도록)
+token_cache = TokenCache(max_size=getattr(settings, 'SUPABASE_TOKEN_CACHE_SIZE', 1024))
+
 
 class SupabaseUser:
     """
@@ -60,61 +70,91 @@ class SupabaseAuthentication(BaseAuthentication):
 
         if not auth_header:
             # Authorization 헤더가 없으면 익명 사용자로 처리
-            print('[SupabaseAuth] Authorization 헤더가 없습니다')
+            StructuredLogger.debug(__name__, 'Authorization 헤더가 없습니다')
             return None
 
         # Bearer 형식 검증
         parts = auth_header.split()
 
         if len(parts) != 2 or parts[0].lower() != 'bearer':
-            print(f'[SupabaseAuth] Bearer 형식이 아닙니다: {auth_header[:50]}...')
+            StructuredLogger.warning(__name__, 'Bearer 형식이 아닙니다')
             raise AuthenticationFailed('Bearer 형식이 아닙니다')
 
         token = parts[1]
-        print(f'[SupabaseAuth] 토큰 검증 시작: {token[:20]}...')
 
         try:
             # JWT Secret 확인
             if not settings.SUPABASE_JWT_SECRET:
-                print('[SupabaseAuth] SUPABASE_JWT_SECRET이 설정되지 않았습니다!')
+                StructuredLogger.error(__name__, 'SUPABASE_JWT_SECRET이 설정되지 않았습니다')
                 raise AuthenticationFailed('JWT Secret이 설정되지 않았습니다')
 
-            # JWT 토큰 디코드 및 검증
-            # Supabase JWT는 audience를 'authenticated'로 설정
-            payload = jwt.decode(
-                token,
-                settings.SUPABASE_JWT_SECRET,
-                algorithms=['HS256'],
-                audience='authenticated',
-                options={"verify_aud": True}
-            )
+            # JWT 토큰 디코드 및 검증 (캐시 적중 시 생략)
+            payload = self.verify_token(token)
 
             # 사용자 정보 추출 (Supabase는 'sub' 필드에 user_id 저장)
             user_id = payload.get('sub')
             email = payload.get('email')
             role = payload.get('role', 'authenticated')
 
-            print(f'[SupabaseAuth] 토큰 검증 성공. User ID: {user_id}, Email: {email}')
+            StructuredLogger.debug(__name__, '토큰 검증 성공. User ID: %s', user_id, user_id=user_id)
 
             if not user_id:
                 raise AuthenticationFailed('토큰에 사용자 ID가 없습니다')
 
+            # 권한 검사에서 다시 디코드하지 않도록 claims 첨부
+            request.supabase_claims = payload
+
             # SupabaseUser 객체 생성 및 반환
             user = SupabaseUser(user_id=user_id, email=email, role=role)
             return (user, token)
 
         except jwt.ExpiredSignatureError:
-            print('[SupabaseAuth] 토큰이 만료되었습니다')
+            StructuredLogger.info(__name__, '토큰이 만료되었습니다')
             raise AuthenticationFailed('토큰이 만료되었습니다')
 
         except jwt.InvalidTokenError as e:
-            print(f'[SupabaseAuth] 유효하지 않은 토큰입니다: {str(e)}')
+            StructuredLogger.warning(__name__, '유효하지 않은 토큰입니다: %s', e)
             raise AuthenticationFailed('유효하지 않은 토큰입니다')
 
         except Exception as e:
-            print(f'[SupabaseAuth] 인증 처리 중 오류: {str(e)}')
+            StructuredLogger.error(__name__, '인증 처리 중 오류: %s', e, exc_info=True)
             raise AuthenticationFailed(f'인증 처리 중 오류가 발생했습니다: {str(e)}')
 
+    @staticmethod
+    def verify_token(token: str) -> Dict:
+        """
+        토큰 서명/만료/audience 검증 후 claims 반환
+
+        검증에 성공한 토큰은 exp까지 캐시하여 같은 토큰의 재검증을 생략합니다.
+
+        Args:
+            token: JWT 토큰
+
+        Returns:
+            Dict: 검증된 claims
+
+        Raises:
+            jwt.InvalidTokenError: 토큰이 유효하지 않거나 만료된 경우
+        """
+        started = time.perf_counter()
+        secret = settings.SUPABASE_JWT_SECRET
+        payload = token_cache.get(token, secret)
+        if payload is not None:
+            JWT_VERIFY_SECONDS.observe(time.perf_counter() - started, cache='hit')
+            return payload
+
+        # Supabase JWT는 audience를 'authenticated'로 설정
+        payload = jwt.decode(
+            token,
+            secret,
+            algorithms=['HS256'],
+            audience='authenticated',
+            options={"verify_aud": True}
+        )
+        token_cache.set(token, secret, payload)
+        JWT_VERIFY_SECONDS.observe(time.perf_counter() - started, cache='miss')
+        return payload
+
     def authenticate_header(self, request):
         """
         401 응답 시 WWW-Authenticate 헤더 값 반환
@@ -0,0 +1,119 @@
+"""
+검증된 토큰 캐시 테스트
+"""
+import time
+from unittest.mock import Mock, patch
+
+import jwt
+import pytest
+from rest_framework.exceptions import PermissionDenied
+
+from infrastructure.authentication import supabase_auth
+from infrastructure.authentication.permissions import require_admin
+from infrastructure.authentication.supabase_auth import SupabaseAuthentication
+from infrastructure.authentication.token_cache import TokenCache
+
+SECRET = 'test-secret-key'
+
+
+def make_token(role='user', exp_in=3600):
+    """audience가 'authenticated'인 Supabase 형식 토큰"""
+    payload = {
+        'sub': 'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
+        'email': 'test@example.com',
+        'role': role,
+        'aud': 'authenticated',
+        'exp': int(time.time()) + exp_in,
+    }
+    return jwt.encode(payload, SECRET, algorithm='HS256')
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    supabase_auth.token_cache.clear()
+    yield
+    supabase_auth.token_cache.clear()
+
+
+class TestTokenCache:
+    """TokenCache 단위 테스트"""
+
+    def test_entry_expires_at_token_exp(self):
+        """exp 시각이 지나면 캐시 항목을 버린다"""
+        # Arrange
+        now = [1000]
+        cache = TokenCache(clock=lambda: now[0])
+        cache.set('token', SECRET, {'sub': 'u1', 'exp': 1060})
+
+        # Act
+        before = cache.get('token', SECRET)
+        now[0] = 1060
+        after = cache.get('token', SECRET)
+
+        # Assert
+        assert before == {'sub': 'u1', 'exp': 1060}
+        assert after is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """최대 개수를 넘으면 가장 오래 쓰지 않은 토큰부터 제거한다"""
+        # Arrange
+        cache = TokenCache(max_size=2, clock=lambda: 0)
+        cache.set('a', SECRET, {'exp': 10})
+        cache.set('b', SECRET, {'exp': 10})
+        cache.get('a', SECRET)
+
+        # Act
+        cache.set('c', SECRET, {'exp': 10})
+
+        # Assert
+        assert cache.get('b', SECRET) is None
+        assert cache.get('a', SECRET) is not None
+        assert cache.get('c', SECRET) is not None
+
+    def test_secret_change_invalidates_entries(self):
+        """JWT Secret이 바뀌면 이전 Secret으로 검증한 항목을 쓰지 않는다"""
+        # Arrange
+        cache = TokenCache(clock=lambda: 0)
+        cache.set('token', SECRET, {'exp': 10})
+
+        # Act & Assert
+        assert cache.get('token', 'rotated-secret') is None
+        assert cache.get('token', SECRET) is None
+
+
+class TestCachedAuthentication:
+    """SupabaseAuthentication / require_admin 캐시 사용 테스트"""
+
+    def test_repeated_requests_decode_once(self):
+        """같은 토큰의 반복 요청은 서명 검증을 한 번만 수행하고 claims를 요청에 첨부한다"""
+        # Arrange
+        token = make_token()
+        requests = [Mock(META={'HTTP_AUTHORIZATION': f'Bearer {token}'}) for _ in range(3)]
+
+        # Act
+        with patch('infrastructure.authentication.supabase_auth.settings.SUPABASE_JWT_SECRET', SECRET), \
+                patch('infrastructure.authentication.supabase_auth.jwt.decode', wraps=jwt.decode) as decode:
+            users = [SupabaseAuthentication().authenticate(request)[0] for request in requests]
+
+        # Assert
+        assert decode.call_count == 1
+        assert {user.id for user in users} == {'a1b2c3d4-e5f6-7890-abcd-ef1234567890'}
+        assert requests[2].supabase_claims['role'] == 'user'
+
+    def test_require_admin_reuses_request_claims(self):
+        """require_admin은 요청에 첨부된 claims로 역할을 확인한다"""
+        # Arrange
+        view = require_admin(lambda request: 'ok')
+        admin = Mock(user=Mock(is_authenticated=True), supabase_claims={'role': 'admin'})
+        user = Mock(user=Mock(is_authenticated=True), supabase_claims={'role': 'user'})
+
+        # Act
+        with patch('infrastructure.authentication.supabase_auth.jwt.decode') as decode:
+            result = view(admin)
+            with pytest.raises(PermissionDenied, match='관리자 권한이 필요합니다'):
+                view(user)
+
+        # Assert
+        assert result == 'ok'
+        decode.assert_not_called()
@@ -0,0 +1,86 @@
+"""
+검증된 JWT 토큰 캐시
+
+책임:
+- 서명/만료/audience 검증을 통과한 토큰의 claims를 프로세스별로 보관
+- 토큰 원문 대신 SHA-256 다이제스트를 키로 사용
+- 토큰의 exp 시각까지만 유효, 최대 개수를 넘으면 가장 오래 쓰지 않은 항목부터 제거 (LRU)
+- JWT Secret이 바뀌면 전체 무효화
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class TokenCache:
+    """
+    검증된 토큰 claims의 LRU 캐시 (스레드 안전)
+
+    Args:
+        max_size: 최대 항목 수 (0이면 캐시하지 않음)
+        clock: 현재 시각(epoch 초) 함수
+    """
+
+    def __init__(self, max_size: int = 1024, clock=time.time):
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: 'OrderedDict[bytes, tuple]' = OrderedDict()
+        self._secret = None
+        self._lock = threading.Lock()
+
+    def get(self, token: str, secret: str) -> Optional[Dict]:
+        """
+        캐시된 claims 조회
+
+        Returns:
+            만료 전이면 claims, 없거나 만료되었거나 Secret이 바뀌었으면 None
+        """
+        key = self._key(token)
+        with self._lock:
+            if secret != self._secret:
+                self._entries.clear()
+                self._secret = secret
+                return None
+
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, claims = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return claims
+
+    def set(self, token: str, secret: str, claims: Dict) -> None:
+        """검증된 claims 저장 (exp가 없는 토큰은 유효 기간을 알 수 없으므로 저장하지 않음)"""
+        expires_at = claims.get('exp')
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self._key(token)
+        with self._lock:
+            if secret != self._secret:
+                self._entries.clear()
+                self._secret = secret
+
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode('utf-8')).digest()
@@ -0,0 +1 @@
+# Infrastructure Benchmarks Module
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크 케이스
+
+대시보드, 데이터 조회, CSV 내보내기, 파일 업로드의 주요 경로를 케이스로 정의합니다.
+업로드 케이스는 대상 테이블을 비운 뒤 업로드하고 매번 롤백하므로 적재된 데이터가 유지됩니다.
+"""
+import os
+from typing import Dict, List
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.dashboard.services.dashboard_service import DashboardService
+from apps.data.domain.models import DataFilter, DataType
+from apps.data.repositories.data_repository import DataRepository
+from apps.data.services.csv_export_service import CSVExportService
+from apps.uploads.services.bulk_loader import BulkLoader
+from apps.uploads.services.file_processor import FileProcessorService
+from infrastructure.benchmarks.runner import BenchmarkCase
+
+# 대시보드 조회 연도 (합성 데이터의 마지막 연도)
+DASHBOARD_YEAR = 2024
+
+# 데이터 조회 페이지 / 검색어
+PAGE_SIZE = 20
+PAGES = (1, 500)
+SEARCH = '공학'
+
+
+def dashboard_cases() -> List[BenchmarkCase]:
+    """대시보드 전체 데이터 조회"""
+    service = DashboardService()
+    return [
+        BenchmarkCase(
+            f'dashboard.{college}',
+            lambda college=college: service.get_dashboard_data(DASHBOARD_YEAR, college=college),
+            {'year': DASHBOARD_YEAR, 'college': college}
+        )
+        for college in ('all', '공과대학')
+    ]
+
+
+def data_list_cases() -> List[BenchmarkCase]:
+    """데이터 조회 (첫 페이지 / 깊은 페이지, 검색 유무)"""
+    repository = DataRepository()
+    cases = []
+    for search in (None, SEARCH):
+        for page in PAGES:
+            name = f"data_list.{'search.' if search else ''}page_{page}"
+            cases.append(BenchmarkCase(
+                name,
+                lambda search=search, page=page: repository.get_all_with_filters(
+                    DataFilter(search=search), page=page, page_size=PAGE_SIZE
+                ),
+                {'search': search, 'page': page, 'page_size': PAGE_SIZE}
+            ))
+    return cases
+
+
+def export_cases() -> List[BenchmarkCase]:
+    """데이터 유형별 CSV 내보내기"""
+    service = CSVExportService()
+    return [
+        BenchmarkCase(
+            f'export.{data_type.value}',
+            lambda data_type=data_type: service.export_to_csv(DataFilter(data_type=data_type)),
+            {'data_type': data_type.value}
+        )
+        for data_type in DataType
+    ]
+
+
+def upload_cases(files: Dict[str, str]) -> List[BenchmarkCase]:
+    """
+    데이터 유형별 파일 업로드 (파싱, 검증, 저장, 이력 기록)
+
+    Args:
+        files: 데이터 유형 → 업로드할 CSV 경로
+    """
+    service = FileProcessorService()
+    loader = BulkLoader()
+    cases = []
+    for data_type, path in files.items():
+        with open(path, 'rb') as f:
+            content = f.read()
+
+        def prepare(data_type=data_type, path=path, content=content):
+            loader.clear(data_type)
+            return SimpleUploadedFile(os.path.basename(path), content, content_type='text/csv')
+
+        cases.append(BenchmarkCase(
+            f'upload.{data_type}',
+            lambda file, data_type=data_type: service.process_file(file, data_type, 'benchmark'),
+            {'data_type': data_type, 'bytes': len(content)},
+            setup=prepare,
+            rollback=True
+        ))
+    return cases
+
+
+def hot_path_cases(upload_files: Dict[str, str]) -> List[BenchmarkCase]:
+    """전체 케이스"""
+    return dashboard_cases() + data_list_cases() + export_cases() + upload_cases(upload_files)
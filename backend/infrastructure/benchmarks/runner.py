@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크 실행기
+
+케이스별로 워밍업 후 N회 실행하여 지연 시간 분포(p50/p95/p99)를 구하고,
+별도의 1회 실행에서 쿼리 수와 최대 메모리(tracemalloc)를 측정합니다.
+측정 도구의 오버헤드가 지연 시간에 섞이지 않도록 두 측정을 분리합니다.
+"""
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import django
+import numpy as np
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+PERCENTILES = (50, 95, 99)
+
+
+class BenchmarkCase(NamedTuple):
+    """
+    벤치마크 케이스
+
+    setup은 매 실행 전에 측정 구간 밖에서 호출되며, 반환값이 func의 인자로 전달됩니다.
+    rollback=True이면 setup과 func를 하나의 트랜잭션에서 실행한 뒤 롤백합니다.
+    """
+    name: str
+    func: Callable[..., Any]
+    params: Dict = {}
+    setup: Optional[Callable[[], Any]] = None
+    rollback: bool = False
+
+
+class BenchmarkRunner:
+    """벤치마크 케이스 실행 및 통계 산출"""
+
+    def __init__(self, iterations: int = 10, warmup: int = 1):
+        if iterations < 1:
+            raise ValueError("iterations는 1 이상이어야 합니다")
+        self.iterations = iterations
+        self.warmup = max(0, warmup)
+
+    def measure(self, case: BenchmarkCase) -> Dict:
+        """
+        케이스 하나 측정
+
+        Returns:
+            Dict: {
+                'case', 'params', 'iterations',
+                'latency_ms': {'min', 'mean', 'p50', 'p95', 'p99', 'max'},
+                'queries': int,
+                'peak_memory_kb': float
+            }
+        """
+        for _ in range(self.warmup):
+            self._execute(case)
+
+        samples = [self._execute(case) for _ in range(self.iterations)]
+        queries, peak = self._profile(case)
+
+        return {
+            'case': case.name,
+            'params': case.params,
+            'iterations': self.iterations,
+            'latency_ms': self.summarize(samples),
+            'queries': queries,
+            'peak_memory_kb': round(peak / 1024, 1),
+        }
+
+    @staticmethod
+    def summarize(samples: List[float]) -> Dict:
+        """초 단위 표본을 밀리초 통계로 변환"""
+        values = np.asarray(samples) * 1000
+        summary = {'min': values.min(), 'mean': values.mean()}
+        summary.update({f'p{q}': np.percentile(values, q) for q in PERCENTILES})
+        summary['max'] = values.max()
+        return {key: round(float(value), 3) for key, value in summary.items()}
+
+    def _execute(self, case: BenchmarkCase) -> float:
+        """1회 실행 시간(초)"""
+        elapsed = 0.0
+
+        def timed(prepared):
+            nonlocal elapsed
+            started = time.perf_counter()
+            self._call(case, prepared)
+            elapsed = time.perf_counter() - started
+
+        self._within(case, timed)
+        return elapsed
+
+    def _profile(self, case: BenchmarkCase):
+        """1회 실행의 (쿼리 수, 최대 할당 바이트)"""
+        result = {}
+
+        def profiled(prepared):
+            with CaptureQueriesContext(connection) as captured:
+                tracemalloc.start()
+                try:
+                    self._call(case, prepared)
+                    _, result['peak'] = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+            result['queries'] = len(captured)
+
+        self._within(case, profiled)
+        return result['queries'], result['peak']
+
+    def _within(self, case: BenchmarkCase, body: Callable[[Any], None]) -> None:
+        """setup 후 body 실행 (rollback 케이스는 트랜잭션 안에서 실행 후 롤백)"""
+        if not case.rollback:
+            body(case.setup() if case.setup else None)
+            return
+
+        with transaction.atomic():
+            body(case.setup() if case.setup else None)
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _call(case: BenchmarkCase, prepared: Any) -> Any:
+        return case.func(prepared) if case.setup else case.func()
+
+
+def environment() -> Dict:
+    """결과 비교용 실행 환경 정보 (커밋, DB, 런타임)"""
+    return {
+        'commit': _git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'database': connection.vendor,
+        'database_version': '.'.join(str(part) for part in connection.get_database_version()),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare(current: Dict, baseline: Dict, metric: str = 'p95') -> List[Dict]:
+    """
+    두 보고서의 같은 (scale, case) 결과를 비교
+
+    Returns:
+        List[Dict]: {'scale', 'case', 'baseline', 'current', 'ratio', 'queries_delta'}
+    """
+    previous = {(item['scale'], item['case']): item for item in baseline.get('results', [])}
+    rows = []
+    for item in current.get('results', []):
+        before = previous.get((item['scale'], item['case']))
+        if before is None:
+            continue
+        old, new = before['latency_ms'][metric], item['latency_ms'][metric]
+        rows.append({
+            'scale': item['scale'],
+            'case': item['case'],
+            'baseline': old,
+            'current': new,
+            'ratio': round(new / old, 3) if old else None,
+            'queries_delta': item['queries'] - before['queries'],
+        })
+    return rows
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크 스위트
+
+규모 인자별로 합성 데이터를 적재한 뒤 주요 경로 케이스를 측정하여
+커밋 간 비교 가능한 JSON 보고서를 만듭니다.
+"""
+import os
+import shutil
+import tempfile
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+from apps.uploads.services.bulk_loader import BulkLoader
+from apps.uploads.services.synthetic_data import SyntheticDataGenerator
+from infrastructure.benchmarks.cases import hot_path_cases
+from infrastructure.benchmarks.runner import BenchmarkRunner, environment
+
+
+class BenchmarkSuite:
+    """
+    규모별 데이터 적재 + 케이스 측정
+
+    현재 DB의 대시보드 테이블을 합성 데이터로 교체하므로
+    run_benchmarks 명령처럼 별도의 테스트 DB에서 실행해야 합니다.
+
+    Args:
+        scales: 측정할 규모 인자 목록
+        iterations: 케이스별 측정 횟수
+        warmup: 케이스별 워밍업 횟수
+        seed: 합성 데이터 시드
+        upload_scale: 업로드 케이스에 쓸 파일의 규모 인자
+    """
+
+    def __init__(
+        self,
+        scales: Sequence[float] = (1.0,),
+        iterations: int = 10,
+        warmup: int = 1,
+        seed: int = 42,
+        upload_scale: float = 0.1
+    ):
+        self.scales = list(scales)
+        self.runner = BenchmarkRunner(iterations=iterations, warmup=warmup)
+        self.seed = seed
+        self.upload_scale = upload_scale
+
+    def run(self, progress: Optional[Callable[[str], None]] = None) -> Dict:
+        """
+        전체 규모 측정
+
+        Args:
+            progress: 진행 메시지를 받을 콜백
+
+        Returns:
+            Dict: {'environment': {...}, 'settings': {...}, 'datasets': [...], 'results': [...]}
+        """
+        progress = progress or (lambda message: None)
+        report = {
+            'environment': environment(),
+            'settings': {
+                'scales': self.scales,
+                'iterations': self.runner.iterations,
+                'warmup': self.runner.warmup,
+                'seed': self.seed,
+                'upload_scale': self.upload_scale,
+            },
+            'datasets': [],
+            'results': [],
+        }
+
+        directory = tempfile.mkdtemp(prefix='benchmark_')
+        try:
+            upload_files = self._write(self.upload_scale, os.path.join(directory, 'upload'))
+            for scale in self.scales:
+                progress(f"scale={scale}: 합성 데이터 적재 중")
+                report['datasets'].append(self.prepare(scale, os.path.join(directory, f'scale_{scale}')))
+
+                for case in hot_path_cases(upload_files):
+                    result = dict(scale=scale, **self.runner.measure(case))
+                    report['results'].append(result)
+                    progress(
+                        f"scale={scale} {case.name}: p50 {result['latency_ms']['p50']}ms, "
+                        f"p95 {result['latency_ms']['p95']}ms, {result['queries']} queries"
+                    )
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+        return report
+
+    def prepare(self, scale: float, directory: str) -> Dict:
+        """
+        규모 인자만큼 합성 데이터를 생성해 테이블을 교체
+
+        병렬 적재 워커는 원래 DB 이름으로 새로 연결하므로 테스트 DB에는 현재 프로세스에서 적재합니다.
+        """
+        started = time.perf_counter()
+        files = self._write(scale, directory)
+        results = BulkLoader(validate=False).load_many(list(files.items()))
+        shutil.rmtree(directory, ignore_errors=True)
+
+        return {
+            'scale': scale,
+            'rows': {result.data_type: result.rows for result in results},
+            'load_seconds': round(time.perf_counter() - started, 2),
+        }
+
+    def _write(self, scale: float, directory: str) -> Dict[str, str]:
+        """데이터 유형 → 생성한 CSV 경로"""
+        os.makedirs(directory, exist_ok=True)
+        written = SyntheticDataGenerator(scale=scale, seed=self.seed).write(directory)
+        return {data_type: path for data_type, path, _ in written}
@@ -0,0 +1 @@
+# Infrastructure Benchmarks Tests Module
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크 실행기/스위트 테스트
+"""
+import pytest
+
+from apps.dashboard.persistence.models import Student
+from infrastructure.benchmarks.runner import BenchmarkCase, BenchmarkRunner, compare
+from infrastructure.benchmarks.suite import BenchmarkSuite
+
+
+class TestBenchmarkRunner:
+    """BenchmarkRunner 테스트"""
+
+    def test_summarize_percentiles_in_ms(self):
+        """초 단위 표본을 밀리초 백분위수로 요약한다"""
+        # Act
+        summary = BenchmarkRunner.summarize([0.001 * n for n in range(1, 101)])
+
+        # Assert
+        assert summary['min'] == 1.0
+        assert summary['max'] == 100.0
+        assert summary['p50'] == pytest.approx(50.5)
+        assert summary['p95'] == pytest.approx(95.05)
+
+    @pytest.mark.django_db
+    def test_rollback_case_leaves_data_untouched(self):
+        """rollback 케이스는 setup/실행 결과를 매번 되돌리고, 쿼리 수를 기록한다"""
+        # Arrange
+        case = BenchmarkCase(
+            'insert',
+            lambda number: Student.objects.create(
+                student_id=number, name='홍길동', college='공과대학', department='컴퓨터공학과',
+                grade=1, program_type='학사', enrollment_status='재학', gender='남', admission_year=2024,
+                email='hong@example.com'
+            ),
+            setup=lambda: '2024000001',
+            rollback=True
+        )
+
+        # Act
+        result = BenchmarkRunner(iterations=3, warmup=1).measure(case)
+
+        # Assert
+        assert not Student.objects.exists()
+        assert result['iterations'] == 3
+        assert result['queries'] >= 1
+        assert result['peak_memory_kb'] > 0
+
+    def test_compare_reports_ratio_per_case(self):
+        """같은 (scale, case)의 p95 비율과 쿼리 수 차이를 계산한다"""
+        # Arrange
+        def report(p95, queries):
+            return {'results': [
+                {'scale': 1.0, 'case': 'dashboard.all', 'latency_ms': {'p95': p95}, 'queries': queries}
+            ]}
+
+        # Act
+        rows = compare(report(30.0, 30), report(20.0, 28))
+
+        # Assert
+        assert rows == [{
+            'scale': 1.0, 'case': 'dashboard.all', 'baseline': 20.0, 'current': 30.0,
+            'ratio': 1.5, 'queries_delta': 2
+        }]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_suite_report_covers_hot_paths():
+    """스위트는 규모별 적재 정보와 모든 주요 경로의 측정 결과를 보고한다"""
+    # Act
+    report = BenchmarkSuite(scales=[0.01], iterations=1, warmup=0, upload_scale=0.01).run()
+
+    # Assert
+    cases = {result['case'] for result in report['results']}
+    assert {'dashboard.all', 'data_list.page_500', 'data_list.search.page_1'} <= cases
+    assert {'export.publication', 'upload.student_roster'} <= cases
+    assert report['datasets'][0]['rows']['student_roster'] == 100
+    assert report['environment']['database'] == 'sqlite'
+    assert all(set(result['latency_ms']) == {'min', 'mean', 'p50', 'p95', 'p99', 'max'}
+               for result in report['results'])
+    assert Student.objects.count() == 100
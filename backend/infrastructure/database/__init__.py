@@ -0,0 +1 @@
+# Infrastructure Database Module
@@ -0,0 +1,106 @@
+"""
+독립적인 ORM 조회의 동시 실행 (비동기 뷰용)
+
+Django 5.0의 비동기 ORM(aget, acount, async for 등)은 요청마다 하나의 스레드에서
+sync_to_async(thread_sensitive=True)로 실행되므로, 한 요청 안에서 await를 나란히 걸어도
+쿼리는 차례대로 실행됩니다.
+
+gather_queries는 서로 독립적인 조회 함수들을 스레드 풀(thread_sensitive=False)에서 동시에 실행합니다.
+- 스레드마다 자기 DB 연결을 쓰며, 조회가 끝나면 연결을 풀에 반납합니다.
+- 풀 백엔드(infrastructure.database.postgresql_pool)를 쓰지 않으면 조회마다 새 연결을 열고 닫게 되므로
+  (대시보드 한 번에 연결 15개) 동시에 실행하지 않고 차례대로 실행합니다.
+- 동시에 실행하는 조회 수는 ASYNC_DB_CONCURRENCY와 풀 크기(POOL['max_size']) - 1 중 작은 값으로 제한합니다.
+  요청 스레드가 이미 연결을 하나 쥐고 있을 수 있기 때문입니다 (복제본 고정 확인 등).
+- 같은 워커의 다른 요청들도 연결을 쥐고 있으면 풀이 모두 사용 중일 수 있으므로, 스레드 풀의 조회는
+  연결을 기다리지 않고(without_waiting), 연결을 얻지 못한 조회는 요청 스레드에서 차례대로 다시 실행합니다.
+  (조회 스레드가 요청 스레드들의 반납을 기다리다 PoolTimeout으로 실패하지 않도록)
+- 호출한 쪽이 트랜잭션 안(atomic 블록, 테스트 포함)이면 다른 연결에서는 커밋되지 않은 데이터가
+  보이지 않으므로, 요청 스레드에서 차례대로 실행합니다.
+
+스레드 풀에서 실행된 쿼리도 ContextVar를 통해 RequestTimingMiddleware의 요청별 쿼리 집계에 포함됩니다.
+
+사용법:
+    results = await gather_queries({
+        'summary': partial(repo.get_summary, year),
+        'trend': partial(repo.get_trend_by_year, year - 2, year),
+    })
+    results['summary']
+"""
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from infrastructure.database.pool import DEFAULT_MAX_SIZE, PoolTimeout, without_waiting
+
+
+POOL_ENGINE = 'infrastructure.database.postgresql_pool'
+
+# 풀에서 연결을 얻지 못해 요청 스레드에서 다시 실행할 조회 표시
+_BUSY = object()
+
+
+def _pooled() -> bool:
+    """모든 DB가 풀 백엔드를 쓰는지 (복제본 조회도 스레드 풀에서 실행되므로 전체 확인)"""
+    return all(database['ENGINE'] == POOL_ENGINE for database in connections.settings.values())
+
+
+def _pool_size() -> int:
+    """가장 작은 풀의 최대 연결 수"""
+    return min(
+        database.get('POOL', {}).get('max_size', DEFAULT_MAX_SIZE) for database in connections.settings.values()
+    )
+
+
+def _in_transaction() -> bool:
+    return any(connection.in_atomic_block for connection in connections.all(initialized_only=True))
+
+
+def _run_all(queries: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    return {name: query() for name, query in queries.items()}
+
+
+def _run_and_close(query: Callable[[], Any]) -> Any:
+    """스레드 풀에서 조회를 실행하고, 그 스레드가 연 DB 연결을 닫음 (풀이 모두 사용 중이면 _BUSY)"""
+    try:
+        with without_waiting():
+            return query()
+    except PoolTimeout:
+        return _BUSY
+    finally:
+        connections.close_all()
+
+
+async def gather_queries(
+    queries: Dict[str, Callable[[], Any]],
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    독립적인 조회 함수들을 동시에 실행
+
+    Args:
+        queries: 이름 → 인자 없는 조회 함수 (ORM을 쓰는 동기 함수)
+        limit: 동시에 실행할 최대 조회 수 (기본값: ASYNC_DB_CONCURRENCY, 풀 크기 - 1을 넘지 않음)
+
+    Returns:
+        Dict: 이름 → 결과 (queries와 같은 순서)
+    """
+    if len(queries) <= 1 or not _pooled():
+        return await sync_to_async(_run_all)(queries)
+    limit = min(limit or getattr(settings, 'ASYNC_DB_CONCURRENCY', 3), _pool_size() - 1)
+    if limit <= 1 or await sync_to_async(_in_transaction)():
+        return await sync_to_async(_run_all)(queries)
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(query: Callable[[], Any]) -> Any:
+        async with semaphore:
+            return await sync_to_async(_run_and_close, thread_sensitive=False)(query)
+
+    results = dict(zip(queries, await asyncio.gather(*(run(query) for query in queries.values()))))
+    busy = {name: queries[name] for name, result in results.items() if result is _BUSY}
+    if busy:
+        results.update(await sync_to_async(_run_all)(busy))
+    return results
@@ -0,0 +1,301 @@
+"""
+DB 커넥션 풀
+
+프로세스 안의 스레드들이 공유하는 클라이언트 측 커넥션 풀입니다.
+Django 백엔드(infrastructure.database.postgresql_pool)가 연결을 열고 닫는 대신 이 풀에서 빌리고 돌려줍니다.
+
+- min_size: 유휴 상태로도 유지하는 최소 연결 수 (풀 생성 시 백그라운드에서 미리 연결)
+- max_size: 최대 연결 수. 모두 사용 중이면 timeout초까지 반납을 기다린 뒤 PoolTimeout
+- 상태 확인: check_interval초 이상 놀던 연결은 빌려주기 전에 check(예: SELECT 1)로 확인하고,
+  실패하면 버리고 다른 연결을 사용
+- max_idle초 넘게 놀던 연결(min_size 초과분)과 max_lifetime초가 지난 연결은 닫음
+- 반납 시 reset(열린 트랜잭션 롤백 등)에 실패한 연결은 풀에 넣지 않음
+- without_waiting() 블록 안에서는 모두 사용 중이면 기다리지 않고 바로 PoolTimeout
+  (연결을 쥔 요청 스레드를 대신해 조회하는 스레드가 그 요청의 반납을 기다리지 않도록)
+
+사용 현황은 db_pool_* 메트릭(/api/metrics/)으로 내보냅니다.
+"""
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+from django.db import OperationalError
+
+from infrastructure.metrics.metrics import DB_POOL_ACQUIRE_SECONDS, DB_POOL_CONNECTIONS, DB_POOL_EVENTS
+
+
+class PoolTimeout(OperationalError):
+    """timeout 안에 연결을 얻지 못함"""
+
+
+DEFAULT_MAX_SIZE = 4
+
+_no_wait: ContextVar[bool] = ContextVar('db_pool_no_wait', default=False)
+
+
+@contextmanager
+def without_waiting() -> Iterator[None]:
+    """이 블록 안에서 빌리는 연결은 풀이 모두 사용 중이면 기다리지 않고 바로 PoolTimeout"""
+    token = _no_wait.set(True)
+    try:
+        yield
+    finally:
+        _no_wait.reset(token)
+
+
+class ConnectionPool:
+    """
+    스레드 안전 커넥션 풀
+
+    Args:
+        connect: 새 연결을 만드는 함수
+        alias: 메트릭 레이블 (DB alias)
+        min_size: 최소 유지 연결 수
+        max_size: 최대 연결 수
+        timeout: 연결을 얻기까지 기다리는 최대 시간(초)
+        max_idle: min_size를 넘는 유휴 연결을 닫기까지의 시간(초)
+        max_lifetime: 연결 최대 수명(초)
+        check_interval: 이 시간(초) 이상 놀던 연결은 빌려주기 전에 상태 확인
+        check: 상태 확인 함수 (예외를 던지면 실패)
+        reset: 반납 시 상태 초기화 함수 (예외를 던지면 연결을 버림)
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        alias: str = 'default',
+        min_size: int = 1,
+        max_size: int = DEFAULT_MAX_SIZE,
+        timeout: float = 10.0,
+        max_idle: float = 300.0,
+        max_lifetime: float = 1800.0,
+        check_interval: float = 5.0,
+        check: Optional[Callable[[Any], None]] = None,
+        reset: Optional[Callable[[Any], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError(f"풀 크기가 올바르지 않습니다: min_size={min_size}, max_size={max_size}")
+
+        self.connect = connect
+        self.alias = alias
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.check_interval = check_interval
+        self.check = check
+        self.reset = reset
+        self.clock = clock
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (연결, 유휴 시작 시각) - 오른쪽이 최근 반납
+        self._created: Dict[int, float] = {}
+        self._size = 0
+        self._waiting = 0
+        self._closed = False
+
+    def acquire(self):
+        """
+        연결 빌리기
+
+        Raises:
+            PoolTimeout: timeout 안에 반납되는 연결이 없는 경우 (without_waiting 안에서는 바로)
+        """
+        started = self.clock()
+        deadline = started + (0.0 if _no_wait.get() else self.timeout)
+        while True:
+            connection, idle_since = self._take(deadline)
+            if connection is None:
+                connection = self._create()
+                break
+            if self._usable(connection, idle_since):
+                break
+            self._discard(connection)
+
+        DB_POOL_ACQUIRE_SECONDS.observe(self.clock() - started, alias=self.alias)
+        self._publish()
+        return connection
+
+    def release(self, connection) -> None:
+        """연결 반납 (초기화에 실패했거나 수명이 지난 연결은 닫음)"""
+        keep = not self._expired(connection)
+        if keep and self.reset is not None:
+            try:
+                self.reset(connection)
+            except Exception:
+                keep = False
+
+        with self._cond:
+            if keep and not self._closed:
+                self._idle.append((connection, self.clock()))
+                stale = self._prune_idle()
+            else:
+                stale = [connection]
+                self._forget(connection)
+            self._cond.notify()
+
+        for stale_connection in stale:
+            self._close(stale_connection)
+        self._publish()
+
+    def fill(self) -> None:
+        """min_size까지 미리 연결"""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            connection = self._create()
+            self.release(connection)
+
+    def close(self) -> None:
+        """유휴 연결을 모두 닫고 더 이상 빌려주지 않음 (사용 중인 연결은 반납 시 닫힘)"""
+        with self._cond:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            for connection in idle:
+                self._forget(connection)
+            self._cond.notify_all()
+
+        for connection in idle:
+            self._close(connection)
+        self._publish()
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                'size': self._size,
+                'idle': idle,
+                'in_use': self._size - idle,
+                'waiting': self._waiting,
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+            }
+
+    def _take(self, deadline: float) -> Tuple[Any, Optional[float]]:
+        """유휴 연결 (없으면 새로 만들 자리를 예약하고 (None, None))"""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise OperationalError(f"{self.alias} 커넥션 풀이 닫혔습니다")
+                if self._idle:
+                    return self._idle.pop()
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None, None
+
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    DB_POOL_EVENTS.inc(alias=self.alias, event='busy' if _no_wait.get() else 'timeout')
+                    raise PoolTimeout(
+                        f"{self.alias} 커넥션 풀에서 {self.timeout}초 안에 연결을 얻지 못했습니다 "
+                        f"(max_size={self.max_size})"
+                    )
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+    def _create(self):
+        """예약된 자리에 새 연결 생성 (실패 시 자리 반환)"""
+        try:
+            connection = self.connect()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._created[id(connection)] = self.clock()
+        DB_POOL_EVENTS.inc(alias=self.alias, event='created')
+        return connection
+
+    def _usable(self, connection, idle_since: float) -> bool:
+        if self._expired(connection):
+            return False
+        if self.check is None or self.clock() - idle_since < self.check_interval:
+            return True
+        try:
+            self.check(connection)
+        except Exception:
+            DB_POOL_EVENTS.inc(alias=self.alias, event='health_check_failed')
+            return False
+        return True
+
+    def _expired(self, connection) -> bool:
+        created = self._created.get(id(connection))
+        return created is None or self.clock() - created >= self.max_lifetime
+
+    def _discard(self, connection) -> None:
+        with self._cond:
+            self._forget(connection)
+            self._cond.notify()
+        self._close(connection)
+
+    def _prune_idle(self) -> list:
+        """min_size를 넘는 오래 놀던 연결 (락 안에서 호출)"""
+        stale = []
+        now = self.clock()
+        while len(self._idle) > self.min_size and now - self._idle[0][1] >= self.max_idle:
+            connection, _ = self._idle.popleft()
+            self._forget(connection)
+            stale.append(connection)
+        return stale
+
+    def _forget(self, connection) -> None:
+        """풀에서 제거 (락 안에서 호출)"""
+        self._size -= 1
+        self._created.pop(id(connection), None)
+
+    def _close(self, connection) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+        DB_POOL_EVENTS.inc(alias=self.alias, event='closed')
+
+    def _publish(self) -> None:
+        stats = self.stats()
+        DB_POOL_CONNECTIONS.set(stats['idle'], alias=self.alias, state='idle')
+        DB_POOL_CONNECTIONS.set(stats['in_use'], alias=self.alias, state='in_use')
+
+
+_pools: Dict[Hashable, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key: Hashable, factory: Callable[[], ConnectionPool]) -> ConnectionPool:
+    """
+    프로세스별 풀 (없으면 factory로 만들고 min_size까지 백그라운드에서 미리 연결)
+
+    fork된 워커가 부모의 연결을 공유하지 않도록 키에 pid를 포함합니다.
+    """
+    key = (os.getpid(), key)
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = factory()
+            threading.Thread(target=_fill, args=(pool,), name='db-pool-fill', daemon=True).start()
+    return pool
+
+
+def _fill(pool: ConnectionPool) -> None:
+    try:
+        pool.fill()
+    except Exception:
+        # 미리 연결하지 못해도 첫 요청에서 다시 연결을 시도함
+        pass
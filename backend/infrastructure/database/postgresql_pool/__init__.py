@@ -0,0 +1,12 @@
+"""
+커넥션 풀을 사용하는 PostgreSQL 백엔드
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'infrastructure.database.postgresql_pool',
+        ...
+        'CONN_MAX_AGE': 0,  # 요청이 끝나면 연결을 풀에 반납
+        'POOL': {'min_size': 1, 'max_size': 4, 'timeout': 10},
+    }
+}
+"""
@@ -0,0 +1,75 @@
+"""
+커넥션 풀 PostgreSQL 백엔드
+
+Django의 postgresql 백엔드와 같지만, 연결을 새로 열고 닫는 대신 프로세스별 ConnectionPool에서
+빌리고 돌려줍니다. CONN_MAX_AGE=0과 함께 사용하면 요청이 끝날 때마다 연결이 풀로 반납되어,
+스레드 수와 관계없이 max_size개의 연결을 요청들이 나눠 씁니다.
+
+풀 설정은 DATABASES[alias]['POOL']에 둡니다 (ConnectionPool 인자: min_size, max_size, timeout,
+max_idle, max_lifetime, check_interval).
+"""
+from django.db.backends.postgresql import base as postgresql
+
+from infrastructure.database.pool import ConnectionPool, get_pool
+
+
+def check_connection(connection) -> None:
+    """상태 확인 (서버가 끊었으면 예외)"""
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    # autocommit이 꺼진 연결이면 SELECT가 트랜잭션을 열어 두므로 닫음
+    # (열린 트랜잭션 안에서는 Django가 연결 시 autocommit을 설정할 수 없음)
+    if connection.info.transaction_status != 0:
+        connection.rollback()
+
+
+def reset_connection(connection) -> None:
+    """반납 전 초기화: 닫힌 연결은 거부하고, 열린 트랜잭션은 롤백한 뒤 autocommit으로 되돌림"""
+    if connection.closed:
+        raise ValueError('닫힌 연결입니다')
+    # psycopg2 / psycopg 3 모두 0이 IDLE (트랜잭션 밖)
+    if connection.info.transaction_status != 0:
+        connection.rollback()
+    if not connection.autocommit:
+        connection.autocommit = True
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+    """풀에서 연결을 빌려 쓰는 PostgreSQL DatabaseWrapper"""
+
+    def get_new_connection(self, conn_params):
+        pool = get_pool(
+            (self.alias, tuple(sorted((key, str(value)) for key, value in conn_params.items()))),
+            lambda: self._create_pool(conn_params)
+        )
+        self.isolation_level = self._configured_isolation_level()
+        connection = pool.acquire()
+        self._pool = pool
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self._pool.release(self.connection)
+
+    def _create_pool(self, conn_params) -> ConnectionPool:
+        return ConnectionPool(
+            connect=lambda: self._connect(conn_params),
+            alias=self.alias,
+            check=check_connection,
+            reset=reset_connection,
+            **self.settings_dict.get('POOL', {})
+        )
+
+    def _connect(self, conn_params):
+        """풀에 넣을 새 연결 (fill()로 미리 만든 연결도 autocommit으로 두어 상태 확인이 트랜잭션을 열지 않게 함)"""
+        connection = postgresql.DatabaseWrapper.get_new_connection(self, conn_params)
+        connection.autocommit = True
+        return connection
+
+    def _configured_isolation_level(self):
+        """부모 get_new_connection과 같은 격리 수준 (풀에서 재사용한 연결에도 적용)"""
+        value = self.settings_dict['OPTIONS'].get('isolation_level')
+        if value is None:
+            return postgresql.IsolationLevel.READ_COMMITTED
+        return postgresql.IsolationLevel(value)
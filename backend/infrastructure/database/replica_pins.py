@@ -0,0 +1,56 @@
+"""
+복제본 고정(read-your-writes) 기록
+
+쓰기(업로드 등)를 한 사용자를 REPLICA_STICKY_SECONDS 동안 기본 DB로 고정합니다.
+고정 여부는 모든 gunicorn 워커와 업로드 워커(run_upload_worker)가 함께 보는 캐시
+(CACHES[REPLICA_PIN_CACHE], 기본값: 기본 DB의 캐시 테이블)에 사용자별로 기록합니다.
+
+사용자는 Supabase JWT의 sub(사용자 ID)와 email로 식별합니다.
+업로드 작업에는 email만 기록되므로 작업 완료 시에는 email로 고정합니다.
+"""
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError
+
+from infrastructure.logging.logger import StructuredLogger
+
+KEY_PREFIX = 'replica-pin'
+
+
+def _cache():
+    return caches[getattr(settings, 'REPLICA_PIN_CACHE', 'replica_pins')]
+
+
+def pin_keys(user_id: Optional[str] = None, email: Optional[str] = None) -> List[str]:
+    """사용자를 식별하는 캐시 키 목록 (값이 없는 식별자는 제외)"""
+    keys = []
+    if user_id:
+        keys.append(f'{KEY_PREFIX}:sub:{user_id}')
+    if email and email != 'anonymous':
+        keys.append(f'{KEY_PREFIX}:email:{email.lower()}')
+    return keys
+
+
+def pin(keys: List[str]) -> None:
+    """REPLICA_STICKY_SECONDS 동안 읽기를 기본 DB로 고정"""
+    if keys:
+        seconds = getattr(settings, 'REPLICA_STICKY_SECONDS', 30)
+        _cache().set_many(dict.fromkeys(keys, 1), timeout=seconds)
+
+
+def is_pinned(keys: List[str]) -> bool:
+    """키 중 하나라도 고정 기간 안이면 True"""
+    return bool(keys) and bool(_cache().get_many(keys))
+
+
+def pin_user(user_id: Optional[str] = None, email: Optional[str] = None) -> None:
+    """복제본 사용 시 사용자를 기본 DB로 고정 (복제본이 없으면 아무것도 하지 않음)"""
+    if not getattr(settings, 'DATABASE_REPLICAS', []):
+        return
+    try:
+        pin(pin_keys(user_id, email))
+    except DatabaseError as e:
+        # 고정 기록 실패로 작업 결과 기록이 실패하지 않도록 경고만 남김 (캐시 테이블 누락 등)
+        StructuredLogger.warning(__name__, '복제본 고정 기록 실패: %s', e)
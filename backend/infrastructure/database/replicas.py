@@ -0,0 +1,116 @@
+"""
+읽기 전용 복제본 선택
+
+DATABASE_REPLICAS의 alias 중 정상인 복제본을 라운드 로빈으로 고릅니다.
+
+상태 확인은 alias별로 check_interval초마다 한 번 실행하며, 결과는 그동안 재사용합니다.
+- 연결 후 SELECT 1 (PostgreSQL 복제본이면 재생 지연 초)
+- 연결/쿼리가 실패하거나 지연이 max_lag초를 넘으면 비정상 → 다음 확인까지 제외
+정상인 복제본이 없으면 None을 돌려주며, 라우터는 기본 DB에서 읽습니다.
+"""
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from django.db import DatabaseError, connections
+
+from infrastructure.logging.logger import StructuredLogger
+
+# 복제본의 재생 지연 (초). 받은 WAL을 모두 재생했으면 0 (쓰기가 없어 마지막 재생 시각이 오래된 경우 포함)
+REPLICATION_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+def check_replica(alias: str) -> float:
+    """
+    복제본 상태 확인
+
+    Returns:
+        float: 재생 지연(초, PostgreSQL 외에는 0)
+
+    Raises:
+        DatabaseError: 연결 또는 쿼리 실패
+    """
+    connection = connections[alias]
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(REPLICATION_LAG_SQL)
+                return float(cursor.fetchone()[0])
+            cursor.execute('SELECT 1')
+            return 0.0
+    except DatabaseError:
+        # 끊어진 연결을 다음 확인 때 새로 열도록 닫음
+        try:
+            connection.close()
+        except DatabaseError:
+            pass
+        raise
+
+
+class ReplicaSelector:
+    """
+    정상 복제본 라운드 로빈 선택 (스레드 안전)
+
+    Args:
+        aliases: 복제본 DB alias 목록
+        check_interval: 상태 확인 간격(초)
+        max_lag: 허용하는 최대 재생 지연(초)
+        check: 상태 확인 함수 (alias → 지연 초, 실패 시 예외)
+    """
+
+    def __init__(
+        self,
+        aliases: Sequence[str],
+        check_interval: float = 5.0,
+        max_lag: float = 10.0,
+        check: Callable[[str], float] = check_replica,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.aliases = list(aliases)
+        self.check_interval = check_interval
+        self.max_lag = max_lag
+        self.check = check
+        self.clock = clock
+        self._counter = itertools.count()
+        self._status: Dict[str, Tuple[bool, float]] = {}
+        self._lock = threading.Lock()
+
+    def choose(self) -> Optional[str]:
+        """정상 복제본 하나 (없으면 None)"""
+        healthy = [alias for alias in self.aliases if self.is_healthy(alias)]
+        if not healthy:
+            return None
+        with self._lock:
+            index = next(self._counter)
+        return healthy[index % len(healthy)]
+
+    def is_healthy(self, alias: str) -> bool:
+        with self._lock:
+            status = self._status.get(alias)
+        if status is not None and self.clock() - status[1] < self.check_interval:
+            return status[0]
+
+        healthy = self._probe(alias)
+        with self._lock:
+            previous = self._status.get(alias)
+            self._status[alias] = (healthy, self.clock())
+        if previous is not None and previous[0] != healthy:
+            StructuredLogger.warning(
+                __name__, '복제본 %s 상태 변경: %s', alias, '정상' if healthy else '비정상',
+                alias=alias, healthy=healthy
+            )
+        return healthy
+
+    def _probe(self, alias: str) -> bool:
+        try:
+            lag = self.check(alias)
+        except DatabaseError as e:
+            StructuredLogger.warning(__name__, '복제본 %s 상태 확인 실패: %s', alias, e, alias=alias)
+            return False
+        return lag <= self.max_lag
@@ -0,0 +1,159 @@
+"""
+읽기 복제본 DB 라우터
+
+read_replica로 표시한 조회 경로(대시보드 서비스, 데이터 조회/내보내기 저장소)의 읽기만
+DATABASE_REPLICAS의 정상 복제본으로 보내고, 그 외 모든 읽기/쓰기는 기본 DB를 사용합니다.
+
+Read-your-writes:
+- 요청 중 쓰기가 일어나면 그 요청의 이후 읽기는 기본 DB에서 합니다.
+- ReplicaPinningMiddleware가 쓰기가 있었던 요청의 사용자(Supabase JWT의 sub/email)를 고정 캐시에 기록하여,
+  REPLICA_STICKY_SECONDS 동안 같은 사용자의 읽기를 기본 DB로 보냅니다
+  (업로드 직후 대시보드/데이터 조회가 복제 지연으로 예전 데이터를 보지 않도록).
+  백그라운드 업로드 작업은 작업이 끝날 때 업로드한 사용자를 고정합니다 (infrastructure.database.replica_pins).
+
+사용법:
+    @read_replica
+    def get_dashboard_data(self, ...):
+        ...
+
+코루틴 함수와 비동기 제너레이터에도 쓸 수 있습니다 (ASGI 비동기 뷰).
+sync_to_async가 컨텍스트를 복사하므로 스레드에서 실행되는 ORM 호출도 같은 표시를 봅니다.
+"""
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import AsyncIterator, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+
+from .replicas import ReplicaSelector
+
+DEFAULT_DB_ALIAS = 'default'
+
+# 복제본 읽기가 허용된 구간인지
+_replica_reads: ContextVar[bool] = ContextVar('replica_reads', default=False)
+# 현재 요청의 라우팅 상태 (요청 밖에서는 None)
+_request_state: ContextVar[Optional['RoutingState']] = ContextVar('routing_state', default=None)
+
+
+class RoutingState:
+    """요청별 라우팅 상태"""
+
+    def __init__(self, pinned: bool = False):
+        self.pinned = pinned  # True면 모든 읽기를 기본 DB에서
+        self.wrote = False    # 이 요청에서 쓰기가 있었는지
+
+
+@contextmanager
+def read_replica_block() -> Iterator[None]:
+    """블록 안의 읽기를 복제본으로 보낼 수 있도록 표시"""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def read_replica(func):
+    """함수 안의 읽기를 복제본으로 보낼 수 있도록 표시하는 데코레이터"""
+    if inspect.isasyncgenfunction(func):
+        @wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            # 스트리밍 응답은 뷰와 미들웨어가 끝난 뒤 소비되므로 호출 시점의 요청 상태(고정 여부)를 붙잡아 둠
+            return _replica_steps(func(*args, **kwargs), _request_state.get())
+
+        return generator_wrapper
+
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with read_replica_block():
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with read_replica_block():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+async def _replica_steps(generator: AsyncIterator, state: Optional[RoutingState]) -> AsyncIterator:
+    """
+    비동기 제너레이터의 각 단계를 read_replica 구간에서 실행
+
+    ContextVar는 yield를 넘어 유지하지 않고 단계마다 설정/복원합니다
+    (소비하는 쪽의 컨텍스트가 단계마다 같다는 보장이 없으므로).
+    """
+    try:
+        while True:
+            with read_replica_block(), _bind_state(state):
+                try:
+                    item = await generator.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        await generator.aclose()
+
+
+@contextmanager
+def _bind_state(state: Optional[RoutingState]) -> Iterator[Optional[RoutingState]]:
+    token = _request_state.set(state)
+    try:
+        yield state
+    finally:
+        _request_state.reset(token)
+
+
+@contextmanager
+def request_scope(pinned: bool = False) -> Iterator[RoutingState]:
+    """요청 하나의 라우팅 상태 (ReplicaPinningMiddleware에서 사용)"""
+    with _bind_state(RoutingState(pinned)) as state:
+        yield state
+
+
+class ReplicaRouter:
+    """
+    DATABASE_ROUTERS에 등록하는 라우터
+
+    복제본이 설정되지 않았으면 항상 None(기본 DB)을 돌려주므로 등록해 두어도 영향이 없습니다.
+    """
+
+    def __init__(self, selector: Optional[ReplicaSelector] = None):
+        self.replicas = list(getattr(settings, 'DATABASE_REPLICAS', []))
+        self.selector = selector or ReplicaSelector(
+            self.replicas,
+            check_interval=getattr(settings, 'REPLICA_HEALTH_CHECK_INTERVAL', 5.0),
+            max_lag=getattr(settings, 'REPLICA_MAX_LAG_SECONDS', 10.0),
+        )
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        if not self.selector.aliases or not _replica_reads.get():
+            return None
+        state = _request_state.get()
+        if state is not None and state.pinned:
+            return None
+        return self.selector.choose()
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        state = _request_state.get()
+        if state is not None:
+            state.wrote = True
+            state.pinned = True
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # 복제본은 기본 DB와 같은 데이터이므로 서로 다른 alias에서 읽은 객체끼리도 관계 허용
+        databases = {DEFAULT_DB_ALIAS, *self.selector.aliases}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        # 로컬에서 복제본 역할을 하는 두 번째 DB는 migrate --database <alias>로 스키마를 만들 수 있도록 관여하지 않음
+        return None
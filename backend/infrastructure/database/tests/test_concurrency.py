@@ -0,0 +1,119 @@
+"""
+독립 조회 동시 실행(gather_queries) 테스트
+"""
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from infrastructure.database import concurrency
+from infrastructure.database.concurrency import gather_queries
+from infrastructure.database.pool import ConnectionPool, PoolTimeout
+
+
+def record_calls(calls):
+    def query(name):
+        def run():
+            calls.append((name, threading.get_ident()))
+            return name
+        return run
+    return query
+
+
+def test_runs_queries_concurrently_in_order(monkeypatch):
+    """풀 백엔드에서는 조회들을 서로 다른 스레드에서 동시에 실행하고 결과는 queries 순서대로 돌려준다"""
+    # Arrange
+    monkeypatch.setattr(concurrency, '_pooled', lambda: True)
+    barrier = threading.Barrier(3, timeout=5)  # 셋이 동시에 실행 중이어야 통과
+
+    def query(value):
+        def run():
+            barrier.wait()
+            return value, threading.get_ident()
+        return run
+
+    # Act
+    results = async_to_sync(gather_queries)({name: query(name) for name in ('c', 'a', 'b')}, limit=3)
+
+    # Assert
+    assert list(results) == ['c', 'a', 'b']
+    assert [value for value, _ in results.values()] == ['c', 'a', 'b']
+    assert len({thread for _, thread in results.values()}) == 3
+
+
+def test_limit_is_capped_below_pool_size(monkeypatch):
+    """동시 실행 수는 풀 크기 - 1을 넘지 않는다 (풀 크기 2면 한 스레드에서 차례대로 실행)"""
+    # Arrange
+    monkeypatch.setattr(concurrency, '_pooled', lambda: True)
+    monkeypatch.setattr(concurrency, '_pool_size', lambda: 2)
+    calls = []
+    query = record_calls(calls)
+
+    # Act
+    results = async_to_sync(gather_queries)({'a': query('a'), 'b': query('b')}, limit=4)
+
+    # Assert
+    assert results == {'a': 'a', 'b': 'b'}
+    assert len({thread for _, thread in calls}) == 1
+
+
+def test_busy_pool_falls_back_to_request_thread(monkeypatch):
+    """요청 스레드들이 연결을 쥐고 있어 풀이 모두 사용 중이면, 조회 스레드는 기다리지 않고 요청 스레드에서 다시 실행한다"""
+    # Arrange
+    monkeypatch.setattr(concurrency, '_pooled', lambda: True)
+    pool = ConnectionPool(lambda: object(), alias='test', min_size=0, max_size=3, timeout=5)
+    held = [pool.acquire(), pool.acquire()]  # 이 요청과 다른 요청이 쥔 연결
+    busy = threading.Event()
+
+    def query(name):
+        def run():
+            try:
+                connection = pool.acquire()
+            except PoolTimeout:
+                busy.set()
+                raise
+            try:
+                busy.wait(5)  # 다른 조회가 연결을 얻지 못할 때까지 쥐고 있음
+                return name, threading.get_ident()
+            finally:
+                pool.release(connection)
+        return run
+
+    # Act
+    results = async_to_sync(gather_queries)({'a': query('a'), 'b': query('b')}, limit=2)
+
+    # Assert
+    assert list(results) == ['a', 'b']
+    assert [name for name, _ in results.values()] == ['a', 'b']
+    assert threading.get_ident() in {thread for _, thread in results.values()}
+    assert pool.stats()['in_use'] == len(held)
+
+
+def test_runs_sequentially_without_pool():
+    """풀 백엔드가 아니면 조회마다 연결을 열지 않도록 한 스레드에서 차례대로 실행한다"""
+    # Arrange
+    calls = []
+    query = record_calls(calls)
+
+    # Act
+    results = async_to_sync(gather_queries)({'a': query('a'), 'b': query('b')}, limit=2)
+
+    # Assert
+    assert results == {'a': 'a', 'b': 'b'}
+    assert len({thread for _, thread in calls}) == 1
+
+
+@pytest.mark.django_db
+def test_runs_sequentially_on_request_thread_inside_transaction(monkeypatch):
+    """트랜잭션 안에서는 커밋되지 않은 데이터가 보이도록 호출한 스레드에서 차례대로 실행한다"""
+    # Arrange
+    monkeypatch.setattr(concurrency, '_pooled', lambda: True)
+    calls = []
+    query = record_calls(calls)
+
+    # Act
+    results = async_to_sync(gather_queries)({'a': query('a'), 'b': query('b')})
+
+    # Assert
+    assert results == {'a': 'a', 'b': 'b'}
+    assert calls == [('a', threading.get_ident()), ('b', threading.get_ident())]
@@ -0,0 +1,248 @@
+"""
+읽기 복제본 라우터 테스트
+"""
+import time
+
+import jwt
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.db import OperationalError
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from apps.dashboard.persistence.models import Student
+from infrastructure.database.replica_pins import pin_user
+from infrastructure.database.replicas import ReplicaSelector
+from infrastructure.database.router import ReplicaRouter, read_replica, read_replica_block, request_scope
+from infrastructure.middleware.replica_middleware import ReplicaPinningMiddleware
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_router(aliases=('replica_1', 'replica_2'), down=(), clock=None):
+    checked = []
+
+    def check(alias):
+        checked.append(alias)
+        if alias in down:
+            raise OperationalError('could not connect to server')
+        return 0.0
+
+    selector = ReplicaSelector(aliases, check_interval=5, check=check, clock=clock or FakeClock())
+    return ReplicaRouter(selector), checked
+
+
+class TestReplicaRouter:
+    """ReplicaRouter 테스트"""
+
+    def test_round_robins_reads_inside_replica_block(self):
+        """read_replica 구간의 읽기만 복제본으로 번갈아 보낸다"""
+        # Arrange
+        router, _ = make_router()
+
+        # Act
+        outside = router.db_for_read(Student)
+        with read_replica_block():
+            inside = [router.db_for_read(Student) for _ in range(3)]
+
+        # Assert
+        assert outside is None
+        assert inside == ['replica_1', 'replica_2', 'replica_1']
+
+    def test_skips_unhealthy_replica_until_next_check(self):
+        """상태 확인에 실패한 복제본은 check_interval 동안 제외하고, 모두 실패하면 기본 DB를 쓴다"""
+        # Arrange
+        clock = FakeClock()
+        down = {'replica_2'}
+        router, checked = make_router(down=down, clock=clock)
+
+        # Act
+        with read_replica_block():
+            chosen = {router.db_for_read(Student) for _ in range(4)}
+            checks_within_interval = len(checked)
+            down.add('replica_1')
+            clock.now = 10
+            fallback = router.db_for_read(Student)
+
+        # Assert
+        assert chosen == {'replica_1'}
+        assert checks_within_interval == 2
+        assert fallback is None
+
+    def test_write_pins_following_reads_to_default(self):
+        """요청 중 쓰기가 일어나면 이후 읽기는 기본 DB에서 한다"""
+        # Arrange
+        router, _ = make_router()
+
+        # Act
+        with request_scope() as state, read_replica_block():
+            before = router.db_for_read(Student)
+            router.db_for_write(Student)
+            after = router.db_for_read(Student)
+
+        # Assert
+        assert before == 'replica_1'
+        assert after is None
+        assert state.wrote
+
+    def test_async_generator_keeps_request_state_while_streaming(self):
+        """read_replica 비동기 제너레이터는 요청이 끝난 뒤 소비되어도 호출 시점의 고정 상태로 라우팅한다"""
+        # Arrange
+        router, _ = make_router()
+
+        @read_replica
+        async def stream():
+            for _ in range(2):
+                yield router.db_for_read(Student)
+
+        async def consume(generator):
+            return [alias async for alias in generator]
+
+        with request_scope(pinned=True):
+            pinned_stream = stream()
+        with request_scope():
+            replica_stream = stream()
+
+        # Act
+        pinned = async_to_sync(consume)(pinned_stream)
+        replica = async_to_sync(consume)(replica_stream)
+
+        # Assert
+        assert pinned == [None, None]
+        assert replica == ['replica_1', 'replica_2']
+        assert router.db_for_read(Student) is None
+
+
+@pytest.fixture
+def replica_settings(settings):
+    settings.DATABASE_REPLICAS = ['replica_1']
+    settings.REPLICA_STICKY_SECONDS = 30
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'replica_pins': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pins'},
+    }
+    caches['replica_pins'].clear()
+    return settings
+
+
+def auth_header(sub, email=None):
+    token = jwt.encode({
+        'sub': sub,
+        'email': email,
+        'aud': 'authenticated',
+        'exp': int(time.time()) + 3600,
+    }, 'test-secret-key', algorithm='HS256')
+    return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+
+@pytest.mark.usefixtures('replica_settings')
+class TestReplicaPinningMiddleware:
+    """ReplicaPinningMiddleware 테스트"""
+
+    def read_alias(self, router, **headers):
+        chosen = []
+
+        def dashboard_view(request):
+            with read_replica_block():
+                chosen.append(router.db_for_read(Student))
+            return HttpResponse()
+
+        ReplicaPinningMiddleware(dashboard_view)(RequestFactory().get('/api/dashboard/', **headers))
+        return chosen[0]
+
+    def test_write_pins_same_user_without_cookies(self):
+        """쓰기가 있었던 사용자의 이후 요청은 쿠키 없이도 기본 DB에서 읽고, 다른 사용자는 복제본을 쓴다"""
+        # Arrange
+        router, _ = make_router()
+
+        def upload_view(request):
+            router.db_for_write(Student)
+            return HttpResponse(status=201)
+
+        # Act
+        response = ReplicaPinningMiddleware(upload_view)(
+            RequestFactory().post('/api/uploads/', **auth_header('user-a'))
+        )
+        writer = self.read_alias(router, **auth_header('user-a'))
+        other = self.read_alias(router, **auth_header('user-b'))
+
+        # Assert
+        assert not response.cookies
+        assert writer is None
+        assert other == 'replica_1'
+
+    def test_async_write_pins_same_user(self):
+        """비동기 요청에서도 쓰기가 있었던 사용자를 고정한다"""
+        # Arrange
+        router, _ = make_router()
+
+        async def upload_view(request):
+            router.db_for_write(Student)
+            return HttpResponse(status=201)
+
+        middleware = ReplicaPinningMiddleware(upload_view)
+
+        # Act
+        async_to_sync(middleware)(RequestFactory().post('/api/uploads/', **auth_header('user-a')))
+        writer = self.read_alias(router, **auth_header('user-a'))
+
+        # Assert
+        assert writer is None
+
+    @pytest.mark.django_db
+    def test_missing_pin_cache_table_does_not_fail_requests(self, settings):
+        """고정 캐시 테이블이 없어도 읽기는 복제본으로, 쓰기 요청은 그대로 응답한다"""
+        # Arrange
+        settings.CACHES = {
+            **settings.CACHES,
+            'replica_pins': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'missing_pins'},
+        }
+        router, _ = make_router()
+
+        def upload_view(request):
+            router.db_for_write(Student)
+            return HttpResponse(status=201)
+
+        # Act
+        response = ReplicaPinningMiddleware(upload_view)(
+            RequestFactory().post('/api/uploads/', **auth_header('user-a'))
+        )
+        reader = self.read_alias(router, **auth_header('user-a'))
+
+        # Assert
+        assert response.status_code == 201
+        assert reader == 'replica_1'
+
+    def test_finished_upload_job_pins_uploader_by_email(self):
+        """백그라운드 업로드 작업이 끝나면 업로드한 사용자(email)를 고정한다"""
+        # Arrange
+        router, _ = make_router()
+
+        # Act
+        before = self.read_alias(router, **auth_header('user-a', 'a@university.ac.kr'))
+        pin_user(email='a@university.ac.kr')
+        after = self.read_alias(router, **auth_header('user-a', 'a@university.ac.kr'))
+
+        # Assert
+        assert before == 'replica_1'
+        assert after is None
+
+
+def test_router_without_replicas_keeps_default():
+    """복제본이 설정되지 않으면 read_replica 구간도 기본 DB를 쓴다"""
+    # Arrange
+    router = ReplicaRouter()
+
+    # Act
+    with read_replica_block():
+        alias = router.db_for_read(Student)
+
+    # Assert
+    assert alias is None
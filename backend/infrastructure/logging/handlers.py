@@ -0,0 +1,82 @@
+"""
+비차단 로그 핸들러
+
+요청 스레드는 로그 레코드를 큐에 넣기만 하고, 실제 출력(stdout/stderr 쓰기)은
+QueueListener의 백그라운드 스레드가 담당합니다.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class _Listener(QueueListener):
+    """큐가 가득 차 있어도 종료 신호를 넣을 수 있도록 대기하는 리스너"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class QueueingStreamHandler(QueueHandler):
+    """
+    큐 기반 스트림 핸들러
+
+    큐가 가득 차면 요청을 막지 않고 레코드를 버리며 dropped에 개수를 셉니다.
+    리스너 스레드는 첫 레코드를 받은 프로세스에서 시작하므로 gunicorn이 설정 로드 후
+    fork하더라도 워커마다 자신의 리스너를 가집니다.
+
+    Args:
+        fmt: 출력 형식 (logging.Formatter)
+        style: 형식 스타일 ('%', '{', '$')
+        stream: 출력 스트림 (기본값: sys.stderr)
+        queue_size: 큐 최대 크기
+    """
+
+    def __init__(self, fmt: str = None, style: str = '%', stream=None, queue_size: int = 10000):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.queue_size = queue_size
+        self.target = logging.StreamHandler(stream)
+        self.target.setFormatter(logging.Formatter(fmt, style=style))
+        self.dropped = 0
+        self._listener = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """큐에 남은 레코드를 모두 출력 (리스너를 멈췄다가 다시 시작)"""
+        with self._lock:
+            if self._listener is not None and self._pid == os.getpid():
+                self._listener.stop()
+                self._listener.start()
+        self.target.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._listener is not None and self._pid == os.getpid():
+                self._listener.stop()
+            self._listener = None
+            self._pid = None
+        self.target.close()
+        super().close()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # fork 이전 프로세스의 리스너 스레드는 이 프로세스에 없으므로 큐와 함께 새로 만든다
+            if self._pid is not None:
+                self.queue = queue.Queue(maxsize=self.queue_size)
+            self._listener = _Listener(self.queue, self.target)
+            self._listener.start()
+            self._pid = os.getpid()
+        atexit.register(self.close)
@@ -2,10 +2,18 @@
 구조화된 로거
 
 일관된 로그 형식으로 API 요청, 오류, 파일 업로드 등을 기록합니다.
+
+요청 경로의 로그는 debug/info/warning을 사용합니다:
+- 레벨이 꺼져 있으면 메시지 포맷과 인자 계산 없이 바로 반환
+- 메시지는 %-스타일 인자로 넘겨 실제로 출력될 때만 포맷 (지연 포맷)
+- DEBUG/INFO는 LOG_SAMPLE_RATE(또는 sample_rate) 비율만 기록
 """
 import logging
+import random
 from typing import Dict, Optional
 
+from django.conf import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +33,57 @@ def get_logger(name: str = None) -> logging.Logger:
 class StructuredLogger:
     """구조화된 로깅을 제공하는 클래스"""
 
+    @staticmethod
+    def debug(name: str, message: str, *args, sample_rate: Optional[float] = None, **fields):
+        """
+        DEBUG 로그 (지연 포맷, 샘플링)
+
+        Args:
+            name: 로거 이름 (보통 __name__)
+            message: %-스타일 메시지
+            *args: 메시지 인자 (출력될 때만 포맷)
+            sample_rate: 기록 비율 (기본값: settings.LOG_SAMPLE_RATE)
+            **fields: 구조화 필드 (LogRecord extra)
+        """
+        StructuredLogger._log(name, logging.DEBUG, message, args, sample_rate, fields)
+
+    @staticmethod
+    def info(name: str, message: str, *args, sample_rate: Optional[float] = None, **fields):
+        """INFO 로그 (지연 포맷, 샘플링)"""
+        StructuredLogger._log(name, logging.INFO, message, args, sample_rate, fields)
+
+    @staticmethod
+    def warning(name: str, message: str, *args, **fields):
+        """WARNING 로그 (지연 포맷, 샘플링하지 않음)"""
+        StructuredLogger._log(name, logging.WARNING, message, args, 1.0, fields)
+
+    @staticmethod
+    def error(name: str, message: str, *args, exc_info: bool = False, **fields):
+        """ERROR 로그 (지연 포맷, 샘플링하지 않음)"""
+        StructuredLogger._log(name, logging.ERROR, message, args, 1.0, fields, exc_info)
+
+    @staticmethod
+    def _log(
+        name: str,
+        level: int,
+        message: str,
+        args: tuple,
+        sample_rate: Optional[float],
+        fields: Dict,
+        exc_info: bool = False
+    ):
+        target = logging.getLogger(name)
+        if not target.isEnabledFor(level):
+            return
+
+        if sample_rate is None:
+            sample_rate = getattr(settings, 'LOG_SAMPLE_RATE', 1.0)
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            return
+
+        # stacklevel=3: debug/info/warning/error → _log → 호출한 위치를 레코드에 기록
+        target.log(level, message, *args, exc_info=exc_info, extra=fields or None, stacklevel=3)
+
     @staticmethod
     def log_api_request(method: str, path: str, user_id: str = None):
         """
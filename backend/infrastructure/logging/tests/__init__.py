@@ -0,0 +1 @@
+# Infrastructure Logging Tests Module
@@ -0,0 +1,116 @@
+"""
+StructuredLogger / QueueingStreamHandler 테스트
+"""
+import io
+import logging
+import os
+
+import pytest
+
+from infrastructure.logging.handlers import QueueingStreamHandler
+from infrastructure.logging.logger import StructuredLogger
+
+
+class CountingArg:
+    """포맷된 횟수를 세는 로그 인자"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return 'value'
+
+
+@pytest.fixture
+def test_logger():
+    target = logging.getLogger('tests.structured')
+    handler = logging.Handler()
+    handler.records = []
+    handler.emit = lambda record: (handler.format(record), handler.records.append(record))
+    target.addHandler(handler)
+    target.propagate = False
+    yield target, handler
+    target.removeHandler(handler)
+    target.propagate = True
+    target.setLevel(logging.NOTSET)
+
+
+class TestStructuredLogger:
+    """StructuredLogger 테스트"""
+
+    def test_disabled_level_skips_formatting(self, test_logger):
+        """레벨이 꺼져 있으면 메시지 인자를 포맷하지 않는다"""
+        # Arrange
+        target, handler = test_logger
+        target.setLevel(logging.WARNING)
+        arg = CountingArg()
+
+        # Act
+        StructuredLogger.debug('tests.structured', 'result: %s', arg)
+
+        # Assert
+        assert arg.formatted == 0
+        assert handler.records == []
+
+    def test_enabled_level_formats_lazily_with_fields(self, test_logger):
+        """레벨이 켜져 있으면 출력 시 포맷하고 구조화 필드를 레코드에 담는다"""
+        # Arrange
+        target, handler = test_logger
+        target.setLevel(logging.DEBUG)
+        arg = CountingArg()
+
+        # Act
+        StructuredLogger.debug('tests.structured', 'result: %s', arg, user_id='u1')
+
+        # Assert
+        record = handler.records[0]
+        assert arg.formatted == 1
+        assert record.getMessage() == 'result: value'
+        assert record.user_id == 'u1'
+        assert record.funcName == 'test_enabled_level_formats_lazily_with_fields'
+
+    def test_sampling_drops_debug_but_keeps_warnings(self, test_logger):
+        """sample_rate=0이면 DEBUG는 버리고 WARNING은 항상 기록한다"""
+        # Arrange
+        target, handler = test_logger
+        target.setLevel(logging.DEBUG)
+
+        # Act
+        StructuredLogger.debug('tests.structured', 'sampled out', sample_rate=0.0)
+        StructuredLogger.warning('tests.structured', 'kept')
+
+        # Assert
+        assert [record.getMessage() for record in handler.records] == ['kept']
+
+
+class TestQueueingStreamHandler:
+    """QueueingStreamHandler 테스트"""
+
+    def test_writes_from_listener_thread(self):
+        """레코드는 백그라운드 리스너가 형식에 맞춰 스트림에 쓴다"""
+        # Arrange
+        stream = io.StringIO()
+        handler = QueueingStreamHandler(fmt='{levelname} {message}', style='{', stream=stream)
+        record = logging.LogRecord('tests', logging.WARNING, __file__, 1, 'hello %s', ('world',), None)
+
+        # Act
+        handler.handle(record)
+        handler.close()
+
+        # Assert
+        assert stream.getvalue() == 'WARNING hello world\n'
+
+    def test_drops_records_when_queue_is_full(self):
+        """큐가 가득 차면 요청 스레드를 막지 않고 레코드를 버린다"""
+        # Arrange
+        handler = QueueingStreamHandler(stream=io.StringIO(), queue_size=1)
+        handler._pid = os.getpid()  # 리스너 없이 큐만 사용 (출력되지 않고 쌓임)
+        record = logging.LogRecord('tests', logging.WARNING, __file__, 1, 'message', (), None)
+
+        # Act
+        handler.handle(record)
+        handler.handle(record)
+
+        # Assert
+        assert handler.dropped == 1
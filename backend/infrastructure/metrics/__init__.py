@@ -0,0 +1 @@
+# Infrastructure Metrics Module
@@ -0,0 +1,77 @@
+"""
+애플리케이션 메트릭 정의
+
+요청, 대시보드 생성, 업로드, 내보내기, JWT 검증, DB 커넥션 풀 메트릭을 한 곳에 정의합니다.
+값은 /api/metrics/ 에서 Prometheus 텍스트 형식으로 조회합니다.
+"""
+from django.conf import settings
+
+from .registry import MetricsRegistry
+
+registry = MetricsRegistry(
+    directory=getattr(settings, 'METRICS_DIR', '') or None,
+    flush_interval=getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0)
+)
+
+HTTP_REQUESTS = registry.counter(
+    'http_requests_total',
+    'HTTP 요청 수 (URL 패턴, 메서드, 상태 코드별)',
+    ('route', 'method', 'status')
+)
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    'http_request_duration_seconds',
+    'HTTP 요청 처리 시간 (초)',
+    ('route', 'method')
+)
+
+DASHBOARD_SECTION_SECONDS = registry.histogram(
+    'dashboard_section_duration_seconds',
+    '대시보드 구간별 생성 시간 (초)',
+    ('section',)
+)
+
+UPLOAD_ROWS = registry.counter(
+    'upload_rows_total',
+    '업로드로 저장된 행 수',
+    ('data_type',)
+)
+
+UPLOAD_ROWS_PER_SECOND = registry.histogram(
+    'upload_rows_per_second',
+    '업로드 처리 속도 (파싱~저장, 행/초)',
+    ('data_type',),
+    buckets=(100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+)
+
+EXPORT_BYTES = registry.counter(
+    'export_bytes_total',
+    'CSV 내보내기 응답 크기 (바이트)',
+    ('data_type',)
+)
+
+JWT_VERIFY_SECONDS = registry.histogram(
+    'jwt_verify_duration_seconds',
+    'JWT 검증 시간 (초, cache=hit/miss)',
+    ('cache',),
+    buckets=(0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01)
+)
+
+DB_POOL_CONNECTIONS = registry.gauge(
+    'db_pool_connections',
+    'DB 커넥션 풀 연결 수 (state=idle/in_use)',
+    ('alias', 'state')
+)
+
+DB_POOL_ACQUIRE_SECONDS = registry.histogram(
+    'db_pool_acquire_duration_seconds',
+    'DB 커넥션 풀에서 연결을 얻기까지 걸린 시간 (초)',
+    ('alias',),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+)
+
+DB_POOL_EVENTS = registry.counter(
+    'db_pool_events_total',
+    'DB 커넥션 풀 이벤트 수 (event=created/closed/timeout/busy/health_check_failed)',
+    ('alias', 'event')
+)
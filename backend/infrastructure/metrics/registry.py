@@ -0,0 +1,415 @@
+"""
+메트릭 레지스트리
+
+외부 APM 없이 카운터, 게이지, 고정 버킷 히스토그램을 집계하고 Prometheus 텍스트 형식으로 출력합니다.
+
+다중 프로세스(gunicorn 워커) 집계:
+- 각 프로세스는 자신의 값을 메모리에 누적하고, METRICS_DIR가 설정되어 있으면 백그라운드 스레드가
+  flush_interval초마다 <METRICS_DIR>/metrics_<pid>.json 으로 스냅샷을 씁니다 (원자적 교체).
+  요청 스레드는 파일 I/O를 하지 않습니다.
+- 출력 시 디렉토리의 모든 스냅샷을 합산합니다. 종료된 워커의 파일도 합산하므로
+  카운터와 히스토그램은 워커 재시작 후에도 줄어들지 않습니다.
+  게이지(현재 값)는 살아 있는 프로세스의 스냅샷만 합산합니다.
+- 종료된 워커의 스냅샷은 출력 시 metrics_aggregate.json 하나로 합치고 삭제하므로
+  (파일 잠금으로 한 프로세스만 수행) 워커가 재시작되어도 파일 수가 늘어나지 않습니다.
+- 디렉토리는 서버 시작 시 clear_directory()로 비웁니다 (gunicorn on_starting).
+"""
+import atexit
+import glob
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: 종료된 워커 스냅샷을 합치지 않고 그대로 합산
+    fcntl = None
+
+# 기본 지연 시간 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+SNAPSHOT_PATTERN = 'metrics_*.json'
+
+# 종료된 워커 스냅샷을 합친 파일 (SNAPSHOT_PATTERN에 포함되어 함께 합산/정리됨)
+AGGREGATE_FILE = 'metrics_aggregate.json'
+LOCK_FILE = '.metrics.lock'
+
+
+class Metric:
+    """메트릭 공통 (이름, 설명, 레이블 이름)"""
+
+    TYPE = ''
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        registry.register(self)
+
+    def _key(self, labels: Dict) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 레이블이 올바르지 않습니다: {sorted(labels)} (필요: {list(self.labelnames)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+
+    TYPE = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if amount < 0:
+            raise ValueError("카운터는 감소할 수 없습니다")
+        self.registry.add(self.name, self._key(labels), amount)
+
+    def empty(self) -> float:
+        return 0.0
+
+
+class Gauge(Metric):
+    """현재 값 (프로세스별 값을 합산하여 출력)"""
+
+    TYPE = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        self.registry.set(self.name, self._key(labels), value)
+
+    def empty(self) -> float:
+        return 0.0
+
+
+class Histogram(Metric):
+    """
+    고정 버킷 히스토그램
+
+    값은 [버킷별 개수..., +Inf 개수, 합계] 리스트로 저장합니다 (누적은 출력 시 계산).
+    """
+
+    TYPE = 'histogram'
+
+    def __init__(
+        self,
+        registry: 'MetricsRegistry',
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(registry, name, documentation, labelnames)
+
+    def observe(self, value: float, **labels) -> None:
+        self.registry.observe(self.name, self._key(labels), self._bucket_index(value), value)
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록의 실행 시간(초)을 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def empty(self) -> List[float]:
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def _bucket_index(self, value: float) -> int:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                return index
+        return len(self.buckets)
+
+
+class MetricsRegistry:
+    """
+    메트릭 저장소 (스레드 안전)
+
+    Args:
+        directory: 다중 프로세스 스냅샷 디렉토리 (None이면 현재 프로세스 값만 출력)
+        flush_interval: 스냅샷 최소 간격(초)
+    """
+
+    def __init__(self, directory: Optional[str] = None, flush_interval: float = 1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._metrics: Dict[str, Metric] = {}
+        self._values: Dict[str, Dict[Tuple[str, ...], object]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flusher_pid = None
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        self._values[metric.name] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return Counter(self, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return Gauge(self, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return Histogram(self, name, documentation, labelnames, buckets)
+
+    def add(self, name: str, key: Tuple[str, ...], amount: float) -> None:
+        with self._lock:
+            series = self._values[name]
+            series[key] = series.get(key, 0.0) + amount
+            self._dirty = True
+        self._ensure_flusher()
+
+    def set(self, name: str, key: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            self._values[name][key] = float(value)
+            self._dirty = True
+        self._ensure_flusher()
+
+    def observe(self, name: str, key: Tuple[str, ...], index: int, value: float) -> None:
+        with self._lock:
+            series = self._values[name]
+            counts = series.get(key)
+            if counts is None:
+                counts = series[key] = self._metrics[name].empty()
+            counts[index] += 1
+            counts[-1] += value
+            self._dirty = True
+        self._ensure_flusher()
+
+    def flush(self) -> None:
+        """현재 프로세스 값을 스냅샷 파일로 저장"""
+        if not self.directory:
+            return
+
+        with self._lock:
+            snapshot = self._snapshot()
+            self._dirty = False
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._write(os.path.join(self.directory, f'metrics_{os.getpid()}.json'), snapshot)
+
+    def collect(self) -> Dict[str, Dict[Tuple[str, ...], object]]:
+        """전체 프로세스 합산 값 (현재 프로세스는 스냅샷을 먼저 갱신)"""
+        if not self.directory:
+            with self._lock:
+                return {
+                    name: {key: list(value) if isinstance(value, list) else value for key, value in series.items()}
+                    for name, series in self._values.items()
+                }
+
+        self.flush()
+        self.fold_dead_snapshots()
+        merged: Dict[str, Dict[Tuple[str, ...], object]] = {name: {} for name in self._metrics}
+        for path in glob.glob(os.path.join(self.directory, SNAPSHOT_PATTERN)):
+            snapshot = self._read(path)
+            if snapshot is None:
+                continue
+            alive = _alive(path)
+            for name, series in snapshot.items():
+                if name not in merged:
+                    continue
+                # 종료된 워커의 게이지는 더 이상 현재 값이 아님
+                if self._metrics[name].TYPE == 'gauge' and not alive:
+                    continue
+                self._merge(merged[name], series)
+        return merged
+
+    def fold_dead_snapshots(self) -> int:
+        """
+        종료된 프로세스의 스냅샷을 AGGREGATE_FILE에 합치고 삭제
+
+        게이지는 종료된 프로세스에서는 의미가 없으므로 버립니다.
+        다른 프로세스가 합치는 중이면 건너뜁니다 (다음 출력 때 처리).
+        합친 파일을 먼저 쓰고 원본을 지우므로, 그 사이에 프로세스가 죽으면 한 번 중복 합산될 수 있습니다.
+
+        Returns:
+            int: 합친 스냅샷 수
+        """
+        if not self.directory or fcntl is None:
+            return 0
+
+        aggregate_path = os.path.join(self.directory, AGGREGATE_FILE)
+        dead = [
+            path for path in glob.glob(os.path.join(self.directory, SNAPSHOT_PATTERN))
+            if path != aggregate_path and not _alive(path)
+        ]
+        if not dead:
+            return 0
+
+        with open(os.path.join(self.directory, LOCK_FILE), 'a') as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return 0
+            try:
+                aggregate = self._read(aggregate_path) or {}
+                folded = []
+                for path in dead:
+                    snapshot = self._read(path)
+                    if snapshot is None:
+                        # 다른 프로세스가 이미 합쳐서 삭제함
+                        continue
+                    for name, series in snapshot.items():
+                        metric = self._metrics.get(name)
+                        if metric is not None and metric.TYPE == 'gauge':
+                            continue
+                        self._merge(aggregate.setdefault(name, {}), series)
+                    folded.append(path)
+
+                if folded:
+                    self._write(aggregate_path, self._encode(aggregate))
+                    for path in folded:
+                        os.remove(path)
+                return len(folded)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        values = self.collect()
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.append(f'# HELP {name} {metric.documentation}')
+            lines.append(f'# TYPE {name} {metric.TYPE}')
+            for key, value in sorted(values[name].items()):
+                labels = list(zip(metric.labelnames, key))
+                if metric.TYPE == 'histogram':
+                    lines.extend(self._histogram_lines(metric, labels, value))
+                else:
+                    lines.append(f'{name}{_labels(labels)} {_number(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """현재 프로세스 값 초기화 (테스트용)"""
+        with self._lock:
+            for series in self._values.values():
+                series.clear()
+            self._dirty = False
+
+    @staticmethod
+    def clear_directory(directory: str) -> None:
+        """스냅샷 디렉토리 비우기 (서버 시작 시)"""
+        for path in glob.glob(os.path.join(directory, SNAPSHOT_PATTERN)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _ensure_flusher(self) -> None:
+        """현재 프로세스의 스냅샷 스레드 시작 (fork된 워커에서는 새로 시작)"""
+        if not self.directory or self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+        threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True).start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self) -> None:
+        pid = os.getpid()
+        while self._flusher_pid == pid:
+            time.sleep(self.flush_interval)
+            if self._dirty:
+                try:
+                    self.flush()
+                except OSError:
+                    pass
+
+    def _snapshot(self) -> Dict[str, List]:
+        return self._encode(self._values)
+
+    @staticmethod
+    def _encode(values: Dict[str, Dict[Tuple[str, ...], object]]) -> Dict[str, List]:
+        return {
+            name: [[list(key), value] for key, value in series.items()]
+            for name, series in values.items()
+        }
+
+    def _read(self, path: str) -> Optional[Dict[str, Dict[Tuple[str, ...], object]]]:
+        """스냅샷 파일 읽기 (없거나 손상되었으면 None)"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                return self._decode(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write(path: str, snapshot: Dict[str, List]) -> None:
+        """스냅샷 파일 원자적 교체"""
+        temporary = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        os.replace(temporary, path)
+
+    @staticmethod
+    def _decode(snapshot: Dict[str, List]) -> Dict[str, Dict[Tuple[str, ...], object]]:
+        return {
+            name: {tuple(key): value for key, value in series}
+            for name, series in snapshot.items()
+        }
+
+    @staticmethod
+    def _merge(target: Dict, series: Dict) -> None:
+        for key, value in series.items():
+            current = target.get(key)
+            if current is None:
+                target[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list):
+                target[key] = [a + b for a, b in zip(current, value)]
+            else:
+                target[key] = current + value
+
+    @staticmethod
+    def _histogram_lines(metric: Histogram, labels: List[Tuple[str, str]], counts: List[float]) -> Iterable[str]:
+        cumulative = 0
+        for bound, count in zip(metric.buckets + (math.inf,), counts):
+            cumulative += count
+            le = '+Inf' if bound == math.inf else repr(float(bound))
+            yield f'{metric.name}_bucket{_labels(labels + [("le", le)])} {_number(cumulative)}'
+        yield f'{metric.name}_sum{_labels(labels)} {_number(counts[-1])}'
+        yield f'{metric.name}_count{_labels(labels)} {_number(cumulative)}'
+
+
+def _alive(path: str) -> bool:
+    """스냅샷을 쓴 프로세스(metrics_<pid>.json)가 살아 있는지"""
+    try:
+        pid = int(os.path.basename(path)[len('metrics_'):-len('.json')])
+        os.kill(pid, 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        # 다른 사용자의 프로세스 (존재함)
+        return True
+    return True
+
+
+def _labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ''
+    pairs = (f'{name}="{_escape(value)}"' for name, value in labels)
+    return '{' + ','.join(pairs) + '}'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
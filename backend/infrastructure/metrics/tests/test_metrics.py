@@ -0,0 +1,147 @@
+"""
+메트릭 레지스트리 / 엔드포인트 테스트
+"""
+import multiprocessing
+import os
+
+import pytest
+from django.test import override_settings
+
+from infrastructure.metrics.metrics import registry
+from infrastructure.metrics.registry import MetricsRegistry
+
+
+def record_in_child(directory):
+    """다른 워커 프로세스에서 메트릭 기록 후 스냅샷 저장"""
+    child = MetricsRegistry(directory=directory)
+    child.counter('jobs_total', '작업 수', ('kind',)).inc(2, kind='csv')
+    child.histogram('job_seconds', '작업 시간', buckets=(0.1, 1.0)).observe(0.5)
+    child.gauge('jobs_running', '실행 중인 작업 수').set(3)
+    child.flush()
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry 테스트"""
+
+    def test_renders_prometheus_text(self):
+        """카운터와 누적 버킷 히스토그램을 Prometheus 텍스트로 출력한다"""
+        # Arrange
+        metrics = MetricsRegistry()
+        requests = metrics.counter('requests_total', '요청 수', ('route',))
+        latency = metrics.histogram('latency_seconds', '지연 시간', buckets=(0.1, 1.0))
+
+        # Act
+        requests.inc(route='api/"data"/')
+        requests.inc(2, route='api/"data"/')
+        for value in (0.05, 0.5, 3.0):
+            latency.observe(value)
+        text = metrics.render()
+
+        # Assert
+        assert '# TYPE requests_total counter' in text
+        assert 'requests_total{route="api/\\"data\\"/"} 3' in text
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1.0"} 2' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+        assert 'latency_seconds_sum 3.55' in text
+        assert 'latency_seconds_count 3' in text
+
+    def test_rejects_wrong_labels(self):
+        """정의와 다른 레이블로 기록하면 ValueError"""
+        # Arrange
+        counter = MetricsRegistry().counter('uploads_total', '업로드 수', ('data_type',))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match='레이블'):
+            counter.inc(kind='csv')
+
+    def test_sums_snapshots_across_processes(self, tmp_path):
+        """디렉토리를 공유하는 프로세스들의 값을 합산한다 (종료된 프로세스의 게이지는 제외)"""
+        # Arrange
+        directory = str(tmp_path)
+        parent = MetricsRegistry(directory=directory)
+        jobs = parent.counter('jobs_total', '작업 수', ('kind',))
+        durations = parent.histogram('job_seconds', '작업 시간', buckets=(0.1, 1.0))
+        running = parent.gauge('jobs_running', '실행 중인 작업 수')
+        jobs.inc(kind='csv')
+        running.set(1)
+        durations.observe(0.05)
+
+        # Act
+        process = multiprocessing.get_context('fork').Process(target=record_in_child, args=(directory,))
+        process.start()
+        process.join()
+        text = parent.render()
+
+        # Assert
+        assert 'jobs_total{kind="csv"} 3' in text
+        assert 'job_seconds_bucket{le="1.0"} 2' in text
+        assert 'job_seconds_count 2' in text
+        assert 'jobs_running 1' in text
+
+    def test_folds_dead_process_snapshots_into_aggregate(self, tmp_path):
+        """종료된 프로세스의 스냅샷은 합계 파일 하나로 합쳐지고, 다시 출력해도 중복 합산되지 않는다"""
+        # Arrange
+        directory = str(tmp_path)
+        parent = MetricsRegistry(directory=directory)
+        parent.counter('jobs_total', '작업 수', ('kind',))
+        parent.histogram('job_seconds', '작업 시간', buckets=(0.1, 1.0))
+        parent.gauge('jobs_running', '실행 중인 작업 수')
+        for _ in range(2):
+            process = multiprocessing.get_context('fork').Process(target=record_in_child, args=(directory,))
+            process.start()
+            process.join()
+
+        # Act
+        first = parent.render()
+        second = parent.render()
+
+        # Assert
+        assert 'jobs_total{kind="csv"} 4' in first
+        assert 'job_seconds_count 2' in first
+        assert 'jobs_running 0' not in first and 'jobs_running 3' not in first
+        assert second == first
+        assert sorted(path.name for path in tmp_path.glob('metrics_*.json')) == sorted([
+            'metrics_aggregate.json', f'metrics_{os.getpid()}.json'
+        ])
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    """GET /api/metrics/ 테스트"""
+
+    def test_exposes_request_metrics(self, client):
+        """요청 메트릭이 URL 패턴 단위로 집계되어 출력된다"""
+        # Arrange
+        registry.reset()
+        client.get('/api/health/')
+
+        # Act
+        response = client.get('/api/metrics/')
+
+        # Assert
+        body = response.content.decode()
+        assert response.status_code == 200
+        assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+        assert 'http_requests_total{route="api/health/",method="GET",status="200"} 1' in body
+        assert 'http_request_duration_seconds_count{route="api/health/",method="GET"} 1' in body
+
+    @override_settings(METRICS_TOKEN='scrape-token')
+    def test_requires_token_when_configured(self, client):
+        """METRICS_TOKEN이 설정되어 있으면 Bearer 토큰이 필요하다"""
+        # Act
+        denied = client.get('/api/metrics/')
+        allowed = client.get('/api/metrics/', HTTP_AUTHORIZATION='Bearer scrape-token')
+
+        # Assert
+        assert denied.status_code == 401
+        assert allowed.status_code == 200
+
+    @override_settings(METRICS_TOKEN='', METRICS_PUBLIC=False)
+    def test_closed_without_token_when_not_public(self, client):
+        """운영 환경(METRICS_PUBLIC=False)에서는 토큰이 설정되지 않으면 응답하지 않는다"""
+        # Act
+        response = client.get('/api/metrics/')
+
+        # Assert
+        assert response.status_code == 401
@@ -0,0 +1,29 @@
+"""
+메트릭 조회 엔드포인트
+
+GET /api/metrics/ - Prometheus 텍스트 형식
+METRICS_TOKEN이 설정되어 있으면 'Authorization: Bearer <METRICS_TOKEN>' 헤더가 필요합니다.
+토큰이 없으면 METRICS_PUBLIC(개발 환경)일 때만 응답하며, 운영 환경에서는 항상 401입니다.
+"""
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from .metrics import registry
+from .registry import CONTENT_TYPE
+
+
+@require_GET
+def metrics_view(request):
+    """전체 워커 합산 메트릭 출력"""
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        provided = request.META.get('HTTP_AUTHORIZATION', '')
+        if not hmac.compare_digest(provided.encode(), f'Bearer {token}'.encode()):
+            return HttpResponse('Unauthorized', status=401, content_type='text/plain')
+    elif not getattr(settings, 'METRICS_PUBLIC', False):
+        return HttpResponse('Unauthorized', status=401, content_type='text/plain')
+
+    return HttpResponse(registry.render(), content_type=CONTENT_TYPE)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+요청 프로파일링 미들웨어 (옵트인)
+
+PROFILING_ENABLED=True인 환경에서 관리자가 'X-Profile: 1' 헤더를 붙여 보낸 요청만
+cProfile + 스택 샘플러로 측정하여 PROFILING_DIR에 저장합니다.
+저장된 프로파일 ID는 응답의 X-Profile-Id 헤더로 돌려주며, /api/profiles/ 에서 조회합니다.
+
+- 설정이 꺼져 있으면 미들웨어 자체가 로드되지 않습니다 (MiddlewareNotUsed).
+- 관리자 여부는 Authorization 헤더의 Supabase JWT(role == 'admin')로 판단하며,
+  관리자가 아니면 헤더를 무시하고 평소대로 처리합니다.
+- 프로파일러는 프로세스당 한 요청에만 동시에 적용합니다 (측정 중이면 다음 요청은 측정 없이 처리).
+- 비동기(ASGI) 요청은 이벤트 루프 스레드를 측정합니다. 같은 루프에서 함께 실행된 다른 요청의
+  코루틴도 섞일 수 있고, sync_to_async 스레드에서 실행된 코드(ORM 쿼리 등)는 대기 시간으로만 나타납니다.
+"""
+import threading
+import time
+
+import jwt
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from infrastructure.authentication.supabase_auth import SupabaseAuthentication
+from infrastructure.logging.logger import StructuredLogger
+from infrastructure.profiling.profiler import RequestProfiler
+from infrastructure.profiling.store import get_profile_store
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+
+
+class ProfilingMiddleware:
+    """관리자 요청 단위 프로파일링"""
+
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.interval = getattr(settings, 'PROFILING_SAMPLE_INTERVAL', 0.005)
+        self.store = get_profile_store()
+        self._lock = threading.Lock()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not self._should_profile(request):
+            return self.get_response(request)
+
+        try:
+            profiler = RequestProfiler(self.interval)
+            try:
+                profiler.start()
+            except ValueError:
+                # 다른 프로파일링 도구(디버거, 커버리지 등)가 이미 활성화된 경우
+                return self.get_response(request)
+
+            started = time.perf_counter()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.stop()
+            duration_ms = (time.perf_counter() - started) * 1000
+
+            profile_id = self.store.save(profiler, self._metadata(request, response, duration_ms))
+        finally:
+            self._lock.release()
+
+        return self._finish(request, response, profile_id, duration_ms)
+
+    async def __acall__(self, request):
+        if not self._should_profile(request):
+            return await self.get_response(request)
+
+        try:
+            profiler = RequestProfiler(self.interval)
+            try:
+                profiler.start()
+            except ValueError:
+                return await self.get_response(request)
+
+            started = time.perf_counter()
+            try:
+                response = await self.get_response(request)
+            finally:
+                profiler.stop()
+            duration_ms = (time.perf_counter() - started) * 1000
+
+            # 프로파일 저장은 파일 쓰기이므로 이벤트 루프 밖에서 실행
+            profile_id = await sync_to_async(self.store.save)(
+                profiler, self._metadata(request, response, duration_ms)
+            )
+        finally:
+            self._lock.release()
+
+        return self._finish(request, response, profile_id, duration_ms)
+
+    def _should_profile(self, request) -> bool:
+        """측정 대상 요청이면 잠금을 잡고 True (호출한 쪽에서 해제)"""
+        if request.META.get(PROFILE_HEADER) != '1' or not self._is_admin(request):
+            return False
+        if not self._lock.acquire(blocking=False):
+            StructuredLogger.info(__name__, '다른 요청을 프로파일링 중이라 건너뜁니다: %s', request.path)
+            return False
+        return True
+
+    @staticmethod
+    def _metadata(request, response, duration_ms: float) -> dict:
+        return {
+            'method': request.method,
+            'path': request.path,
+            'query': request.META.get('QUERY_STRING', ''),
+            'status': response.status_code,
+            'duration_ms': round(duration_ms, 2),
+        }
+
+    @staticmethod
+    def _finish(request, response, profile_id: str, duration_ms: float):
+        response['X-Profile-Id'] = profile_id
+        StructuredLogger.info(
+            __name__, '프로파일 저장: %s %s → %s', request.method, request.path, profile_id,
+            profile_id=profile_id, duration_ms=round(duration_ms, 2)
+        )
+        return response
+
+    @staticmethod
+    def _is_admin(request) -> bool:
+        parts = request.META.get('HTTP_AUTHORIZATION', '').split()
+        if len(parts) != 2 or parts[0].lower() != 'bearer' or not settings.SUPABASE_JWT_SECRET:
+            return False
+        try:
+            payload = SupabaseAuthentication.verify_token(parts[1])
+        except jwt.InvalidTokenError:
+            return False
+        return payload.get('role') == 'admin'
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+복제본 고정(read-your-writes) 미들웨어
+
+요청마다 라우팅 상태를 만들고, 요청한 사용자(Supabase JWT의 sub/email)가 고정 기간 안이면
+읽기를 기본 DB로 보냅니다. 요청 중 쓰기(업로드 등)가 일어났으면 그 사용자를
+REPLICA_STICKY_SECONDS 동안 고정합니다 (infrastructure.database.replica_pins).
+
+프론트엔드는 다른 도메인에서 자격 증명(쿠키) 없이 호출하므로 쿠키 대신 Authorization 헤더로 사용자를 식별합니다.
+백그라운드 업로드 작업은 작업이 끝날 때 UploadJobService가 고정합니다.
+DATABASE_REPLICAS가 비어 있으면 로드되지 않습니다.
+
+비동기(ASGI) 요청에서는 고정 캐시(DatabaseCache) 조회/기록을 sync_to_async로 실행합니다.
+고정 캐시 조회/기록이 DB 오류(캐시 테이블 누락, 기본 DB 장애 등)로 실패해도 요청은 실패시키지 않고,
+경고만 남긴 뒤 고정되지 않은 것으로 처리합니다.
+"""
+from typing import Dict, List, Optional
+
+import jwt
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DatabaseError
+
+from infrastructure.authentication.supabase_auth import SupabaseAuthentication
+from infrastructure.database.replica_pins import is_pinned, pin, pin_keys
+from infrastructure.database.router import request_scope
+from infrastructure.logging.logger import StructuredLogger
+
+# 고정 여부를 확인하는 메서드 (쓰기 요청은 쓰는 순간 그 요청의 이후 읽기가 기본 DB로 고정됨)
+READ_METHODS = ('GET', 'HEAD')
+
+
+def _claims(request) -> Optional[Dict]:
+    """Authorization 헤더의 Supabase JWT claims (없거나 유효하지 않으면 None)"""
+    parts = request.META.get('HTTP_AUTHORIZATION', '').split()
+    if len(parts) != 2 or parts[0].lower() != 'bearer' or not settings.SUPABASE_JWT_SECRET:
+        return None
+    try:
+        return SupabaseAuthentication.verify_token(parts[1])
+    except jwt.InvalidTokenError:
+        return None
+
+
+def _is_pinned(keys: List[str]) -> bool:
+    """고정 여부 (고정 캐시를 읽지 못하면 고정되지 않은 것으로 처리)"""
+    try:
+        return is_pinned(keys)
+    except DatabaseError as e:
+        StructuredLogger.warning(__name__, '복제본 고정 조회 실패: %s', e)
+        return False
+
+
+def _pin(keys: List[str]) -> None:
+    """사용자 고정 (고정 캐시에 기록하지 못하면 경고만 남김)"""
+    try:
+        pin(keys)
+    except DatabaseError as e:
+        StructuredLogger.warning(__name__, '복제본 고정 기록 실패: %s', e)
+
+
+class ReplicaPinningMiddleware:
+    """쓰기 직후 일정 시간 동안 같은 사용자의 읽기를 기본 DB로 고정"""
+
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'DATABASE_REPLICAS', []):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        keys = self._pin_keys(request)
+        pinned = request.method in READ_METHODS and _is_pinned(keys)
+
+        with request_scope(pinned=pinned) as state:
+            response = self.get_response(request)
+
+        if state.wrote:
+            _pin(keys)
+        return response
+
+    async def __acall__(self, request):
+        keys = self._pin_keys(request)
+        pinned = request.method in READ_METHODS and keys and await sync_to_async(_is_pinned)(keys)
+
+        # 라우팅 상태는 ContextVar이므로 sync_to_async로 실행되는 ORM 호출에도 전달됨
+        with request_scope(pinned=bool(pinned)) as state:
+            response = await self.get_response(request)
+
+        if state.wrote:
+            await sync_to_async(_pin)(keys)
+        return response
+
+    @staticmethod
+    def _pin_keys(request) -> List[str]:
+        claims = _claims(request)
+        if claims is None:
+            return []
+        return pin_keys(claims.get('sub'), claims.get('email'))
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+정적 파일 미들웨어 (WhiteNoise 비동기 지원)
+
+WhiteNoise 6.6의 WhiteNoiseMiddleware는 동기 전용이라 ASGI에서는 Django가 요청마다
+이 지점에서 async_to_sync/sync_to_async로 전환하며 스레드를 하나씩 잡습니다.
+이 클래스는 같은 규칙으로 정적 파일을 찾아 응답하되, 비동기 요청에서는 정적 파일이 아닌 요청을
+그대로 await로 넘기고 파일 조회/응답 생성만 sync_to_async로 실행합니다.
+
+정적 파일 본문은 WhiteNoise의 동기 파일 이터레이터이므로 ASGI에서는 Django가 스레드에서 읽어 전송합니다.
+"""
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """동기/비동기 요청을 모두 처리하는 WhiteNoiseMiddleware"""
+
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            # 개발 환경: 요청마다 파일 시스템을 확인
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
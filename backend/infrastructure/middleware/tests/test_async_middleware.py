@@ -0,0 +1,39 @@
+"""
+미들웨어 비동기 지원 테스트
+"""
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.module_loading import import_string
+
+from infrastructure.middleware.static_middleware import AsyncWhiteNoiseMiddleware
+
+
+async def async_view(request):
+    return HttpResponse('ok')
+
+
+def test_middleware_chain_is_async_capable():
+    """ASGI에서 동기 전환이 일어나지 않도록 MIDDLEWARE는 모두 비동기를 지원한다"""
+    # Act
+    sync_only = [
+        path for path in settings.MIDDLEWARE
+        if not getattr(import_string(path), 'async_capable', False)
+    ]
+
+    # Assert
+    assert sync_only == []
+
+
+def test_static_middleware_awaits_non_static_requests():
+    """정적 파일이 아닌 비동기 요청은 다음 단계로 await하여 넘긴다"""
+    # Arrange
+    middleware = AsyncWhiteNoiseMiddleware(async_view)
+
+    # Act
+    response = async_to_sync(middleware)(RequestFactory().get('/api/dashboard/'))
+
+    # Assert
+    assert iscoroutinefunction(middleware)
+    assert response.content == b'ok'
@@ -0,0 +1,97 @@
+"""
+요청 계측 미들웨어 테스트
+"""
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from infrastructure.middleware.timing_middleware import RequestTimingMiddleware
+
+
+def view_with_queries(request):
+    """쿼리 3개를 실행하는 뷰"""
+    with connection.cursor() as cursor:
+        for _ in range(3):
+            cursor.execute('SELECT 1')
+    return HttpResponse('ok')
+
+
+def run_queries_in_worker_thread():
+    """요청 스레드가 아닌 스레드에서 쿼리 2개를 실행하고 연결을 닫음"""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.execute('SELECT 1')
+    finally:
+        connections.close_all()
+
+
+async def async_view_with_queries(request):
+    """요청 스레드(sync_to_async)와 스레드 풀에서 쿼리를 실행하는 비동기 뷰"""
+    await sync_to_async(view_with_queries)(request)
+    await sync_to_async(run_queries_in_worker_thread, thread_sensitive=False)()
+    return HttpResponse('ok')
+
+
+@pytest.mark.django_db
+class TestRequestTimingMiddleware:
+    """RequestTimingMiddleware 테스트"""
+
+    def test_adds_server_timing_with_query_count(self):
+        """처리 시간과 쿼리 수/시간을 Server-Timing 헤더와 request.timing에 남긴다"""
+        # Arrange
+        request = RequestFactory().get('/api/dashboard/')
+
+        # Act
+        response = RequestTimingMiddleware(view_with_queries)(request)
+
+        # Assert
+        header = response['Server-Timing']
+        assert header.startswith('total;dur=')
+        assert 'db;dur=' in header and 'desc="3 queries"' in header
+        assert request.timing['queries'] == 3
+        assert request.timing['total_ms'] >= request.timing['db_ms']
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0)
+    def test_slow_request_logs_full_query_list(self, caplog):
+        """임계값 이상 걸린 요청은 전체 쿼리 목록과 함께 WARNING으로 기록한다"""
+        # Arrange
+        request = RequestFactory().get('/api/data/')
+
+        # Act
+        with caplog.at_level(logging.WARNING, logger='infrastructure.middleware.timing_middleware'):
+            RequestTimingMiddleware(view_with_queries)(request)
+
+        # Assert
+        record = caplog.records[-1]
+        assert record.getMessage().startswith('Slow request: GET /api/data/ 200')
+        assert [query['sql'] for query in record.query_list] == ['SELECT 1'] * 3
+        assert len(record.slowest_queries) == 3
+        assert record.status == 200
+
+    def test_measures_drf_render_time(self, client):
+        """DRF 응답의 렌더링 시간을 render 항목으로 측정한다"""
+        # Act
+        response = client.get('/api/schema/')
+
+        # Assert
+        assert 'render;dur=' in response['Server-Timing']
+        assert response.wsgi_request.timing['render_ms'] > 0
+
+    def test_async_request_counts_queries_from_all_threads(self):
+        """비동기 요청은 await로 처리하며, 스레드 풀에서 실행된 쿼리도 요청에 집계한다"""
+        # Arrange
+        middleware = RequestTimingMiddleware(async_view_with_queries)
+        request = RequestFactory().get('/api/dashboard/')
+
+        # Act
+        response = async_to_sync(middleware)(request)
+
+        # Assert
+        assert iscoroutinefunction(middleware)
+        assert 'desc="5 queries"' in response['Server-Timing']
+        assert request.timing['queries'] == 5
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+요청 계측 미들웨어
+
+요청별 처리 시간, DB 쿼리 수/시간, 가장 느린 쿼리, 응답 렌더링(직렬화) 시간을 측정하여
+Server-Timing 헤더, 구조화 로그 필드, 요청 메트릭(http_requests_total 등)으로 남깁니다.
+SLOW_REQUEST_THRESHOLD_MS 이상 걸린 요청은 전체 쿼리 목록과 함께 WARNING으로 기록합니다.
+
+동기(WSGI)/비동기(ASGI) 요청을 모두 처리합니다. 쿼리 기록기는 ContextVar로 요청에 연결되므로
+sync_to_async 스레드나 gather_queries의 스레드 풀에서 실행된 쿼리도 그 요청에 집계됩니다.
+"""
+import heapq
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from infrastructure.logging.logger import StructuredLogger
+from infrastructure.metrics.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrapper로 등록되는 쿼리 기록기
+
+    쿼리 수와 총 시간은 항상 집계하고, 느린 요청 보고용 쿼리 목록은 max_queries개까지 보관합니다.
+    """
+
+    def __init__(self, max_queries: int = 1000):
+        self.count = 0
+        self.seconds = 0.0
+        self.max_queries = max_queries
+        self.queries: List[Tuple[float, str, str]] = []
+        # 비동기 뷰의 동시 조회는 여러 스레드에서 기록
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.count += 1
+                self.seconds += elapsed
+                if len(self.queries) < self.max_queries:
+                    self.queries.append((elapsed, context['connection'].alias, sql))
+
+    def slowest(self, limit: int) -> List[Dict]:
+        """가장 느린 쿼리 limit개"""
+        return [self._entry(query) for query in heapq.nlargest(limit, self.queries, key=lambda query: query[0])]
+
+    def all(self) -> List[Dict]:
+        """실행 순서대로 기록된 전체 쿼리"""
+        return [self._entry(query) for query in self.queries]
+
+    @staticmethod
+    def _entry(query: Tuple[float, str, str]) -> Dict:
+        elapsed, alias, sql = query
+        return {'ms': round(elapsed * 1000, 2), 'db': alias, 'sql': sql}
+
+
+# 현재 요청의 쿼리 기록기 (요청 밖에서는 None)
+_active_recorder: ContextVar[Optional[QueryRecorder]] = ContextVar('query_recorder', default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    """모든 DB 연결에 한 번 등록되는 execute_wrapper (현재 요청의 기록기로 전달)"""
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def _register(connection) -> None:
+    # 재연결 시 중복 등록 방지
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def _register_on_connect(sender, connection, **kwargs):
+    _register(connection)
+
+
+def install_query_recorder() -> None:
+    """이후 열리는 모든 DB 연결(모든 스레드)과 현재 스레드의 연결에 _record_query 등록"""
+    connection_created.connect(_register_on_connect, weak=False, dispatch_uid='request_timing_queries')
+    for connection in connections.all(initialized_only=True):
+        _register(connection)
+
+
+class RequestTimingMiddleware:
+    """
+    요청 처리 시간 / SQL 계측 미들웨어
+
+    MIDDLEWARE의 맨 앞에 두어야 다른 미들웨어의 시간까지 포함됩니다.
+    측정값은 request.timing에도 첨부됩니다.
+
+    Server-Timing 예:
+        total;dur=182.4, db;dur=35.1;desc="12 queries", render;dur=8.3, app;dur=139.0
+    """
+
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.threshold_ms = getattr(settings, 'SLOW_REQUEST_THRESHOLD_MS', 1000)
+        self.top_queries = getattr(settings, 'REQUEST_TIMING_TOP_QUERIES', 5)
+        self.max_queries = getattr(settings, 'REQUEST_TIMING_MAX_QUERIES', 1000)
+        install_query_recorder()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        recorder, token, started = self._start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _active_recorder.reset(token)
+        return self._finish(request, response, recorder, started)
+
+    async def __acall__(self, request):
+        recorder, token, started = self._start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _active_recorder.reset(token)
+        return self._finish(request, response, recorder, started)
+
+    def _start(self, request):
+        recorder = QueryRecorder(self.max_queries)
+        request._render_seconds = 0.0
+        return recorder, _active_recorder.set(recorder), time.perf_counter()
+
+    def _finish(self, request, response, recorder: QueryRecorder, started: float):
+        total_ms = (time.perf_counter() - started) * 1000
+        timing = {
+            'total_ms': round(total_ms, 2),
+            'db_ms': round(recorder.seconds * 1000, 2),
+            'queries': recorder.count,
+            'render_ms': round(request._render_seconds * 1000, 2),
+        }
+        timing['app_ms'] = round(max(0.0, total_ms - timing['db_ms'] - timing['render_ms']), 2)
+        request.timing = timing
+
+        response['Server-Timing'] = self.server_timing(timing)
+        self._record_metrics(request, response, total_ms)
+        self._log(request, response, timing, recorder)
+        return response
+
+    def process_template_response(self, request, response):
+        """렌더링(DRF 직렬화 결과의 JSON 인코딩 등) 시간 측정"""
+        started = time.perf_counter()
+
+        def finished(rendered):
+            request._render_seconds += time.perf_counter() - started
+
+        response.add_post_render_callback(finished)
+        return response
+
+    @staticmethod
+    def server_timing(timing: Dict) -> str:
+        """측정값 → Server-Timing 헤더 값"""
+        return (
+            f"total;dur={timing['total_ms']}, "
+            f"db;dur={timing['db_ms']};desc=\"{timing['queries']} queries\", "
+            f"render;dur={timing['render_ms']}, "
+            f"app;dur={timing['app_ms']}"
+        )
+
+    @staticmethod
+    def _record_metrics(request, response, total_ms: float) -> None:
+        """URL 패턴 단위로 집계 (경로 값을 레이블로 쓰지 않아 시계열 수가 늘지 않음)"""
+        match = getattr(request, 'resolver_match', None)
+        route = match.route if match is not None else 'unmatched'
+        HTTP_REQUESTS.inc(route=route, method=request.method, status=response.status_code)
+        HTTP_REQUEST_SECONDS.observe(total_ms / 1000, route=route, method=request.method)
+
+    def _log(self, request, response, timing: Dict, recorder: QueryRecorder) -> None:
+        fields = dict(
+            timing,
+            method=request.method,
+            path=request.path,
+            status=response.status_code,
+        )
+        message = '%s %s %s %.1fms (%d queries, db %.1fms)'
+        args = (request.method, request.path, response.status_code,
+                timing['total_ms'], timing['queries'], timing['db_ms'])
+
+        if timing['total_ms'] >= self.threshold_ms:
+            StructuredLogger.warning(
+                __name__, 'Slow request: ' + message, *args,
+                slowest_queries=recorder.slowest(self.top_queries),
+                query_list=recorder.all(),
+                **fields
+            )
+        elif logger.isEnabledFor(logging.INFO):
+            StructuredLogger.info(
+                __name__, message, *args,
+                slowest_queries=recorder.slowest(self.top_queries),
+                **fields
+            )
@@ -0,0 +1 @@
+# Infrastructure Profiling Module
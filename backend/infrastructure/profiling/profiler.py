@@ -0,0 +1,120 @@
+"""
+요청 프로파일러
+
+한 요청을 cProfile(함수별 호출 수/시간)과 스택 샘플러(collapsed stack)로 동시에 측정합니다.
+
+- cProfile: pstats 파일과 누적 시간순 텍스트 요약
+- 스택 샘플러: 별도 스레드가 interval초마다 요청 스레드의 호출 스택을 기록하여
+  flamegraph.pl / speedscope에서 바로 읽을 수 있는 collapsed stack 텍스트로 출력
+  ("root;...;leaf 샘플수" 한 줄에 스택 하나)
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from typing import Optional
+
+from django.conf import settings
+
+# 스택 프레임 이름에서 제거할 경로 접두사 (프로젝트 루트)
+_ROOT = str(settings.BASE_DIR) + os.sep
+
+
+class StackSampler:
+    """
+    지정한 스레드의 호출 스택을 주기적으로 기록하는 샘플링 프로파일러
+
+    Args:
+        thread_id: 대상 스레드 ID (threading.get_ident())
+        interval: 샘플링 간격(초)
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    @property
+    def total(self) -> int:
+        return sum(self.samples.values())
+
+    def collapsed(self) -> str:
+        """collapsed stack 텍스트 (샘플 수 내림차순)"""
+        return ''.join(f'{stack} {count}\n' for stack, count in self.samples.most_common())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._stack(frame)] += 1
+
+    @staticmethod
+    def _stack(frame) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            filename = code.co_filename
+            if filename.startswith(_ROOT):
+                filename = filename[len(_ROOT):]
+            names.append(f'{filename}:{code.co_name}')
+            frame = frame.f_back
+        return ';'.join(reversed(names))
+
+
+class RequestProfiler:
+    """
+    cProfile + 스택 샘플러
+
+    Usage:
+        profiler = RequestProfiler()
+        with profiler:
+            response = get_response(request)
+        profiler.stats_text(), profiler.sampler.collapsed()
+
+    Raises:
+        ValueError: 다른 프로파일러가 이미 활성화되어 있는 경우 (start 시)
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler(threading.get_ident(), interval)
+
+    def start(self) -> None:
+        self.profile.enable()
+        self.sampler.start()
+
+    def stop(self) -> None:
+        self.sampler.stop()
+        self.profile.disable()
+
+    def __enter__(self) -> 'RequestProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def dump_stats(self, path: str) -> None:
+        """pstats 파일 저장 (python -m pstats <path> / snakeviz로 분석)"""
+        self.profile.dump_stats(path)
+
+    def stats_text(self, limit: int = 50) -> str:
+        """누적 시간순 상위 limit개 함수 요약"""
+        output = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=output)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return output.getvalue()
@@ -0,0 +1,106 @@
+"""
+프로파일 저장소
+
+프로파일마다 다음 파일을 PROFILING_DIR에 저장하고, 최근 max_profiles개만 유지합니다.
+- <id>.json       메타데이터 (메서드, 경로, 상태 코드, 처리 시간, 샘플 수, 생성 시각)
+- <id>.prof       cProfile pstats
+- <id>.txt        누적 시간순 요약
+- <id>.collapsed  collapsed stack (flamegraph 입력)
+
+ID는 생성 시각으로 시작하므로 이름순 정렬이 곧 시간순입니다.
+"""
+import glob
+import json
+import os
+import re
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from .profiler import RequestProfiler
+
+# 조회 가능한 파일 종류 → (확장자, Content-Type)
+ARTIFACTS = {
+    'prof': ('.prof', 'application/octet-stream'),
+    'txt': ('.txt', 'text/plain; charset=utf-8'),
+    'collapsed': ('.collapsed', 'text/plain; charset=utf-8'),
+}
+
+PROFILE_ID_PATTERN = re.compile(r'^\d{8}T\d{12}-[0-9a-f]{8}$')
+
+
+class ProfileStore:
+    """
+    크기가 제한된 로컬 프로파일 디렉토리
+
+    Args:
+        directory: 저장 디렉토리
+        max_profiles: 유지할 최대 프로파일 수 (초과 시 오래된 것부터 삭제)
+    """
+
+    def __init__(self, directory: str, max_profiles: int = 50):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def save(self, profiler: RequestProfiler, metadata: Dict) -> str:
+        """
+        프로파일 저장
+
+        Returns:
+            str: 프로파일 ID
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        now = datetime.now(timezone.utc)
+        profile_id = f"{now.strftime('%Y%m%dT%H%M%S%f')}-{uuid.uuid4().hex[:8]}"
+
+        profiler.dump_stats(self._path(profile_id, '.prof'))
+        self._write(profile_id, '.txt', profiler.stats_text())
+        self._write(profile_id, '.collapsed', profiler.sampler.collapsed())
+        # 메타데이터를 마지막에 써서, 목록에는 파일이 모두 준비된 프로파일만 보이도록 함
+        metadata = dict(metadata, id=profile_id, created_at=now.isoformat(), samples=profiler.sampler.total)
+        self._write(profile_id, '.json', json.dumps(metadata, ensure_ascii=False))
+
+        self._prune()
+        return profile_id
+
+    def list(self) -> List[Dict]:
+        """저장된 프로파일 메타데이터 (최신순)"""
+        profiles = []
+        for path in sorted(glob.glob(os.path.join(self.directory, '*.json')), reverse=True):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def path(self, profile_id: str, kind: str) -> Optional[str]:
+        """프로파일 파일 경로 (ID 형식이 잘못되었거나 파일이 없으면 None)"""
+        if kind not in ARTIFACTS or not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = self._path(profile_id, ARTIFACTS[kind][0])
+        return path if os.path.exists(path) else None
+
+    def _prune(self) -> None:
+        paths = sorted(glob.glob(os.path.join(self.directory, '*.json')))
+        for path in paths[:max(0, len(paths) - self.max_profiles)]:
+            profile_id = os.path.basename(path)[:-len('.json')]
+            for extension in ('.json',) + tuple(extension for extension, _ in ARTIFACTS.values()):
+                try:
+                    os.remove(self._path(profile_id, extension))
+                except OSError:
+                    pass
+
+    def _write(self, profile_id: str, extension: str, content: str) -> None:
+        with open(self._path(profile_id, extension), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def _path(self, profile_id: str, extension: str) -> str:
+        return os.path.join(self.directory, profile_id + extension)
+
+
+def get_profile_store() -> ProfileStore:
+    """설정(PROFILING_DIR, PROFILING_MAX_PROFILES) 기반 저장소"""
+    return ProfileStore(settings.PROFILING_DIR, getattr(settings, 'PROFILING_MAX_PROFILES', 50))
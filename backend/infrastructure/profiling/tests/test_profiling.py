@@ -0,0 +1,133 @@
+"""
+요청 프로파일링 테스트
+"""
+import os
+import time
+
+import jwt
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from infrastructure.authentication import supabase_auth
+from infrastructure.middleware.profiling_middleware import ProfilingMiddleware
+from infrastructure.profiling.profiler import RequestProfiler
+from infrastructure.profiling.store import ProfileStore
+
+SECRET = 'test-secret-key'
+
+
+def make_token(role):
+    payload = {
+        'sub': 'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
+        'role': role,
+        'aud': 'authenticated',
+        'exp': int(time.time()) + 3600,
+    }
+    return jwt.encode(payload, SECRET, algorithm='HS256')
+
+
+def slow_view(request):
+    """샘플러가 스택을 잡을 수 있을 만큼 머무르는 뷰"""
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    return HttpResponse('ok')
+
+
+@pytest.fixture
+def profile_dir(tmp_path):
+    supabase_auth.token_cache.clear()
+    with override_settings(PROFILING_ENABLED=True, PROFILING_DIR=str(tmp_path), SUPABASE_JWT_SECRET=SECRET):
+        yield tmp_path
+
+
+class TestProfilingMiddleware:
+    """ProfilingMiddleware 테스트"""
+
+    def test_profiles_admin_request_with_header(self, profile_dir):
+        """관리자가 X-Profile 헤더를 보내면 pstats와 collapsed stack을 저장한다"""
+        # Arrange
+        request = RequestFactory().get(
+            '/api/data/', HTTP_X_PROFILE='1', HTTP_AUTHORIZATION=f'Bearer {make_token("admin")}'
+        )
+
+        # Act
+        response = ProfilingMiddleware(slow_view)(request)
+
+        # Assert
+        profile_id = response['X-Profile-Id']
+        assert sorted(os.listdir(profile_dir)) == [
+            f'{profile_id}{extension}' for extension in ('.collapsed', '.json', '.prof', '.txt')
+        ]
+        assert 'slow_view' in (profile_dir / f'{profile_id}.txt').read_text()
+        assert 'test_profiling.py:slow_view' in (profile_dir / f'{profile_id}.collapsed').read_text()
+
+    @pytest.mark.parametrize('headers', [
+        {'HTTP_X_PROFILE': '1', 'HTTP_AUTHORIZATION': f'Bearer {make_token("user")}'},
+        {'HTTP_AUTHORIZATION': f'Bearer {make_token("admin")}'},
+    ])
+    def test_ignores_non_admin_or_missing_header(self, profile_dir, headers):
+        """관리자가 아니거나 헤더가 없으면 측정하지 않는다"""
+        # Arrange
+        request = RequestFactory().get('/api/data/', **headers)
+
+        # Act
+        response = ProfilingMiddleware(slow_view)(request)
+
+        # Assert
+        assert 'X-Profile-Id' not in response
+        assert os.listdir(profile_dir) == []
+
+
+class TestProfileStore:
+    """ProfileStore 테스트"""
+
+    def test_keeps_only_latest_profiles(self, tmp_path):
+        """max_profiles를 넘으면 오래된 프로파일의 파일을 모두 삭제한다"""
+        # Arrange
+        store = ProfileStore(str(tmp_path), max_profiles=2)
+        ids = []
+
+        # Act
+        for number in range(3):
+            with RequestProfiler() as profiler:
+                sum(range(1000))
+            ids.append(store.save(profiler, {'path': f'/api/{number}/'}))
+
+        # Assert
+        assert [profile['path'] for profile in store.list()] == ['/api/2/', '/api/1/']
+        assert not any(name.startswith(ids[0]) for name in os.listdir(tmp_path))
+        assert store.path('../../etc/passwd', 'txt') is None
+
+
+@pytest.mark.django_db
+class TestProfileEndpoints:
+    """GET /api/profiles/ 테스트"""
+
+    def test_admin_lists_and_downloads_profiles(self, client, profile_dir):
+        """관리자는 프로파일 목록과 collapsed stack을 조회할 수 있다"""
+        # Arrange
+        auth = {'HTTP_AUTHORIZATION': f'Bearer {make_token("admin")}'}
+        profiled = client.get('/api/health/', HTTP_X_PROFILE='1', **auth)
+        profile_id = profiled['X-Profile-Id']
+
+        # Act
+        index = client.get('/api/profiles/', **auth)
+        artifact = client.get(f'/api/profiles/{profile_id}/txt/', **auth)
+        missing = client.get(f'/api/profiles/{profile_id}/html/', **auth)
+
+        # Assert
+        assert index.status_code == 200
+        assert index.json()['profiles'][0]['path'] == '/api/health/'
+        assert artifact.status_code == 200
+        assert b'function calls' in b''.join(artifact.streaming_content)
+        assert missing.status_code == 404
+
+    def test_non_admin_is_forbidden(self, client, profile_dir):
+        """관리자가 아니면 403"""
+        # Act
+        response = client.get('/api/profiles/', HTTP_AUTHORIZATION=f'Bearer {make_token("user")}')
+
+        # Assert
+        assert response.status_code == 403
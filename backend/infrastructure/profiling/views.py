@@ -0,0 +1,41 @@
+"""
+프로파일 조회 엔드포인트 (관리자 전용)
+
+GET /api/profiles/                    - 저장된 프로파일 목록 (최신순)
+GET /api/profiles/<id>/<kind>/        - 프로파일 파일 (kind: prof, txt, collapsed)
+"""
+from django.http import FileResponse, Http404
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from infrastructure.authentication.supabase_auth import SupabaseAuthentication
+from infrastructure.permissions.admin_permission import IsAdmin
+
+from .store import ARTIFACTS, get_profile_store
+
+
+class ProfileIndexView(APIView):
+    """저장된 프로파일 목록"""
+    authentication_classes = [SupabaseAuthentication]
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    def get(self, request):
+        profiles = get_profile_store().list()
+        return Response({'count': len(profiles), 'profiles': profiles})
+
+
+class ProfileArtifactView(APIView):
+    """프로파일 파일 다운로드"""
+    authentication_classes = [SupabaseAuthentication]
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    def get(self, request, profile_id, kind):
+        path = get_profile_store().path(profile_id, kind)
+        if path is None:
+            raise Http404('프로파일을 찾을 수 없습니다')
+
+        extension, content_type = ARTIFACTS[kind]
+        response = FileResponse(open(path, 'rb'), content_type=content_type)
+        response['Content-Disposition'] = f'inline; filename="{profile_id}{extension}"'
+        return response
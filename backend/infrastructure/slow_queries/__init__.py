@@ -0,0 +1 @@
+# Infrastructure Slow Query Module
@@ -0,0 +1,278 @@
+"""
+느린 쿼리 수집
+
+DB 실행을 감싸(connection.execute_wrapper) 임계값 이상 걸린 쿼리의 SQL, 파라미터, 호출 위치
+(apps/ 아래 가장 가까운 프레임, 예: 저장소 메서드), 실행 계획을 링 버퍼에 기록합니다.
+
+실행 계획:
+- PostgreSQL: EXPLAIN (ANALYZE, BUFFERS) — 쿼리를 한 번 더 실행하므로 SELECT에만 적용
+- SQLite: EXPLAIN QUERY PLAN
+계획에서 사용된 인덱스와 순차 스캔(Seq Scan / SCAN) 테이블을 뽑아, 모델에 선언된 인덱스 중
+실제로 쓰이는 것과 쓰이지 않는 것을 보고합니다.
+
+링 버퍼는 프로세스별입니다 (gunicorn 워커마다 따로 수집).
+"""
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError, transaction
+
+_ROOT = str(settings.BASE_DIR) + os.sep
+_APPS_ROOT = os.path.join(_ROOT, 'apps') + os.sep
+
+# 계획에서 인덱스 사용 / 순차 스캔 추출 (PostgreSQL, SQLite)
+_INDEX_PATTERN = re.compile(r'(?:Index(?: Only)? Scan using|Bitmap Index Scan on|USING (?:COVERING )?INDEX) (\w+)')
+_SEQ_SCAN_PATTERN = re.compile(r'(?:Seq Scan on (\w+)|^\s*SCAN (?:TABLE )?(\w+)\s*$)', re.MULTILINE)
+
+# EXPLAIN 실행 중에는 수집하지 않음 (재귀 방지)
+_local = threading.local()
+
+
+def normalize_sql(sql: str) -> str:
+    """비교/집계용 SQL 형태 (문자열/숫자 리터럴과 IN 목록 제거)"""
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+(?:\.\d+)?\b', '?', sql)
+    sql = re.sub(r'IN \((?:\?, )*\?\)', 'IN (...)', sql)
+    return sql
+
+
+def plan_summary(plan: str) -> Tuple[List[str], List[str]]:
+    """실행 계획 → (사용된 인덱스, 순차 스캔된 테이블)"""
+    indexes = sorted(set(_INDEX_PATTERN.findall(plan)))
+    seq_scans = sorted({postgres or sqlite for postgres, sqlite in _SEQ_SCAN_PATTERN.findall(plan)})
+    return indexes, seq_scans
+
+
+def declared_indexes() -> Dict[str, str]:
+    """모델에 선언된 이름 있는 인덱스 → 테이블"""
+    return {
+        index.name: model._meta.db_table
+        for model in apps.get_models()
+        for index in model._meta.indexes
+        if index.name
+    }
+
+
+def explain(connection, sql: str, params) -> str:
+    """
+    SELECT 쿼리의 실행 계획
+
+    실패하면(권한, 중단된 트랜잭션 등) 오류 메시지를 반환합니다.
+    세이브포인트 안에서 실행하여 실패가 바깥 트랜잭션을 깨뜨리지 않도록 합니다.
+    """
+    if connection.vendor == 'postgresql':
+        statement = f'EXPLAIN (ANALYZE, BUFFERS) {sql}'
+    elif connection.vendor == 'sqlite':
+        statement = f'EXPLAIN QUERY PLAN {sql}'
+    else:
+        statement = f'EXPLAIN {sql}'
+
+    _local.explaining = True
+    try:
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(statement, params)
+                rows = cursor.fetchall()
+    except DatabaseError as e:
+        return f'EXPLAIN 실패: {e}'
+    finally:
+        _local.explaining = False
+
+    if connection.vendor == 'sqlite':
+        # (id, parent, notused, detail) → 부모 깊이만큼 들여쓰기
+        depth = {0: -1}
+        lines = []
+        for node_id, parent, _, detail in rows:
+            depth[node_id] = depth.get(parent, -1) + 1
+            lines.append('  ' * depth[node_id] + detail)
+        return '\n'.join(lines)
+    return '\n'.join(str(row[0]) for row in rows)
+
+
+def call_site() -> str:
+    """쿼리를 발생시킨 apps/ 아래 가장 가까운 프레임 (파일:줄 함수)"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_APPS_ROOT) and f'{os.sep}tests{os.sep}' not in filename:
+            return f'{filename[len(_ROOT):]}:{frame.f_lineno} {frame.f_code.co_name}'
+        frame = frame.f_back
+    return 'unknown'
+
+
+class SlowQueryLog:
+    """
+    느린 쿼리 링 버퍼 (스레드 안전)
+
+    Args:
+        max_entries: 보관할 최대 쿼리 수 (초과 시 오래된 것부터 버림)
+    """
+
+    def __init__(self, max_entries: int = 500):
+        self._entries = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def record(self, entry: Dict) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self) -> List[Dict]:
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def top(self, limit: int = 20) -> List[Dict]:
+        """같은 형태의 SQL을 묶어 총 소요 시간순 상위 limit개 (가장 느린 실행의 계획 포함)"""
+        return top_offenders(self.entries(), limit)
+
+    def index_usage(self) -> Dict:
+        return index_usage(self.entries())
+
+
+def top_offenders(entries: Iterable[Dict], limit: int = 20) -> List[Dict]:
+    """느린 쿼리 기록 → SQL 형태별 집계 (총 소요 시간 내림차순)"""
+    groups: Dict[str, Dict] = {}
+    for entry in entries:
+        group = groups.get(entry['fingerprint'])
+        if group is None:
+            group = groups[entry['fingerprint']] = {
+                'sql': entry['fingerprint'],
+                'count': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+                'call_sites': [],
+                'indexes': [],
+                'seq_scans': [],
+            }
+        group['count'] += 1
+        group['total_ms'] += entry['ms']
+        if entry['call_site'] not in group['call_sites']:
+            group['call_sites'].append(entry['call_site'])
+        if entry['ms'] >= group['max_ms']:
+            group.update(
+                max_ms=entry['ms'],
+                slowest_sql=entry['sql'],
+                params=entry['params'],
+                plan=entry['plan'],
+                indexes=entry['indexes'],
+                seq_scans=entry['seq_scans'],
+            )
+
+    ranked = sorted(groups.values(), key=lambda group: group['total_ms'], reverse=True)[:limit]
+    for group in ranked:
+        group['total_ms'] = round(group['total_ms'], 2)
+        group['mean_ms'] = round(group['total_ms'] / group['count'], 2)
+    return ranked
+
+
+def index_usage(entries: Iterable[Dict]) -> Dict:
+    """선언된 인덱스 중 계획에 나타난 것 / 나타나지 않은 것, 순차 스캔된 테이블"""
+    used = set()
+    seq_scans = set()
+    for entry in entries:
+        used.update(entry['indexes'])
+        seq_scans.update(entry['seq_scans'])
+
+    declared = declared_indexes()
+    tables = {model._meta.db_table for model in apps.get_models()}
+    return {
+        'used': sorted(name for name in used if name in declared),
+        'unused': sorted(name for name in declared if name not in used),
+        # 서브쿼리/임시 B-tree 등 테이블이 아닌 스캔 제외
+        'seq_scanned_tables': sorted(seq_scans & tables),
+    }
+
+
+class SlowQueryCapture:
+    """
+    connection.execute_wrapper로 등록되는 느린 쿼리 수집기
+
+    Args:
+        log: 기록할 링 버퍼
+        threshold_ms: 이 시간 이상 걸린 쿼리만 기록
+        explain_plans: 실행 계획 수집 여부
+    """
+
+    def __init__(self, log: SlowQueryLog, threshold_ms: float = 200, explain_plans: bool = True):
+        self.log = log
+        self.threshold_ms = threshold_ms
+        self.explain_plans = explain_plans
+
+    def __call__(self, execute, sql, params, many, context):
+        if getattr(_local, 'explaining', False):
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        result = execute(sql, params, many, context)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if elapsed_ms >= self.threshold_ms:
+            self._record(sql, params, many, context['connection'], elapsed_ms)
+        return result
+
+    def _record(self, sql: str, params, many: bool, connection, elapsed_ms: float) -> None:
+        plan = ''
+        if self.explain_plans and not many and sql.lstrip()[:6].upper() == 'SELECT':
+            plan = explain(connection, sql, params)
+        indexes, seq_scans = plan_summary(plan)
+
+        self.log.record({
+            'ms': round(elapsed_ms, 2),
+            'db': connection.alias,
+            'sql': sql,
+            'fingerprint': normalize_sql(sql),
+            'params': _params(params, many),
+            'call_site': call_site(),
+            'plan': plan,
+            'indexes': indexes,
+            'seq_scans': seq_scans,
+            'at': time.time(),
+        })
+
+
+def _params(params, many: bool) -> Optional[List]:
+    """로그에 남길 파라미터 (executemany는 생략)"""
+    if many or params is None:
+        return None
+    values = params.values() if isinstance(params, dict) else params
+    return [value if isinstance(value, (int, float, bool, type(None))) else str(value)[:200] for value in values]
+
+
+slow_query_log = SlowQueryLog(max_entries=getattr(settings, 'SLOW_QUERY_BUFFER_SIZE', 500))
+
+
+def install() -> None:
+    """
+    SLOW_QUERY_CAPTURE_ENABLED이면 새로 연결되는 모든 DB 연결에 수집기를 등록
+    (CoreConfig.ready에서 호출)
+    """
+    if not getattr(settings, 'SLOW_QUERY_CAPTURE_ENABLED', False):
+        return
+
+    from django.db.backends.signals import connection_created
+
+    capture = SlowQueryCapture(
+        slow_query_log,
+        threshold_ms=getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', 200),
+        explain_plans=getattr(settings, 'SLOW_QUERY_EXPLAIN', True),
+    )
+
+    def register(sender, connection, **kwargs):
+        # 재연결 시 중복 등록 방지
+        if capture not in connection.execute_wrappers:
+            connection.execute_wrappers.append(capture)
+
+    connection_created.connect(register, weak=False, dispatch_uid='slow_query_capture')
@@ -0,0 +1,119 @@
+"""
+느린 쿼리 수집 테스트
+"""
+import time
+
+import jwt
+import pytest
+from django.db import connection
+
+from apps.dashboard.repositories.department_kpi_repository import DepartmentKPIRepository
+from infrastructure.authentication import supabase_auth
+from infrastructure.slow_queries.capture import (
+    SlowQueryCapture,
+    SlowQueryLog,
+    plan_summary,
+    slow_query_log,
+)
+
+POSTGRES_PLAN = """Sort  (cost=10.50..10.60 rows=40 width=64) (actual time=0.120..0.125 rows=40 loops=1)
+  ->  Hash Join  (cost=1.20..9.40 rows=40 width=64) (actual time=0.050..0.100 rows=40 loops=1)
+        ->  Seq Scan on publication  (cost=0.00..7.00 rows=200 width=48) (actual time=0.010..0.040 rows=200 loops=1)
+        ->  Index Scan using idx_dept_kpi_year on department_kpi  (cost=0.15..8.17 rows=1 width=16)
+  Buffers: shared hit=12"""
+
+
+def make_token(role):
+    payload = {
+        'sub': 'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
+        'role': role,
+        'aud': 'authenticated',
+        'exp': int(time.time()) + 3600,
+    }
+    return jwt.encode(payload, 'test-secret-key', algorithm='HS256')
+
+
+@pytest.mark.django_db
+class TestSlowQueryCapture:
+    """SlowQueryCapture 테스트"""
+
+    def test_records_plan_and_repository_call_site(self):
+        """임계값 이상 걸린 쿼리를 호출한 저장소 메서드, 파라미터, 실행 계획과 함께 기록한다"""
+        # Arrange
+        log = SlowQueryLog()
+
+        # Act
+        with connection.execute_wrapper(SlowQueryCapture(log, threshold_ms=0)):
+            DepartmentKPIRepository().get_summary(year=2024)
+
+        # Assert
+        [entry] = log.entries()
+        assert entry['call_site'].startswith('apps/dashboard/repositories/department_kpi_repository.py:')
+        assert entry['call_site'].endswith(' get_summary')
+        assert entry['params'] == [2024]
+        assert 'idx_dept_kpi_year' in entry['plan']
+        assert entry['indexes'] == ['idx_dept_kpi_year']
+
+    def test_skips_queries_under_threshold(self):
+        """임계값보다 빠른 쿼리는 기록하지 않는다"""
+        # Arrange
+        log = SlowQueryLog()
+
+        # Act
+        with connection.execute_wrapper(SlowQueryCapture(log, threshold_ms=60_000)):
+            DepartmentKPIRepository().get_summary(year=2024)
+
+        # Assert
+        assert len(log) == 0
+
+
+class TestSlowQueryLog:
+    """SlowQueryLog 집계 테스트"""
+
+    def test_groups_by_sql_shape_and_reports_index_usage(self):
+        """같은 형태의 SQL을 묶어 총 시간순으로 정렬하고 선언된 인덱스 사용 여부를 보고한다"""
+        # Arrange
+        log = SlowQueryLog(max_entries=10)
+        indexes, seq_scans = plan_summary(POSTGRES_PLAN)
+        for sql, ms in (("SELECT * FROM publication WHERE id = 1", 30.0),
+                        ("SELECT * FROM publication WHERE id = 2", 50.0),
+                        ("SELECT * FROM student_roster WHERE grade = 3", 60.0)):
+            log.record({
+                'ms': ms, 'sql': sql, 'fingerprint': sql.rsplit(' ', 1)[0] + ' ?', 'params': None,
+                'call_site': 'apps/data/x.py:1 f', 'plan': POSTGRES_PLAN, 'indexes': indexes, 'seq_scans': seq_scans,
+            })
+
+        # Act
+        top = log.top(limit=5)
+        usage = log.index_usage()
+
+        # Assert
+        assert [(group['sql'], group['count'], group['total_ms']) for group in top] == [
+            ('SELECT * FROM publication WHERE id = ?', 2, 80.0),
+            ('SELECT * FROM student_roster WHERE grade = ?', 1, 60.0),
+        ]
+        assert top[0]['slowest_sql'] == 'SELECT * FROM publication WHERE id = 2'
+        assert usage['used'] == ['idx_dept_kpi_year']
+        assert 'idx_pub_dept' in usage['unused']
+        assert usage['seq_scanned_tables'] == ['publication']
+
+
+@pytest.mark.django_db
+class TestSlowQueryEndpoint:
+    """GET /api/slow-queries/ 테스트"""
+
+    def test_admin_only(self, client, settings):
+        """관리자만 조회할 수 있다"""
+        # Arrange
+        settings.SUPABASE_JWT_SECRET = 'test-secret-key'
+        supabase_auth.token_cache.clear()
+        slow_query_log.clear()
+
+        # Act
+        admin = client.get('/api/slow-queries/', HTTP_AUTHORIZATION=f'Bearer {make_token("admin")}')
+        user = client.get('/api/slow-queries/', HTTP_AUTHORIZATION=f'Bearer {make_token("user")}')
+
+        # Assert
+        assert admin.status_code == 200
+        assert admin.json()['captured'] == 0
+        assert user.status_code == 403
@@ -0,0 +1,39 @@
+"""
+느린 쿼리 조회 엔드포인트 (관리자 전용)
+
+GET    /api/slow-queries/?limit=20 - 현재 워커에서 수집한 느린 쿼리 상위 목록과 인덱스 사용 현황
+DELETE /api/slow-queries/          - 수집 기록 비우기
+"""
+from django.conf import settings
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from infrastructure.authentication.supabase_auth import SupabaseAuthentication
+from infrastructure.permissions.admin_permission import IsAdmin
+
+from .capture import slow_query_log
+
+
+class SlowQueryView(APIView):
+    """느린 쿼리 상위 목록"""
+    authentication_classes = [SupabaseAuthentication]
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    def get(self, request):
+        try:
+            limit = max(1, int(request.query_params.get('limit', 20)))
+        except ValueError:
+            return Response({'error': 'limit은 정수여야 합니다'}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'enabled': getattr(settings, 'SLOW_QUERY_CAPTURE_ENABLED', False),
+            'threshold_ms': getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', 200),
+            'captured': len(slow_query_log),
+            'top': slow_query_log.top(limit),
+            'indexes': slow_query_log.index_usage(),
+        })
+
+    def delete(self, request):
+        slow_query_log.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
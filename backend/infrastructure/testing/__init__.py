@@ -0,0 +1 @@
+# Infrastructure Testing Support Module
@@ -0,0 +1,179 @@
+"""
+쿼리 예산 (테스트 지원)
+
+엔드포인트와 서비스 메서드별 최대 쿼리 수 / 최대 조회 행 수를 선언하고,
+합성 데이터 픽스처(BUDGET_SCALE) 위에서 실행하여 예산을 넘으면 실패시킵니다.
+
+실패 메시지에는 기록된 쿼리 스냅샷(query_snapshots/<이름>.sql)과 이번 실행 SQL의
+diff가 포함되어, 어떤 쿼리가 늘었는지(N+1 등) 바로 확인할 수 있습니다.
+스냅샷은 저장소에 함께 커밋하며, UPDATE_QUERY_SNAPSHOTS=1로 실행해 예산 안에서 통과할 때만
+생성/갱신합니다 (평소 테스트 실행은 작업 트리를 바꾸지 않음).
+
+사용법:
+    @pytest.mark.django_db
+    def test_dashboard_budget(synthetic_data):
+        assert_query_budget('DashboardService.get_dashboard_data',
+                            lambda: DashboardService().get_dashboard_data(2024, 'all'))
+"""
+import difflib
+import os
+import re
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional
+from unittest import mock
+
+from django.db import connections
+from django.db.backends.utils import CursorWrapper
+from django.test.utils import CaptureQueriesContext
+
+from infrastructure.slow_queries.capture import normalize_sql as normalize
+
+# 예산을 측정하는 합성 데이터 규모 / 시드
+BUDGET_SCALE = 0.02
+BUDGET_SEED = 42
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'query_snapshots')
+
+
+class Budget(NamedTuple):
+    """최대 쿼리 수 / 최대 조회 행 수 (None이면 행 수 제한 없음)"""
+    queries: int
+    rows: Optional[int] = None
+
+
+# 합성 데이터(BUDGET_SCALE, BUDGET_SEED) 기준 예산
+# 현재 동작을 고정한 값이며, 쿼리를 줄이는 변경을 하면 함께 낮춥니다.
+BUDGETS = {
+    # KPI 요약/추이와 차트 9종을 각각 조회 (현재/이전 연도 KPI 중복 조회 포함)
+    'DashboardService.get_dashboard_data': Budget(queries=28, rows=120),
+    'GET /api/dashboard/': Budget(queries=28, rows=120),
+    # 유형별 count + 조회 후 메모리에서 병합/페이지네이션 (전체 행 조회)
+    'DataRepository.get_all_with_filters': Budget(queries=4, rows=471),
+    'DataRepository.get_all_with_filters[search]': Budget(queries=4, rows=53),
+    'DataRepository.get_all_with_filters[data_type]': Budget(queries=1, rows=60),
+    'GET /api/data/': Budget(queries=4, rows=471),
+    'CSVExportService.export_to_csv': Budget(queries=1, rows=60),
+    'GET /api/data/export/': Budget(queries=1, rows=60),
+}
+
+
+class QueryBudgetExceeded(AssertionError):
+    """쿼리 예산 초과"""
+
+
+class QueryRecording:
+    """실행된 SQL과 조회 행 수"""
+
+    def __init__(self):
+        self.sql: List[str] = []
+        self.rows = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.sql)
+
+
+@contextmanager
+def record_queries(using: str = 'default') -> Iterator[QueryRecording]:
+    """
+    블록 안에서 실행된 SQL과 fetch된 행 수 기록
+
+    행 수는 CursorWrapper의 fetchone/fetchmany/fetchall 결과를 셉니다.
+    """
+    recording = QueryRecording()
+
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        recording.rows += row is not None
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self.cursor.fetchmany(*args, **kwargs)
+        recording.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self.cursor.fetchall()
+        recording.rows += len(rows)
+        return rows
+
+    with mock.patch.object(CursorWrapper, 'fetchone', fetchone, create=True), \
+            mock.patch.object(CursorWrapper, 'fetchmany', fetchmany, create=True), \
+            mock.patch.object(CursorWrapper, 'fetchall', fetchall, create=True), \
+            CaptureQueriesContext(connections[using]) as captured:
+        yield recording
+
+    recording.sql = [query['sql'] for query in captured.captured_queries]
+
+
+def assert_query_budget(name: str, func: Callable[[], Any], budget: Optional[Budget] = None) -> Any:
+    """
+    func를 실행하여 선언된 예산 이내인지 확인
+
+    Args:
+        name: BUDGETS의 이름
+        func: 측정할 호출
+        budget: 예산 (기본값: BUDGETS[name])
+
+    Returns:
+        func의 반환값
+
+    Raises:
+        QueryBudgetExceeded: 쿼리 수 또는 조회 행 수가 예산을 넘은 경우
+    """
+    budget = budget or BUDGETS[name]
+    with record_queries() as recording:
+        result = func()
+
+    over_queries = recording.count > budget.queries
+    over_rows = budget.rows is not None and recording.rows > budget.rows
+    if over_queries or over_rows:
+        raise QueryBudgetExceeded(_report(name, budget, recording))
+
+    _save_snapshot(name, recording)
+    return result
+
+
+def load_budget_data(scale: float = BUDGET_SCALE, seed: int = BUDGET_SEED) -> None:
+    """예산 측정용 합성 데이터를 현재(테스트) DB에 적재"""
+    import tempfile
+
+    from apps.uploads.services.bulk_loader import BulkLoader
+    from apps.uploads.services.synthetic_data import SyntheticDataGenerator
+
+    with tempfile.TemporaryDirectory() as directory:
+        written = SyntheticDataGenerator(scale=scale, seed=seed).write(directory)
+        BulkLoader(validate=False).load_many([(data_type, path) for data_type, path, _ in written])
+
+
+def _snapshot_path(name: str) -> str:
+    filename = re.sub(r'[^\w.\[\]-]+', '_', name).strip('_')
+    return os.path.join(SNAPSHOT_DIR, f'{filename}.sql')
+
+
+def _save_snapshot(name: str, recording: QueryRecording) -> None:
+    if os.environ.get('UPDATE_QUERY_SNAPSHOTS') != '1':
+        return
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    with open(_snapshot_path(name), 'w', encoding='utf-8') as f:
+        f.write(''.join(normalize(sql) + '\n' for sql in recording.sql))
+
+
+def _report(name: str, budget: Budget, recording: QueryRecording) -> str:
+    lines = [
+        f"{name}: 쿼리 예산 초과",
+        f"  queries: {recording.count} (예산 {budget.queries})",
+        f"  rows: {recording.rows} (예산 {budget.rows if budget.rows is not None else '-'})",
+    ]
+
+    current = [normalize(sql) for sql in recording.sql]
+    path = _snapshot_path(name)
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            expected = f.read().splitlines()
+        lines.append(f"SQL diff ({os.path.basename(path)} → 이번 실행):")
+        lines.extend(difflib.unified_diff(expected, current, 'snapshot', 'executed', lineterm='', n=1))
+    else:
+        lines.append("실행된 SQL:")
+        lines.extend(f"  {index}. {sql}" for index, sql in enumerate(recording.sql, 1))
+    return '\n'.join(lines)
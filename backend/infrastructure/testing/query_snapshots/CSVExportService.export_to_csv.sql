@@ -0,0 +1 @@
+SELECT "publication"."id", "publication"."created_at", "publication"."updated_at", "publication"."paper_id", "publication"."publication_date", "publication"."college", "publication"."department", "publication"."paper_title", "publication"."lead_author", "publication"."co_authors", "publication"."journal_name", "publication"."journal_grade", "publication"."impact_factor", "publication"."project_linked" FROM "publication" ORDER BY "publication"."publication_date" DESC
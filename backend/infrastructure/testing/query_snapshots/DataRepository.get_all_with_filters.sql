@@ -0,0 +1,4 @@
+SELECT "department_kpi"."id", "department_kpi"."created_at", "department_kpi"."updated_at", "department_kpi"."evaluation_year", "department_kpi"."college", "department_kpi"."department", "department_kpi"."employment_rate", "department_kpi"."full_time_faculty", "department_kpi"."visiting_faculty", "department_kpi"."tech_transfer_income", "department_kpi"."intl_conferences" FROM "department_kpi" ORDER BY "department_kpi"."evaluation_year" DESC, "department_kpi"."college" ASC, "department_kpi"."department" ASC
+SELECT "publication"."id", "publication"."created_at", "publication"."updated_at", "publication"."paper_id", "publication"."publication_date", "publication"."college", "publication"."department", "publication"."paper_title", "publication"."lead_author", "publication"."co_authors", "publication"."journal_name", "publication"."journal_grade", "publication"."impact_factor", "publication"."project_linked" FROM "publication" ORDER BY "publication"."publication_date" DESC
+SELECT "research_project"."id", "research_project"."created_at", "research_project"."updated_at", "research_project"."execution_id", "research_project"."project_number", "research_project"."project_name", "research_project"."principal_investigator", "research_project"."department", "research_project"."funding_agency", "research_project"."total_budget", "research_project"."execution_date", "research_project"."execution_item", "research_project"."execution_amount", "research_project"."status", "research_project"."remarks" FROM "research_project" ORDER BY "research_project"."execution_date" DESC
+SELECT "student"."id", "student"."created_at", "student"."updated_at", "student"."student_id", "student"."name", "student"."college", "student"."department", "student"."grade", "student"."program_type", "student"."enrollment_status", "student"."gender", "student"."admission_year", "student"."advisor", "student"."email" FROM "student" ORDER BY "student"."student_id" ASC
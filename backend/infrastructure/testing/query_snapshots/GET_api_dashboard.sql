@@ -0,0 +1,28 @@
+SELECT (CAST(AVG("department_kpi"."employment_rate") AS NUMERIC)) AS "avg_employment_rate", SUM("department_kpi"."full_time_faculty") AS "total_full_time_faculty", SUM("department_kpi"."visiting_faculty") AS "total_visiting_faculty", (CAST(SUM("department_kpi"."tech_transfer_income") AS NUMERIC)) AS "total_tech_transfer_income", SUM("department_kpi"."intl_conferences") AS "total_intl_conferences" FROM "department_kpi" WHERE "department_kpi"."evaluation_year" = ?
+SELECT COUNT(*) AS "__count" FROM "publication" WHERE "publication"."publication_date" BETWEEN ? AND ?
+SELECT COUNT(*) AS "__count" FROM "publication" WHERE ("publication"."publication_date" BETWEEN ? AND ? AND "publication"."journal_grade" = ?)
+SELECT COUNT(*) AS "__count" FROM "publication" WHERE ("publication"."publication_date" BETWEEN ? AND ? AND "publication"."journal_grade" = ?)
+SELECT (CAST(AVG("publication"."impact_factor") AS NUMERIC)) AS "avg" FROM "publication" WHERE ("publication"."publication_date" BETWEEN ? AND ? AND "publication"."impact_factor" IS NOT NULL AND "publication"."journal_grade" = ?)
+SELECT COUNT(*) AS "__count" FROM "publication" WHERE ("publication"."publication_date" BETWEEN ? AND ? AND "publication"."project_linked" = ?)
+SELECT COUNT(*) AS "__count" FROM "student" WHERE "student"."enrollment_status" = ?
+SELECT "student"."program_type", COUNT("student"."id") AS "count" FROM "student" WHERE "student"."enrollment_status" = ? GROUP BY "student"."program_type" ORDER BY "student"."program_type" ASC
+SELECT "student"."enrollment_status", COUNT("student"."id") AS "count" FROM "student" GROUP BY "student"."enrollment_status" ORDER BY "student"."enrollment_status" ASC
+SELECT SUM("budget") FROM (SELECT "research_project"."project_number" AS "col1", MAX("research_project"."total_budget") AS "budget" FROM "research_project" GROUP BY ?) subquery
+SELECT SUM("research_project"."execution_amount") AS "total_execution" FROM "research_project" WHERE "research_project"."status" = ?
+SELECT (CAST(AVG("department_kpi"."employment_rate") AS NUMERIC)) AS "avg_employment_rate", SUM("department_kpi"."full_time_faculty") AS "total_full_time_faculty", SUM("department_kpi"."visiting_faculty") AS "total_visiting_faculty", (CAST(SUM("department_kpi"."tech_transfer_income") AS NUMERIC)) AS "total_tech_transfer_income", SUM("department_kpi"."intl_conferences") AS "total_intl_conferences" FROM "department_kpi" WHERE "department_kpi"."evaluation_year" = ?
+SELECT COUNT(*) AS "__count" FROM "publication" WHERE "publication"."publication_date" BETWEEN ? AND ?
+SELECT COUNT(*) AS "__count" FROM "publication" WHERE ("publication"."publication_date" BETWEEN ? AND ? AND "publication"."journal_grade" = ?)
+SELECT COUNT(*) AS "__count" FROM "publication" WHERE ("publication"."publication_date" BETWEEN ? AND ? AND "publication"."journal_grade" = ?)
+SELECT (CAST(AVG("publication"."impact_factor") AS NUMERIC)) AS "avg" FROM "publication" WHERE ("publication"."publication_date" BETWEEN ? AND ? AND "publication"."impact_factor" IS NOT NULL AND "publication"."journal_grade" = ?)
+SELECT COUNT(*) AS "__count" FROM "publication" WHERE ("publication"."publication_date" BETWEEN ? AND ? AND "publication"."project_linked" = ?)
+SELECT COUNT(*) AS "__count" FROM "student" WHERE "student"."enrollment_status" = ?
+SELECT "student"."program_type", COUNT("student"."id") AS "count" FROM "student" WHERE "student"."enrollment_status" = ? GROUP BY "student"."program_type" ORDER BY "student"."program_type" ASC
+SELECT "student"."enrollment_status", COUNT("student"."id") AS "count" FROM "student" GROUP BY "student"."enrollment_status" ORDER BY "student"."enrollment_status" ASC
+SELECT "department_kpi"."department", "department_kpi"."employment_rate" FROM "department_kpi" WHERE "department_kpi"."evaluation_year" = ? ORDER BY "department_kpi"."department" ASC
+SELECT "department_kpi"."evaluation_year", SUM("department_kpi"."full_time_faculty") AS "total_full_time_faculty", SUM("department_kpi"."visiting_faculty") AS "total_visiting_faculty", (CAST(SUM("department_kpi"."tech_transfer_income") AS NUMERIC)) AS "total_tech_transfer_income" FROM "department_kpi" WHERE ("department_kpi"."evaluation_year" >= ? AND "department_kpi"."evaluation_year" <= ?) GROUP BY "department_kpi"."evaluation_year" ORDER BY "department_kpi"."evaluation_year" ASC
+SELECT "publication"."journal_grade", COUNT("publication"."id") AS "count" FROM "publication" WHERE "publication"."publication_date" BETWEEN ? AND ? GROUP BY "publication"."journal_grade" ORDER BY "publication"."journal_grade" ASC
+SELECT "publication"."department", COUNT("publication"."id") AS "count" FROM "publication" WHERE "publication"."publication_date" BETWEEN ? AND ? GROUP BY "publication"."department" ORDER BY ? DESC
+SELECT "student"."program_type", COUNT("student"."id") AS "count" FROM "student" WHERE "student"."enrollment_status" = ? GROUP BY "student"."program_type" ORDER BY "student"."program_type" ASC
+SELECT "student"."department", COUNT("student"."id") AS "count" FROM "student" WHERE "student"."enrollment_status" = ? GROUP BY "student"."department" ORDER BY ? DESC
+SELECT "research_project"."execution_item", COALESCE(SUM("research_project"."execution_amount"), ?) AS "total_amount" FROM "research_project" GROUP BY "research_project"."execution_item" ORDER BY ? DESC
+SELECT "research_project"."funding_agency", "research_project"."project_number", MAX("research_project"."total_budget") AS "project_budget" FROM "research_project" GROUP BY "research_project"."funding_agency", "research_project"."project_number"
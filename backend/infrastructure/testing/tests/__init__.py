@@ -0,0 +1 @@
+# Infrastructure Testing Support Tests Module
@@ -0,0 +1,94 @@
+"""
+쿼리 예산 테스트 지원 모듈 테스트
+"""
+import pytest
+from django.db import connection
+
+from infrastructure.testing import query_budget
+from infrastructure.testing.query_budget import (
+    Budget,
+    QueryBudgetExceeded,
+    assert_query_budget,
+    normalize,
+    record_queries,
+)
+
+
+def run_selects(count):
+    with connection.cursor() as cursor:
+        for number in range(count):
+            cursor.execute(f"SELECT {number}, 'value'")
+            cursor.fetchall()
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(query_budget, 'SNAPSHOT_DIR', str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestQueryBudget:
+    """assert_query_budget 테스트"""
+
+    def test_counts_queries_and_fetched_rows(self):
+        """실행된 SQL 수와 fetch된 행 수를 기록한다"""
+        # Act
+        with record_queries() as recording:
+            run_selects(3)
+
+        # Assert
+        assert recording.count == 3
+        assert recording.rows == 3
+
+    def test_passing_run_writes_snapshot_when_updating(self, snapshot_dir, monkeypatch):
+        """UPDATE_QUERY_SNAPSHOTS=1이면 예산 안에서 통과할 때 정규화된 SQL 스냅샷을 남긴다"""
+        # Arrange
+        monkeypatch.setenv('UPDATE_QUERY_SNAPSHOTS', '1')
+
+        # Act
+        assert_query_budget('service.method', lambda: run_selects(2), Budget(queries=2, rows=2))
+
+        # Assert
+        assert (snapshot_dir / 'service.method.sql').read_text() == "SELECT ?, ?\nSELECT ?, ?\n"
+
+    def test_passing_run_does_not_write_snapshot_by_default(self, snapshot_dir, monkeypatch):
+        """평소 실행에서는 스냅샷이 없어도 파일을 만들지 않는다"""
+        # Arrange
+        monkeypatch.delenv('UPDATE_QUERY_SNAPSHOTS', raising=False)
+
+        # Act
+        assert_query_budget('service.method', lambda: run_selects(2), Budget(queries=2, rows=2))
+
+        # Assert
+        assert list(snapshot_dir.iterdir()) == []
+
+    def test_exceeded_budget_fails_with_sql_diff(self, snapshot_dir):
+        """예산을 넘으면 스냅샷 대비 늘어난 SQL을 diff로 보여준다"""
+        # Arrange
+        (snapshot_dir / 'service.method.sql').write_text("SELECT ?, ?\n")
+
+        # Act
+        with pytest.raises(QueryBudgetExceeded) as exc_info:
+            assert_query_budget('service.method', lambda: run_selects(3), Budget(queries=1))
+
+        # Assert
+        message = str(exc_info.value)
+        assert 'queries: 3 (예산 1)' in message
+        assert message.count('+SELECT ?, ?') == 2
+        assert (snapshot_dir / 'service.method.sql').read_text() == "SELECT ?, ?\n"
+
+    def test_exceeded_row_budget_fails(self, snapshot_dir):
+        """조회 행 수 예산을 넘어도 실패한다"""
+        # Act & Assert
+        with pytest.raises(QueryBudgetExceeded, match='rows: 2'):
+            assert_query_budget('service.rows', lambda: run_selects(2), Budget(queries=5, rows=1))
+
+
+def test_normalize_strips_literals():
+    """리터럴과 IN 목록을 제거해 쿼리 형태만 남긴다"""
+    # Act
+    sql = normalize("SELECT * FROM t WHERE a = 'x''y' AND b IN (1, 2, 3) AND c > 2.5")
+
+    # Assert
+    assert sql == "SELECT * FROM t WHERE a = ? AND b IN (...) AND c > ?"
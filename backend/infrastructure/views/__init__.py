@@ -0,0 +1 @@
+# Infrastructure Views Module
@@ -0,0 +1,69 @@
+"""
+비동기 DRF 뷰 기반 클래스
+
+DRF 3.14는 비동기 핸들러를 지원하지 않으므로, APIView/ViewSet의 dispatch를 코루틴으로 바꾼 기반 클래스를 둡니다.
+- 인증/권한 확인(initial), 예외 처리, 응답 마무리는 DRF와 같으며 이벤트 루프에서 실행합니다.
+  SupabaseAuthentication은 DB를 쓰지 않으므로 이벤트 루프를 막지 않습니다.
+- 핸들러(get, list 등)는 async def로 작성하고, ORM은 비동기 API(aget, async for 등)나
+  sync_to_async / gather_queries를 통해 호출합니다.
+
+ASGI(config.asgi)에서는 이벤트 루프에서 바로 실행되고, WSGI(config.wsgi)에서는 Django가
+요청마다 async_to_sync로 감싸 실행하므로 두 배포 방식 모두 같은 뷰를 사용합니다.
+"""
+from asgiref.sync import markcoroutinefunction
+from django.core.handlers.asgi import ASGIRequest
+from django.utils.decorators import classonlymethod
+from rest_framework.views import APIView
+from rest_framework.viewsets import ViewSet
+
+
+def is_asgi_request(request) -> bool:
+    """ASGI 서버(uvicorn 등)로 들어온 요청인지 (DRF Request 또는 Django HttpRequest)"""
+    return isinstance(getattr(request, '_request', request), ASGIRequest)
+
+
+class AsyncDispatchMixin:
+    """코루틴 핸들러를 기다리는 DRF dispatch"""
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            self.initial(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            # options 등 DRF 기본 핸들러는 동기 함수
+            if hasattr(response, '__await__'):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncAPIView(AsyncDispatchMixin, APIView):
+    """
+    비동기 APIView
+
+    핸들러를 모두 async def로 정의해야 Django가 비동기 뷰로 인식합니다 (View.view_is_async).
+    """
+
+
+class AsyncViewSet(AsyncDispatchMixin, ViewSet):
+    """비동기 ViewSet (라우터에 그대로 등록)"""
+
+    @classonlymethod
+    def as_view(cls, actions=None, **initkwargs):
+        # ViewSetMixin.as_view는 View.as_view를 거치지 않으므로 직접 코루틴 뷰로 표시
+        return markcoroutinefunction(super().as_view(actions, **initkwargs))